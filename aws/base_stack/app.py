@@ -20,6 +20,7 @@ from workstation_core.runtime_resolution import (
     get_account,
     get_region,
     parse_optional_bool_context,
+    parse_optional_index_list_context,
     parse_optional_text_context,
 )
 
@@ -87,10 +88,44 @@ def main() -> None:
         )
     if access_mode in {"ssh", "both"}:
         public_ip_enabled = True
+    package_cache_context = app.node.try_get_context("package_cache")
+    package_cache = False
+    if package_cache_context is not None:
+        package_cache = parse_optional_bool_context(
+            value=package_cache_context,
+            context_key="package_cache",
+        )
+    container_cache_context = app.node.try_get_context("container_cache")
+    container_cache = False
+    if container_cache_context is not None:
+        container_cache = parse_optional_bool_context(
+            value=container_cache_context,
+            context_key="container_cache",
+        )
+    volume_preread_context = app.node.try_get_context("volume_preread")
+    volume_preread = False
+    if volume_preread_context is not None:
+        volume_preread = parse_optional_bool_context(
+            value=volume_preread_context,
+            context_key="volume_preread",
+        )
+    container_cache_credential_arn = parse_optional_text_context(
+        app.node.try_get_context("container_cache_credential_arn")
+    )
     eip_allocation_id = parse_optional_text_context(app.node.try_get_context("eip_allocation_id"))
+    availability_zone_indexes = parse_optional_index_list_context(
+        value=app.node.try_get_context("availability_zone_indexes"),
+        context_key="availability_zone_indexes",
+    )
     env = cdk.Environment(account=get_account(), region=get_region())
     shared_network_config = get_shared_network_config()
-    Env4aiNetworkStack(app, shared_network_config.stack_name, env=env)
+    Env4aiNetworkStack(
+        app,
+        shared_network_config.stack_name,
+        package_cache=package_cache,
+        container_cache_credential_arn=container_cache_credential_arn,
+        env=env,
+    )
     shared_network = load_shared_network_imports()
 
     workstation_stack = WorkstationStack(
@@ -99,6 +134,7 @@ def main() -> None:
         shared_igw_id=shared_network.internet_gateway_id,
         shared_vpc_id=shared_network.vpc_id,
         shared_vpc_cidr_block=shared_network.vpc_cidr_block,
+        availability_zone_indexes=availability_zone_indexes,
         ami_id_override=ami_id_override,
         bootstrap_on_restored_ami=bootstrap_on_restored_ami,
         verbose_bootstrap_resolution=verbose_bootstrap_resolution,
@@ -107,6 +143,9 @@ def main() -> None:
         public_ip_enabled=public_ip_enabled,
         shared_ssm_clients_security_group_id=shared_network.ssm_clients_security_group_id,
         shared_ssm_instance_profile_arn=shared_network.ssm_instance_profile_arn,
+        package_cache=package_cache,
+        container_cache=container_cache,
+        volume_preread=volume_preread,
         environment_spec=ENVIRONMENT_SPEC,
         env=env,
     )
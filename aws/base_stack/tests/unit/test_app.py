@@ -95,6 +95,8 @@ class AppResolverTests(unittest.TestCase):
         network_stack_mock.assert_called_once_with(
             app_instance,
             "Env4aiNetworkStack",
+            package_cache=False,
+            container_cache_credential_arn=None,
             env=environment_obj,
         )
         load_shared_network_imports.assert_called_once_with()
@@ -104,6 +106,7 @@ class AppResolverTests(unittest.TestCase):
             shared_igw_id="igw",
             shared_vpc_id="vpc-123",
             shared_vpc_cidr_block="10.0.0.0/16",
+            availability_zone_indexes=None,
             ami_id_override=None,
             bootstrap_on_restored_ami=False,
             verbose_bootstrap_resolution=False,
@@ -111,6 +114,9 @@ class AppResolverTests(unittest.TestCase):
             access_mode="ssh",
             shared_ssm_clients_security_group_id="sg-ssm",
             shared_ssm_instance_profile_arn="arn:aws:iam::111111111111:instance-profile/ssm",
+            package_cache=False,
+            container_cache=False,
+            volume_preread=False,
             environment_spec=ENVIRONMENT_SPEC,
             env=environment_obj,
         )
@@ -142,6 +148,8 @@ class AppResolverTests(unittest.TestCase):
         network_stack_mock.assert_called_once_with(
             app_instance,
             "Env4aiNetworkStack",
+            package_cache=False,
+            container_cache_credential_arn=None,
             env=environment_obj,
         )
         stack_mock.assert_called_once_with(
@@ -150,6 +158,7 @@ class AppResolverTests(unittest.TestCase):
             shared_igw_id="igw",
             shared_vpc_id="vpc-123",
             shared_vpc_cidr_block="10.0.0.0/16",
+            availability_zone_indexes=None,
             ami_id_override="ami-override123",
             bootstrap_on_restored_ami=False,
             verbose_bootstrap_resolution=False,
@@ -157,6 +166,9 @@ class AppResolverTests(unittest.TestCase):
             access_mode="ssh",
             shared_ssm_clients_security_group_id="sg-ssm",
             shared_ssm_instance_profile_arn="arn:aws:iam::111111111111:instance-profile/ssm",
+            package_cache=False,
+            container_cache=False,
+            volume_preread=False,
             environment_spec=ENVIRONMENT_SPEC,
             env=environment_obj,
         )
@@ -188,6 +200,8 @@ class AppResolverTests(unittest.TestCase):
         network_stack_mock.assert_called_once_with(
             app_instance,
             "Env4aiNetworkStack",
+            package_cache=False,
+            container_cache_credential_arn=None,
             env=environment_obj,
         )
         stack_mock.assert_called_once_with(
@@ -196,6 +210,7 @@ class AppResolverTests(unittest.TestCase):
             shared_igw_id="igw",
             shared_vpc_id="vpc-123",
             shared_vpc_cidr_block="10.0.0.0/16",
+            availability_zone_indexes=None,
             ami_id_override=None,
             bootstrap_on_restored_ami=False,
             verbose_bootstrap_resolution=True,
@@ -203,6 +218,9 @@ class AppResolverTests(unittest.TestCase):
             access_mode="ssh",
             shared_ssm_clients_security_group_id="sg-ssm",
             shared_ssm_instance_profile_arn="arn:aws:iam::111111111111:instance-profile/ssm",
+            package_cache=False,
+            container_cache=False,
+            volume_preread=False,
             environment_spec=ENVIRONMENT_SPEC,
             env=environment_obj,
         )
@@ -234,10 +252,61 @@ class AppResolverTests(unittest.TestCase):
         network_stack_mock.assert_called_once_with(
             app_instance,
             "Env4aiNetworkStack",
+            package_cache=False,
+            container_cache_credential_arn=None,
             env=environment_obj,
         )
         self.assertEqual("ssm", stack_mock.call_args.kwargs["access_mode"])
 
+    def test_main_passes_availability_zone_indexes_from_context(self) -> None:
+        """Expected: the deploy-selected zone indexes reach the workstation stack."""
+        app_instance = Mock()
+        app_instance.node.try_get_context.side_effect = (
+            lambda key: "2,0" if key == "availability_zone_indexes" else None
+        )
+
+        with (
+            patch("app.cdk.App", return_value=app_instance),
+            patch("app.cdk.Environment", return_value=Mock()),
+            patch("app.get_account", return_value="111111111111"),
+            patch("app.get_region", return_value="us-west-2"),
+            patch("app.get_shared_network_config", return_value=Mock(stack_name="Env4aiNetworkStack")),
+            patch("app.Env4aiNetworkStack"),
+            patch(
+                "app.load_shared_network_imports",
+                return_value=self._shared_network_imports(),
+            ),
+            patch("app.WorkstationStack") as stack_mock,
+        ):
+            base_app.main()
+
+        self.assertEqual((2, 0), stack_mock.call_args.kwargs["availability_zone_indexes"])
+
+    def test_main_passes_package_cache_from_context(self) -> None:
+        """Expected: the package_cache context reaches the network and workstation stacks."""
+        app_instance = Mock()
+        app_instance.node.try_get_context.side_effect = (
+            lambda key: "true" if key == "package_cache" else None
+        )
+
+        with (
+            patch("app.cdk.App", return_value=app_instance),
+            patch("app.cdk.Environment", return_value=Mock()),
+            patch("app.get_account", return_value="111111111111"),
+            patch("app.get_region", return_value="us-west-2"),
+            patch("app.get_shared_network_config", return_value=Mock(stack_name="Env4aiNetworkStack")),
+            patch("app.Env4aiNetworkStack") as network_stack_mock,
+            patch(
+                "app.load_shared_network_imports",
+                return_value=self._shared_network_imports(),
+            ),
+            patch("app.WorkstationStack") as stack_mock,
+        ):
+            base_app.main()
+
+        self.assertTrue(network_stack_mock.call_args.kwargs["package_cache"])
+        self.assertTrue(stack_mock.call_args.kwargs["package_cache"])
+
     def test_main_propagates_account_resolution_failure(self) -> None:
         """Failure: account resolution error bubbles up and aborts synth."""
         app_instance = Mock()
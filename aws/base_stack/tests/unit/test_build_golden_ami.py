@@ -0,0 +1,60 @@
+"""Unit tests for the build_golden_ami wrapper script."""
+
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+import unittest
+from unittest.mock import Mock, patch
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+
+from build_golden_ami import main  # noqa: E402
+
+
+class BuildGoldenAmiScriptTests(unittest.TestCase):
+    """Validate golden AMI build wrapper behavior."""
+
+    @staticmethod
+    def _argv(*extra: str) -> list[str]:
+        """Return common args for golden AMI build tests."""
+        return [
+            "--environment",
+            "test",
+            "--stack-dir",
+            "/tmp/test",
+            "--stack-name",
+            "TestWorkstationStack",
+            *extra,
+        ]
+
+    def test_main_builds_with_environment_spec_and_subnet_override(self) -> None:
+        """Expected: the build receives the loaded spec and the CLI subnet override."""
+        session = Mock(region_name="us-west-2")
+        environment_spec = Mock(environment_key="test")
+        with (
+            patch("build_golden_ami.load_environment_spec", return_value=environment_spec),
+            patch("build_golden_ami.build_golden_image", return_value="ami-golden") as build,
+            patch("builtins.print"),
+        ):
+            result = main(self._argv("--subnet-id", "subnet-1"), session=session)
+
+        self.assertEqual(0, result)
+        self.assertIs(environment_spec, build.call_args.kwargs["environment_spec"])
+        self.assertEqual("subnet-1", build.call_args.kwargs["subnet_id"])
+
+    def test_main_requires_environment_spec(self) -> None:
+        """Failure: environments without ENVIRONMENT_SPEC cannot build golden AMIs."""
+        session = Mock(region_name="us-west-2")
+        with (
+            patch("build_golden_ami.load_environment_spec", return_value=None),
+            patch("build_golden_ami.build_golden_image") as build,
+        ):
+            with self.assertRaisesRegex(RuntimeError, "No ENVIRONMENT_SPEC"):
+                main(self._argv(), session=session)
+
+        build.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -313,6 +313,139 @@ class CheckScriptTests(unittest.TestCase):
         self.assertEqual(0, result)
         self.assertIn("aws ssm start-session --region us-west-2 --profile sandbox --target i-123", stdout.getvalue())
 
+    def test_main_prints_bootstrap_timings_for_running_instance(self) -> None:
+        """Expected: the runner's console summary is rendered as a per-script table."""
+        args = type(
+            "Args",
+            (),
+            {
+                "region": "us-west-2",
+                "profile": None,
+                "stack_name": "TestWorkstationStack",
+                "spot_fleet_logical_id": "TestSpotFleet",
+                "ssh_host_alias": "test-workstation",
+                "ssh_user": "ubuntu",
+                "identity_file": "~/.ssh/aws_key.pem",
+                "access_mode": "ssm",
+                "eip_allocation_id": None,
+                "eip_public_ip": None,
+            },
+        )()
+        ec2_client = Mock()
+        ec2_client.get_console_output.return_value = {
+            "Output": "env4ai-bootstrap-summary: deps.sh=100,160,0 android.sh=160,460,0",
+        }
+        session = Mock()
+        session.client.side_effect = [ec2_client, Mock()]
+
+        with (
+            tempfile.TemporaryDirectory() as tmpdir,
+            patch("check_instance.DEFAULT_LIFECYCLE_TIMING_DIR", Path(tmpdir)),
+            patch("check_instance.parse_args", return_value=args),
+            patch("check_instance.get_region", return_value="us-west-2"),
+            patch("check_instance.boto3.Session", return_value=session),
+            patch("check_instance.get_spot_fleet_request_id", return_value="sfr-123"),
+            patch(
+                "check_instance.get_newest_instance_for_spot_fleet",
+                return_value={"InstanceId": "i-123", "State": {"Name": "running"}},
+            ),
+            patch("sys.stdout", new_callable=io.StringIO) as stdout,
+        ):
+            result = main()
+
+        self.assertEqual(0, result)
+        self.assertIn("Bootstrap timings (i-123, complete):", stdout.getvalue())
+        self.assertRegex(stdout.getvalue(), r"android\.sh\s+300s")
+
+    def test_main_fails_when_bootstrap_script_fails_while_waiting(self) -> None:
+        """Failure: --wait-for-bootstrap returns non-zero when a bootstrap script fails."""
+        args = type(
+            "Args",
+            (),
+            {
+                "region": "us-west-2",
+                "profile": None,
+                "stack_name": "TestWorkstationStack",
+                "spot_fleet_logical_id": "TestSpotFleet",
+                "ssh_host_alias": "test-workstation",
+                "ssh_user": "ubuntu",
+                "identity_file": "~/.ssh/aws_key.pem",
+                "access_mode": "ssh",
+                "eip_allocation_id": None,
+                "eip_public_ip": None,
+                "wait": False,
+                "wait_for_bootstrap": True,
+                "bootstrap_timeout": 120.0,
+            },
+        )()
+        session = Mock()
+        session.client.side_effect = [Mock(), Mock()]
+
+        with (
+            patch("check_instance.parse_args", return_value=args),
+            patch("check_instance.get_region", return_value="us-west-2"),
+            patch("check_instance.boto3.Session", return_value=session),
+            patch("check_instance.wait_for_workstation_ready", return_value=Mock(instance_id="i-123")),
+            patch("check_instance.print_connection_guidance"),
+            patch(
+                "check_instance.describe_bootstrap_launch",
+                return_value=Mock(instance_id="i-123", image_id="ami-base", has_runner=True),
+            ),
+            patch(
+                "check_instance.wait_for_bootstrap_complete",
+                side_effect=RuntimeError("Bootstrap script deps.sh exited with status 1 on i-123"),
+            ) as wait_for_bootstrap,
+            patch("sys.stdout", new_callable=io.StringIO) as stdout,
+        ):
+            result = main()
+
+        self.assertEqual(1, result)
+        self.assertEqual(120.0, wait_for_bootstrap.call_args.kwargs["timeout_seconds"])
+        self.assertIn("Error: Bootstrap script deps.sh exited with status 1", stdout.getvalue())
+
+    def test_main_skips_bootstrap_wait_without_a_runner(self) -> None:
+        """Edge: golden and restored launches have no bootstrap runner, so the wait is skipped."""
+        args = type(
+            "Args",
+            (),
+            {
+                "region": "us-west-2",
+                "profile": None,
+                "stack_name": "TestWorkstationStack",
+                "spot_fleet_logical_id": "TestSpotFleet",
+                "ssh_host_alias": "test-workstation",
+                "ssh_user": "ubuntu",
+                "identity_file": "~/.ssh/aws_key.pem",
+                "access_mode": "ssh",
+                "eip_allocation_id": None,
+                "eip_public_ip": None,
+                "wait": False,
+                "wait_for_bootstrap": True,
+                "bootstrap_timeout": 120.0,
+            },
+        )()
+        session = Mock()
+        session.client.side_effect = [Mock(), Mock()]
+
+        with (
+            patch("check_instance.parse_args", return_value=args),
+            patch("check_instance.get_region", return_value="us-west-2"),
+            patch("check_instance.boto3.Session", return_value=session),
+            patch("check_instance.wait_for_workstation_ready", return_value=Mock(instance_id="i-123")),
+            patch("check_instance.print_connection_guidance"),
+            patch(
+                "check_instance.describe_bootstrap_launch",
+                return_value=Mock(instance_id="i-123", image_id="ami-golden", has_runner=False),
+            ),
+            patch("check_instance.wait_for_bootstrap_complete") as wait_for_bootstrap,
+            patch("sys.stdout", new_callable=io.StringIO) as stdout,
+        ):
+            result = main()
+
+        self.assertEqual(0, result)
+        wait_for_bootstrap.assert_not_called()
+        self.assertIn("i-123 was launched from ami-golden without the user-data bootstrap", stdout.getvalue())
+
     def test_main_returns_failure_when_region_resolution_fails(self) -> None:
         """Failure: unresolved region returns non-zero and prints error."""
         args = type(
@@ -0,0 +1,41 @@
+"""Unit tests for the deploy_batch wrapper script."""
+
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+import unittest
+from unittest.mock import Mock, patch
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+
+from deploy_batch import main, parse_args  # noqa: E402
+
+
+class DeployBatchScriptTests(unittest.TestCase):
+    """Validate thin wrapper behavior for the deploy_batch script."""
+
+    def test_main_returns_failure_when_any_environment_fails(self) -> None:
+        """Failure: a single failed environment makes the batch exit non-zero."""
+        targets = [Mock(environment_key="gastown"), Mock(environment_key="builder")]
+        with (
+            patch("deploy_batch.discover_environments", return_value=[]),
+            patch("deploy_batch.resolve_batch_targets", return_value=targets),
+            patch(
+                "deploy_batch.run_batch_deploy",
+                return_value=[Mock(succeeded=True), Mock(succeeded=False)],
+            ) as run_batch_deploy,
+        ):
+            result = main(["gastown", "builder", "--max-workers", "2"])
+
+        self.assertEqual(1, result)
+        self.assertEqual(2, run_batch_deploy.call_args.kwargs["max_workers"])
+
+    def test_parse_args_rejects_non_positive_worker_limit(self) -> None:
+        """Edge: the worker limit must allow at least one deploy."""
+        with self.assertRaises(SystemExit):
+            parse_args(["gastown", "--max-workers", "0"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -43,7 +43,8 @@ class DeployWorkstationScriptTests(unittest.TestCase):
                 profile=None,
                 region=None,
                 access_mode=None,
-            )
+            ),
+            session=None,
         )
 
     def test_parse_args_accepts_optional_region_and_profile(self) -> None:
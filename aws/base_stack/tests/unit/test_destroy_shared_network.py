@@ -29,7 +29,7 @@ class DestroySharedNetworkScriptTests(unittest.TestCase):
             result = main(["--profile", "dev"])
 
         self.assertEqual(0, result)
-        destroy_shared_network_stack.assert_called_once_with(profile="dev", region=None)
+        destroy_shared_network_stack.assert_called_once_with(profile="dev", region=None, session=None)
 
     def test_main_propagates_destroy_failures(self) -> None:
         """Failure: shared-network teardown errors are not swallowed."""
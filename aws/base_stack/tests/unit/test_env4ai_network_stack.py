@@ -11,7 +11,7 @@ _BASE_STACK = Path(__file__).resolve().parents[2]
 sys.path.insert(0, str(_BASE_STACK))
 
 from workstation.env4ai_network_stack import Env4aiNetworkStack
-from workstation_core.config import get_shared_network_export_name
+from workstation_core.config import get_package_cache_bucket_name, get_shared_network_export_name
 
 
 class Env4aiNetworkStackTests(unittest.TestCase):
@@ -162,6 +162,126 @@ class Env4aiNetworkStackTests(unittest.TestCase):
             outputs["SsmInstanceProfileArn"]["Export"]["Name"],
         )
 
+    def test_network_stack_omits_package_cache_by_default(self) -> None:
+        """Edge: without the package cache flag no bucket or cache output is created."""
+        app = core.App()
+        stack = Env4aiNetworkStack(app, "Env4aiNetworkStack", env=self._test_env())
+        template = assertions.Template.from_stack(stack)
+
+        template.resource_count_is("AWS::S3::Bucket", 0)
+        self.assertNotIn("PackageCacheBucketName", template.to_json()["Outputs"])
+
+    def test_network_stack_creates_package_cache_bucket_for_the_instance_role(self) -> None:
+        """Expected: the package cache bucket is private and only open to the instance role in the shared VPC."""
+        app = core.App()
+        stack = Env4aiNetworkStack(app, "Env4aiNetworkStack", package_cache=True, env=self._test_env())
+        template = assertions.Template.from_stack(stack)
+        outputs = template.to_json()["Outputs"]
+        instance_role_id = stack.get_logical_id(stack.ssm_instance_role.node.default_child)
+
+        template.has_resource_properties(
+            "AWS::S3::Bucket",
+            {
+                "BucketName": get_package_cache_bucket_name("111111111111", "us-west-2"),
+                "PublicAccessBlockConfiguration": {
+                    "BlockPublicAcls": True,
+                    "BlockPublicPolicy": True,
+                    "IgnorePublicAcls": True,
+                    "RestrictPublicBuckets": True,
+                },
+            },
+        )
+        template.has_resource_properties(
+            "AWS::S3::BucketPolicy",
+            {
+                "PolicyDocument": {
+                    "Statement": assertions.Match.array_with(
+                        [
+                            assertions.Match.object_like(
+                                {
+                                    "Sid": "PackageCacheObjectsFromInstanceRole",
+                                    "Action": ["s3:GetObject", "s3:PutObject"],
+                                    "Principal": {"AWS": {"Fn::GetAtt": [instance_role_id, "Arn"]}},
+                                    "Condition": {
+                                        "StringEquals": {"aws:SourceVpc": assertions.Match.any_value()}
+                                    },
+                                }
+                            )
+                        ]
+                    )
+                }
+            },
+        )
+        statements = next(iter(template.find_resources("AWS::S3::BucketPolicy").values()))["Properties"][
+            "PolicyDocument"
+        ]["Statement"]
+        self.assertNotIn(
+            {"AWS": "*"},
+            [statement.get("Principal") for statement in statements if statement["Effect"] == "Allow"],
+        )
+        self.assertEqual(
+            get_shared_network_export_name("PackageCacheBucketName"),
+            outputs["PackageCacheBucketName"]["Export"]["Name"],
+        )
+
+    def test_network_stack_creates_container_pull_through_cache(self) -> None:
+        """Expected: Docker Hub and ECR Public rules with private ECR endpoints and pull permissions."""
+        app = core.App()
+        stack = Env4aiNetworkStack(
+            app,
+            "Env4aiNetworkStack",
+            container_cache_credential_arn="arn:aws:secretsmanager:us-west-2:111111111111:secret:x",
+            env=self._test_env(),
+        )
+        template = assertions.Template.from_stack(stack)
+        outputs = template.to_json()["Outputs"]
+
+        template.has_resource_properties(
+            "AWS::ECR::PullThroughCacheRule",
+            {
+                "EcrRepositoryPrefix": "docker-hub",
+                "UpstreamRegistryUrl": "registry-1.docker.io",
+                "CredentialArn": "arn:aws:secretsmanager:us-west-2:111111111111:secret:x",
+            },
+        )
+        template.has_resource_properties(
+            "AWS::ECR::PullThroughCacheRule",
+            {"EcrRepositoryPrefix": "ecr-public", "UpstreamRegistryUrl": "public.ecr.aws"},
+        )
+        for service in ("ecr.api", "ecr.dkr"):
+            template.has_resource_properties(
+                "AWS::EC2::VPCEndpoint",
+                {"ServiceName": f"com.amazonaws.us-west-2.{service}", "PrivateDnsEnabled": True},
+            )
+        template.has_resource_properties(
+            "AWS::IAM::Policy",
+            {
+                "PolicyDocument": {
+                    "Statement": assertions.Match.array_with(
+                        [
+                            assertions.Match.object_like(
+                                {"Action": "ecr:GetAuthorizationToken", "Resource": "*"}
+                            )
+                        ]
+                    )
+                }
+            },
+        )
+        self.assertEqual(
+            get_shared_network_export_name("ContainerCacheRegistry"),
+            outputs["ContainerCacheRegistry"]["Export"]["Name"],
+        )
+        self.assertNotIn("Export", outputs["ContainerCacheCredentialArn"])
+
+    def test_network_stack_omits_container_cache_by_default(self) -> None:
+        """Edge: without a Docker Hub credential no pull-through rules are created."""
+        app = core.App()
+        stack = Env4aiNetworkStack(app, "Env4aiNetworkStack", env=self._test_env())
+        template = assertions.Template.from_stack(stack)
+
+        template.resource_count_is("AWS::ECR::PullThroughCacheRule", 0)
+        self.assertNotIn("ContainerCacheRegistry", template.to_json()["Outputs"])
+
 
 if __name__ == "__main__":
     unittest.main()
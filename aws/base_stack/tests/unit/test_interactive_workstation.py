@@ -92,6 +92,36 @@ class InteractiveWorkstationScriptTests(unittest.TestCase):
         rendered = " ".join(str(args[0]) for args, _kwargs in mocked_print.call_args_list if args)
         self.assertIn("Unavailable: stack is already deployed.", rendered)
 
+    def test_run_action_loop_reuses_detail_lines_until_an_action_refreshes_them(self) -> None:
+        """Expected: redraws after a blocked choice skip the AWS detail lookups; refresh recomputes them."""
+        with (
+            patch(
+                "interactive_workstation.get_workstation_status",
+                return_value=WorkstationStatus(stack_state="not found", stack_status=None),
+            ),
+            patch(
+                "interactive_workstation._render_environment_details",
+                return_value="  Golden AMI: available (ami-golden, hash aaaaaaaaaaaa)\n",
+            ) as render_details,
+            patch("builtins.input", side_effect=["3", "6", "9"]),
+            patch(
+                "interactive_workstation.dispatch_action",
+                side_effect=[ActionResult(), ActionResult(should_quit=True)],
+            ) as dispatch,
+            patch("builtins.print") as mocked_print,
+        ):
+            result = _run_action_loop(
+                environment=self._environment(),
+                cloudformation_client=Mock(),
+                ec2_client=Mock(),
+            )
+
+        self.assertTrue(result.should_quit)
+        self.assertEqual(["refresh", "quit"], [call.args[0] for call in dispatch.call_args_list])
+        self.assertEqual(2, render_details.call_count)
+        rendered = [str(args[0]) for args, _kwargs in mocked_print.call_args_list if args]
+        self.assertEqual(3, sum("Golden AMI: available" in line for line in rendered))
+
 
 if __name__ == "__main__":
     unittest.main()
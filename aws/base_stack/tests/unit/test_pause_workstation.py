@@ -0,0 +1,88 @@
+"""Unit tests for the pause_workstation wrapper script."""
+
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+import unittest
+from unittest.mock import Mock, patch
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+
+from pause_workstation import main  # noqa: E402
+from workstation_core.pause import InstanceTransition, LifecycleTimings  # noqa: E402
+from workstation_core.readiness import WorkstationReadiness  # noqa: E402
+
+
+class PauseWorkstationScriptTests(unittest.TestCase):
+    """Validate pause/resume wrapper behavior."""
+
+    @staticmethod
+    def _argv(*extra: str) -> list[str]:
+        """Return common args for pause/resume tests."""
+        return [
+            "--environment",
+            "test",
+            "--stack-dir",
+            "/tmp/test",
+            "--stack-name",
+            "TestWorkstationStack",
+            *extra,
+        ]
+
+    def test_main_pauses_without_waiting_for_readiness(self) -> None:
+        """Expected: pause stops the instance and never starts the readiness wait."""
+        session = Mock(region_name="us-west-2")
+        with (
+            patch("pause_workstation.load_environment_spec", return_value=None),
+            patch(
+                "pause_workstation.pause_workstation",
+                return_value=InstanceTransition(instance_id="i-1", elapsed_seconds=31.0),
+            ) as pause,
+            patch("pause_workstation.wait_for_workstation_ready") as wait_for_ready,
+            patch("builtins.print") as mocked_print,
+        ):
+            result = main(self._argv(), session=session)
+
+        self.assertEqual(0, result)
+        self.assertEqual("TestSpotFleet", pause.call_args.kwargs["spot_fleet_logical_id"])
+        wait_for_ready.assert_not_called()
+        self.assertIn("Paused i-1 after 31s", mocked_print.call_args.args[0])
+
+    def test_main_resume_reassociates_eip_and_records_timing(self) -> None:
+        """Expected: resume starts the instance, waits with the Elastic IP and records the resume time."""
+        session = Mock(region_name="us-west-2")
+        eip_info = {"allocation_id": "eipalloc-1", "public_ip": "1.2.3.4"}
+        readiness = WorkstationReadiness("i-1", "1.2.3.4", True, False, 12.0)
+        with (
+            patch.dict("os.environ", {"ACCESS_MODE": "ssh"}),
+            patch("pause_workstation.load_environment_spec", return_value=None),
+            patch("pause_workstation.find_eip_by_name", return_value=eip_info),
+            patch("pause_workstation.start_paused_workstation", return_value="i-1") as start,
+            patch("pause_workstation.wait_for_workstation_ready", return_value=readiness) as wait_for_ready,
+            patch("pause_workstation.print_connection_guidance"),
+            patch("pause_workstation.record_lifecycle_timing") as record_timing,
+            patch(
+                "pause_workstation.load_lifecycle_timings",
+                return_value=LifecycleTimings(deploy_seconds=800.0, resume_seconds=40.0),
+            ),
+            patch("builtins.print") as mocked_print,
+        ):
+            result = main(self._argv("--resume"), session=session)
+
+        self.assertEqual(0, result)
+        start.assert_called_once()
+        self.assertEqual("eipalloc-1", wait_for_ready.call_args.kwargs["eip_allocation_id"])
+        self.assertEqual("resume", record_timing.call_args.kwargs["action"])
+        self.assertEqual("Last ready times: deploy 800s, resume 40s", mocked_print.call_args.args[0])
+
+    def test_main_raises_when_region_is_unresolvable(self) -> None:
+        """Failure: wrapper aborts before any EC2 call when region cannot be resolved."""
+        session = Mock(region_name=None)
+        with patch("pause_workstation.boto3.Session", return_value=session):
+            with self.assertRaisesRegex(RuntimeError, "Unable to resolve AWS region"):
+                main(self._argv())
+
+
+if __name__ == "__main__":
+    unittest.main()
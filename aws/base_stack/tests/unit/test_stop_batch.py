@@ -0,0 +1,39 @@
+"""Unit tests for the stop_batch wrapper script."""
+
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+import unittest
+from unittest.mock import Mock, patch
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+
+from stop_batch import main  # noqa: E402
+
+
+class StopBatchScriptTests(unittest.TestCase):
+    """Validate thin wrapper behavior for the stop_batch script."""
+
+    def test_main_passes_teardown_flags_and_reports_failures(self) -> None:
+        """Failure: a single environment left running makes the batch exit non-zero."""
+        targets = [Mock(environment_key="gastown"), Mock(environment_key="builder")]
+        with (
+            patch.dict("os.environ", {"EIP_DESTROY": "1"}),
+            patch("stop_batch.discover_environments", return_value=[]),
+            patch("stop_batch.resolve_batch_targets", return_value=targets),
+            patch(
+                "stop_batch.run_batch_stop",
+                return_value=[Mock(succeeded=True), Mock(succeeded=False)],
+            ) as run_batch_stop,
+        ):
+            result = main(["gastown", "builder", "--destroy-shared-network"])
+
+        self.assertEqual(1, result)
+        self.assertTrue(run_batch_stop.call_args.kwargs["destroy_eip"])
+        self.assertTrue(run_batch_stop.call_args.kwargs["destroy_shared_network"])
+        self.assertIsNone(run_batch_stop.call_args.kwargs["max_workers"])
+
+
+if __name__ == "__main__":
+    unittest.main()
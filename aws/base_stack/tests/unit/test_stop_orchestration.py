@@ -82,6 +82,29 @@ class StopOrchestrationTests(unittest.TestCase):
             calls,
         )
 
+    def test_run_stop_orchestration_fast_stop_destroys_once_snapshots_start(self) -> None:
+        """Edge: fast stop skips the availability wait and records the pending AMI."""
+        wait_for_image = Mock()
+        wait_for_snapshots = Mock(return_value=("snap-1", "snap-2"))
+        record_pending = Mock()
+        destroy_stack = Mock()
+
+        saved_image_id = run_stop_orchestration(
+            _inputs(ami_save=True, ami_tag="20260302", fast_stop=True),
+            resolve_running_instance_id=Mock(return_value="i-abc"),
+            create_image=Mock(return_value="ami-new"),
+            wait_for_image_available=wait_for_image,
+            destroy_stack=destroy_stack,
+            wait_for_image_snapshots=wait_for_snapshots,
+            record_pending_image=record_pending,
+        )
+
+        self.assertEqual("ami-new", saved_image_id)
+        wait_for_image.assert_not_called()
+        wait_for_snapshots.assert_called_once_with("ami-new")
+        record_pending.assert_called_once_with("ami-new", "test_20260302", ("snap-1", "snap-2"))
+        destroy_stack.assert_called_once_with()
+
     def test_run_stop_orchestration_aborts_destroy_when_save_fails(self) -> None:
         """Failure: destroy is blocked when save-on-stop fails."""
         destroy_stack = Mock()
@@ -31,6 +31,7 @@ class StopWorkstationScriptTests(unittest.TestCase):
                 "profile": None,
                 "region": None,
                 "destroy_eip": False,
+                "fast_stop": False,
             },
         )()
 
@@ -71,6 +72,28 @@ class StopWorkstationScriptTests(unittest.TestCase):
         self.assertEqual("release-a", inputs.ami_tag)
         self.assertEqual("test", inputs.environment_key)
 
+    def test_main_enables_fast_stop_from_environment(self) -> None:
+        """Edge: AMI_FAST_STOP=1 switches the save to the snapshot-start wait."""
+        session = Mock()
+        session.region_name = "us-west-2"
+        session.client.side_effect = [Mock(), Mock()]
+        with (
+            patch.dict("os.environ", {"AMI_FAST_STOP": "1"}),
+            patch("stop_workstation.parse_args", return_value=self._args()),
+            patch("stop_workstation.parse_stop_ami_config", return_value=(True, "release-a")),
+            patch("stop_workstation.boto3.Session", return_value=session),
+            patch("stop_workstation.run_stop_orchestration", return_value="ami-1") as run_orchestration,
+            patch("stop_workstation.record_pending_ami") as record_pending_ami,
+            patch("builtins.print"),
+        ):
+            result = main()
+            run_orchestration.call_args.kwargs["record_pending_image"]("ami-1", "test_release-a", ("snap-1",))
+
+        self.assertEqual(0, result)
+        self.assertTrue(run_orchestration.call_args.args[0].fast_stop)
+        self.assertIsNotNone(run_orchestration.call_args.kwargs["wait_for_image_snapshots"])
+        self.assertEqual(("snap-1",), record_pending_ami.call_args.kwargs["snapshot_ids"])
+
     def test_main_passes_release_eip_callback_when_destroy_eip_flag_set(self) -> None:
         """Expected: destroy-eip flag causes a release_eip callback to be passed to orchestration."""
         args = type(
@@ -84,6 +107,7 @@ class StopWorkstationScriptTests(unittest.TestCase):
                 "profile": None,
                 "region": None,
                 "destroy_eip": True,
+                "fast_stop": False,
             },
         )()
         session = Mock()
@@ -117,6 +141,7 @@ class StopWorkstationScriptTests(unittest.TestCase):
                 "profile": None,
                 "region": None,
                 "destroy_eip": True,
+                "fast_stop": False,
             },
         )()
         session = Mock()
@@ -21,7 +21,9 @@ from aws_cdk.assertions import Match
 
 from workstation.workstation_stack import WorkstationStack
 from workstation.env4ai_network_stack import Env4aiNetworkStack
-from workstation_core import AmiSelectorConfig, EnvironmentSpec
+from dataclasses import replace
+
+from workstation_core import AmiSelectorConfig, EnvironmentSpec, InstanceTypeOption, cdk_helpers
 from workstation_core.cdk_helpers import resolve_ami_id, resolve_subnet_availability_zone
 
 # A deterministic spec so resource logical IDs are predictable in assertions.
@@ -118,6 +120,45 @@ class WorkstationStackTests(unittest.TestCase):
             },
         )
 
+    def test_multi_az_spec_creates_a_subnet_and_association_per_zone(self) -> None:
+        """Expected: the split CIDRs land in the selected zones and the fleet sees every subnet."""
+        app = core.App()
+        stack = self._make_stack(
+            app,
+            "aws-workstation-multi-az",
+            environment_spec=replace(TEST_SPEC, availability_zone_count=2),
+            availability_zone_indexes=(2, 0),
+        )
+        template = assertions.Template.from_stack(stack)
+        template_json = template.to_json()
+
+        template.resource_count_is("AWS::EC2::Subnet", 2)
+        template.resource_count_is("AWS::EC2::SubnetRouteTableAssociation", 2)
+        self.assertEqual(
+            {"10.0.99.0/25": 2, "10.0.99.128/25": 0},
+            {
+                subnet["Properties"]["CidrBlock"]: subnet["Properties"]["AvailabilityZone"]["Fn::Select"][0]
+                for subnet in template.find_resources("AWS::EC2::Subnet").values()
+            },
+        )
+        launch_spec = template_json["Resources"]["TestSpotFleet"]["Properties"][
+            "SpotFleetRequestConfigData"
+        ]["LaunchSpecifications"][0]
+        self.assertEqual(
+            {"Fn::Join": [",", [{"Ref": "TestSubnet"}, {"Ref": "TestSubnet2"}]]},
+            launch_spec["SubnetId"],
+        )
+
+    def test_multi_az_spec_rejects_index_count_mismatch(self) -> None:
+        """Failure: one zone index is required per subnet."""
+        with self.assertRaisesRegex(ValueError, "one index per environment subnet"):
+            self._make_stack(
+                core.App(),
+                "aws-workstation-multi-az-mismatch",
+                environment_spec=replace(TEST_SPEC, availability_zone_count=2),
+                availability_zone_indexes=(1,),
+            )
+
     def test_resolve_subnet_availability_zone_raises_on_negative_index(self) -> None:
         """Failure: negative AZ index is rejected with a clear error."""
         with self.assertRaisesRegex(
@@ -147,6 +188,50 @@ class WorkstationStackTests(unittest.TestCase):
             },
         )
 
+    def test_spot_fleet_is_capacity_optimized_without_rebalancing(self) -> None:
+        """Expected: the fleet picks the deepest pool and never launches a second workstation."""
+        app = core.App()
+        stack = self._make_stack(app, "aws-workstation-capacity-optimized")
+        template = assertions.Template.from_stack(stack)
+
+        template.has_resource_properties(
+            "AWS::EC2::SpotFleet",
+            {
+                "SpotFleetRequestConfigData": {
+                    "AllocationStrategy": "capacityOptimized",
+                    "SpotMaintenanceStrategies": Match.absent(),
+                }
+            },
+        )
+
+    def test_spot_fleet_stops_instances_on_interruption(self) -> None:
+        """Expected: a maintain fleet stops (not terminates) so pause/resume keeps the instance."""
+        app = core.App()
+        stack = self._make_stack(app, "aws-workstation-stop-interruption")
+        template = assertions.Template.from_stack(stack)
+
+        template.has_resource_properties(
+            "AWS::EC2::SpotFleet",
+            {"SpotFleetRequestConfigData": {"Type": "maintain", "InstanceInterruptionBehavior": "stop"}},
+        )
+
+    def test_fallback_instance_types_emit_one_weighted_launch_spec_each(self) -> None:
+        """Expected: each acceptable instance type gets its own launch specification, in order."""
+        app = core.App()
+        spec = replace(
+            TEST_SPEC,
+            fallback_instance_types=(InstanceTypeOption("t3a.micro"), InstanceTypeOption("t3.small", weight=2)),
+        )
+        stack = self._make_stack(app, "aws-workstation-fallback-types", environment_spec=spec)
+        launch_specs = assertions.Template.from_stack(stack).to_json()["Resources"]["TestSpotFleet"]["Properties"][
+            "SpotFleetRequestConfigData"
+        ]["LaunchSpecifications"]
+
+        self.assertEqual(
+            [("t3.micro", 1), ("t3a.micro", 1), ("t3.small", 2)],
+            [(launch_spec["InstanceType"], launch_spec["WeightedCapacity"]) for launch_spec in launch_specs],
+        )
+
     def test_ssm_mode_omits_ssh_ingress_and_key_name(self) -> None:
         """Expected: SSM-only mode avoids SSH ingress and EC2 key requirements."""
         app = core.App()
@@ -480,6 +565,23 @@ class WorkstationStackTests(unittest.TestCase):
 
         self.assertIn("UserData", launch_spec)
 
+    def test_restored_ami_path_adds_volume_preread_userdata(self) -> None:
+        """Expected: a restored-AMI deploy with volume pre-read gets user data without the bootstrap."""
+        app = core.App()
+        stack = self._make_stack(
+            app,
+            "aws-workstation-restored-preread",
+            ami_id_override="ami-restored003",
+            volume_preread=True,
+        )
+        template_dict = assertions.Template.from_stack(stack).to_json()
+        launch_spec = template_dict["Resources"]["TestSpotFleet"]["Properties"][
+            "SpotFleetRequestConfigData"
+        ]["LaunchSpecifications"][0]
+
+        self.assertIn("UserData", launch_spec)
+        cdk_helpers.build_bootstrap_user_data.assert_not_called()
+
     def test_stack_uses_shared_network_resources_instead_of_creating_vpc_and_igw(self) -> None:
         """Expected: environment stacks only create tenant resources inside the shared VPC."""
         app = core.App()
@@ -506,6 +608,94 @@ class WorkstationStackTests(unittest.TestCase):
             {"CidrBlock": TEST_SPEC.subnet_cidr},
         )
 
+    def test_package_cache_adds_s3_gateway_endpoint_and_cache_runner(self) -> None:
+        """Expected: the package cache routes S3 through the stack's route table and bootstraps with it."""
+        app = core.App()
+        stack = self._make_stack(app, "aws-workstation-package-cache", package_cache=True)
+        template = assertions.Template.from_stack(stack)
+        launch_spec = template.to_json()["Resources"]["TestSpotFleet"]["Properties"][
+            "SpotFleetRequestConfigData"
+        ]["LaunchSpecifications"][0]
+
+        template.has_resource_properties(
+            "AWS::EC2::VPCEndpoint",
+            {
+                "ServiceName": "com.amazonaws.us-west-2.s3",
+                "VpcEndpointType": "Gateway",
+                "RouteTableIds": Match.array_with([{"Ref": Match.any_value()}]),
+            },
+        )
+        # Reason: conftest stubs user-data rendering, so assert on the URL handed to it.
+        self.assertEqual(
+            "https://env4ai-package-cache-111111111111-us-west-2.s3.us-west-2.amazonaws.com/test",
+            cdk_helpers.build_bootstrap_user_data.call_args.kwargs["package_cache_url"],
+        )
+        # Reason: the bucket only accepts requests signed by the shared instance role.
+        self.assertIn("IamInstanceProfile", launch_spec)
+
+    def test_package_cache_requires_shared_instance_profile(self) -> None:
+        """Failure: cache requests cannot be signed without the shared instance profile."""
+        app = core.App()
+        network_stack = Env4aiNetworkStack(app, "network", env=self._test_env())
+
+        with self.assertRaisesRegex(ValueError, "required for the package cache"):
+            WorkstationStack(
+                app,
+                "aws-workstation-package-cache-no-profile",
+                shared_vpc=network_stack.vpc,
+                shared_igw_id=network_stack.internet_gateway.ref,
+                environment_spec=TEST_SPEC,
+                package_cache=True,
+                env=self._test_env(),
+            )
+
+    def test_container_cache_pulls_declared_images_through_ecr(self) -> None:
+        """Expected: the container cache attaches the instance profile and rewrites Docker Hub images."""
+        app = core.App()
+        spec = replace(
+            TEST_SPEC,
+            bootstrap_files=("docker.sh",),
+            container_images=("postgres:17@sha256:abc", "ghcr.io/org/tool:1"),
+        )
+        stack = self._make_stack(app, "aws-workstation-container-cache", environment_spec=spec, container_cache=True)
+        template_json = assertions.Template.from_stack(stack).to_json()
+        launch_spec = template_json["Resources"]["TestSpotFleet"]["Properties"][
+            "SpotFleetRequestConfigData"
+        ]["LaunchSpecifications"][0]
+        registry = "111111111111.dkr.ecr.us-west-2.amazonaws.com"
+        user_data_kwargs = cdk_helpers.build_bootstrap_user_data.call_args.kwargs
+
+        self.assertIn("IamInstanceProfile", launch_spec)
+        self.assertEqual(registry, user_data_kwargs["container_registry"])
+        self.assertEqual(
+            (f"{registry}/docker-hub/library/postgres:17 postgres:17@sha256:abc", "ghcr.io/org/tool:1"),
+            user_data_kwargs["container_images"],
+        )
+
+    def test_container_cache_requires_shared_instance_profile(self) -> None:
+        """Failure: instances cannot authenticate to ECR without the shared instance profile."""
+        app = core.App()
+        network_stack = Env4aiNetworkStack(app, "network", env=self._test_env())
+
+        with self.assertRaisesRegex(ValueError, "required for the container cache"):
+            WorkstationStack(
+                app,
+                "aws-workstation-container-cache-no-profile",
+                shared_vpc=network_stack.vpc,
+                shared_igw_id=network_stack.internet_gateway.ref,
+                environment_spec=TEST_SPEC,
+                container_cache=True,
+                env=self._test_env(),
+            )
+
+    def test_stack_omits_s3_gateway_endpoint_without_package_cache(self) -> None:
+        """Edge: workstations only get an S3 endpoint when the package cache is enabled."""
+        app = core.App()
+        stack = self._make_stack(app, "aws-workstation-no-package-cache")
+        template = assertions.Template.from_stack(stack)
+
+        template.resource_count_is("AWS::EC2::VPCEndpoint", 0)
+
 
 if __name__ == "__main__":
     unittest.main()
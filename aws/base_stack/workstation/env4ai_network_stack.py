@@ -2,13 +2,31 @@
 
 from __future__ import annotations
 
-from aws_cdk import Annotations, CfnOutput, Fn, Stack, Tags, aws_ec2 as ec2, aws_iam as iam
+from aws_cdk import (
+    Annotations,
+    CfnOutput,
+    Duration,
+    Fn,
+    RemovalPolicy,
+    Stack,
+    Tags,
+    aws_ec2 as ec2,
+    aws_ecr as ecr,
+    aws_iam as iam,
+    aws_s3 as s3,
+)
 from constructs import Construct
 
 from workstation_core import get_shared_network_config
-from workstation_core.config import get_shared_network_export_name
+from workstation_core.config import (
+    get_container_cache_registry,
+    get_package_cache_bucket_name,
+    get_shared_network_export_name,
+)
+from workstation_core.container_cache import CONTAINER_CACHE_UPSTREAMS
 
 _SSM_ENDPOINT_SUBNET_CIDR = "10.0.250.0/24"
+_PACKAGE_CACHE_EXPIRATION_DAYS = 30
 _EC2MESSAGES_UNSUPPORTED_REGIONS = frozenset(
     {
         "ap-east-2",
@@ -29,12 +47,24 @@ def _supports_ec2messages_endpoint(region: str) -> bool:
 class Env4aiNetworkStack(Stack):
     """Shared network stack for all workstation environments."""
 
-    def __init__(self, scope: Construct, construct_id: str, **kwargs) -> None:
+    def __init__(
+        self,
+        scope: Construct,
+        construct_id: str,
+        package_cache: bool = False,
+        container_cache_credential_arn: str | None = None,
+        **kwargs,
+    ) -> None:
         """Create the shared VPC and Internet Gateway resources.
 
         Args:
             scope: Construct scope.
             construct_id: Logical construct id.
+            package_cache: Whether to create the S3 package cache bucket that
+                workstations in the shared VPC restore package manager caches from.
+            container_cache_credential_arn: Secrets Manager ARN of the Docker Hub
+                credentials; when set, an ECR pull-through cache for Docker Hub and
+                ECR Public is created with ``ecr.api``/``ecr.dkr`` endpoints.
             **kwargs: Additional ``Stack`` keyword args.
         """
         super().__init__(scope, construct_id, **kwargs)
@@ -137,6 +167,12 @@ class Env4aiNetworkStack(Stack):
                 "Skipping ec2messages endpoint because this region does not support it."
             )
 
+        self.package_cache_bucket: s3.Bucket | None = None
+        if package_cache:
+            self.package_cache_bucket = self._create_package_cache_bucket()
+        if container_cache_credential_arn:
+            self._create_container_cache(container_cache_credential_arn)
+
         CfnOutput(
             self,
             "VpcId",
@@ -172,3 +208,128 @@ class Env4aiNetworkStack(Stack):
             description="Shared EC2 instance profile for Session Manager access.",
             export_name=get_shared_network_export_name("SsmInstanceProfileArn"),
         )
+        if self.package_cache_bucket is not None:
+            CfnOutput(
+                self,
+                "PackageCacheBucketName",
+                value=self.package_cache_bucket.bucket_name,
+                description="Shared package cache bucket reachable from the env4ai VPC.",
+                export_name=get_shared_network_export_name("PackageCacheBucketName"),
+            )
+        if container_cache_credential_arn:
+            CfnOutput(
+                self,
+                "ContainerCacheRegistry",
+                value=get_container_cache_registry(Stack.of(self).account, Stack.of(self).region),
+                description="ECR registry that serves the shared container pull-through cache.",
+                export_name=get_shared_network_export_name("ContainerCacheRegistry"),
+            )
+            CfnOutput(
+                self,
+                "ContainerCacheCredentialArn",
+                value=container_cache_credential_arn,
+                description="Secrets Manager secret with the Docker Hub credentials of the pull-through cache.",
+            )
+
+    def _create_package_cache_bucket(self) -> s3.Bucket:
+        """Create the package cache bucket, readable and writable only by the shared instance role."""
+        stack = Stack.of(self)
+        bucket = s3.Bucket(
+            self,
+            "PackageCacheBucket",
+            bucket_name=get_package_cache_bucket_name(stack.account, stack.region),
+            block_public_access=s3.BlockPublicAccess.BLOCK_ALL,
+            encryption=s3.BucketEncryption.S3_MANAGED,
+            enforce_ssl=True,
+            object_ownership=s3.ObjectOwnership.BUCKET_OWNER_ENFORCED,
+            # Reason: archives are rewritten whenever a bootstrap adds packages, so
+            # only caches no environment has touched for a month expire.
+            lifecycle_rules=[s3.LifecycleRule(expiration=Duration.days(_PACKAGE_CACHE_EXPIRATION_DAYS))],
+            removal_policy=RemovalPolicy.DESTROY,
+            auto_delete_objects=True,
+        )
+        # Reason: every workstation restores these archives as root, so only SigV4 requests
+        # signed by the shared instance role, arriving through the shared VPC's S3 gateway
+        # endpoint, may read or replace them. Each environment uses its own key prefix.
+        source_vpc_condition = {"StringEquals": {"aws:SourceVpc": self.vpc.vpc_id}}
+        bucket.add_to_resource_policy(
+            iam.PolicyStatement(
+                sid="PackageCacheObjectsFromInstanceRole",
+                principals=[self.ssm_instance_role],
+                actions=["s3:GetObject", "s3:PutObject"],
+                resources=[bucket.arn_for_objects("*")],
+                conditions=source_vpc_condition,
+            )
+        )
+        bucket.add_to_resource_policy(
+            iam.PolicyStatement(
+                sid="PackageCacheListFromInstanceRole",
+                principals=[self.ssm_instance_role],
+                actions=["s3:ListBucket"],
+                resources=[bucket.bucket_arn],
+                conditions=source_vpc_condition,
+            )
+        )
+        return bucket
+
+    def _create_container_cache(self, credential_arn: str) -> None:
+        """Create the ECR pull-through cache rules, endpoints and instance permissions."""
+        for prefix, upstream_url in CONTAINER_CACHE_UPSTREAMS.items():
+            rule = ecr.CfnPullThroughCacheRule(
+                self,
+                f"PullThroughCache{''.join(part.capitalize() for part in prefix.split('-'))}",
+                ecr_repository_prefix=prefix,
+                upstream_registry_url=upstream_url,
+            )
+            if prefix == "docker-hub":
+                # Reason: ECR requires credentials for Docker Hub; ECR Public is anonymous. The
+                # pinned aws-cdk-lib predates the CredentialArn property, so it is set directly.
+                rule.add_property_override("CredentialArn", credential_arn)
+
+        container_endpoints_sg = ec2.SecurityGroup(
+            self,
+            "ContainerCacheEndpointsSecurityGroup",
+            vpc=self.vpc,
+            allow_all_outbound=True,
+            description="Shared interface endpoint security group for ECR access.",
+        )
+        # Reason: every workstation pulls images, not only the SSM clients.
+        container_endpoints_sg.add_ingress_rule(
+            ec2.Peer.ipv4(self.vpc.vpc_cidr_block),
+            ec2.Port.tcp(443),
+            "Allow HTTPS from the shared VPC",
+        )
+        endpoint_subnets = ec2.SubnetSelection(subnets=[self.ssm_endpoint_subnet])
+        for endpoint_id, service in (
+            ("EcrApiEndpoint", ec2.InterfaceVpcEndpointAwsService.ECR),
+            ("EcrDockerEndpoint", ec2.InterfaceVpcEndpointAwsService.ECR_DOCKER),
+        ):
+            ec2.InterfaceVpcEndpoint(
+                self,
+                endpoint_id,
+                vpc=self.vpc,
+                service=service,
+                subnets=endpoint_subnets,
+                security_groups=[container_endpoints_sg],
+                private_dns_enabled=True,
+            )
+
+        stack = Stack.of(self)
+        self.ssm_instance_role.add_to_policy(
+            iam.PolicyStatement(actions=["ecr:GetAuthorizationToken"], resources=["*"])
+        )
+        self.ssm_instance_role.add_to_policy(
+            iam.PolicyStatement(
+                actions=[
+                    "ecr:BatchCheckLayerAvailability",
+                    "ecr:BatchGetImage",
+                    "ecr:GetDownloadUrlForLayer",
+                    "ecr:BatchImportUpstreamImage",
+                    "ecr:CreateRepository",
+                ],
+                resources=[
+                    f"arn:{stack.partition}:ecr:{stack.region}:{stack.account}:repository/{prefix}/*"
+                    for prefix in CONTAINER_CACHE_UPSTREAMS
+                ],
+            )
+        )
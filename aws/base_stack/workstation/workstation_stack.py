@@ -1,16 +1,20 @@
 from aws_cdk import (
     CfnOutput,
     CfnTag,
+    Fn,
     Stack,
     aws_ec2 as ec2,
 )
 from constructs import Construct
-from typing import Literal
+from typing import Literal, Sequence
 
 from environment_config import ENVIRONMENT_SPEC
 from workstation_core import EnvironmentSpec
+from workstation_core.config import get_container_cache_registry, get_package_cache_bucket_name
+from workstation_core.container_cache import container_pull_references
 from workstation_core.cdk_helpers import (
     build_spot_fleet_launch_specification,
+    expand_launch_specification_for_instance_types,
     resolve_ami_id,
     resolve_subnet_availability_zone,
 )
@@ -32,6 +36,7 @@ class WorkstationStack(Stack):
         shared_vpc_id: str | None = None,
         shared_vpc_cidr_block: str | None = None,
         availability_zone_index: int = 0,
+        availability_zone_indexes: Sequence[int] | None = None,
         ami_id_override: str | None = None,
         ami_source: Literal["default", "selected"] | None = None,
         selected_ami_id: str | None = None,
@@ -42,6 +47,9 @@ class WorkstationStack(Stack):
         public_ip_enabled: bool | None = None,
         shared_ssm_clients_security_group_id: str | None = None,
         shared_ssm_instance_profile_arn: str | None = None,
+        package_cache: bool = False,
+        container_cache: bool = False,
+        volume_preread: bool = False,
         environment_spec: EnvironmentSpec = ENVIRONMENT_SPEC,
         **kwargs,
     ) -> None:
@@ -54,7 +62,10 @@ class WorkstationStack(Stack):
             shared_igw_id: Shared Internet Gateway id from ``Env4aiNetworkStack``.
             shared_vpc_id: Shared VPC id used when the stack must import the VPC internally.
             shared_vpc_cidr_block: Shared VPC CIDR used with ``shared_vpc_id`` imports.
-            availability_zone_index: Selected AZ index for workstation subnet.
+            availability_zone_index: Selected AZ index for the first workstation subnet;
+                further subnets use the following indexes.
+            availability_zone_indexes: Explicit AZ index per workstation subnet,
+                overriding ``availability_zone_index``.
             ami_id_override: Optional explicit AMI ID used for deploy-time restore flows.
             ami_source: AMI source mode for workstation launch. When unset, legacy
                 ``ami_id_override`` behavior is preserved.
@@ -66,6 +77,14 @@ class WorkstationStack(Stack):
             public_ip_enabled: Explicit public IPv4 mapping override for outbound access.
             shared_ssm_clients_security_group_id: Shared SSM client SG ID from network stack.
             shared_ssm_instance_profile_arn: Shared SSM instance profile ARN from network stack.
+            package_cache: Route S3 through a gateway endpoint and have the bootstrap
+                restore package manager caches from the environment's prefix in the
+                shared package cache bucket, attaching the shared instance profile
+                whose role signs those requests.
+            container_cache: Pull the environment's container images through the shared
+                ECR pull-through cache, attaching the shared instance profile for ECR access.
+            volume_preread: Read the whole root volume in the background after launch so
+                blocks restored from the AMI's snapshots are loaded before first use.
             environment_spec: Canonical environment configuration and naming source.
             **kwargs: Additional ``Stack`` keyword args.
         """
@@ -82,6 +101,10 @@ class WorkstationStack(Stack):
                 raise ValueError(
                     "shared_ssm_instance_profile_arn is required for access_mode 'ssm' or 'both'"
                 )
+        if container_cache and not shared_ssm_instance_profile_arn:
+            raise ValueError("shared_ssm_instance_profile_arn is required for the container cache")
+        if package_cache and not shared_ssm_instance_profile_arn:
+            raise ValueError("shared_ssm_instance_profile_arn is required for the package cache")
         resolved_shared_vpc = shared_vpc
         if resolved_shared_vpc is None:
             if not shared_vpc_id:
@@ -110,12 +133,23 @@ class WorkstationStack(Stack):
                 description="Elastic IP allocation ID associated with this workstation.",
             )
 
-        local_zone_subnet = ec2.CfnSubnet(self, environment_spec.construct_id("Subnet"),
-            availability_zone=resolve_subnet_availability_zone(availability_zone_index),
-            cidr_block=environment_spec.subnet_cidr,
-            vpc_id=resolved_shared_vpc.vpc_id,
-            map_public_ip_on_launch=public_ip_enabled
-        )
+        subnet_cidrs = environment_spec.subnet_cidrs
+        if availability_zone_indexes is None:
+            availability_zone_indexes = [availability_zone_index + offset for offset in range(len(subnet_cidrs))]
+        if len(availability_zone_indexes) != len(subnet_cidrs):
+            raise ValueError("availability_zone_indexes must list one index per environment subnet")
+
+        # Reason: the first subnet keeps its original construct id so single-AZ stacks are unchanged.
+        subnet_suffixes = ["" if position == 0 else str(position + 1) for position in range(len(subnet_cidrs))]
+        workstation_subnets = [
+            ec2.CfnSubnet(self, environment_spec.construct_id(f"Subnet{suffix}"),
+                availability_zone=resolve_subnet_availability_zone(zone_index),
+                cidr_block=subnet_cidr,
+                vpc_id=resolved_shared_vpc.vpc_id,
+                map_public_ip_on_launch=public_ip_enabled
+            )
+            for suffix, zone_index, subnet_cidr in zip(subnet_suffixes, availability_zone_indexes, subnet_cidrs)
+        ]
 
         route_table = ec2.CfnRouteTable(
             self,
@@ -129,12 +163,33 @@ class WorkstationStack(Stack):
             destination_cidr_block="0.0.0.0/0",
             gateway_id=shared_igw_id,
         )
-        ec2.CfnSubnetRouteTableAssociation(
-            self,
-            environment_spec.construct_id("SubnetRouteTableAssociation"),
-            subnet_id=local_zone_subnet.ref,
-            route_table_id=route_table.ref,
-        )
+        for suffix, subnet in zip(subnet_suffixes, workstation_subnets):
+            ec2.CfnSubnetRouteTableAssociation(
+                self,
+                environment_spec.construct_id(f"SubnetRouteTableAssociation{suffix}"),
+                subnet_id=subnet.ref,
+                route_table_id=route_table.ref,
+            )
+
+        if package_cache or container_cache:
+            # Reason: gateway endpoint routes can only be placed by the stack that owns the
+            # route table, so each workstation stack adds its own S3 endpoint. ECR serves
+            # image layers from S3, so the container cache uses it too.
+            ec2.CfnVPCEndpoint(
+                self,
+                environment_spec.construct_id("S3GatewayEndpoint"),
+                vpc_id=resolved_shared_vpc.vpc_id,
+                service_name=f"com.amazonaws.{self.region}.s3",
+                vpc_endpoint_type="Gateway",
+                route_table_ids=[route_table.ref],
+            )
+        package_cache_url: str | None = None
+        if package_cache:
+            bucket_name = get_package_cache_bucket_name(self.account, self.region)
+            package_cache_url = (
+                f"https://{bucket_name}.s3.{self.region}.amazonaws.com/{environment_spec.environment_key}"
+            )
+        container_registry = get_container_cache_registry(self.account, self.region) if container_cache else None
 
         ssh_sg = ec2.SecurityGroup(
             self,
@@ -203,15 +258,26 @@ class WorkstationStack(Stack):
             ami_id=ami_id,
             instance_type=environment_spec.instance_type,
             security_group_ids=security_group_ids,
-            subnet_id=local_zone_subnet.ref,
+            # Reason: Spot Fleet accepts a comma-separated subnet list and launches in whichever has capacity.
+            subnet_id=Fn.join(",", [subnet.ref for subnet in workstation_subnets])
+            if len(workstation_subnets) > 1
+            else workstation_subnets[0].ref,
             volume_size=environment_spec.volume_size,
             include_bootstrap_user_data=should_include_bootstrap,
             bootstrap_files=environment_spec.bootstrap_files,
             key_name="aws_key" if requires_public_ssh else None,
             iam_instance_profile_arn=(
-                shared_ssm_instance_profile_arn if access_mode in {"ssm", "both"} else None
+                shared_ssm_instance_profile_arn
+                if access_mode in {"ssm", "both"} or container_cache or package_cache
+                else None
             ),
             verbose_bootstrap_resolution=verbose_bootstrap_resolution,
+            bootstrap_dependencies=environment_spec.bootstrap_dependencies,
+            bootstrap_parallelism=environment_spec.bootstrap_parallelism,
+            package_cache_url=package_cache_url,
+            container_registry=container_registry,
+            container_images=container_pull_references(environment_spec.container_images, container_registry),
+            volume_preread=volume_preread,
         )
         launch_specification["tag_specifications"] = [
             ec2.CfnSpotFleet.SpotFleetTagSpecificationProperty(
@@ -223,13 +289,26 @@ class WorkstationStack(Stack):
         ]
 
         # Spot Fleet Request
+        # Reason: capacityOptimizedPrioritized only honours priorities on launch-template
+        # overrides, so launch specifications use capacityOptimized across every type.
+        # Capacity rebalancing is left off: a replacement launched beside a single-user
+        # workstation could be the instance the fleet keeps, dropping the user's session.
         ec2.CfnSpotFleet(self, environment_spec.spot_fleet_logical_id,
             spot_fleet_request_config_data=ec2.CfnSpotFleet.SpotFleetRequestConfigDataProperty(
                 iam_fleet_role="arn:aws:iam::{}:role/aws-ec2-spot-fleet-tagging-role".format(self.account),
                 target_capacity=1,
+                type="maintain",
+                # Reason: "stop" keeps the root volume across interruptions and lets
+                # pause_workstation.py stop and restart the same instance.
+                instance_interruption_behavior="stop",
                 spot_price=environment_spec.spot_price,
+                allocation_strategy="capacityOptimized",
                 launch_specifications=[
-                    ec2.CfnSpotFleet.SpotFleetLaunchSpecificationProperty(**launch_specification)
+                    ec2.CfnSpotFleet.SpotFleetLaunchSpecificationProperty(**specification)
+                    for specification in expand_launch_specification_for_instance_types(
+                        launch_specification,
+                        environment_spec.instance_type_options,
+                    )
                 ]
             )
         )
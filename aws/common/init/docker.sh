@@ -7,6 +7,15 @@ export NEEDRESTART_MODE=a
 
 log() { echo "[docker] $*"; }
 
+# Written by the bootstrap runner when the container cache is enabled or the
+# environment declares container_images.
+CONTAINER_REGISTRY_FILE=/etc/env4ai/container-registry
+CONTAINER_IMAGES_FILE=/etc/env4ai/container-images
+ECR_REGISTRY=""
+if [ -s "$CONTAINER_REGISTRY_FILE" ]; then
+  ECR_REGISTRY="$(cat "$CONTAINER_REGISTRY_FILE")"
+fi
+
 # ------------------------------------------------------------
 # Docker Engine + Compose plugin
 # ------------------------------------------------------------
@@ -32,7 +41,8 @@ apt-get install -y --no-install-recommends \
   docker-ce-cli \
   containerd.io \
   docker-buildx-plugin \
-  docker-compose-plugin
+  docker-compose-plugin \
+  ${ECR_REGISTRY:+amazon-ecr-credential-helper}
 
 systemctl enable --now docker
 
@@ -41,6 +51,55 @@ if id ubuntu >/dev/null 2>&1; then
   usermod -aG docker ubuntu
 fi
 
+# ------------------------------------------------------------
+# Container pull-through cache + declared images
+# ------------------------------------------------------------
+if [ -n "$ECR_REGISTRY" ]; then
+  log "Using the ECR credential helper for ${ECR_REGISTRY}..."
+  for docker_home in /root /home/ubuntu; do
+    [ -d "$docker_home" ] || continue
+    mkdir -p "$docker_home/.docker"
+    if [ ! -f "$docker_home/.docker/config.json" ]; then
+      printf '{"credHelpers": {"%s": "ecr-login"}}\n' "$ECR_REGISTRY" >"$docker_home/.docker/config.json"
+    fi
+  done
+  if id ubuntu >/dev/null 2>&1 && [ -d /home/ubuntu/.docker ]; then
+    chown -R ubuntu:ubuntu /home/ubuntu/.docker
+  fi
+fi
+
+# Each line is "<pull reference> [<declared image>]". Images pulled through the
+# cache are tagged with their declared name so compose files start them locally.
+if [ -s "$CONTAINER_IMAGES_FILE" ]; then
+  while read -r image original; do
+    [ -n "$image" ] || continue
+    log "Pulling ${image}..."
+    if ! docker pull --quiet "$image"; then
+      log "Could not pull ${image}; it is pulled from its registry on first use instead."
+      continue
+    fi
+    [ -n "$original" ] || continue
+    # A digest cannot be a tag target; tag the name and let the pinned reference resolve through it.
+    local_name="${original%@*}"
+    if [ "$local_name" != "$original" ]; then
+      case "${local_name##*/}" in
+        *:*) ;;
+        *)
+          log "${original} pins a digest without a tag; it is pulled from its registry on first use."
+          continue
+          ;;
+      esac
+    fi
+    if ! docker tag "$image" "$local_name"; then
+      log "Could not tag ${image} as ${local_name}; it is pulled from its registry on first use."
+      continue
+    fi
+    if ! docker image inspect "$original" >/dev/null 2>&1; then
+      log "${original} does not resolve to ${local_name}; it is pulled from its registry on first use."
+    fi
+  done <"$CONTAINER_IMAGES_FILE"
+fi
+
 apt-get clean
 rm -rf /var/lib/apt/lists/*
 
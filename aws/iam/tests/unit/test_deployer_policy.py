@@ -33,6 +33,103 @@ class DeployerPolicyTests(unittest.TestCase):
 
         self.assertIn("cloudformation:ListStacks", statement["Action"])
 
+    def test_cloudformation_statement_allows_cancelling_failed_change_set_updates(self) -> None:
+        """Expected: the change-set deploy engine can cancel an update after the first failure."""
+        policy = _load_policy()
+        statement = next(
+            item
+            for item in policy["Statement"]
+            if item["Sid"] == "CloudFormationStackLifecycle"
+        )
+
+        self.assertIn("cloudformation:CancelUpdateStack", statement["Action"])
+
+    def test_policy_allows_reading_spot_fleet_request_history(self) -> None:
+        """Expected: readiness can classify Spot Fleet fulfilment errors."""
+        policy = _load_policy()
+        statement = next(
+            item
+            for item in policy["Statement"]
+            if item["Sid"] == "EC2VpcSecurityAndSpotFleet"
+        )
+
+        self.assertIn("ec2:DescribeSpotFleetRequestHistory", statement["Action"])
+
+    def test_policy_allows_reading_instance_user_data(self) -> None:
+        """Expected: check_instance can tell whether an instance runs the user-data bootstrap."""
+        policy = _load_policy()
+        statement = next(
+            item
+            for item in policy["Statement"]
+            if item["Sid"] == "EC2VpcSecurityAndSpotFleet"
+        )
+
+        self.assertIn("ec2:DescribeInstanceAttribute", statement["Action"])
+
+    def test_policy_allows_reading_spot_placement_signals(self) -> None:
+        """Expected: deploys can rank Availability Zones by Spot price and placement score."""
+        policy = _load_policy()
+        statement = next(
+            item
+            for item in policy["Statement"]
+            if item["Sid"] == "EC2VpcSecurityAndSpotFleet"
+        )
+
+        self.assertIn("ec2:DescribeSpotPriceHistory", statement["Action"])
+        self.assertIn("ec2:GetSpotPlacementScores", statement["Action"])
+
+    def test_policy_allows_pausing_and_resuming_instances(self) -> None:
+        """Expected: pause/resume can stop and start the workstation instance."""
+        policy = _load_policy()
+        statement = next(
+            item
+            for item in policy["Statement"]
+            if item["Sid"] == "EC2VpcSecurityAndSpotFleet"
+        )
+
+        self.assertIn("ec2:StopInstances", statement["Action"])
+        self.assertIn("ec2:StartInstances", statement["Action"])
+
+    def test_policy_allows_building_golden_amis(self) -> None:
+        """Expected: golden AMI builds can launch, image, and terminate a builder instance."""
+        policy = _load_policy()
+        statement = next(
+            item
+            for item in policy["Statement"]
+            if item["Sid"] == "GoldenAmiBuild"
+        )
+
+        for action in ("ec2:RunInstances", "ec2:TerminateInstances", "ec2:GetConsoleOutput", "ec2:CreateImage"):
+            self.assertIn(action, statement["Action"])
+
+    def test_policy_allows_fast_snapshot_restore_for_restored_amis(self) -> None:
+        """Expected: AMI_WARM=fsr can enable, poll and disable fast snapshot restore."""
+        policy = _load_policy()
+        statement = next(
+            item
+            for item in policy["Statement"]
+            if item["Sid"] == "FastSnapshotRestoreForRestoredAmis"
+        )
+
+        for action in (
+            "ec2:EnableFastSnapshotRestores",
+            "ec2:DisableFastSnapshotRestores",
+            "ec2:DescribeFastSnapshotRestores",
+        ):
+            self.assertIn(action, statement["Action"])
+
+    def test_container_cache_secret_lookup_is_scoped_to_pull_through_cache_secrets(self) -> None:
+        """Expected: the deployer can only describe secrets under the ECR pull-through cache prefix."""
+        policy = _load_policy()
+        statement = next(
+            item
+            for item in policy["Statement"]
+            if item["Sid"] == "ReadContainerCacheCredentialSecret"
+        )
+
+        self.assertEqual("secretsmanager:DescribeSecret", statement["Action"])
+        self.assertEqual("arn:aws:secretsmanager:*:*:secret:ecr-pullthroughcache/*", statement["Resource"])
+
     def test_ssm_iam_statement_is_scoped_to_shared_role_and_profile(self) -> None:
         """Expected: shared SSM IAM lifecycle actions avoid wildcard resources."""
         policy = _load_policy()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""Compare per-action start-up cost of subprocess and in-process entrypoints.
+
+Each interactive menu action used to spawn ``uv run ../scripts/<action>.py``,
+paying uv environment resolution, interpreter start-up, imports, and boto3
+session and client creation every time.  This benchmark measures that fixed
+cost for each action script against the in-process path, which reuses the
+already-imported modules and one shared boto3 session.  No AWS API calls are
+made.
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+from pathlib import Path
+import shlex
+import statistics
+import subprocess
+import sys
+import time
+from typing import Sequence
+
+import boto3
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+AWS_ROOT = SCRIPTS_DIR.parent
+if str(AWS_ROOT) not in sys.path:
+    sys.path.insert(0, str(AWS_ROOT))
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+from workstation_core.orchestration import load_environment_spec
+
+ACTION_SCRIPTS = (
+    "deploy_workstation",
+    "stop_workstation",
+    "save_workstation_ami",
+    "destroy_shared_network",
+)
+_SUBPROCESS_SNIPPET = (
+    "import sys; sys.path[:0] = [{aws_root!r}, {scripts_dir!r}]; "
+    "import boto3, {module}; "
+    "from workstation_core.orchestration import load_environment_spec; "
+    "load_environment_spec({stack_dir!r}); "
+    "session = boto3.Session(region_name={region!r}); "
+    "session.client('ec2'); session.client('cloudformation')"
+)
+
+
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    """Parse command line arguments for the start-up benchmark."""
+    parser = argparse.ArgumentParser(
+        description="Measure per-action start-up cost of subprocess versus in-process execution."
+    )
+    parser.add_argument(
+        "--stack-dir",
+        default=str(AWS_ROOT / "gastown"),
+        help="Environment directory whose environment_config.py is loaded per action.",
+    )
+    parser.add_argument(
+        "--region",
+        default="us-west-2",
+        help="Region used for client construction (no API calls are made).",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="Number of timed runs per action and mode.",
+    )
+    parser.add_argument(
+        "--launcher",
+        default="uv run python",
+        help="Command that starts a Python interpreter for subprocess actions (for example 'python3').",
+    )
+    return parser.parse_args(argv)
+
+
+def _time_subprocess(command: list[str], cwd: str) -> float:
+    """Return wall-clock seconds for one subprocess run."""
+    started_at = time.perf_counter()
+    subprocess.run(command, check=True, cwd=cwd, stdout=subprocess.DEVNULL)
+    return time.perf_counter() - started_at
+
+
+def _time_in_process(module_name: str, session: boto3.Session, stack_dir: str) -> float:
+    """Return wall-clock seconds for the in-process equivalent of one action start."""
+    started_at = time.perf_counter()
+    importlib.import_module(module_name)
+    load_environment_spec(stack_dir)
+    session.client("ec2")
+    session.client("cloudformation")
+    return time.perf_counter() - started_at
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the benchmark and print a per-action comparison table."""
+    args = parse_args(argv)
+    launcher = shlex.split(args.launcher)
+    session = boto3.Session(region_name=args.region)
+
+    print(f"{'action':<24} {'subprocess (s)':>15} {'in-process (s)':>15} {'saved (s)':>10}")
+    for module_name in ACTION_SCRIPTS:
+        snippet = _SUBPROCESS_SNIPPET.format(
+            aws_root=str(AWS_ROOT),
+            scripts_dir=str(SCRIPTS_DIR),
+            module=module_name,
+            stack_dir=args.stack_dir,
+            region=args.region,
+        )
+        subprocess_seconds = statistics.median(
+            _time_subprocess([*launcher, "-c", snippet], cwd=args.stack_dir)
+            for _ in range(args.repeat)
+        )
+        in_process_seconds = statistics.median(
+            _time_in_process(module_name, session, args.stack_dir) for _ in range(args.repeat)
+        )
+        print(
+            f"{module_name:<24} {subprocess_seconds:>15.3f} {in_process_seconds:>15.3f} "
+            f"{subprocess_seconds - in_process_seconds:>10.3f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
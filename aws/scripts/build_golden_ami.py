@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""Build a golden AMI with an environment's bootstrap scripts pre-applied."""
+
+from __future__ import annotations
+
+import argparse
+import os
+from pathlib import Path
+import sys
+from typing import Sequence
+
+import boto3
+
+# Reason: allow importing sibling shared package when executed as a script.
+AWS_ROOT = Path(__file__).resolve().parents[1]
+if str(AWS_ROOT) not in sys.path:
+    sys.path.insert(0, str(AWS_ROOT))
+
+from workstation_core import load_environment_spec
+from workstation_core.golden_ami import build_golden_image
+from workstation_core.tracing import ensure_tracing, instrument_client
+
+
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    """Parse CLI args for the golden AMI build workflow."""
+    parser = argparse.ArgumentParser(
+        description=(
+            "Launch a temporary instance from the environment's default AMI, run its bootstrap scripts, "
+            "and save the result as a golden AMI keyed by the base AMI and script contents."
+        )
+    )
+    parser.add_argument(
+        "--environment",
+        required=True,
+        help="Environment key (for example: gastown).",
+    )
+    parser.add_argument(
+        "--stack-dir",
+        required=True,
+        help="Path to CDK app directory (for example: aws/gastown).",
+    )
+    parser.add_argument(
+        "--stack-name",
+        required=True,
+        help="CloudFormation stack name (its subnet hosts the build when deployed).",
+    )
+    parser.add_argument(
+        "--subnet-id",
+        default=None,
+        help="Optional subnet with internet access for the build instance.",
+    )
+    parser.add_argument(
+        "--profile",
+        default=None,
+        help="Optional AWS profile override.",
+    )
+    parser.add_argument(
+        "--region",
+        default=None,
+        help="Optional AWS region override.",
+    )
+    return parser.parse_args(argv)
+
+
+def _resolve_region(cli_region: str | None) -> str | None:
+    """Resolve region precedence from CLI then AWS env vars."""
+    if cli_region and cli_region.strip():
+        return cli_region.strip()
+    if os.environ.get("AWS_REGION", "").strip():
+        return os.environ["AWS_REGION"].strip()
+    if os.environ.get("AWS_DEFAULT_REGION", "").strip():
+        return os.environ["AWS_DEFAULT_REGION"].strip()
+    return None
+
+
+def _resolve_profile(cli_profile: str | None) -> str | None:
+    """Resolve profile precedence from CLI then AWS env vars."""
+    if cli_profile and cli_profile.strip():
+        return cli_profile.strip()
+    if os.environ.get("AWS_PROFILE", "").strip():
+        return os.environ["AWS_PROFILE"].strip()
+    return None
+
+
+def main(argv: Sequence[str] | None = None, *, session: boto3.Session | None = None) -> int:
+    """Run the golden AMI build workflow.
+
+    Args:
+        argv: Optional CLI arguments; defaults to ``sys.argv``.
+        session: Optional boto3 session reused instead of resolving a new one.
+
+    Returns:
+        Process status code.
+    """
+    args = parse_args(argv)
+    tracer = ensure_tracing("build_golden_ami")
+    with tracer.span("build_golden_ami", environment=args.environment, stack_name=args.stack_name):
+        return _run(args, session=session)
+
+
+def _run(args: argparse.Namespace, *, session: boto3.Session | None = None) -> int:
+    """Build the golden AMI for parsed CLI arguments."""
+    if session is None:
+        session = boto3.Session(
+            profile_name=_resolve_profile(args.profile),
+            region_name=_resolve_region(args.region),
+        )
+    if not session.region_name:
+        raise RuntimeError(
+            "Unable to resolve AWS region. Set --region, AWS_REGION, AWS_DEFAULT_REGION, or configure profile region."
+        )
+
+    environment_spec = load_environment_spec(stack_dir=args.stack_dir)
+    if environment_spec is None:
+        raise RuntimeError(
+            f"No ENVIRONMENT_SPEC found in {args.stack_dir}/environment_config.py; "
+            "golden AMIs need the environment's bootstrap scripts and default AMI selector."
+        )
+
+    build_golden_image(
+        instrument_client(session.client("ec2")),
+        instrument_client(session.client("cloudformation")),
+        stack_dir=args.stack_dir,
+        stack_name=args.stack_name,
+        environment_spec=environment_spec,
+        subnet_id=args.subnet_id.strip() if args.subnet_id and args.subnet_id.strip() else None,
+    )
+    print("New default deploys of this environment will launch from the golden AMI.")
+    return 0
+
+
+if __name__ == "__main__":
+    try:
+        raise SystemExit(main())
+    except RuntimeError as err:
+        print(str(err), file=sys.stderr)
+        raise SystemExit(1)
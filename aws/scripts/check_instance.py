@@ -9,12 +9,31 @@ from datetime import datetime
 import importlib.util
 import os
 from pathlib import Path
-from time import sleep
-from typing import Any
+import sys
+import time
+from typing import Any, Sequence
 
 import boto3
 from botocore.exceptions import BotoCoreError, ClientError
 
+from workstation_core.bootstrap_timing import (
+    BOOTSTRAP_WAIT_TIMEOUT_SECONDS,
+    describe_bootstrap_launch,
+    print_bootstrap_report,
+    report_bootstrap_timings,
+    wait_for_bootstrap_complete,
+)
+from workstation_core.elastic_ip import associate_eip_with_instance
+from workstation_core.pause import DEFAULT_LIFECYCLE_TIMING_DIR
+from workstation_core.readiness import (
+    build_ssh_config_snippet,
+    build_ssm_start_session_command,
+    print_connection_guidance,
+    wait_for_workstation_ready,
+)
+from workstation_core.spot_fulfilment import SpotFleetFulfilmentMonitor
+from workstation_core.tracing import ensure_tracing, instrument_client, trace_span
+
 
 def _load_environment_spec_from_cwd() -> Any | None:
     """Load ``ENVIRONMENT_SPEC`` from cwd-local ``environment_config.py``.
@@ -37,7 +56,7 @@ def _load_environment_spec_from_cwd() -> Any | None:
     return getattr(module, "ENVIRONMENT_SPEC", None)
 
 
-def parse_args() -> argparse.Namespace:
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
     name = Path.cwd().name
     environment_spec = _load_environment_spec_from_cwd()
     default_stack_name = f"{name.capitalize()}WorkstationStack"
@@ -105,7 +124,23 @@ def parse_args() -> argparse.Namespace:
         default=None,
         help="Elastic IP public IP address to show in SSH config (used with --eip-allocation-id).",
     )
-    return parser.parse_args()
+    parser.add_argument(
+        "--wait",
+        action="store_true",
+        help="Poll with backoff until the workstation is reachable instead of reporting current state.",
+    )
+    parser.add_argument(
+        "--wait-for-bootstrap",
+        action="store_true",
+        help="Like --wait, then keep waiting until the user-data bootstrap scripts have finished.",
+    )
+    parser.add_argument(
+        "--bootstrap-timeout",
+        type=float,
+        default=BOOTSTRAP_WAIT_TIMEOUT_SECONDS,
+        help="Seconds to wait for the bootstrap scripts with --wait-for-bootstrap.",
+    )
+    return parser.parse_args(argv)
 
 
 def normalize_optional(value: str | None) -> str | None:
@@ -243,38 +278,133 @@ def get_newest_instance_for_spot_fleet(ec2_client: Any, spot_fleet_request_id: s
     return max(instances, key=launch_time)
 
 
-def build_ssh_config_snippet(host_alias: str, ip_address: str, ssh_user: str, identity_file: str) -> str:
-    """Build an SSH config snippet for user guidance."""
-    return (
-        f"Host {host_alias}\n"
-        f"  HostName {ip_address}\n"
-        f"  User {ssh_user}\n"
-        f"  IdentityFile {identity_file}\n"
-        f"  IdentitiesOnly yes\n"
+def print_fulfilment_diagnosis(ec2_client: Any, spot_fleet_request_id: str) -> None:
+    """Explain why a Spot Fleet has no instances when its history says so."""
+    monitor = SpotFleetFulfilmentMonitor(ec2_client, spot_fleet_request_id, capacity_grace_seconds=0.0)
+    try:
+        failure = monitor.poll()
+    except (ClientError, BotoCoreError) as exc:
+        print(f"Warning: unable to read Spot Fleet request history: {exc}")
+        return
+    if failure is not None:
+        print(failure.format(spot_fleet_request_id))
+
+
+def print_bootstrap_timings(ec2_client: Any, *, region: str, stack_name: str, instance_id: str) -> None:
+    """Print the per-script bootstrap timing table when the instance reported one."""
+    print()
+    report = report_bootstrap_timings(
+        ec2_client,
+        timing_dir=DEFAULT_LIFECYCLE_TIMING_DIR,
+        region=region,
+        stack_name=stack_name,
+        instance_id=instance_id,
+        out=sys.stdout,
     )
+    if report is None:
+        print("Bootstrap timings: none reported (still booting, or launched without the user-data bootstrap).")
 
 
-def build_ssm_start_session_command(region: str, instance_id: str, profile: str | None) -> str:
-    """Build the AWS CLI command used to start an SSM session."""
-    command = ["aws", "ssm", "start-session", "--region", region]
-    if profile:
-        command.extend(["--profile", profile])
-    command.extend(["--target", instance_id])
-    return " ".join(command)
+def main(argv: Sequence[str] | None = None, *, session: boto3.Session | None = None) -> int:
+    """Run instance lookup and print user-facing connection instructions.
 
+    Args:
+        argv: Optional CLI arguments; defaults to ``sys.argv``.
+        session: Optional boto3 session reused instead of resolving a new one.
 
-def main() -> int:
-    """Run instance lookup and print user-facing connection instructions."""
-    args = parse_args()
-    try:
-        region = get_region(cli_region=args.region, cli_profile=args.profile)
-    except RuntimeError as exc:
-        print(f"Error: {exc}")
-        return 1
+    Returns:
+        Process status code.
+    """
+    args = parse_args(argv)
+    tracer = ensure_tracing("check_instance")
+    with tracer.span("check_instance", stack_name=args.stack_name):
+        return _run_check(args, session=session)
+
+
+def _run_check(args: argparse.Namespace, *, session: boto3.Session | None = None) -> int:
+    """Run instance lookup for parsed CLI arguments."""
+    if session is not None and session.region_name:
+        region = session.region_name
+    else:
+        try:
+            region = get_region(cli_region=args.region, cli_profile=args.profile)
+        except RuntimeError as exc:
+            print(f"Error: {exc}")
+            return 1
+        session = boto3.Session(profile_name=normalize_optional(args.profile), region_name=region)
+    ec2_client = instrument_client(session.client("ec2"))
+    cloudformation_client = instrument_client(session.client("cloudformation"))
+    access_mode = normalize_optional(args.access_mode) or "ssh"
+    eip_allocation_id = normalize_optional(args.eip_allocation_id)
+    eip_public_ip = normalize_optional(args.eip_public_ip)
 
-    session = boto3.Session(profile_name=normalize_optional(args.profile), region_name=region)
-    ec2_client = session.client("ec2")
-    cloudformation_client = session.client("cloudformation")
+    wait_for_bootstrap = getattr(args, "wait_for_bootstrap", False)
+    if getattr(args, "wait", False) or wait_for_bootstrap:
+        started_at = time.monotonic()
+        try:
+            readiness = wait_for_workstation_ready(
+                cloudformation_client,
+                ec2_client,
+                stack_name=args.stack_name,
+                spot_fleet_logical_id=args.spot_fleet_logical_id,
+                access_mode=access_mode,
+                eip_allocation_id=eip_allocation_id,
+                eip_public_ip=eip_public_ip,
+                ssm_client=instrument_client(session.client("ssm")) if access_mode == "ssm" else None,
+            )
+        except RuntimeError as exc:
+            print(f"Error: {exc}")
+            return 1
+        print_connection_guidance(
+            readiness,
+            access_mode=access_mode,
+            region=region,
+            profile=normalize_optional(args.profile),
+            ssh_alias=args.ssh_host_alias,
+            ssh_user=args.ssh_user,
+            identity_file=args.identity_file,
+        )
+        if not wait_for_bootstrap:
+            print_bootstrap_timings(
+                ec2_client,
+                region=region,
+                stack_name=args.stack_name,
+                instance_id=readiness.instance_id,
+            )
+            return 0
+        print()
+        try:
+            launch = describe_bootstrap_launch(ec2_client, readiness.instance_id)
+        except RuntimeError as exc:
+            print(f"Error: {exc}")
+            return 1
+        if not launch.has_runner:
+            # Reason: without the runner no summary is ever printed, so waiting would only time out.
+            print(
+                f"Bootstrap: {launch.instance_id} was launched from {launch.image_id or 'its AMI'} without the "
+                "user-data bootstrap (golden AMI, or a saved AMI without AMI_BOOTSTRAP); not waiting for it."
+            )
+            print(f"Workstation usable after {time.monotonic() - started_at:.0f}s.")
+            return 0
+        try:
+            report = wait_for_bootstrap_complete(
+                ec2_client,
+                readiness.instance_id,
+                timeout_seconds=args.bootstrap_timeout,
+                out=sys.stdout,
+            )
+        except RuntimeError as exc:
+            print(f"Error: {exc}")
+            return 1
+        print_bootstrap_report(
+            report,
+            timing_dir=DEFAULT_LIFECYCLE_TIMING_DIR,
+            region=region,
+            stack_name=args.stack_name,
+            out=sys.stdout,
+        )
+        print(f"Workstation usable after {time.monotonic() - started_at:.0f}s.")
+        return 0
 
     try:
         spot_fleet_request_id = get_spot_fleet_request_id(
@@ -282,12 +412,17 @@ def main() -> int:
             stack_name=args.stack_name,
             logical_resource_id=args.spot_fleet_logical_id,
         )
+    except RuntimeError as exc:
+        print(f"Error: {exc}")
+        return 1
+    try:
         instance = get_newest_instance_for_spot_fleet(
             ec2_client=ec2_client,
             spot_fleet_request_id=spot_fleet_request_id,
         )
     except RuntimeError as exc:
         print(f"Error: {exc}")
+        print_fulfilment_diagnosis(ec2_client, spot_fleet_request_id)
         return 1
 
     instance_id = instance.get("InstanceId", "unknown")
@@ -299,22 +434,16 @@ def main() -> int:
     print(f"Region: {region}")
     if launch_time:
         print(f"Launch time: {launch_time}")
-
-    access_mode = normalize_optional(args.access_mode) or "ssh"
-    eip_allocation_id = normalize_optional(args.eip_allocation_id)
-    eip_public_ip = normalize_optional(args.eip_public_ip)
+    if state == "running":
+        print_bootstrap_timings(ec2_client, region=region, stack_name=args.stack_name, instance_id=instance_id)
 
     if eip_allocation_id:
-        if not public_ip:
-            print("Public IP not assigned yet; cannot associate Elastic IP. Wait a moment, then run this script again.")
+        if state != "running":
+            print("Instance is not running yet; rerun with --wait to associate the Elastic IP once it is.")
             return 1
         try:
-            sleep(5)
-            ec2_client.associate_address(
-                AllocationId=eip_allocation_id,
-                InstanceId=instance_id,
-                AllowReassociation=True,
-            )
+            with trace_span("check_instance.associate_eip", instance_id=instance_id):
+                associate_eip_with_instance(ec2_client, eip_allocation_id, instance_id)
             print(f"Elastic IP associated: {eip_public_ip or eip_allocation_id}")
         except (BotoCoreError, ClientError) as exc:
             print(f"Warning: Elastic IP association failed: {exc}")
@@ -337,7 +466,7 @@ def main() -> int:
         return 0
 
     if not display_ip:
-        print("Public IP not assigned yet. Wait a moment, then run this script again.")
+        print("Public IP not assigned yet. Rerun with --wait to poll until it is.")
         return 1
 
     print(f"Public IP: {display_ip}")
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""Deploy several workstation environments concurrently."""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+import sys
+from typing import Sequence
+
+# Reason: allow importing sibling shared package when executed as a script.
+AWS_ROOT = Path(__file__).resolve().parents[1]
+if str(AWS_ROOT) not in sys.path:
+    sys.path.insert(0, str(AWS_ROOT))
+
+from workstation_core.batch import DEFAULT_BATCH_WORKERS, resolve_batch_targets, run_batch_deploy
+from workstation_core.interactive_workstation import discover_environments
+from workstation_core.tracing import ensure_tracing
+
+
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    """Parse command line arguments.
+
+    Args:
+        argv: Optional CLI arguments for testability.
+
+    Returns:
+        Parsed namespace with batch deploy configuration.
+    """
+    parser = argparse.ArgumentParser(
+        description=(
+            "Deploy several workstation environments at once. The shared network "
+            "stack is deployed once, then environments deploy concurrently."
+        )
+    )
+    parser.add_argument(
+        "environments",
+        nargs="+",
+        help="Environment keys to deploy (for example: gastown builder openclaw).",
+    )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=DEFAULT_BATCH_WORKERS,
+        help=f"Maximum environments deployed at once (default {DEFAULT_BATCH_WORKERS}).",
+    )
+    parser.add_argument(
+        "--profile",
+        default=None,
+        help="Optional AWS profile override.",
+    )
+    parser.add_argument(
+        "--region",
+        default=None,
+        help="Optional AWS region override.",
+    )
+    parser.add_argument(
+        "--access-mode",
+        choices=("ssh", "ssm", "both"),
+        default=None,
+        help="Optional access mode applied to every environment.",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Deploy even when synthesized templates match the deployed stacks (also FORCE_DEPLOY=1).",
+    )
+    parser.add_argument(
+        "--deploy-engine",
+        choices=("changeset", "cdk"),
+        default=None,
+        help="Deploy through CloudFormation change sets or the CDK CLI (also DEPLOY_ENGINE).",
+    )
+    args = parser.parse_args(argv)
+    if args.max_workers < 1:
+        parser.error("--max-workers must be at least 1.")
+    return args
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the batch deploy and return a process status code.
+
+    Args:
+        argv: Optional CLI arguments; defaults to ``sys.argv``.
+
+    Returns:
+        Zero when every environment deployed, otherwise one.
+    """
+    args = parse_args(argv)
+    targets = resolve_batch_targets(args.environments, discover_environments(AWS_ROOT, sys.stdout))
+    tracer = ensure_tracing("deploy_batch")
+    with tracer.span("deploy_batch", environments=",".join(target.environment_key for target in targets)):
+        results = run_batch_deploy(
+            targets,
+            profile=args.profile,
+            region=args.region,
+            access_mode=args.access_mode,
+            force=args.force,
+            deploy_engine=args.deploy_engine,
+            max_workers=args.max_workers,
+        )
+    return 0 if all(result.succeeded for result in results) else 1
+
+
+if __name__ == "__main__":
+    try:
+        raise SystemExit(main())
+    except RuntimeError as err:
+        print(str(err), file=sys.stderr)
+        raise SystemExit(1)
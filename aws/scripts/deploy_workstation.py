@@ -9,12 +9,15 @@ from pathlib import Path
 import sys
 from typing import Sequence
 
+import boto3
+
 # Reason: allow importing sibling shared package when executed as a script.
 AWS_ROOT = Path(__file__).resolve().parents[1]
 if str(AWS_ROOT) not in sys.path:
     sys.path.insert(0, str(AWS_ROOT))
 
 from workstation_core.orchestration import DeployWorkflowInputs, run_deploy_lifecycle
+from workstation_core.tracing import ensure_tracing
 
 
 def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
@@ -63,22 +66,46 @@ def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
         default=None,
         help="Optional workstation access mode override.",
     )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Deploy even when the synthesized template matches the deployed stack (also FORCE_DEPLOY=1).",
+    )
+    parser.add_argument(
+        "--deploy-engine",
+        choices=("changeset", "cdk"),
+        default=None,
+        help="Deploy through CloudFormation change sets or the CDK CLI (also DEPLOY_ENGINE; default cdk).",
+    )
     return parser.parse_args(argv)
 
 
-def main(argv: Sequence[str] | None = None) -> int:
-    """Run deploy orchestration flow and return process status code."""
+def main(argv: Sequence[str] | None = None, *, session: boto3.Session | None = None) -> int:
+    """Run deploy orchestration flow and return process status code.
+
+    Args:
+        argv: Optional CLI arguments; defaults to ``sys.argv``.
+        session: Optional boto3 session reused instead of resolving a new one.
+
+    Returns:
+        Process status code.
+    """
     args = parse_args(argv)
-    return run_deploy_lifecycle(
-        DeployWorkflowInputs(
-            environment=args.environment,
-            stack_dir=args.stack_dir,
-            stack_name=args.stack_name,
-            profile=args.profile,
-            region=args.region,
-            access_mode=args.access_mode,
+    tracer = ensure_tracing("deploy_workstation")
+    with tracer.span("deploy_workstation", environment=args.environment, stack_name=args.stack_name):
+        return run_deploy_lifecycle(
+            DeployWorkflowInputs(
+                environment=args.environment,
+                stack_dir=args.stack_dir,
+                stack_name=args.stack_name,
+                profile=args.profile,
+                region=args.region,
+                access_mode=args.access_mode,
+                force=args.force,
+                deploy_engine=args.deploy_engine,
+            ),
+            session=session,
         )
-    )
 
 
 if __name__ == "__main__":
@@ -8,6 +8,8 @@ from pathlib import Path
 import sys
 from typing import Sequence
 
+import boto3
+
 AWS_ROOT = Path(__file__).resolve().parents[1]
 if str(AWS_ROOT) not in sys.path:
     sys.path.insert(0, str(AWS_ROOT))
@@ -35,10 +37,18 @@ def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
     return parser.parse_args(argv)
 
 
-def main(argv: Sequence[str] | None = None) -> int:
-    """Run shared-network destroy orchestration."""
+def main(argv: Sequence[str] | None = None, *, session: boto3.Session | None = None) -> int:
+    """Run shared-network destroy orchestration.
+
+    Args:
+        argv: Optional CLI arguments; defaults to ``sys.argv``.
+        session: Optional boto3 session reused instead of resolving a new one.
+
+    Returns:
+        Process status code.
+    """
     args = parse_args(argv)
-    return destroy_shared_network_stack(profile=args.profile, region=args.region)
+    return destroy_shared_network_stack(profile=args.profile, region=args.region, session=session)
 
 
 if __name__ == "__main__":
@@ -4,10 +4,11 @@
 from __future__ import annotations
 
 import argparse
+import io
 import os
 from pathlib import Path
 import sys
-from typing import Sequence
+from typing import Any, Callable, Sequence
 
 import boto3
 
@@ -28,11 +29,33 @@ from workstation_core.interactive_workstation import (
     dispatch_action,
     load_last_used_environment_key,
     parse_action_choice,
+    ScriptEntrypoint,
     run_script,
+    run_script_in_process,
     save_last_used_environment_key,
 )
+from workstation_core.bootstrap_timing import report_bootstrap_timings
+from workstation_core.golden_ami import resolve_golden_image_status
+from workstation_core.orchestration import load_environment_spec
+from workstation_core.pause import DEFAULT_LIFECYCLE_TIMING_DIR, format_lifecycle_timings, load_lifecycle_timings
+from workstation_core.pending_ami import check_pending_amis
+from workstation_core.tracing import init_tracing, instrument_client, trace_span
 from workstation_core.workstation_status import WorkstationStatus, get_workstation_status
 
+import build_golden_ami
+import deploy_workstation
+import destroy_shared_network
+import pause_workstation
+import save_workstation_ami
+import stop_workstation
+
+ActionRunner = Callable[[list[str], Path, dict[str, str] | None], None]
+# Reason: the detail lines cost several AWS calls, so redraws reuse them until an
+# action that can change them runs or the stack's instance changes.
+_DETAIL_REFRESH_ACTIONS = frozenset(
+    {"deploy_default", "deploy_pick_ami", "save_ami_only", "destroy_and_save", "build_golden_ami", "refresh"}
+)
+
 
 def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
     """Parse command line args for interactive workstation mode."""
@@ -57,6 +80,11 @@ def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
         default=str(Path.home() / ".config" / "env4ai" / "workstation-last-environment"),
         help="Path used to persist the last selected environment key.",
     )
+    parser.add_argument(
+        "--subprocess-actions",
+        action="store_true",
+        help="Run each action as a separate 'uv run' process instead of in-process.",
+    )
     return parser.parse_args(argv)
 
 
@@ -87,6 +115,8 @@ def _render_status(environment: EnvironmentTarget, status: WorkstationStatus) ->
     print(f"  Stack state: {status.stack_state}")
     if status.stack_status:
         print(f"  Stack status: {status.stack_status}")
+    if status.stack_state == "paused" and status.instance_id:
+        print(f"  Instance ID: {status.instance_id} (stopped)")
     if status.stack_state == "running":
         if status.instance_id:
             print(f"  Instance ID: {status.instance_id}")
@@ -108,6 +138,9 @@ def _show_gated_action_menu(availability: dict[str, ActionAvailability]) -> None
         ("7", "switch_environment", "Switch environment"),
         ("8", "destroy_shared_network", "Destroy shared network"),
         ("9", "quit", "Quit"),
+        ("10", "pause", "Pause workstation (stop instance, keep stack)"),
+        ("11", "resume", "Resume paused workstation"),
+        ("12", "build_golden_ami", "Build golden AMI from the bootstrap scripts"),
     ]
 
     print("\nActions:")
@@ -119,6 +152,41 @@ def _show_gated_action_menu(availability: dict[str, ActionAvailability]) -> None
         print(f"  {number}. {label} [{entry.disabled_reason}]")
 
 
+def _golden_image_status_line(environment: EnvironmentTarget, ec2_client: Any) -> str | None:
+    """Return the golden AMI status line, or ``None`` when it cannot be resolved."""
+    try:
+        environment_spec = load_environment_spec(stack_dir=str(environment.stack_dir))
+        if environment_spec is None:
+            return None
+        return resolve_golden_image_status(
+            ec2_client,
+            stack_dir=environment.stack_dir,
+            environment_spec=environment_spec,
+        ).describe()
+    except Exception:
+        # Reason: the golden AMI line is informational and must not block the menu.
+        return None
+
+
+def _render_environment_details(environment: EnvironmentTarget, ec2_client: Any, status: WorkstationStatus) -> str:
+    """Return the golden AMI, bootstrap timing and pending AMI lines for the status view."""
+    out = io.StringIO()
+    golden_image_line = _golden_image_status_line(environment, ec2_client)
+    if golden_image_line:
+        out.write(f"  {golden_image_line}\n")
+    if status.stack_state == "running" and status.instance_id:
+        report_bootstrap_timings(
+            ec2_client,
+            timing_dir=DEFAULT_LIFECYCLE_TIMING_DIR,
+            region=str(ec2_client.meta.region_name),
+            stack_name=environment.stack_name,
+            instance_id=status.instance_id,
+            out=out,
+        )
+    check_pending_amis(ec2_client, environment_key=environment.environment_key, out=out)
+    return out.getvalue()
+
+
 def _build_environment_state(status: WorkstationStatus) -> InteractiveEnvironmentState:
     """Build a deterministic state snapshot used by action gating policy."""
     return InteractiveEnvironmentState(
@@ -131,13 +199,49 @@ def _build_environment_state(status: WorkstationStatus) -> InteractiveEnvironmen
     )
 
 
+def _build_entrypoints(session: boto3.Session) -> dict[str, ScriptEntrypoint]:
+    """Map action script names to in-process entrypoints sharing one session."""
+    return {
+        "deploy_workstation": lambda argv: deploy_workstation.main(argv, session=session),
+        "stop_workstation": lambda argv: stop_workstation.main(argv, session=session),
+        "save_workstation_ami": lambda argv: save_workstation_ami.main(argv, session=session),
+        "pause_workstation": lambda argv: pause_workstation.main(argv, session=session),
+        "build_golden_ami": lambda argv: build_golden_ami.main(argv, session=session),
+        "destroy_shared_network": lambda argv: destroy_shared_network.main(argv, session=session),
+    }
+
+
+def _build_action_runner(session: boto3.Session, *, use_subprocess: bool) -> ActionRunner:
+    """Return the command runner used by ``dispatch_action``."""
+    if use_subprocess:
+        return lambda command, cwd, env_overrides: run_script(
+            command,
+            cwd=cwd,
+            env_overrides=env_overrides,
+        )
+    entrypoints = _build_entrypoints(session)
+    return lambda command, cwd, env_overrides: run_script_in_process(
+        command,
+        cwd=cwd,
+        env_overrides=env_overrides,
+        entrypoints=entrypoints,
+    )
+
+
 def _run_action_loop(
     *,
     environment: EnvironmentTarget,
-    cloudformation_client: object,
-    ec2_client: object,
+    cloudformation_client: Any,
+    ec2_client: Any,
+    runner: ActionRunner = lambda command, cwd, env_overrides: run_script(
+        command,
+        cwd=cwd,
+        env_overrides=env_overrides,
+    ),
 ) -> ActionResult:
     """Run actions loop for one selected environment."""
+    details: str | None = None
+    details_key: tuple[str, str | None] | None = None
     while True:
         status = get_workstation_status(
             cloudformation_client,
@@ -147,12 +251,25 @@ def _run_action_loop(
             ssh_alias=environment.ssh_alias,
         )
         _render_status(environment, status)
+        timings = format_lifecycle_timings(
+            load_lifecycle_timings(
+                DEFAULT_LIFECYCLE_TIMING_DIR,
+                str(ec2_client.meta.region_name),
+                environment.stack_name,
+            )
+        )
+        if timings:
+            print(f"  {timings}")
+        if details is None or details_key != (status.stack_state, status.instance_id):
+            details = _render_environment_details(environment, ec2_client, status)
+            details_key = (status.stack_state, status.instance_id)
+        print(details, end="")
         current_state = _build_environment_state(status)
         current_availability = build_action_availability(current_state)
         _show_gated_action_menu(current_availability)
-        choice = parse_action_choice(input("Choose action (1-9): "))
+        choice = parse_action_choice(input("Choose action (1-12): "))
         if choice is None:
-            print("Invalid selection. Enter 1-9, or q to quit.")
+            print("Invalid selection. Enter 1-12, or q to quit.")
             continue
         if not current_availability[choice].enabled:
             print(current_availability[choice].disabled_reason or "Action is unavailable.")
@@ -173,18 +290,17 @@ def _run_action_loop(
                 or "Action is unavailable because state changed."
             )
             continue
+        if choice in _DETAIL_REFRESH_ACTIONS:
+            details = None
         try:
-            result = dispatch_action(
-                choice,
-                environment,
-                input_func=input,
-                out=sys.stdout,
-                runner=lambda command, cwd, env_overrides: run_script(
-                    command,
-                    cwd=cwd,
-                    env_overrides=env_overrides,
-                ),
-            )
+            with trace_span(f"interactive.{choice}", environment=environment.environment_key):
+                result = dispatch_action(
+                    choice,
+                    environment,
+                    input_func=input,
+                    out=sys.stdout,
+                    runner=runner,
+                )
         except RuntimeError as err:
             print(str(err))
             continue
@@ -206,8 +322,10 @@ def main(argv: Sequence[str] | None = None) -> int:
             "Unable to resolve AWS region. Set --region, AWS_REGION, AWS_DEFAULT_REGION, or configure profile region."
         )
 
-    cloudformation_client = session.client("cloudformation")
-    ec2_client = session.client("ec2")
+    init_tracing("interactive_workstation")
+    cloudformation_client = instrument_client(session.client("cloudformation"))
+    ec2_client = instrument_client(session.client("ec2"))
+    runner = _build_action_runner(session, use_subprocess=args.subprocess_actions)
     environments = discover_environments(aws_root, out=sys.stdout)
     last_used_environment_key = load_last_used_environment_key(state_file)
 
@@ -228,6 +346,7 @@ def main(argv: Sequence[str] | None = None) -> int:
             environment=selected,
             cloudformation_client=cloudformation_client,
             ec2_client=ec2_client,
+            runner=runner,
         )
         if result.should_quit:
             print("Bye.")
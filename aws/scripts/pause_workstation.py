@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""Pause or resume a workstation by stopping or starting its Spot instance."""
+
+from __future__ import annotations
+
+import argparse
+import os
+from pathlib import Path
+import sys
+import time
+from typing import Sequence
+
+import boto3
+
+# Reason: allow importing sibling shared package when executed as a script.
+AWS_ROOT = Path(__file__).resolve().parents[1]
+if str(AWS_ROOT) not in sys.path:
+    sys.path.insert(0, str(AWS_ROOT))
+
+from workstation_core import load_environment_spec, resolve_access_mode
+from workstation_core.elastic_ip import find_eip_by_name
+from workstation_core.orchestration import requires_elastic_ip
+from workstation_core.pause import (
+    DEFAULT_LIFECYCLE_TIMING_DIR,
+    format_lifecycle_timings,
+    load_lifecycle_timings,
+    pause_workstation,
+    record_lifecycle_timing,
+    start_paused_workstation,
+)
+from workstation_core.readiness import print_connection_guidance, wait_for_workstation_ready
+from workstation_core.tracing import ensure_tracing, instrument_client
+
+
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    """Parse CLI args for the pause/resume workflow."""
+    parser = argparse.ArgumentParser(
+        description=(
+            "Stop the workstation's Spot instance while keeping its stack, volume and Elastic IP. "
+            "With --resume, start the same instance again."
+        )
+    )
+    parser.add_argument(
+        "--environment",
+        required=True,
+        help="Environment key (used to find the Elastic IP on resume).",
+    )
+    parser.add_argument(
+        "--stack-dir",
+        required=True,
+        help="Path to CDK app directory (for example: aws/gastown).",
+    )
+    parser.add_argument(
+        "--stack-name",
+        required=True,
+        help="CloudFormation stack name.",
+    )
+    parser.add_argument(
+        "--spot-fleet-logical-id",
+        default=None,
+        help="Optional Spot Fleet logical id override.",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        default=False,
+        help="Start the paused instance and reassociate its Elastic IP instead of pausing.",
+    )
+    parser.add_argument(
+        "--profile",
+        default=None,
+        help="Optional AWS profile override.",
+    )
+    parser.add_argument(
+        "--region",
+        default=None,
+        help="Optional AWS region override.",
+    )
+    return parser.parse_args(argv)
+
+
+def _resolve_region(cli_region: str | None) -> str | None:
+    """Resolve region precedence from CLI then AWS env vars."""
+    if cli_region and cli_region.strip():
+        return cli_region.strip()
+    if os.environ.get("AWS_REGION", "").strip():
+        return os.environ["AWS_REGION"].strip()
+    if os.environ.get("AWS_DEFAULT_REGION", "").strip():
+        return os.environ["AWS_DEFAULT_REGION"].strip()
+    return None
+
+
+def _resolve_profile(cli_profile: str | None) -> str | None:
+    """Resolve profile precedence from CLI then AWS env vars."""
+    if cli_profile and cli_profile.strip():
+        return cli_profile.strip()
+    if os.environ.get("AWS_PROFILE", "").strip():
+        return os.environ["AWS_PROFILE"].strip()
+    return None
+
+
+def main(argv: Sequence[str] | None = None, *, session: boto3.Session | None = None) -> int:
+    """Run the pause or resume workflow.
+
+    Args:
+        argv: Optional CLI arguments; defaults to ``sys.argv``.
+        session: Optional boto3 session reused instead of resolving a new one.
+
+    Returns:
+        Process status code.
+    """
+    args = parse_args(argv)
+    action = "resume" if args.resume else "pause"
+    tracer = ensure_tracing(f"{action}_workstation")
+    with tracer.span(f"{action}_workstation", environment=args.environment, stack_name=args.stack_name):
+        return _run(args, session=session)
+
+
+def _run(args: argparse.Namespace, *, session: boto3.Session | None = None) -> int:
+    """Run pause or resume for parsed CLI arguments."""
+    profile = _resolve_profile(args.profile)
+    if session is None:
+        session = boto3.Session(profile_name=profile, region_name=_resolve_region(args.region))
+    if not session.region_name:
+        raise RuntimeError(
+            "Unable to resolve AWS region. Set --region, AWS_REGION, AWS_DEFAULT_REGION, or configure profile region."
+        )
+    region = str(session.region_name)
+
+    environment_spec = load_environment_spec(stack_dir=args.stack_dir)
+    environment_key = args.environment
+    spot_fleet_logical_id = f"{Path(args.stack_dir).name.capitalize()}SpotFleet"
+    ssh_alias = f"{environment_key}-workstation"
+    if environment_spec is not None:
+        environment_key = str(environment_spec.environment_key)
+        spot_fleet_logical_id = str(environment_spec.spot_fleet_logical_id)
+        ssh_alias = str(environment_spec.ssh_alias)
+    if args.spot_fleet_logical_id and args.spot_fleet_logical_id.strip():
+        spot_fleet_logical_id = args.spot_fleet_logical_id.strip()
+
+    ec2_client = instrument_client(session.client("ec2"))
+    cloudformation_client = instrument_client(session.client("cloudformation"))
+
+    if not args.resume:
+        transition = pause_workstation(
+            cloudformation_client,
+            ec2_client,
+            stack_name=args.stack_name,
+            spot_fleet_logical_id=spot_fleet_logical_id,
+        )
+        print(f"Paused {transition.instance_id} after {transition.elapsed_seconds:.0f}s. Resume with --resume.")
+        return 0
+
+    access_mode = resolve_access_mode(cli_access_mode=None, env=os.environ, environment_spec=environment_spec)
+    eip_info = find_eip_by_name(ec2_client, environment_key) if requires_elastic_ip(access_mode) else None
+    started_at = time.monotonic()
+    start_paused_workstation(
+        cloudformation_client,
+        ec2_client,
+        stack_name=args.stack_name,
+        spot_fleet_logical_id=spot_fleet_logical_id,
+    )
+    readiness = wait_for_workstation_ready(
+        cloudformation_client,
+        ec2_client,
+        stack_name=args.stack_name,
+        spot_fleet_logical_id=spot_fleet_logical_id,
+        access_mode=access_mode,
+        eip_allocation_id=eip_info["allocation_id"] if eip_info is not None else None,
+        eip_public_ip=eip_info["public_ip"] if eip_info is not None else None,
+        ssm_client=instrument_client(session.client("ssm")) if access_mode == "ssm" else None,
+    )
+    resume_seconds = time.monotonic() - started_at
+    print_connection_guidance(
+        readiness,
+        access_mode=access_mode,
+        region=region,
+        profile=profile,
+        ssh_alias=ssh_alias,
+    )
+    record_lifecycle_timing(
+        DEFAULT_LIFECYCLE_TIMING_DIR,
+        region,
+        args.stack_name,
+        action="resume",
+        seconds=resume_seconds,
+    )
+    print(format_lifecycle_timings(load_lifecycle_timings(DEFAULT_LIFECYCLE_TIMING_DIR, region, args.stack_name)))
+    return 0
+
+
+if __name__ == "__main__":
+    try:
+        raise SystemExit(main())
+    except RuntimeError as err:
+        print(str(err), file=sys.stderr)
+        raise SystemExit(1)
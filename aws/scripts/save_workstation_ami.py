@@ -23,6 +23,8 @@ from workstation_core import (
     resolve_running_instance_id,
     wait_for_image_available,
 )
+from workstation_core.ami_catalog import expire_ami_catalog
+from workstation_core.tracing import instrument_client
 
 
 def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
@@ -108,13 +110,22 @@ def _resolve_spot_fleet_logical_id(args: argparse.Namespace) -> str:
     return f"{Path(args.stack_dir).name.capitalize()}SpotFleet"
 
 
-def main(argv: Sequence[str] | None = None) -> int:
-    """Run save-only AMI workflow."""
-    args = parse_args(argv)
-    profile = _resolve_profile(args.profile)
-    region = _resolve_region(args.region)
+def main(argv: Sequence[str] | None = None, *, session: boto3.Session | None = None) -> int:
+    """Run save-only AMI workflow.
+
+    Args:
+        argv: Optional CLI arguments; defaults to ``sys.argv``.
+        session: Optional boto3 session reused instead of resolving a new one.
 
-    session = boto3.Session(profile_name=profile, region_name=region)
+    Returns:
+        Process status code.
+    """
+    args = parse_args(argv)
+    if session is None:
+        session = boto3.Session(
+            profile_name=_resolve_profile(args.profile),
+            region_name=_resolve_region(args.region),
+        )
     if not session.region_name:
         raise RuntimeError(
             "Unable to resolve AWS region. Set --region, AWS_REGION, AWS_DEFAULT_REGION, or configure profile region."
@@ -127,8 +138,8 @@ def main(argv: Sequence[str] | None = None) -> int:
     image_name = build_stop_image_name(environment_key, args.ami_tag)
     spot_fleet_logical_id = _resolve_spot_fleet_logical_id(args)
 
-    ec2_client = session.client("ec2")
-    cloudformation_client = session.client("cloudformation")
+    ec2_client = instrument_client(session.client("ec2"))
+    cloudformation_client = instrument_client(session.client("cloudformation"))
     instance_id = resolve_running_instance_id(
         cloudformation_client,
         ec2_client,
@@ -140,6 +151,7 @@ def main(argv: Sequence[str] | None = None) -> int:
         instance_id=instance_id,
         image_name=image_name,
     )
+    expire_ami_catalog(ec2_client, environment_key)
     wait_for_image_available(ec2_client, image_id=image_id)
     print(f"Saved AMI {image_name} ({image_id})")
     return 0
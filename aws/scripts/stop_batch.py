@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""Stop several workstation environments concurrently."""
+
+from __future__ import annotations
+
+import argparse
+import os
+from pathlib import Path
+import sys
+from typing import Sequence
+
+# Reason: allow importing sibling shared package when executed as a script.
+AWS_ROOT = Path(__file__).resolve().parents[1]
+if str(AWS_ROOT) not in sys.path:
+    sys.path.insert(0, str(AWS_ROOT))
+
+from workstation_core.ami_lifecycle import is_truthy
+from workstation_core.batch import resolve_batch_targets, run_batch_stop
+from workstation_core.interactive_workstation import discover_environments
+from workstation_core.tracing import ensure_tracing
+
+
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    """Parse command line arguments.
+
+    Args:
+        argv: Optional CLI arguments for testability.
+
+    Returns:
+        Parsed namespace with batch stop configuration.
+    """
+    parser = argparse.ArgumentParser(
+        description=(
+            "Destroy several workstation stacks at once. When AMI_SAVE=1 and AMI_TAG "
+            "are set, every AMI save starts first and each stack is destroyed as soon "
+            "as its own image is available."
+        )
+    )
+    parser.add_argument(
+        "environments",
+        nargs="+",
+        help="Environment keys to stop (for example: gastown builder openclaw).",
+    )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=None,
+        help="Maximum environments waiting or destroying at once (default: all).",
+    )
+    parser.add_argument(
+        "--profile",
+        default=None,
+        help="Optional AWS profile override.",
+    )
+    parser.add_argument(
+        "--region",
+        default=None,
+        help="Optional AWS region override.",
+    )
+    parser.add_argument(
+        "--destroy-eip",
+        action="store_true",
+        default=False,
+        help="Release each environment's Elastic IP after its stack is destroyed. Also enabled by EIP_DESTROY=1.",
+    )
+    parser.add_argument(
+        "--destroy-shared-network",
+        action="store_true",
+        default=False,
+        help="Destroy the shared network stack once no environment stacks remain.",
+    )
+    parser.add_argument(
+        "--fast-stop",
+        action="store_true",
+        default=False,
+        help=(
+            "With AMI_SAVE=1, destroy each stack once its AMI's snapshots have started. "
+            "Also enabled by AMI_FAST_STOP=1."
+        ),
+    )
+    args = parser.parse_args(argv)
+    if args.max_workers is not None and args.max_workers < 1:
+        parser.error("--max-workers must be at least 1.")
+    return args
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the batch stop and return a process status code.
+
+    Args:
+        argv: Optional CLI arguments; defaults to ``sys.argv``.
+
+    Returns:
+        Zero when every environment stopped, otherwise one.
+    """
+    args = parse_args(argv)
+    targets = resolve_batch_targets(args.environments, discover_environments(AWS_ROOT, sys.stdout))
+    tracer = ensure_tracing("stop_batch")
+    with tracer.span("stop_batch", environments=",".join(target.environment_key for target in targets)):
+        results = run_batch_stop(
+            targets,
+            profile=args.profile,
+            region=args.region,
+            destroy_eip=args.destroy_eip or is_truthy(os.environ.get("EIP_DESTROY", "")),
+            destroy_shared_network=args.destroy_shared_network,
+            fast_stop=args.fast_stop or is_truthy(os.environ.get("AMI_FAST_STOP", "")),
+            max_workers=args.max_workers,
+        )
+    return 0 if all(result.succeeded for result in results) else 1
+
+
+if __name__ == "__main__":
+    try:
+        raise SystemExit(main())
+    except RuntimeError as err:
+        print(str(err), file=sys.stderr)
+        raise SystemExit(1)
@@ -11,7 +11,7 @@ from typing import Sequence
 
 import boto3
 
-from workstation_core.orchestration import load_environment_spec, run_command
+from workstation_core.orchestration import build_destroy_command, load_environment_spec, run_command
 from workstation_core import (
     StopOrchestrationInputs,
     build_stop_image_name,
@@ -22,7 +22,10 @@ from workstation_core import (
     run_stop_orchestration,
     wait_for_image_available,
 )
+from workstation_core.ami_catalog import expire_ami_catalog
 from workstation_core.elastic_ip import find_eip_by_name, release_eip as _release_eip
+from workstation_core.pending_ami import DEFAULT_PENDING_AMI_DIR, record_pending_ami, wait_for_image_snapshots
+from workstation_core.tracing import ensure_tracing, instrument_client
 
 DESTROY_TIMEOUT_SECONDS = 45 * 60
 
@@ -71,6 +74,15 @@ def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
         default=False,
         help="Release the associated Elastic IP after the stack is destroyed. Also enabled by EIP_DESTROY=1.",
     )
+    parser.add_argument(
+        "--fast-stop",
+        action="store_true",
+        default=False,
+        help=(
+            "With AMI_SAVE=1, destroy once the AMI's snapshots have started instead of waiting "
+            "for the AMI to become available. Also enabled by AMI_FAST_STOP=1."
+        ),
+    )
     return parser.parse_args(argv)
 
 
@@ -115,21 +127,38 @@ def _resolve_spot_fleet_logical_id(args: argparse.Namespace) -> str:
     return f"{Path(args.stack_dir).name.capitalize()}SpotFleet"
 
 
-def main(argv: Sequence[str] | None = None) -> int:
-    """Run stop workflow with optional save-on-stop AMI path."""
+def main(argv: Sequence[str] | None = None, *, session: boto3.Session | None = None) -> int:
+    """Run stop workflow with optional save-on-stop AMI path.
+
+    Args:
+        argv: Optional CLI arguments; defaults to ``sys.argv``.
+        session: Optional boto3 session reused instead of resolving a new one.
+
+    Returns:
+        Process status code.
+    """
     args = parse_args(argv)
+    tracer = ensure_tracing("stop_workstation")
+    with tracer.span("stop_workstation", environment=args.environment, stack_name=args.stack_name):
+        return _run_stop(args, session=session)
+
+
+def _run_stop(args: argparse.Namespace, *, session: boto3.Session | None = None) -> int:
+    """Run the stop workflow for parsed CLI arguments."""
     ami_save, ami_tag = parse_stop_ami_config(os.environ)
 
-    profile = _resolve_profile(args.profile)
-    region = _resolve_region(args.region)
-    session = boto3.Session(profile_name=profile, region_name=region)
+    if session is None:
+        session = boto3.Session(
+            profile_name=_resolve_profile(args.profile),
+            region_name=_resolve_region(args.region),
+        )
     if not session.region_name:
         raise RuntimeError(
             "Unable to resolve AWS region. Set --region, AWS_REGION, AWS_DEFAULT_REGION, or configure profile region."
         )
 
-    ec2_client = session.client("ec2")
-    cloudformation_client = session.client("cloudformation")
+    ec2_client = instrument_client(session.client("ec2"))
+    cloudformation_client = instrument_client(session.client("cloudformation"))
     environment_key = _resolve_environment_key(
         stack_dir=args.stack_dir,
         fallback_environment=args.environment,
@@ -141,6 +170,7 @@ def main(argv: Sequence[str] | None = None) -> int:
         spot_fleet_logical_id=spot_fleet_logical_id,
         ami_save=ami_save,
         ami_tag=ami_tag,
+        fast_stop=args.fast_stop or is_truthy(os.environ.get("AMI_FAST_STOP", "")),
     )
 
     eip_destroy = args.destroy_eip or is_truthy(os.environ.get("EIP_DESTROY", ""))
@@ -171,16 +201,32 @@ def main(argv: Sequence[str] | None = None) -> int:
             image_id=image_id,
         ),
         destroy_stack=lambda: run_command(
-            ["uv", "run", "cdk", "destroy", "--force", args.stack_name],
+            build_destroy_command(args.stack_name),
             cwd=args.stack_dir,
             timeout_seconds=DESTROY_TIMEOUT_SECONDS,
         ),
         release_eip=release_eip_callback,
+        wait_for_image_snapshots=lambda image_id: wait_for_image_snapshots(
+            ec2_client,
+            image_id=image_id,
+        ),
+        record_pending_image=lambda image_id, image_name, snapshot_ids: record_pending_ami(
+            DEFAULT_PENDING_AMI_DIR,
+            str(session.region_name),
+            image_id=image_id,
+            image_name=image_name,
+            environment_key=environment_key,
+            snapshot_ids=snapshot_ids,
+        ),
     )
 
     if saved_image_id is not None:
+        expire_ami_catalog(ec2_client, environment_key)
         image_name = build_stop_image_name(environment_key, ami_tag or "")
-        print(f"Saved AMI {image_name} ({saved_image_id})")
+        if stop_inputs.fast_stop:
+            print(f"AMI {image_name} ({saved_image_id}) is still completing; its snapshots have started.")
+        else:
+            print(f"Saved AMI {image_name} ({saved_image_id})")
     print("Destroy complete.")
     return 0
 
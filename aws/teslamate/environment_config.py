@@ -20,6 +20,12 @@ _ENVIRONMENT_SPEC = EnvironmentSpec(
     volume_size=20,
     spot_price="0.1",
     default_access_mode="both",
+    # Reason: keep in sync with the compose file written by init/teslamate.sh.
+    container_images=(
+        "postgres:17.9@sha256:bf7b099328817f46a5248cf0df4c9f03a4c64954b442a4fa796ae84e97b716c7",
+        "teslamate/teslamate:3.0.0@sha256:f064d5b303a98b3ae72d26dac2e7a4adfa67d40c33a2f08f3cc1348d7494cd33",
+        "teslamate/grafana:3.0.0@sha256:e02d1f036dd10771ea04db2bafc483067a9dbb874d0b5137dda5a6fe539b77dc",
+    ),
 )
 validate_environment_spec(_ENVIRONMENT_SPEC)
 
@@ -79,4 +79,5 @@ services:
 EOF
 
 cd "$COMPOSE_DIR"
-docker compose pull
+# Reason: docker.sh already tagged the cached images; only fetch what it could not.
+docker compose pull --policy missing
@@ -4,11 +4,19 @@ This package defines cross-environment foundations that can be reused by
 multiple AWS workstation applications.
 """
 
+from workstation_core.ami_catalog import (
+    AmiCatalog,
+    catalog_environment_images,
+    catalog_exact_image_id,
+    expire_ami_catalog,
+    refresh_ami_catalog,
+)
 from workstation_core.ami_lifecycle import (
     AmiModeConfig,
     AmiSelectionResult,
     build_ami_lookup_error_message,
     create_image_from_instance,
+    describe_own_images,
     is_truthy,
     list_environment_images,
     pick_image_interactively,
@@ -20,47 +28,85 @@ from workstation_core.ami_lifecycle import (
     validate_mode_arguments,
     wait_for_image_available,
 )
+from workstation_core.assembly_cache import compute_assembly_cache_key, find_cached_assembly
+from workstation_core.batch import BatchEnvironmentResult, run_batch_deploy, run_batch_stop
+from workstation_core.bootstrap_timing import (
+    BootstrapLaunch,
+    BootstrapScriptTiming,
+    BootstrapTimingReport,
+    describe_bootstrap_launch,
+    fetch_bootstrap_timings,
+    format_bootstrap_timings,
+    report_bootstrap_timings,
+    wait_for_bootstrap_complete,
+)
 from workstation_core.cdk_helpers import (
     CdkTarget,
     build_bootstrap_user_data,
     build_spot_fleet_launch_specification,
     build_stack_name,
+    render_bootstrap_runner,
     resolve_ami_id,
     resolve_subnet_availability_zone,
 )
+from workstation_core.change_set_deploy import (
+    ChangeSetDeployResult,
+    ResourceTiming,
+    StackArtifact,
+    StackEventTail,
+    deploy_stack_artifact,
+    format_resource_timings,
+    load_stack_artifact,
+)
 from workstation_core.config import CoreConfig, SharedNetworkConfig, get_shared_network_config
 from workstation_core.environment_config import (
     AmiSelectorConfig,
     EnvironmentSpec,
+    InstanceTypeOption,
+    resolve_bootstrap_dependencies,
     validate_environment_spec,
 )
 from workstation_core.orchestration import (
     DeployWorkflowInputs,
     OrchestrationPlan,
+    SharedNetworkFeatures,
     StopOrchestrationInputs,
     build_stop_image_name,
     deploy_shared_network_stack,
     deploy_stack,
     destroy_shared_network_stack,
+    ensure_shared_network_stack,
     load_environment_spec,
     make_ec2_client,
     parse_stop_ami_config,
     resolve_access_mode,
+    resolve_deploy_engine,
     run_command,
     run_deploy_lifecycle,
-    run_post_deploy_check,
     run_stop_orchestration,
     validate_plan,
 )
 from workstation_core.runtime import RuntimeContext
+from workstation_core.az_selection import (
+    AvailabilityZoneSelection,
+    choose_workstation_availability_zones,
+    select_availability_zones,
+)
+from workstation_core.spot_fulfilment import (
+    SpotFleetFailure,
+    SpotFleetFulfilmentMonitor,
+    classify_spot_fleet_error,
+)
 from workstation_core.runtime_resolution import (
     get_account,
+    get_caller_account,
     get_profile_name,
     get_profile_section_name,
     get_region,
     get_region_from_config,
     load_aws_config,
     parse_optional_bool_context,
+    parse_optional_index_list_context,
     parse_optional_text_context,
 )
 from workstation_core.interactive_workstation import (
@@ -72,8 +118,14 @@ from workstation_core.interactive_workstation import (
     load_last_used_environment_key,
     parse_action_choice,
     run_script,
+    run_script_in_process,
     save_last_used_environment_key,
 )
+from workstation_core.deploy_fingerprint import (
+    StackDeployDecision,
+    decide_stack_deploy,
+    format_deploy_report,
+)
 from workstation_core.elastic_ip import (
     associate_eip_with_instance,
     create_eip,
@@ -82,9 +134,45 @@ from workstation_core.elastic_ip import (
     release_eip,
 )
 from workstation_core.workstation_status import WorkstationStatus, get_workstation_status
+from workstation_core.golden_ami import (
+    GoldenImageChoice,
+    GoldenImageStatus,
+    build_golden_image,
+    choose_deploy_golden_image,
+    resolve_golden_image_status,
+)
+from workstation_core.pause import (
+    LifecycleTimings,
+    format_lifecycle_timings,
+    load_lifecycle_timings,
+    pause_workstation,
+    start_paused_workstation,
+)
+from workstation_core.pending_ami import PendingAmi, check_pending_amis, wait_for_image_snapshots
+from workstation_core.preflight import DeployPreflight, DeployPreflightResult
+from workstation_core.readiness import (
+    WorkstationReadiness,
+    print_connection_guidance,
+    wait_for_workstation_ready,
+)
+from workstation_core.tracing import (
+    Tracer,
+    ensure_tracing,
+    get_tracer,
+    init_tracing,
+    instrument_client,
+    trace_span,
+)
+from workstation_core.volume_warming import (
+    FastSnapshotRestoreLease,
+    VolumePrereadStatus,
+    enable_fast_snapshot_restores,
+    wait_for_volume_preread,
+)
 
 __all__ = [
     "AmiSelectorConfig",
+    "InstanceTypeOption",
     "associate_eip_with_instance",
     "create_eip",
     "find_eip_by_name",
@@ -93,26 +181,62 @@ __all__ = [
     "AmiModeConfig",
     "AmiSelectionResult",
     "CdkTarget",
+    "compute_assembly_cache_key",
+    "find_cached_assembly",
+    "BatchEnvironmentResult",
+    "run_batch_deploy",
+    "run_batch_stop",
+    "ChangeSetDeployResult",
+    "ResourceTiming",
+    "StackArtifact",
+    "StackEventTail",
+    "deploy_stack_artifact",
+    "format_resource_timings",
+    "load_stack_artifact",
     "CoreConfig",
     "DeployWorkflowInputs",
     "EnvironmentSpec",
     "OrchestrationPlan",
     "SharedNetworkConfig",
+    "SharedNetworkFeatures",
     "StopOrchestrationInputs",
     "RuntimeContext",
+    "AvailabilityZoneSelection",
+    "choose_workstation_availability_zones",
+    "select_availability_zones",
+    "SpotFleetFailure",
+    "SpotFleetFulfilmentMonitor",
+    "classify_spot_fleet_error",
     "build_ami_lookup_error_message",
     "build_bootstrap_user_data",
+    "BootstrapLaunch",
+    "BootstrapScriptTiming",
+    "BootstrapTimingReport",
+    "describe_bootstrap_launch",
+    "fetch_bootstrap_timings",
+    "format_bootstrap_timings",
+    "report_bootstrap_timings",
+    "wait_for_bootstrap_complete",
+    "render_bootstrap_runner",
     "build_spot_fleet_launch_specification",
     "build_stack_name",
     "deploy_shared_network_stack",
     "deploy_stack",
     "destroy_shared_network_stack",
+    "ensure_shared_network_stack",
     "get_shared_network_config",
     "resolve_ami_id",
     "resolve_subnet_availability_zone",
     "validate_environment_spec",
+    "resolve_bootstrap_dependencies",
     "is_truthy",
     "list_environment_images",
+    "describe_own_images",
+    "AmiCatalog",
+    "catalog_environment_images",
+    "catalog_exact_image_id",
+    "expire_ami_catalog",
+    "refresh_ami_catalog",
     "load_environment_spec",
     "make_ec2_client",
     "pick_image_interactively",
@@ -122,23 +246,25 @@ __all__ = [
     "run_ami_permission_preflight",
     "run_command",
     "run_deploy_lifecycle",
-    "run_post_deploy_check",
     "validate_plan",
     "build_stop_image_name",
     "parse_stop_ami_config",
     "resolve_access_mode",
+    "resolve_deploy_engine",
     "run_stop_orchestration",
     "validate_mode_arguments",
     "resolve_running_instance_id",
     "create_image_from_instance",
     "wait_for_image_available",
     "get_account",
+    "get_caller_account",
     "get_profile_name",
     "get_profile_section_name",
     "get_region",
     "get_region_from_config",
     "load_aws_config",
     "parse_optional_bool_context",
+    "parse_optional_index_list_context",
     "parse_optional_text_context",
     "ActionResult",
     "EnvironmentTarget",
@@ -148,7 +274,39 @@ __all__ = [
     "load_last_used_environment_key",
     "parse_action_choice",
     "run_script",
+    "run_script_in_process",
     "save_last_used_environment_key",
     "WorkstationStatus",
     "get_workstation_status",
+    "GoldenImageChoice",
+    "GoldenImageStatus",
+    "build_golden_image",
+    "choose_deploy_golden_image",
+    "resolve_golden_image_status",
+    "LifecycleTimings",
+    "format_lifecycle_timings",
+    "load_lifecycle_timings",
+    "pause_workstation",
+    "start_paused_workstation",
+    "PendingAmi",
+    "check_pending_amis",
+    "wait_for_image_snapshots",
+    "DeployPreflight",
+    "DeployPreflightResult",
+    "StackDeployDecision",
+    "decide_stack_deploy",
+    "format_deploy_report",
+    "WorkstationReadiness",
+    "print_connection_guidance",
+    "wait_for_workstation_ready",
+    "FastSnapshotRestoreLease",
+    "VolumePrereadStatus",
+    "enable_fast_snapshot_restores",
+    "wait_for_volume_preread",
+    "Tracer",
+    "ensure_tracing",
+    "get_tracer",
+    "init_tracing",
+    "instrument_client",
+    "trace_span",
 ]
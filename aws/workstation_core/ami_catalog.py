@@ -0,0 +1,266 @@
+"""Local catalog of environment AMIs for list, pick and load lookups."""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass, replace
+from datetime import datetime, timedelta, timezone
+import json
+import logging
+import os
+from pathlib import Path
+import time
+from typing import Any, Callable
+
+from workstation_core.ami_lifecycle import describe_own_images, resolve_exact_image_id
+
+LOGGER = logging.getLogger(__name__)
+DEFAULT_AMI_CATALOG_DIR = Path.home() / ".config" / "env4ai" / "ami-catalog"
+# Reason: saves through this tool expire the catalog, so the TTL only bounds drift from other tools.
+AMI_CATALOG_TTL_SECONDS = 10 * 60
+# Reason: incremental refreshes only see new images; a daily full refresh drops deregistered ones.
+AMI_CATALOG_FULL_REFRESH_SECONDS = 24 * 60 * 60
+
+
+@dataclass(frozen=True, slots=True)
+class AmiCatalog:
+    """Cached AMIs of one environment in one account and region.
+
+    Args:
+        images: AMI records shaped like ``list_environment_images`` output,
+            newest first.
+        refreshed_at: Wall-clock time of the last refresh from EC2.
+        full_refreshed_at: Wall-clock time of the last full refresh.
+        stale: Whether a save marked the catalog out of date.
+    """
+
+    images: tuple[dict[str, str], ...]
+    refreshed_at: float
+    full_refreshed_at: float
+    stale: bool = False
+
+
+def _catalog_path(catalog_dir: Path, account_id: str, region: str, environment: str) -> Path:
+    """Return the catalog file for one account, region and environment."""
+    return catalog_dir / account_id / region / f"{environment}.json"
+
+
+def load_ami_catalog(catalog_dir: Path, account_id: str, region: str, environment: str) -> AmiCatalog | None:
+    """Return the stored catalog, or ``None`` when it is missing or unreadable."""
+    path = _catalog_path(catalog_dir, account_id, region, environment)
+    try:
+        record = json.loads(path.read_text(encoding="utf-8"))
+        return AmiCatalog(
+            images=tuple({str(key): str(value) for key, value in image.items()} for image in record["images"]),
+            refreshed_at=float(record["refreshed_at"]),
+            full_refreshed_at=float(record["full_refreshed_at"]),
+            stale=bool(record.get("stale", False)),
+        )
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        LOGGER.warning("Ignoring unreadable AMI catalog path=%s", path)
+        return None
+
+
+def store_ami_catalog(
+    catalog_dir: Path,
+    account_id: str,
+    region: str,
+    environment: str,
+    catalog: AmiCatalog,
+) -> None:
+    """Write the catalog to disk (best effort)."""
+    path = _catalog_path(catalog_dir, account_id, region, environment)
+    staged = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        staged.write_text(json.dumps(asdict(catalog), indent=2) + "\n", encoding="utf-8")
+        # Reason: concurrent deploys must never read a half-written catalog.
+        staged.replace(path)
+    except OSError:
+        LOGGER.warning("Unable to store AMI catalog path=%s", path, exc_info=True)
+
+
+def expire_ami_catalog(
+    ec2_client: Any,
+    environment: str,
+    *,
+    catalog_dir: Path = DEFAULT_AMI_CATALOG_DIR,
+) -> None:
+    """Mark an environment's catalogs stale so the next lookup sees a new save.
+
+    Every account's catalog for the region is expired.
+    """
+    region = str(ec2_client.meta.region_name)
+    # Reason: callers save without resolving their account; an extra refresh is cheaper than an STS call.
+    for path in sorted(catalog_dir.glob(f"*/{region}/{environment}.json")):
+        account_id = path.parent.parent.name
+        catalog = load_ami_catalog(catalog_dir, account_id, region, environment)
+        if catalog is not None and not catalog.stale:
+            store_ami_catalog(catalog_dir, account_id, region, environment, replace(catalog, stale=True))
+
+
+def _creation_days(since: float, now: float) -> list[str]:
+    """Return ``creation-date`` filter values covering every UTC day from ``since`` to ``now``."""
+    day = datetime.fromtimestamp(since, tz=timezone.utc).date()
+    last = max(day, datetime.fromtimestamp(now, tz=timezone.utc).date())
+    days: list[str] = []
+    while day <= last:
+        days.append(f"{day.isoformat()}T*")
+        day += timedelta(days=1)
+    return days
+
+
+def _sorted_images(images: Any) -> tuple[dict[str, str], ...]:
+    """Return AMI records newest first."""
+    return tuple(sorted(images, key=lambda image: image["creation_date"], reverse=True))
+
+
+def refresh_ami_catalog(
+    ec2_client: Any,
+    environment: str,
+    *,
+    account_id: str,
+    catalog_dir: Path = DEFAULT_AMI_CATALOG_DIR,
+    full: bool = False,
+    clock: Callable[[], float] = time.time,
+) -> AmiCatalog:
+    """Refresh an environment's catalog from EC2 and store it.
+
+    An incremental refresh lists only AMIs created since the previous refresh
+    and re-reads the ones that were still pending.  A full refresh lists
+    every AMI and runs when requested, when there is no catalog yet, or once
+    the last full refresh is older than ``AMI_CATALOG_FULL_REFRESH_SECONDS``.
+
+    Args:
+        ec2_client: Boto3 EC2 client for the catalog region.
+        environment: Environment prefix in AMI names.
+        account_id: Account owning the AMIs.
+        catalog_dir: Root directory of the local catalog.
+        full: Force a full refresh.
+        clock: Wall clock for testability.
+
+    Returns:
+        The refreshed catalog.
+
+    Raises:
+        RuntimeError: If the AMI lookup fails.
+    """
+    region = str(ec2_client.meta.region_name)
+    now = clock()
+    name_filter = {"Name": "name", "Values": [f"{environment}_*"]}
+    scope = f"list AMIs for '{environment}'"
+    cached = None if full else load_ami_catalog(catalog_dir, account_id, region, environment)
+    if cached is None or now - cached.full_refreshed_at > AMI_CATALOG_FULL_REFRESH_SECONDS:
+        images = describe_own_images(ec2_client, [name_filter], action="AMI catalog refresh", scope=scope)
+        catalog = AmiCatalog(images=_sorted_images(images), refreshed_at=now, full_refreshed_at=now)
+    else:
+        by_id = {image["image_id"]: image for image in cached.images}
+        pending_ids = [image_id for image_id, image in by_id.items() if image["state"] == "pending"]
+        if pending_ids:
+            rechecked = describe_own_images(
+                ec2_client,
+                [name_filter, {"Name": "image-id", "Values": pending_ids}],
+                action="AMI catalog refresh",
+                scope=scope,
+            )
+            # Reason: a pending AMI that disappeared was deregistered or failed to register.
+            for image_id in pending_ids:
+                del by_id[image_id]
+            by_id.update((image["image_id"], image) for image in rechecked)
+        created = describe_own_images(
+            ec2_client,
+            [name_filter, {"Name": "creation-date", "Values": _creation_days(cached.refreshed_at, now)}],
+            action="AMI catalog refresh",
+            scope=scope,
+        )
+        by_id.update((image["image_id"], image) for image in created)
+        catalog = AmiCatalog(
+            images=_sorted_images(by_id.values()),
+            refreshed_at=now,
+            full_refreshed_at=cached.full_refreshed_at,
+        )
+    store_ami_catalog(catalog_dir, account_id, region, environment, catalog)
+    return catalog
+
+
+def catalog_environment_images(
+    ec2_client: Any,
+    environment: str,
+    *,
+    account_id: str,
+    refresh: bool = False,
+    catalog_dir: Path = DEFAULT_AMI_CATALOG_DIR,
+    ttl_seconds: float = AMI_CATALOG_TTL_SECONDS,
+    clock: Callable[[], float] = time.time,
+) -> list[dict[str, str]]:
+    """List an environment's AMIs from the local catalog.
+
+    The catalog is refreshed first when ``refresh`` is set (fully), or when it
+    is missing, stale or older than ``ttl_seconds`` (incrementally).
+
+    Returns:
+        AMI records shaped like ``list_environment_images`` output, newest first.
+
+    Raises:
+        RuntimeError: If a needed refresh fails.
+    """
+    catalog = None
+    if not refresh:
+        catalog = load_ami_catalog(catalog_dir, account_id, str(ec2_client.meta.region_name), environment)
+    if catalog is None or catalog.stale or clock() - catalog.refreshed_at > ttl_seconds:
+        catalog = refresh_ami_catalog(
+            ec2_client,
+            environment,
+            account_id=account_id,
+            catalog_dir=catalog_dir,
+            full=refresh,
+            clock=clock,
+        )
+    return [dict(image) for image in catalog.images]
+
+
+def catalog_exact_image_id(
+    ec2_client: Any,
+    expected_name: str,
+    environment: str,
+    *,
+    account_id: str,
+    refresh: bool = False,
+    catalog_dir: Path = DEFAULT_AMI_CATALOG_DIR,
+    ttl_seconds: float = AMI_CATALOG_TTL_SECONDS,
+    clock: Callable[[], float] = time.time,
+) -> str:
+    """Resolve an AMI id by exact name, preferring the local catalog.
+
+    An id the catalog lists as ``available`` is confirmed with one lookup by
+    id.  Names the catalog does not list as ``available``, and ids that no
+    longer describe as ``available``, are resolved live with
+    ``resolve_exact_image_id``, which reports missing and pending AMIs.
+
+    Raises:
+        RuntimeError: If the AMI is missing, pending or cannot be looked up.
+    """
+    images = catalog_environment_images(
+        ec2_client,
+        environment,
+        account_id=account_id,
+        refresh=refresh,
+        catalog_dir=catalog_dir,
+        ttl_seconds=ttl_seconds,
+        clock=clock,
+    )
+    for image in images:
+        if image["name"] == expected_name:
+            if image["state"] == "available" and image["image_id"]:
+                # Reason: images deregistered elsewhere stay listed until the next full refresh.
+                live = describe_own_images(
+                    ec2_client,
+                    [{"Name": "image-id", "Values": [image["image_id"]]}],
+                    action="AMI exact-name lookup",
+                    scope=f"load AMI '{expected_name}'",
+                )
+                if any(item["name"] == expected_name and item["state"] == "available" for item in live):
+                    return image["image_id"]
+            break
+    return resolve_exact_image_id(ec2_client, expected_name=expected_name)
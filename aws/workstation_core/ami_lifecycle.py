@@ -26,12 +26,14 @@ class AmiModeConfig:
         ami_list: Whether AMI list mode is enabled.
         ami_pick: Whether list-and-pick mode is enabled.
         ami_bootstrap: Whether bootstrap should run for restored AMI deploys.
+        ami_refresh: Whether the local AMI catalog is fully refreshed before use.
     """
 
     ami_load_tag: str
     ami_list: bool
     ami_pick: bool
     ami_bootstrap: bool
+    ami_refresh: bool = False
 
 
 @dataclass(frozen=True, slots=True)
@@ -69,6 +71,7 @@ def read_ami_mode_from_env(env: Mapping[str, str] | None = None) -> AmiModeConfi
         ami_list=is_truthy(environment.get("AMI_LIST")),
         ami_pick=is_truthy(environment.get("AMI_PICK")),
         ami_bootstrap=is_truthy(environment.get("AMI_BOOTSTRAP")),
+        ami_refresh=is_truthy(environment.get("AMI_REFRESH")),
     )
 
 
@@ -175,22 +178,58 @@ def list_environment_images(ec2_client: BaseClient, environment: str) -> list[di
         )
         raise RuntimeError(build_ami_lookup_error_message(f"list AMIs for '{environment}'")) from err
 
-    images = response.get("Images", [])
-    normalized: list[dict[str, str]] = []
-    for image in images:
-        normalized.append(
-            {
-                "image_id": str(image.get("ImageId", "")),
-                "name": str(image.get("Name", "")),
-                "arn": str(image.get("ImageArn", "")),
-                "state": str(image.get("State", "unknown")),
-                "creation_date": str(image.get("CreationDate", "")),
-            }
-        )
+    normalized = [normalize_image_record(image) for image in response.get("Images", [])]
     normalized.sort(key=lambda image: image["creation_date"], reverse=True)
     return normalized
 
 
+def normalize_image_record(image: Mapping[str, Any]) -> dict[str, str]:
+    """Reduce a ``describe_images`` entry to the AMI metadata the lifecycle uses."""
+    return {
+        "image_id": str(image.get("ImageId", "")),
+        "name": str(image.get("Name", "")),
+        "arn": str(image.get("ImageArn", "")),
+        "state": str(image.get("State", "unknown")),
+        "creation_date": str(image.get("CreationDate", "")),
+    }
+
+
+def describe_own_images(
+    ec2_client: BaseClient,
+    filters: Sequence[Mapping[str, Any]],
+    *,
+    action: str,
+    scope: str,
+) -> list[dict[str, str]]:
+    """Page through ``describe_images`` for account-owned AMIs.
+
+    Args:
+        ec2_client: Boto3 EC2 client.
+        filters: ``describe_images`` filters.
+        action: Action named in permission errors.
+        scope: Action named in other lookup errors.
+
+    Returns:
+        Normalized AMI records in API order.
+
+    Raises:
+        RuntimeError: If the lookup fails.
+    """
+    records: list[dict[str, str]] = []
+    try:
+        paginator = ec2_client.get_paginator("describe_images")
+        # Reason: without MaxResults the API returns one unbounded page.
+        pages = paginator.paginate(Owners=["self"], Filters=list(filters), PaginationConfig={"PageSize": 1000})
+        for page in pages:
+            records.extend(normalize_image_record(image) for image in page.get("Images", []))
+    except Exception as err:
+        if isinstance(err, ClientError):
+            _raise_permission_preflight_error(action, err)
+        LOGGER.exception("Paginated describe_images failed filters=%s", filters)
+        raise RuntimeError(build_ami_lookup_error_message(scope)) from err
+    return records
+
+
 def resolve_exact_image_id(ec2_client: BaseClient, expected_name: str) -> str:
     """Resolve an AMI ID by exact AMI name.
 
@@ -225,6 +264,12 @@ def resolve_exact_image_id(ec2_client: BaseClient, expected_name: str) -> str:
     image_id = str(exact_matches[0].get("ImageId", "")).strip()
     if not image_id:
         raise RuntimeError(f"Requested AMI '{expected_name}' is missing ImageId metadata.")
+    if str(exact_matches[0].get("State", "")).strip() == "pending":
+        # Reason: fast-stop AMIs can still be completing in the background.
+        raise RuntimeError(
+            f"Requested AMI '{expected_name}' ({image_id}) is still pending. "
+            "Retry once it is available. Deploy aborted before Spot request creation."
+        )
     return image_id
 
 
@@ -329,15 +374,25 @@ def resolve_ami_selection(
     mode: AmiModeConfig,
     input_func: Callable[[str], str] = input,
     out: TextIO = sys.stdout,
+    *,
+    check_permissions: Callable[[], None] | None = None,
+    list_images: Callable[[], list[dict[str, str]]] | None = None,
+    resolve_image_id: Callable[[str], str] | None = None,
 ) -> AmiSelectionResult:
     """Resolve AMI behavior for deploy based on AMI lifecycle flags.
 
+    The optional lookup callbacks let callers supply results that were
+    fetched ahead of time (for example by the concurrent deploy preflight).
+
     Args:
         ec2_client: Boto3 EC2 client.
         environment_key: Canonical environment key used for AMI names.
         mode: AMI mode config.
         input_func: Input provider for interactive selection.
         out: Output stream used for list/pick feedback.
+        check_permissions: Optional replacement for the AMI permission preflight.
+        list_images: Optional replacement for ``list_environment_images``.
+        resolve_image_id: Optional replacement for ``resolve_exact_image_id``.
 
     Returns:
         AMI selection result used by deploy orchestration.
@@ -350,16 +405,25 @@ def resolve_ami_selection(
 
     should_check_ami_permissions = bool(mode.ami_load_tag or mode.ami_list)
     if should_check_ami_permissions:
-        run_ami_permission_preflight(ec2_client, environment=environment_key)
+        if check_permissions is not None:
+            check_permissions()
+        else:
+            run_ami_permission_preflight(ec2_client, environment=environment_key)
 
     if mode.ami_load_tag:
         expected_name = f"{environment_key}_{mode.ami_load_tag}"
-        selected_ami_id = resolve_exact_image_id(ec2_client, expected_name=expected_name)
+        if resolve_image_id is not None:
+            selected_ami_id = resolve_image_id(expected_name)
+        else:
+            selected_ami_id = resolve_exact_image_id(ec2_client, expected_name=expected_name)
         out.write(f"Resolved AMI {expected_name} -> {selected_ami_id}\n")
         return AmiSelectionResult(selected_ami_id=selected_ami_id, should_deploy=True)
 
     if mode.ami_list:
-        images = list_environment_images(ec2_client, environment=environment_key)
+        if list_images is not None:
+            images = list_images()
+        else:
+            images = list_environment_images(ec2_client, environment=environment_key)
         print_image_list(images, out=out)
         if not mode.ami_pick:
             return AmiSelectionResult(selected_ami_id=None, should_deploy=False)
@@ -0,0 +1,178 @@
+"""Content-addressed cache of synthesized CDK cloud assemblies."""
+
+from __future__ import annotations
+
+from dataclasses import asdict, is_dataclass
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+import shutil
+from typing import Any, Mapping
+
+from workstation_core.runtime_resolution import get_account, get_region
+
+LOGGER = logging.getLogger(__name__)
+DEFAULT_ASSEMBLY_CACHE_DIR = Path.home() / ".config" / "env4ai" / "assemblies"
+MAX_CACHED_ASSEMBLIES = 12
+_AWS_ROOT = Path(__file__).resolve().parents[1]
+# Reason: these files define what ``base_stack/app.py`` synthesizes.
+_APP_SOURCE_GLOBS = ("base_stack/app.py", "base_stack/workstation/*.py", "workstation_core/*.py")
+_STACK_DIR_FILES = ("cdk.json", "cdk.context.json", "environment_config.py")
+
+
+def _file_digest(path: Path) -> str:
+    """Return the SHA-256 of a file, or ``missing`` when it cannot be read."""
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except OSError:
+        return "missing"
+
+
+def _bootstrap_script_digests(stack_dir: Path, bootstrap_files: tuple[str, ...]) -> list[list[str]]:
+    """Hash init scripts using the same local-then-common lookup as the synth."""
+    digests: list[list[str]] = []
+    for filename in bootstrap_files:
+        local_path = stack_dir / "init" / filename
+        shared_path = stack_dir.parent / "common" / "init" / filename
+        resolved = local_path if local_path.is_file() else shared_path
+        origin = "local" if resolved is local_path else "common"
+        digests.append([filename, origin, _file_digest(resolved)])
+    return digests
+
+
+def _resolved_target(env: Mapping[str, str]) -> dict[str, str]:
+    """Return the account and region the synth will bind stacks to."""
+    target: dict[str, str] = {}
+    for key, resolver in (("account", get_account), ("region", get_region)):
+        try:
+            target[key] = resolver(env)
+        except RuntimeError:
+            target[key] = ""
+    return target
+
+
+def compute_assembly_cache_key(
+    stack_dir: str | Path,
+    context: Mapping[str, str],
+    environment_spec: object | None,
+    *,
+    env: Mapping[str, str] | None = None,
+    aws_root: Path = _AWS_ROOT,
+) -> str:
+    """Return the cache key for one synth of an environment's CDK app.
+
+    The key covers the environment spec, the CDK context values, the resolved
+    init scripts, the app sources and the target account/region.
+
+    Args:
+        stack_dir: Environment CDK app directory.
+        context: CDK context values passed to the synth.
+        environment_spec: Loaded ``ENVIRONMENT_SPEC``, if any.
+        env: Optional environment mapping for testability.
+        aws_root: Repository ``aws/`` directory holding the app sources.
+
+    Returns:
+        Hex SHA-256 digest.
+    """
+    stack_path = Path(stack_dir).resolve()
+    spec_payload: Any = asdict(environment_spec) if is_dataclass(environment_spec) else repr(environment_spec)
+    bootstrap_files = tuple(getattr(environment_spec, "bootstrap_files", ()) or ())
+    app_sources = sorted(
+        [str(path.relative_to(aws_root)), _file_digest(path)]
+        for pattern in _APP_SOURCE_GLOBS
+        for path in aws_root.glob(pattern)
+    )
+    payload = {
+        "stack_dir": stack_path.name,
+        "context": dict(context),
+        "environment_spec": spec_payload,
+        "init_scripts": _bootstrap_script_digests(stack_path, bootstrap_files),
+        "stack_files": [[name, _file_digest(stack_path / name)] for name in _STACK_DIR_FILES],
+        "app_sources": app_sources,
+        "target": _resolved_target(env if env is not None else os.environ),
+    }
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def find_cached_assembly(cache_dir: Path, key: str) -> Path | None:
+    """Return the cached assembly for ``key`` and mark it recently used."""
+    assembly_dir = cache_dir / key
+    if not (assembly_dir / "manifest.json").is_file():
+        return None
+    try:
+        os.utime(assembly_dir)
+    except OSError:
+        pass
+    return assembly_dir
+
+
+def find_assembly_with_stack(
+    cache_dir: Path,
+    stack_name: str,
+    *,
+    env: Mapping[str, str] | None = None,
+) -> Path | None:
+    """Return the most recently used cached assembly that defines ``stack_name``.
+
+    Destroy commands only need the stack name and target environment from an
+    assembly, so any cached synth of the stack for the current account and
+    region will do.
+    """
+    target = _resolved_target(env if env is not None else os.environ)
+    if not cache_dir.is_dir() or not target["account"] or not target["region"]:
+        return None
+    expected_environment = f"aws://{target['account']}/{target['region']}"
+    candidates = sorted(
+        (path for path in cache_dir.iterdir() if (path / "manifest.json").is_file()),
+        key=lambda path: path.stat().st_mtime,
+        reverse=True,
+    )
+    for assembly_dir in candidates:
+        try:
+            manifest = json.loads((assembly_dir / "manifest.json").read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            continue
+        artifact = manifest.get("artifacts", {}).get(stack_name)
+        if isinstance(artifact, dict) and artifact.get("environment") == expected_environment:
+            return assembly_dir
+    return None
+
+
+def staging_dir(cache_dir: Path, key: str) -> Path:
+    """Return a fresh per-process staging directory for a synth of ``key``."""
+    path = cache_dir / f".{key}.{os.getpid()}.tmp"
+    shutil.rmtree(path, ignore_errors=True)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def store_assembly(cache_dir: Path, key: str, synthesized_dir: Path) -> Path:
+    """Move a freshly synthesized assembly into the cache under ``key``.
+
+    A concurrent writer that stored the same key first wins; its assembly is
+    returned and the staging copy is discarded.
+    """
+    assembly_dir = cache_dir / key
+    try:
+        synthesized_dir.rename(assembly_dir)
+    except OSError:
+        if not (assembly_dir / "manifest.json").is_file():
+            raise
+        shutil.rmtree(synthesized_dir, ignore_errors=True)
+    prune_assembly_cache(cache_dir)
+    return assembly_dir
+
+
+def prune_assembly_cache(cache_dir: Path, keep: int = MAX_CACHED_ASSEMBLIES) -> None:
+    """Remove the least recently used assemblies beyond ``keep`` (best effort)."""
+    entries = sorted(
+        (path for path in cache_dir.iterdir() if path.is_dir() and not path.name.startswith(".")),
+        key=lambda path: path.stat().st_mtime,
+        reverse=True,
+    )
+    for stale in entries[keep:]:
+        LOGGER.debug("Pruning cached assembly path=%s", stale)
+        shutil.rmtree(stale, ignore_errors=True)
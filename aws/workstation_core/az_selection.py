@@ -0,0 +1,411 @@
+"""Pick workstation Availability Zones from Spot prices and placement scores."""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+import json
+import logging
+from pathlib import Path
+import time
+from typing import Any, Callable, Mapping
+
+LOGGER = logging.getLogger(__name__)
+DEFAULT_AZ_CACHE_DIR = Path.home() / ".config" / "env4ai" / "az-selection"
+# Reason: Spot prices and placement scores move slowly; a short TTL keeps repeat deploys off the APIs.
+AZ_SELECTION_TTL_SECONDS = 30 * 60
+_SPOT_PRODUCT_DESCRIPTION = "Linux/UNIX"
+
+
+@dataclass(frozen=True, slots=True)
+class AvailabilityZoneCandidate:
+    """Spot signals for one Availability Zone.
+
+    Args:
+        index: Position of the zone in ``Fn::GetAZs`` order (sorted zone names).
+        zone_name: Zone name (for example ``us-west-2a``).
+        zone_id: Account-independent zone id (for example ``usw2-az1``).
+        spot_price: Current Spot price, or ``None`` when the instance type is not offered.
+        placement_score: Spot placement score from 1 to 10, when available.
+    """
+
+    index: int
+    zone_name: str
+    zone_id: str
+    spot_price: float | None
+    placement_score: int | None
+
+
+@dataclass(frozen=True, slots=True)
+class AvailabilityZoneSelection:
+    """Availability Zones chosen for the workstation subnets.
+
+    Args:
+        indexes: Zone indexes passed to the CDK app as ``availability_zone_indexes``,
+            one per subnet.
+        zone_names: Zone names, when known.
+        reason: Short explanation shown to the user.
+        candidates: Every zone considered, in index order.
+    """
+
+    indexes: tuple[int, ...]
+    zone_names: tuple[str, ...]
+    reason: str
+    candidates: tuple[AvailabilityZoneCandidate, ...] = ()
+
+
+def read_availability_zone_override(env: Mapping[str, str]) -> tuple[int, ...] | None:
+    """Return the ``AZ_INDEX`` override, or ``None`` when unset.
+
+    ``AZ_INDEX`` holds one zone index per workstation subnet, comma separated.
+
+    Raises:
+        RuntimeError: If an entry is not a non-negative integer or repeats.
+    """
+    raw = str(env.get("AZ_INDEX", "")).strip()
+    if not raw:
+        return None
+    entries = [entry.strip() for entry in raw.split(",")]
+    if not all(entry.isdigit() for entry in entries) or len(set(entries)) != len(entries):
+        raise RuntimeError(
+            f"Invalid AZ_INDEX value {raw!r}. Use distinct zero-based Availability Zone indexes such as 0 or 0,1."
+        )
+    return tuple(int(entry) for entry in entries)
+
+
+def deployed_availability_zone_indexes(cloudformation_client: Any, stack_name: str) -> tuple[int, ...]:
+    """Return the subnet zone indexes of a deployed workstation stack.
+
+    Args:
+        cloudformation_client: Boto3 CloudFormation client.
+        stack_name: Workstation stack name.
+
+    Returns:
+        The ``Fn::Select`` index of each deployed subnet in template order, or
+        an empty tuple when the stack does not exist.
+
+    Raises:
+        RuntimeError: If the deployed template cannot be read.
+    """
+    try:
+        response = cloudformation_client.get_template(StackName=stack_name, TemplateStage="Original")
+    except Exception as err:
+        if "does not exist" in str(err):
+            return ()
+        raise RuntimeError(f"Failed to read the deployed template of stack '{stack_name}'.") from err
+    body = response.get("TemplateBody")
+    if isinstance(body, str):
+        try:
+            body = json.loads(body)
+        except ValueError:
+            return ()
+    if not isinstance(body, dict):
+        return ()
+    indexes: list[int] = []
+    for resource in body.get("Resources", {}).values():
+        if not isinstance(resource, dict) or resource.get("Type") != "AWS::EC2::Subnet":
+            continue
+        zone = resource.get("Properties", {}).get("AvailabilityZone")
+        if isinstance(zone, dict) and isinstance(zone.get("Fn::Select"), list) and zone["Fn::Select"]:
+            try:
+                indexes.append(int(zone["Fn::Select"][0]))
+            except (TypeError, ValueError):
+                continue
+    return tuple(indexes)
+
+
+def _default_zones(ec2_client: Any) -> list[dict[str, Any]]:
+    """Return the region's available default zones in ``Fn::GetAZs`` order."""
+    response = ec2_client.describe_availability_zones(
+        Filters=[
+            {"Name": "zone-type", "Values": ["availability-zone"]},
+            {"Name": "state", "Values": ["available"]},
+        ]
+    )
+    # Reason: Fn::GetAZs lists the region's default zones in name order.
+    return sorted(
+        (
+            zone
+            for zone in response.get("AvailabilityZones", [])
+            if zone.get("OptInStatus", "opt-in-not-required") == "opt-in-not-required"
+        ),
+        key=lambda zone: str(zone["ZoneName"]),
+    )
+
+
+def availability_zone_names(ec2_client: Any, indexes: tuple[int, ...]) -> tuple[str, ...]:
+    """Resolve ``Fn::GetAZs`` indexes to zone names.
+
+    Raises:
+        RuntimeError: If an index is outside the region's zones.
+    """
+    zones = _default_zones(ec2_client)
+    if any(index >= len(zones) for index in indexes):
+        raise RuntimeError(
+            f"{ec2_client.meta.region_name} has {len(zones)} Availability Zones; "
+            f"index {max(indexes)} does not exist."
+        )
+    return tuple(str(zones[index]["ZoneName"]) for index in indexes)
+
+
+def list_availability_zone_candidates(ec2_client: Any, *, instance_type: str) -> list[AvailabilityZoneCandidate]:
+    """Read zones, current Spot prices and placement scores for an instance type.
+
+    Placement scores are best effort: accounts without Spot history or the
+    ``ec2:GetSpotPlacementScores`` permission still get price-based ranking.
+
+    Args:
+        ec2_client: Boto3 EC2 client for the deploy region.
+        instance_type: Workstation instance type.
+
+    Returns:
+        Candidates in ``Fn::GetAZs`` order.
+    """
+    zones = _default_zones(ec2_client)
+    prices = _latest_spot_prices(ec2_client, instance_type)
+    scores = _placement_scores(ec2_client, instance_type)
+    return [
+        AvailabilityZoneCandidate(
+            index=index,
+            zone_name=str(zone["ZoneName"]),
+            zone_id=str(zone.get("ZoneId", "")),
+            spot_price=prices.get(str(zone["ZoneName"])),
+            placement_score=scores.get(str(zone.get("ZoneId", ""))),
+        )
+        for index, zone in enumerate(zones)
+    ]
+
+
+def _latest_spot_prices(ec2_client: Any, instance_type: str) -> dict[str, float]:
+    """Return the current Spot price per zone name."""
+    request: dict[str, Any] = {
+        "InstanceTypes": [instance_type],
+        "ProductDescriptions": [_SPOT_PRODUCT_DESCRIPTION],
+        # Reason: a StartTime of now returns only the price in effect per zone.
+        "StartTime": datetime.now(timezone.utc),
+    }
+    latest: dict[str, tuple[datetime, float]] = {}
+    while True:
+        response = ec2_client.describe_spot_price_history(**request)
+        for entry in response.get("SpotPriceHistory", []):
+            zone_name = str(entry.get("AvailabilityZone", ""))
+            timestamp = entry.get("Timestamp") or datetime.min.replace(tzinfo=timezone.utc)
+            if zone_name and (zone_name not in latest or timestamp > latest[zone_name][0]):
+                latest[zone_name] = (timestamp, float(entry["SpotPrice"]))
+        next_token = response.get("NextToken")
+        if not next_token:
+            break
+        request["NextToken"] = next_token
+    return {zone_name: price for zone_name, (_timestamp, price) in latest.items()}
+
+
+def _placement_scores(ec2_client: Any, instance_type: str) -> dict[str, int]:
+    """Return Spot placement scores per zone id, or nothing when unavailable."""
+    region = str(ec2_client.meta.region_name)
+    request: dict[str, Any] = {
+        "InstanceTypes": [instance_type],
+        "TargetCapacity": 1,
+        "SingleAvailabilityZone": True,
+        "RegionNames": [region],
+    }
+    scores: dict[str, int] = {}
+    try:
+        while True:
+            response = ec2_client.get_spot_placement_scores(**request)
+            for entry in response.get("SpotPlacementScores", []):
+                if entry.get("AvailabilityZoneId"):
+                    scores[str(entry["AvailabilityZoneId"])] = int(entry.get("Score", 0))
+            next_token = response.get("NextToken")
+            if not next_token:
+                break
+            request["NextToken"] = next_token
+    except Exception:
+        LOGGER.warning("Spot placement scores unavailable region=%s", region, exc_info=True)
+        return {}
+    return scores
+
+
+def rank_availability_zones(
+    candidates: list[AvailabilityZoneCandidate] | tuple[AvailabilityZoneCandidate, ...],
+    *,
+    max_price: float | None = None,
+) -> list[AvailabilityZoneCandidate]:
+    """Order usable zones from best to worst.
+
+    Zones without a Spot price do not offer the instance type, and zones
+    priced above ``max_price`` would reject the fleet with ``price-too-low``;
+    both are dropped.  The rest rank by placement score, then price, then
+    index so ties keep the historical first zone.
+    """
+    usable = [
+        candidate
+        for candidate in candidates
+        if candidate.spot_price is not None and (max_price is None or candidate.spot_price <= max_price)
+    ]
+    return sorted(
+        usable,
+        key=lambda candidate: (-(candidate.placement_score or 0), candidate.spot_price, candidate.index),
+    )
+
+
+def _cache_path(cache_dir: Path, account_id: str, region: str, instance_type: str) -> Path:
+    """Return the cache file for one account, region and instance type."""
+    # Reason: zone names map to different physical zones in each account.
+    return cache_dir / account_id / region / f"{instance_type}.json"
+
+
+def load_cached_candidates(
+    cache_dir: Path,
+    account_id: str,
+    region: str,
+    instance_type: str,
+    *,
+    ttl_seconds: float = AZ_SELECTION_TTL_SECONDS,
+    clock: Callable[[], float] = time.time,
+) -> list[AvailabilityZoneCandidate] | None:
+    """Return cached candidates younger than ``ttl_seconds``, if any."""
+    path = _cache_path(cache_dir, account_id, region, instance_type)
+    try:
+        record = json.loads(path.read_text(encoding="utf-8"))
+        if clock() - float(record["recorded_at"]) > ttl_seconds:
+            return None
+        return [AvailabilityZoneCandidate(**candidate) for candidate in record["candidates"]]
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, KeyError, TypeError):
+        LOGGER.warning("Ignoring unreadable availability zone cache path=%s", path)
+        return None
+
+
+def store_cached_candidates(
+    cache_dir: Path,
+    account_id: str,
+    region: str,
+    instance_type: str,
+    candidates: list[AvailabilityZoneCandidate],
+    *,
+    clock: Callable[[], float] = time.time,
+) -> None:
+    """Write candidates to the local cache (best effort)."""
+    path = _cache_path(cache_dir, account_id, region, instance_type)
+    record = {"recorded_at": clock(), "candidates": [asdict(candidate) for candidate in candidates]}
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(record, indent=2) + "\n", encoding="utf-8")
+    except OSError:
+        LOGGER.warning("Unable to cache availability zone signals path=%s", path, exc_info=True)
+
+
+def select_availability_zones(
+    ec2_client: Any,
+    *,
+    account_id: str,
+    instance_type: str,
+    zone_count: int = 1,
+    max_price: str | float | None = None,
+    cache_dir: Path = DEFAULT_AZ_CACHE_DIR,
+    ttl_seconds: float = AZ_SELECTION_TTL_SECONDS,
+    clock: Callable[[], float] = time.time,
+) -> AvailabilityZoneSelection:
+    """Choose the zones with the best Spot placement score and price.
+
+    When fewer than ``zone_count`` zones are usable, the remaining subnets go
+    to other zones in index order so the environment's CIDR split still fits.
+
+    Args:
+        ec2_client: Boto3 EC2 client for the deploy region.
+        account_id: Account of ``ec2_client``; the cache is kept per account.
+        instance_type: Workstation instance type.
+        zone_count: Number of zones (one per workstation subnet).
+        max_price: Spot Fleet maximum price from the environment spec.
+        cache_dir: Root directory of the local signal cache.
+        ttl_seconds: Maximum cache age.
+        clock: Wall clock for testability.
+
+    Returns:
+        The best zones, best first.
+
+    Raises:
+        RuntimeError: If no zone offers the instance type at or below
+            ``max_price``, or the region has fewer than ``zone_count`` zones.
+    """
+    region = str(ec2_client.meta.region_name)
+    candidates = load_cached_candidates(
+        cache_dir, account_id, region, instance_type, ttl_seconds=ttl_seconds, clock=clock
+    )
+    if candidates is None:
+        candidates = list_availability_zone_candidates(ec2_client, instance_type=instance_type)
+        store_cached_candidates(cache_dir, account_id, region, instance_type, candidates, clock=clock)
+
+    price_limit = float(max_price) if max_price not in (None, "") else None
+    ranked = rank_availability_zones(candidates, max_price=price_limit)
+    if not ranked:
+        raise RuntimeError(
+            f"No Availability Zone in {region} offers {instance_type} Spot capacity"
+            + (f" at or below {price_limit}." if price_limit is not None else ".")
+        )
+    if len(candidates) < zone_count:
+        raise RuntimeError(f"{region} has {len(candidates)} Availability Zones; the environment needs {zone_count}.")
+    chosen = ranked[:zone_count]
+    chosen += [candidate for candidate in candidates if candidate not in chosen][: zone_count - len(chosen)]
+    best = chosen[0]
+    score = f"placement score {best.placement_score}" if best.placement_score is not None else "no placement score"
+    return AvailabilityZoneSelection(
+        indexes=tuple(candidate.index for candidate in chosen),
+        zone_names=tuple(candidate.zone_name for candidate in chosen),
+        reason=f"best {score}, Spot price {best.spot_price}",
+        candidates=tuple(candidates),
+    )
+
+
+def choose_workstation_availability_zones(
+    ec2_client: Any,
+    cloudformation_client: Any,
+    *,
+    account_id: str,
+    stack_name: str,
+    instance_type: str,
+    zone_count: int = 1,
+    max_price: str | float | None = None,
+    cache_dir: Path = DEFAULT_AZ_CACHE_DIR,
+) -> AvailabilityZoneSelection:
+    """Resolve the zone indexes for a workstation deploy.
+
+    A stack that is already deployed keeps its zones, because moving a
+    subnet replaces the running workstation.  Otherwise the best zones by Spot
+    signals are used, falling back to the first zones when the signals are
+    unavailable.
+
+    Raises:
+        RuntimeError: If the deployed template cannot be read.
+    """
+    deployed_indexes = deployed_availability_zone_indexes(cloudformation_client, stack_name)
+    # Reason: a changed zone count re-splits the subnet CIDR, so every subnet is replaced anyway.
+    if len(deployed_indexes) == zone_count:
+        return AvailabilityZoneSelection(deployed_indexes, (), "kept from the deployed stack")
+    try:
+        return select_availability_zones(
+            ec2_client,
+            account_id=account_id,
+            instance_type=instance_type,
+            zone_count=zone_count,
+            max_price=max_price,
+            cache_dir=cache_dir,
+        )
+    except Exception as err:
+        LOGGER.warning("Availability zone selection failed instance_type=%s", instance_type, exc_info=True)
+        return AvailabilityZoneSelection(
+            tuple(range(zone_count)),
+            (),
+            f"selection unavailable ({err}); using the first zones",
+        )
+
+
+def format_availability_zone_selection(selection: AvailabilityZoneSelection) -> str:
+    """Render the selection as one status line."""
+    if selection.zone_names:
+        zones = ", ".join(f"{name} (index {index})" for name, index in zip(selection.zone_names, selection.indexes))
+    else:
+        zones = ", ".join(f"index {index}" for index in selection.indexes)
+    label = "Availability Zone" if len(selection.indexes) == 1 else "Availability Zones"
+    return f"{label}: {zones}, {selection.reason}.\n"
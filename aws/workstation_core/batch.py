@@ -0,0 +1,473 @@
+"""Run workstation lifecycles for several environments at once."""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+import contextvars
+from dataclasses import dataclass
+import logging
+import os
+import sys
+import threading
+import time
+from typing import Any, Callable, Mapping, Sequence, TextIO
+
+from workstation_core.ami_catalog import expire_ami_catalog
+from workstation_core.ami_lifecycle import (
+    create_image_from_instance,
+    is_truthy,
+    resolve_running_instance_id,
+    wait_for_image_available,
+)
+from workstation_core.deploy_fingerprint import format_deploy_report
+from workstation_core.elastic_ip import find_eip_by_name, release_eip
+from workstation_core.interactive_workstation import EnvironmentTarget
+from workstation_core.orchestration import (
+    DEPLOY_COMMAND_TIMEOUT_SECONDS,
+    DeployWorkflowInputs,
+    build_destroy_command,
+    build_shared_network_features,
+    build_stop_image_name,
+    destroy_shared_network_stack,
+    ensure_shared_network_stack,
+    make_cloudformation_client,
+    make_ec2_client,
+    parse_stop_ami_config,
+    read_container_cache_enabled,
+    read_package_cache_enabled,
+    run_command,
+    run_deploy_lifecycle,
+)
+from workstation_core.pending_ami import DEFAULT_PENDING_AMI_DIR, record_pending_ami, wait_for_image_snapshots
+from workstation_core.tracing import trace_span
+
+LOGGER = logging.getLogger(__name__)
+DEFAULT_BATCH_WORKERS = 3
+
+
+@dataclass(frozen=True, slots=True)
+class BatchEnvironmentResult:
+    """Outcome of one environment in a batch run.
+
+    Args:
+        environment_key: Canonical environment key.
+        stack_name: CloudFormation stack name.
+        succeeded: Whether the environment's lifecycle completed.
+        elapsed_seconds: Wall time spent on the environment.
+        error: Error message when the lifecycle failed.
+    """
+
+    environment_key: str
+    stack_name: str
+    succeeded: bool
+    elapsed_seconds: float
+    error: str | None = None
+
+
+class PrefixedWriter:
+    """Line-buffered text stream that prefixes each line with a label.
+
+    Writers sharing ``lock`` never interleave within a line, so concurrent
+    environments stay readable on one terminal.
+    """
+
+    def __init__(self, out: TextIO, prefix: str, lock: threading.Lock) -> None:
+        self._out = out
+        self._prefix = prefix
+        self._lock = lock
+        self._pending = ""
+
+    def write(self, text: str) -> int:
+        """Buffer ``text`` and emit every completed line."""
+        self._pending += text
+        *lines, self._pending = self._pending.split("\n")
+        if lines:
+            with self._lock:
+                for line in lines:
+                    self._out.write(f"{self._prefix}{line}\n")
+        return len(text)
+
+    def flush(self) -> None:
+        """Emit any partial line."""
+        if self._pending:
+            with self._lock:
+                self._out.write(f"{self._prefix}{self._pending}\n")
+            self._pending = ""
+
+
+def resolve_batch_targets(
+    environment_keys: Sequence[str],
+    available: Sequence[EnvironmentTarget],
+) -> list[EnvironmentTarget]:
+    """Map requested environment keys onto discovered environments.
+
+    Args:
+        environment_keys: Requested keys, in the order given.
+        available: Environments discovered under ``aws/``.
+
+    Returns:
+        Matching targets with duplicates removed.
+
+    Raises:
+        RuntimeError: If no keys are given or a key is unknown.
+    """
+    by_key = {target.environment_key: target for target in available}
+    targets: list[EnvironmentTarget] = []
+    unknown: list[str] = []
+    for raw_key in environment_keys:
+        key = raw_key.strip().lower()
+        if key in by_key:
+            if by_key[key] not in targets:
+                targets.append(by_key[key])
+        elif key:
+            unknown.append(raw_key)
+    if unknown:
+        raise RuntimeError(
+            f"Unknown environment(s): {', '.join(unknown)}. "
+            f"Available: {', '.join(sorted(by_key))}."
+        )
+    if not targets:
+        raise RuntimeError("At least one environment key is required.")
+    return targets
+
+
+def run_batch(
+    targets: Sequence[EnvironmentTarget],
+    *,
+    action: str,
+    run_environment: Callable[[EnvironmentTarget, TextIO], object],
+    max_workers: int = DEFAULT_BATCH_WORKERS,
+    monotonic: Callable[[], float] = time.monotonic,
+    out: TextIO = sys.stdout,
+) -> list[BatchEnvironmentResult]:
+    """Run one lifecycle callback per environment in a bounded thread pool.
+
+    A failing environment does not stop the others; its error is captured in
+    its result.
+
+    Args:
+        targets: Environments to process.
+        action: Span/label name for the lifecycle (for example ``deploy``).
+        run_environment: Callback running one environment's lifecycle and
+            writing progress to the supplied stream.
+        max_workers: Maximum environments processed at once.
+        monotonic: Monotonic clock for timings.
+        out: Output stream shared by all environments.
+
+    Returns:
+        One result per target, in target order.
+    """
+    lock = threading.Lock()
+    label_width = max(len(target.environment_key) for target in targets)
+
+    def run_one(target: EnvironmentTarget) -> BatchEnvironmentResult:
+        writer = PrefixedWriter(out, f"[{target.environment_key:<{label_width}}] ", lock)
+        started_at = monotonic()
+        try:
+            with trace_span(f"batch.{action}", environment=target.environment_key):
+                run_environment(target, writer)
+        except Exception as err:
+            LOGGER.debug("Batch %s failed environment=%s error=%s", action, target.environment_key, err)
+            writer.write(f"{action} failed: {err}\n")
+            return BatchEnvironmentResult(
+                target.environment_key,
+                target.stack_name,
+                False,
+                monotonic() - started_at,
+                str(err),
+            )
+        finally:
+            writer.flush()
+        return BatchEnvironmentResult(target.environment_key, target.stack_name, True, monotonic() - started_at)
+
+    with ThreadPoolExecutor(
+        max_workers=max(1, min(max_workers, len(targets))),
+        thread_name_prefix=f"env4ai-batch-{action}",
+    ) as executor:
+        # Reason: copy the caller's context so per-environment spans nest under the batch span.
+        futures = [
+            executor.submit(contextvars.copy_context().run, run_one, target)
+            for target in targets
+        ]
+        return [future.result() for future in futures]
+
+
+def format_batch_report(action: str, results: Sequence[BatchEnvironmentResult], total_seconds: float) -> str:
+    """Render per-environment results and timings as a table."""
+    width = max([len("ENVIRONMENT"), *(len(result.environment_key) for result in results)])
+    lines = [
+        f"Batch {action} summary:",
+        f"  {'ENVIRONMENT':<{width}}  RESULT  TIME",
+    ]
+    for result in results:
+        status = "ok" if result.succeeded else "failed"
+        line = f"  {result.environment_key:<{width}}  {status:<6}  {result.elapsed_seconds:>5.0f}s"
+        if result.error:
+            line += f"  {result.error}"
+        lines.append(line)
+    lines.append(f"Total wall time: {total_seconds:.0f}s")
+    return "\n".join(lines) + "\n"
+
+
+def _reject_interactive_input(prompt: str) -> str:
+    """Input function for batch runs, which cannot prompt."""
+    raise RuntimeError(f"Batch runs are non-interactive; cannot prompt for: {prompt.strip()}")
+
+
+def _resolve_profile_and_region(
+    profile: str | None,
+    region: str | None,
+    env: Mapping[str, str],
+) -> tuple[str | None, str | None]:
+    """Resolve AWS profile and region from CLI overrides then environment variables."""
+    return (
+        profile or env.get("AWS_PROFILE"),
+        region or env.get("AWS_REGION") or env.get("AWS_DEFAULT_REGION"),
+    )
+
+
+def run_batch_deploy(
+    targets: Sequence[EnvironmentTarget],
+    *,
+    profile: str | None = None,
+    region: str | None = None,
+    access_mode: str | None = None,
+    force: bool = False,
+    deploy_engine: str | None = None,
+    max_workers: int = DEFAULT_BATCH_WORKERS,
+    env: Mapping[str, str] | None = None,
+    monotonic: Callable[[], float] = time.monotonic,
+    out: TextIO = sys.stdout,
+) -> list[BatchEnvironmentResult]:
+    """Deploy several environments concurrently after one shared-network step.
+
+    The shared network stack is checked (and deployed when missing) once, before
+    any environment starts.  Each environment then runs the normal deploy
+    lifecycle with its own AWS clients, so per-environment preflight sees the
+    network as present.
+
+    Args:
+        targets: Environments to deploy.
+        profile: Optional AWS profile override.
+        region: Optional AWS region override.
+        access_mode: Optional access mode applied to every environment.
+        force: Deploy even when synthesized templates are unchanged.
+        deploy_engine: Optional stack deploy engine override.
+        max_workers: Maximum environments deployed at once.
+        env: Optional environment mapping for AMI controls and AWS defaults.
+        monotonic: Monotonic clock for timings.
+        out: Output stream for progress and the summary table.
+
+    Returns:
+        One result per environment, in target order.
+
+    Raises:
+        RuntimeError: If interactive AMI modes are requested or the shared
+            network step fails.
+    """
+    environment = env if env is not None else os.environ
+    if is_truthy(environment.get("AMI_LIST")) or is_truthy(environment.get("AMI_PICK")):
+        raise RuntimeError("Batch deploys are non-interactive; unset AMI_LIST and AMI_PICK.")
+
+    started_at = monotonic()
+    resolved_profile, resolved_region = _resolve_profile_and_region(profile, region, environment)
+    with trace_span("batch.shared_network"):
+        network_decision = ensure_shared_network_stack(
+            stack_dir=str(targets[0].stack_dir),
+            cloudformation_client=make_cloudformation_client(profile=resolved_profile, region=resolved_region),
+            features=build_shared_network_features(
+                package_cache=read_package_cache_enabled(environment),
+                container_cache=read_container_cache_enabled(environment),
+                profile=resolved_profile,
+                region=resolved_region,
+            ),
+        )
+    out.write(format_deploy_report([network_decision]))
+
+    def deploy_environment(target: EnvironmentTarget, writer: TextIO) -> None:
+        run_deploy_lifecycle(
+            DeployWorkflowInputs(
+                environment=target.environment_key,
+                stack_dir=str(target.stack_dir),
+                stack_name=target.stack_name,
+                profile=profile,
+                region=region,
+                access_mode=access_mode,
+                force=force,
+                deploy_engine=deploy_engine,
+            ),
+            env=environment,
+            input_func=_reject_interactive_input,
+            out=writer,
+        )
+
+    results = run_batch(
+        targets,
+        action="deploy",
+        run_environment=deploy_environment,
+        max_workers=max_workers,
+        monotonic=monotonic,
+        out=out,
+    )
+    out.write(format_batch_report("deploy", results, monotonic() - started_at))
+    return results
+
+
+def _start_stop_images(
+    targets: Sequence[EnvironmentTarget],
+    *,
+    ami_tag: str,
+    ec2_client: Any,
+    cloudformation_client: Any,
+    out: TextIO,
+) -> tuple[dict[str, str], dict[str, str]]:
+    """Start one stop-time AMI per environment without waiting for any of them.
+
+    Returns:
+        ``(image_ids, errors)`` keyed by environment key.
+    """
+    image_ids: dict[str, str] = {}
+    errors: dict[str, str] = {}
+    for target in targets:
+        image_name = build_stop_image_name(target.environment_key, ami_tag)
+        try:
+            with trace_span("stop.resolve_running_instance", environment=target.environment_key):
+                instance_id = resolve_running_instance_id(
+                    cloudformation_client,
+                    ec2_client,
+                    stack_name=target.stack_name,
+                    spot_fleet_logical_id=target.spot_fleet_logical_id,
+                ).strip()
+            if not instance_id:
+                raise RuntimeError("Unable to resolve a running instance for AMI save-on-stop.")
+            with trace_span("stop.create_image", image_name=image_name, instance_id=instance_id):
+                image_ids[target.environment_key] = create_image_from_instance(
+                    ec2_client,
+                    instance_id=instance_id,
+                    image_name=image_name,
+                )
+        except RuntimeError as err:
+            errors[target.environment_key] = str(err)
+            out.write(f"Could not start AMI {image_name}: {err}\n")
+            continue
+        expire_ami_catalog(ec2_client, target.environment_key)
+        out.write(f"Started AMI {image_name} ({image_ids[target.environment_key]}) from {instance_id}\n")
+    return image_ids, errors
+
+
+def run_batch_stop(
+    targets: Sequence[EnvironmentTarget],
+    *,
+    profile: str | None = None,
+    region: str | None = None,
+    destroy_eip: bool = False,
+    destroy_shared_network: bool = False,
+    fast_stop: bool = False,
+    max_workers: int | None = None,
+    env: Mapping[str, str] | None = None,
+    monotonic: Callable[[], float] = time.monotonic,
+    out: TextIO = sys.stdout,
+) -> list[BatchEnvironmentResult]:
+    """Stop several environments with overlapping AMI saves.
+
+    With ``AMI_SAVE=1`` every ``CreateImage`` call is issued up front, then each
+    environment waits for its own image and destroys its stack as soon as that
+    image is available, so the batch takes about as long as the slowest save.
+    An environment whose image could not be started is left running.
+
+    Args:
+        targets: Environments to stop.
+        profile: Optional AWS profile override.
+        region: Optional AWS region override.
+        destroy_eip: Release each environment's Elastic IP after its destroy.
+        destroy_shared_network: Destroy the shared network stack once every
+            environment stack is gone.
+        fast_stop: Destroy once each AMI's snapshots have started and record
+            the still-pending AMI in the local ledger.
+        max_workers: Maximum environments waiting/destroying at once; defaults
+            to all of them.
+        env: Optional environment mapping for AMI controls and AWS defaults.
+        monotonic: Monotonic clock for timings.
+        out: Output stream for progress and the summary table.
+
+    Returns:
+        One result per environment, in target order.
+
+    Raises:
+        RuntimeError: If ``AMI_SAVE=1`` is set without ``AMI_TAG`` or the
+            shared network teardown fails.
+    """
+    environment = env if env is not None else os.environ
+    ami_save, ami_tag = parse_stop_ami_config(environment)
+    resolved_profile, resolved_region = _resolve_profile_and_region(profile, region, environment)
+    ec2_client = make_ec2_client(profile=resolved_profile, region=resolved_region)
+    cloudformation_client = make_cloudformation_client(profile=resolved_profile, region=resolved_region)
+
+    started_at = monotonic()
+    image_ids: dict[str, str] = {}
+    start_errors: dict[str, str] = {}
+    if ami_save:
+        with trace_span("batch.start_images"):
+            image_ids, start_errors = _start_stop_images(
+                targets,
+                ami_tag=ami_tag or "",
+                ec2_client=ec2_client,
+                cloudformation_client=cloudformation_client,
+                out=out,
+            )
+
+    def stop_environment(target: EnvironmentTarget, writer: TextIO) -> None:
+        if target.environment_key in start_errors:
+            # Reason: never destroy a stack whose AMI save did not start.
+            raise RuntimeError(f"AMI save-on-stop failed; stack left running: {start_errors[target.environment_key]}")
+        image_id = image_ids.get(target.environment_key)
+        if image_id is not None:
+            image_name = build_stop_image_name(target.environment_key, ami_tag or "")
+            if fast_stop:
+                with trace_span("stop.wait_for_image_snapshots", image_id=image_id):
+                    snapshot_ids = wait_for_image_snapshots(ec2_client, image_id=image_id)
+                record_pending_ami(
+                    DEFAULT_PENDING_AMI_DIR,
+                    str(ec2_client.meta.region_name),
+                    image_id=image_id,
+                    image_name=image_name,
+                    environment_key=target.environment_key,
+                    snapshot_ids=snapshot_ids,
+                )
+                writer.write(f"AMI {image_name} ({image_id}) is still completing; its snapshots have started.\n")
+            else:
+                with trace_span("stop.wait_for_image_available", image_id=image_id):
+                    wait_for_image_available(ec2_client, image_id=image_id)
+                writer.write(f"Saved AMI {image_name} ({image_id})\n")
+
+        eip_info = find_eip_by_name(ec2_client, target.environment_key) if destroy_eip else None
+        with trace_span("stop.destroy_stack", stack_name=target.stack_name):
+            run_command(
+                build_destroy_command(target.stack_name),
+                cwd=str(target.stack_dir),
+                timeout_seconds=DEPLOY_COMMAND_TIMEOUT_SECONDS,
+            )
+        if eip_info is not None:
+            with trace_span("stop.release_eip"):
+                release_eip(ec2_client, eip_info["allocation_id"])
+        elif destroy_eip:
+            writer.write(f"Warning: no Elastic IP found with Name={target.environment_key!r}, skipping release.\n")
+        writer.write("Destroy complete.\n")
+
+    results = run_batch(
+        targets,
+        action="stop",
+        run_environment=stop_environment,
+        max_workers=max_workers or len(targets),
+        monotonic=monotonic,
+        out=out,
+    )
+    out.write(format_batch_report("stop", results, monotonic() - started_at))
+
+    if destroy_shared_network:
+        if all(result.succeeded for result in results):
+            with trace_span("batch.shared_network_destroy"):
+                destroy_shared_network_stack(profile=resolved_profile, region=resolved_region, out=out)
+        else:
+            out.write("Skipping shared network destroy because some environments failed to stop.\n")
+    return results
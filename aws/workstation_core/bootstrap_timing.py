@@ -0,0 +1,442 @@
+"""Read per-script bootstrap timings from the instance console and keep a history."""
+
+from __future__ import annotations
+
+import base64
+import binascii
+from dataclasses import dataclass
+from datetime import datetime, timezone
+import gzip
+import json
+import logging
+from pathlib import Path
+import sys
+import time
+from typing import Any, Callable, Mapping, TextIO
+
+from workstation_core.cdk_helpers import BOOTSTRAP_LOG_DIR, BOOTSTRAP_RUNNER_FILENAME
+
+LOGGER = logging.getLogger(__name__)
+BOOTSTRAP_TIMING_MARKER = "env4ai-bootstrap:"
+BOOTSTRAP_SUMMARY_MARKER = "env4ai-bootstrap-summary:"
+BOOTSTRAP_TIMING_HISTORY_LIMIT = 20
+BOOTSTRAP_WAIT_TIMEOUT_SECONDS = 45 * 60
+BOOTSTRAP_POLL_SECONDS = 15.0
+
+
+@dataclass(frozen=True, slots=True)
+class BootstrapScriptTiming:
+    """Timing of one bootstrap script as reported by the user-data runner.
+
+    Args:
+        script: Init script filename.
+        started_at: Epoch seconds when the script started, if it did.
+        finished_at: Epoch seconds when the script exited, if it has.
+        exit_code: Script exit status, if it has exited.
+        skipped: Whether the runner skipped the script after a failed dependency.
+    """
+
+    script: str
+    started_at: int | None = None
+    finished_at: int | None = None
+    exit_code: int | None = None
+    skipped: bool = False
+
+    @property
+    def duration_seconds(self) -> int | None:
+        """Return the script's run time, or ``None`` until it has exited."""
+        if self.started_at is None or self.finished_at is None:
+            return None
+        return max(0, self.finished_at - self.started_at)
+
+    @property
+    def status(self) -> str:
+        """Return ``ok``, ``failed (exit N)``, ``running`` or ``skipped``."""
+        if self.skipped:
+            return "skipped"
+        if self.exit_code is None:
+            return "running"
+        return "ok" if self.exit_code == 0 else f"failed (exit {self.exit_code})"
+
+
+@dataclass(frozen=True, slots=True)
+class BootstrapTimingReport:
+    """Bootstrap timings read from one instance.
+
+    Args:
+        instance_id: Instance the timings were read from.
+        scripts: Per-script timings in the order the runner reported them.
+        complete: Whether the runner printed its final summary.
+    """
+
+    instance_id: str
+    scripts: tuple[BootstrapScriptTiming, ...]
+    complete: bool
+
+    @property
+    def total_seconds(self) -> int | None:
+        """Return wall-clock time from the first start to the last exit."""
+        starts = [timing.started_at for timing in self.scripts if timing.started_at is not None]
+        ends = [timing.finished_at for timing in self.scripts if timing.finished_at is not None]
+        if not starts or not ends:
+            return None
+        return max(0, max(ends) - min(starts))
+
+
+def _parse_int(value: str) -> int | None:
+    """Return ``value`` as an int, or ``None`` when it is not one."""
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
+
+def _parse_summary(payload: str) -> tuple[BootstrapScriptTiming, ...]:
+    """Parse ``name=start,end,exit`` / ``name=skipped`` summary entries."""
+    timings = []
+    for entry in payload.split():
+        script, _, value = entry.partition("=")
+        if not script or not value:
+            continue
+        if value == "skipped":
+            timings.append(BootstrapScriptTiming(script=script, skipped=True))
+            continue
+        parts = value.split(",")
+        if len(parts) != 3:
+            continue
+        started_at, finished_at, exit_code = (_parse_int(part) for part in parts)
+        timings.append(
+            BootstrapScriptTiming(
+                script=script,
+                started_at=started_at,
+                finished_at=finished_at,
+                exit_code=exit_code,
+            )
+        )
+    return tuple(timings)
+
+
+def parse_bootstrap_timings(instance_id: str, console_output: str) -> BootstrapTimingReport | None:
+    """Build a timing report from the runner's console markers.
+
+    The final summary line is preferred because early per-script markers can
+    scroll out of the console buffer during a long bootstrap; without it, the
+    start/end markers still visible describe a bootstrap in progress.
+
+    Args:
+        instance_id: Instance the console output belongs to.
+        console_output: Decoded ``GetConsoleOutput`` text.
+
+    Returns:
+        Timing report, or ``None`` when the output has no bootstrap markers.
+    """
+    lines = console_output.splitlines()
+    for line in reversed(lines):
+        if BOOTSTRAP_SUMMARY_MARKER in line:
+            scripts = _parse_summary(line.split(BOOTSTRAP_SUMMARY_MARKER, 1)[1])
+            return BootstrapTimingReport(instance_id=instance_id, scripts=scripts, complete=True)
+
+    timings: dict[str, BootstrapScriptTiming] = {}
+    for line in lines:
+        if BOOTSTRAP_TIMING_MARKER not in line:
+            continue
+        fields = line.split(BOOTSTRAP_TIMING_MARKER, 1)[1].split()
+        if not fields:
+            continue
+        script = fields[0]
+        values = dict(field.partition("=")[::2] for field in fields[1:])
+        current = timings.get(script, BootstrapScriptTiming(script=script))
+        if "start" in values:
+            current = BootstrapScriptTiming(script=script, started_at=_parse_int(values["start"]))
+        if "end" in values:
+            current = BootstrapScriptTiming(
+                script=script,
+                started_at=current.started_at,
+                finished_at=_parse_int(values["end"]),
+                exit_code=_parse_int(values.get("exit", "")),
+            )
+        timings[script] = current
+    if not timings:
+        return None
+    return BootstrapTimingReport(instance_id=instance_id, scripts=tuple(timings.values()), complete=False)
+
+
+def fetch_bootstrap_timings(ec2_client: Any, instance_id: str) -> BootstrapTimingReport | None:
+    """Read the instance console and parse its bootstrap timing markers."""
+    try:
+        response = ec2_client.get_console_output(InstanceId=instance_id, Latest=True)
+    except Exception:
+        # Reason: Latest=True is only supported on Nitro instances.
+        response = ec2_client.get_console_output(InstanceId=instance_id)
+    return parse_bootstrap_timings(instance_id, str(response.get("Output") or ""))
+
+
+@dataclass(frozen=True, slots=True)
+class BootstrapLaunch:
+    """Whether an instance was launched with the user-data bootstrap runner.
+
+    Args:
+        instance_id: EC2 instance id.
+        image_id: AMI the instance was launched from.
+        has_runner: Whether the instance user data carries the bootstrap runner.
+    """
+
+    instance_id: str
+    image_id: str
+    has_runner: bool
+
+
+def describe_bootstrap_launch(ec2_client: Any, instance_id: str) -> BootstrapLaunch:
+    """Read an instance's AMI and user data to tell whether it runs the bootstrap.
+
+    Instances launched from a golden AMI, or from a saved AMI without
+    ``AMI_BOOTSTRAP``, carry no runner and never print a bootstrap summary.
+
+    Raises:
+        RuntimeError: If the instance or its user data cannot be read.
+    """
+    try:
+        reservations = ec2_client.describe_instances(InstanceIds=[instance_id]).get("Reservations", [])
+        attribute = ec2_client.describe_instance_attribute(InstanceId=instance_id, Attribute="userData")
+    except Exception as err:
+        raise RuntimeError(f"Unable to read the launch details of {instance_id}: {err}") from err
+    image_id = next(
+        (
+            str(instance.get("ImageId", ""))
+            for reservation in reservations
+            for instance in reservation.get("Instances", [])
+        ),
+        "",
+    )
+    encoded = str(attribute.get("UserData", {}).get("Value") or "")
+    try:
+        payload = base64.b64decode(encoded)
+        if payload[:2] == b"\x1f\x8b":
+            payload = gzip.decompress(payload)
+    except (binascii.Error, OSError, EOFError):
+        LOGGER.warning("Ignoring undecodable user data instance_id=%s", instance_id)
+        payload = b""
+    return BootstrapLaunch(
+        instance_id=instance_id,
+        image_id=image_id,
+        has_runner=BOOTSTRAP_RUNNER_FILENAME.encode("utf-8") in payload,
+    )
+
+
+def _describe_progress(report: BootstrapTimingReport | None) -> str:
+    """Summarize which scripts have finished and which are still running."""
+    if report is None:
+        return "no bootstrap output on the console yet"
+    finished = [timing for timing in report.scripts if timing.exit_code is not None]
+    running = [timing.script for timing in report.scripts if timing.status == "running"]
+    status = f"{len(finished)} script(s) finished"
+    if running:
+        status += f", running {', '.join(running)}"
+    return status
+
+
+def wait_for_bootstrap_complete(
+    ec2_client: Any,
+    instance_id: str,
+    *,
+    timeout_seconds: float = BOOTSTRAP_WAIT_TIMEOUT_SECONDS,
+    poll_interval_seconds: float = BOOTSTRAP_POLL_SECONDS,
+    monotonic: Callable[[], float] = time.monotonic,
+    sleeper: Callable[[float], None] = time.sleep,
+    out: TextIO = sys.stdout,
+) -> BootstrapTimingReport:
+    """Poll the instance console until the bootstrap runner prints its summary.
+
+    Console lookup errors are treated as "no output yet" until the deadline,
+    since the console is often empty for the first minutes after launch.
+
+    Args:
+        ec2_client: Boto3 EC2 client.
+        instance_id: Instance running the user-data bootstrap.
+        timeout_seconds: Overall deadline.
+        poll_interval_seconds: Delay between console reads.
+        monotonic: Monotonic clock for deadlines.
+        sleeper: Sleep function.
+        out: Output stream for progress lines.
+
+    Returns:
+        The complete timing report.
+
+    Raises:
+        RuntimeError: If a bootstrap script exits non-zero, or the summary
+            does not appear before the deadline.
+    """
+    started_at = monotonic()
+    deadline = started_at + timeout_seconds
+    last_status = ""
+    while True:
+        try:
+            report = fetch_bootstrap_timings(ec2_client, instance_id)
+        except Exception as err:
+            LOGGER.debug("Console read failed instance_id=%s error=%s", instance_id, err)
+            report = None
+        if report is not None:
+            failed = next(
+                (timing for timing in report.scripts if timing.exit_code not in (None, 0)),
+                None,
+            )
+            if failed is not None:
+                raise RuntimeError(
+                    f"Bootstrap script {failed.script} exited with status {failed.exit_code} on {instance_id}; "
+                    f"see {BOOTSTRAP_LOG_DIR}/{failed.script}.log on the instance."
+                )
+            if report.complete:
+                out.write(f"Bootstrap finished on {instance_id} after {monotonic() - started_at:.0f}s of waiting.\n")
+                return report
+
+        now = monotonic()
+        status = _describe_progress(report)
+        if status != last_status:
+            out.write(f"Waiting for bootstrap: {status} ({now - started_at:.0f}s elapsed)\n")
+            last_status = status
+        if now >= deadline:
+            raise RuntimeError(
+                f"Bootstrap on {instance_id} did not finish within {timeout_seconds:.0f} seconds "
+                f"(last status: {status}). Check {BOOTSTRAP_LOG_DIR} on the instance."
+            )
+        sleeper(min(poll_interval_seconds, max(deadline - now, 0.0)))
+
+
+def _history_path(timing_dir: Path, region: str, stack_name: str) -> Path:
+    """Return the bootstrap timing history path for one stack."""
+    return timing_dir / region / f"{stack_name}.bootstrap.json"
+
+
+def load_bootstrap_timing_history(timing_dir: Path, region: str, stack_name: str) -> list[dict[str, Any]]:
+    """Load recorded bootstrap runs, oldest first, ignoring unreadable records."""
+    path = _history_path(timing_dir, region, stack_name)
+    try:
+        record = json.loads(path.read_text(encoding="utf-8"))
+        runs = record.get("runs", [])
+    except (OSError, ValueError, AttributeError):
+        return []
+    return [run for run in runs if isinstance(run, dict)] if isinstance(runs, list) else []
+
+
+def record_bootstrap_timings(
+    timing_dir: Path,
+    region: str,
+    stack_name: str,
+    report: BootstrapTimingReport,
+) -> None:
+    """Persist a complete report, replacing any earlier record for the same instance (best effort)."""
+    if not report.complete:
+        return
+    runs = [
+        run
+        for run in load_bootstrap_timing_history(timing_dir, region, stack_name)
+        if run.get("instance_id") != report.instance_id
+    ]
+    runs.append(
+        {
+            "instance_id": report.instance_id,
+            "recorded_at": datetime.now(timezone.utc).isoformat(),
+            "total_seconds": report.total_seconds,
+            "scripts": {
+                timing.script: {
+                    "seconds": timing.duration_seconds,
+                    "exit_code": timing.exit_code,
+                    "skipped": timing.skipped,
+                }
+                for timing in report.scripts
+            },
+        }
+    )
+    path = _history_path(timing_dir, region, stack_name)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        record = {"stack_name": stack_name, "runs": runs[-BOOTSTRAP_TIMING_HISTORY_LIMIT:]}
+        path.write_text(json.dumps(record, indent=2) + "\n", encoding="utf-8")
+    except OSError:
+        LOGGER.warning("Unable to record bootstrap timings path=%s", path, exc_info=True)
+
+
+def previous_bootstrap_durations(history: list[dict[str, Any]], instance_id: str) -> dict[str, int]:
+    """Return per-script durations from the latest recorded run of another instance."""
+    for run in reversed(history):
+        if run.get("instance_id") == instance_id:
+            continue
+        scripts = run.get("scripts")
+        if not isinstance(scripts, dict):
+            return {}
+        return {
+            script: int(entry["seconds"])
+            for script, entry in scripts.items()
+            if isinstance(entry, dict) and isinstance(entry.get("seconds"), (int, float))
+        }
+    return {}
+
+
+def _format_seconds(value: int | None) -> str:
+    """Render seconds as ``123s`` or ``-`` when unknown."""
+    return "-" if value is None else f"{value}s"
+
+
+def format_bootstrap_timings(
+    report: BootstrapTimingReport,
+    previous: Mapping[str, int] | None = None,
+) -> list[str]:
+    """Render a per-script timing table, with the previous deploy's durations when known."""
+    previous = previous or {}
+    state = "complete" if report.complete else "in progress"
+    width = max([len("total"), *(len(timing.script) for timing in report.scripts)])
+    lines = [
+        f"Bootstrap timings ({report.instance_id}, {state}):",
+        f"{'script':<{width}}  {'time':>6}  {'prev':>6}  status",
+    ]
+    for timing in report.scripts:
+        lines.append(
+            f"{timing.script:<{width}}  {_format_seconds(timing.duration_seconds):>6}  "
+            f"{_format_seconds(previous.get(timing.script)):>6}  {timing.status}"
+        )
+    lines.append(f"{'total':<{width}}  {_format_seconds(report.total_seconds):>6}")
+    return lines
+
+
+def report_bootstrap_timings(
+    ec2_client: Any,
+    *,
+    timing_dir: Path,
+    region: str,
+    stack_name: str,
+    instance_id: str,
+    out: TextIO = sys.stdout,
+) -> BootstrapTimingReport | None:
+    """Fetch, record and print the bootstrap timing table for one instance (best effort).
+
+    Returns:
+        The report that was printed, or ``None`` when no timings were available.
+    """
+    try:
+        report = fetch_bootstrap_timings(ec2_client, instance_id)
+    except Exception:
+        # Reason: timings are informational and must not fail status commands.
+        LOGGER.warning("Unable to read bootstrap timings instance_id=%s", instance_id, exc_info=True)
+        return None
+    if report is None:
+        return None
+    print_bootstrap_report(report, timing_dir=timing_dir, region=region, stack_name=stack_name, out=out)
+    return report
+
+
+def print_bootstrap_report(
+    report: BootstrapTimingReport,
+    *,
+    timing_dir: Path,
+    region: str,
+    stack_name: str,
+    out: TextIO = sys.stdout,
+) -> None:
+    """Record a report in the stack's history and print it against the previous run."""
+    previous = previous_bootstrap_durations(
+        load_bootstrap_timing_history(timing_dir, region, stack_name),
+        report.instance_id,
+    )
+    record_bootstrap_timings(timing_dir, region, stack_name, report)
+    for line in format_bootstrap_timings(report, previous):
+        print(line, file=out)
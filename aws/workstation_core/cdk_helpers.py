@@ -2,10 +2,272 @@
 
 import base64
 from dataclasses import dataclass
+import gzip
+import hashlib
+import json
 from pathlib import Path
-from typing import Any, Literal
-
-from workstation_core.environment_config import EnvironmentSpec
+import shlex
+from typing import Any, Literal, Mapping, Sequence
+
+from workstation_core.environment_config import (
+    EnvironmentSpec,
+    InstanceTypeOption,
+    resolve_bootstrap_dependencies,
+)
+
+BOOTSTRAP_LOG_DIR = "/var/log/env4ai-bootstrap"
+BOOTSTRAP_RUNNER_FILENAME = "env4ai-bootstrap-runner.sh"
+_BOOTSTRAP_SCRIPT_DIR = "/var/lib/env4ai/bootstrap"
+_CONTAINER_CONFIG_DIR = "/etc/env4ai"
+VOLUME_PREREAD_MARKER = "env4ai-volume-preread:"
+USER_DATA_LIMIT_BYTES = 16 * 1024
+USER_DATA_WARN_RATIO = 0.8
+_MIME_BOUNDARY = "==ENV4AI-BOOTSTRAP=="
+# Reason: cloud-init replaces lists across cloud-config parts by default; append keeps every write_files entry.
+_MIME_MERGE_TYPE = "list(append)+dict(recurse_array)+str()"
+# Reason: starts every script whose needs succeeded, up to max_jobs at once, and skips
+# scripts whose needs failed; each script logs to <log_dir>/<name>.log. Scripts run in
+# strict mode so a failed command fails the script even without its own header. Start/end
+# markers and a final summary go to the serial console so the CLI can read timings without SSH.
+_BOOTSTRAP_RUNNER_LOOP = """mark() { echo "env4ai-bootstrap: $*" 2>/dev/null >/dev/console || true; }
+declare -A state=()
+running=0
+while :; do
+  progress=0
+  for name in "${order[@]}"; do
+    [ -n "${state[$name]:-}" ] && continue
+    ready=1
+    for dep in ${needs[$name]}; do
+      case "${state[$dep]:-}" in
+        ok) ;;
+        failed|skipped)
+          state[$name]=skipped
+          echo "[bootstrap] $name skipped: $dep did not succeed"
+          ready=0
+          progress=1
+          break
+          ;;
+        *) ready=0 ;;
+      esac
+    done
+    if [ "$ready" = 1 ] && [ "$running" -lt "$max_jobs" ]; then
+      state[$name]=running
+      running=$((running + 1))
+      progress=1
+      echo "[bootstrap] $name started"
+      (
+        started=$(date +%s)
+        mark "$name start=$started"
+        bash -euo pipefail "$script_dir/$name" >"$log_dir/$name.log" 2>&1
+        status=$?
+        finished=$(date +%s)
+        mark "$name end=$finished exit=$status"
+        echo "[bootstrap] $name exit=$status ($((finished - started))s)"
+        echo "$started,$finished,$status" >"$log_dir/$name.timing"
+        echo "$status" >"$log_dir/$name.status.tmp"
+        mv "$log_dir/$name.status.tmp" "$log_dir/$name.status"
+      ) &
+    fi
+  done
+  pending=0
+  for name in "${order[@]}"; do
+    case "${state[$name]:-}" in ok|failed|skipped) ;; *) pending=1 ;; esac
+  done
+  [ "$pending" = 0 ] && break
+  if [ "$running" -gt 0 ]; then
+    wait -n
+    for name in "${order[@]}"; do
+      if [ "${state[$name]:-}" = running ] && [ -f "$log_dir/$name.status" ]; then
+        if [ "$(cat "$log_dir/$name.status")" = 0 ]; then state[$name]=ok; else state[$name]=failed; fi
+        running=$((running - 1))
+      fi
+    done
+  elif [ "$progress" = 0 ]; then
+    break
+  fi
+done
+wait
+result=0
+summary=""
+for name in "${order[@]}"; do
+  case "${state[$name]:-}" in
+    ok) ;;
+    failed) echo "[bootstrap] $name failed; see $log_dir/$name.log"; result=1 ;;
+    *) echo "[bootstrap] $name was skipped"; result=1 ;;
+  esac
+  if [ -f "$log_dir/$name.timing" ]; then
+    summary="$summary $name=$(cat "$log_dir/$name.timing")"
+  else
+    summary="$summary $name=skipped"
+  fi
+done
+echo "${summary# }" >"$log_dir/summary"
+echo "env4ai-bootstrap-summary: ${summary# }" 2>/dev/null >/dev/console || true
+"""
+# Reason: the package cache is plain tarballs restored before the scripts and saved after
+# them, so a miss simply downloads from upstream. Each archive is uploaded again only when
+# its file list changed; apt keeps a hard link of every installed .deb because the scripts'
+# ``apt-get clean`` empties the apt archive directory. Requests are SigV4-signed with the
+# instance role from IMDS, since the bucket only accepts that role. Archives are checked to
+# hold only their kind's cache paths, extracted into a staging directory, and only those
+# paths are copied back, so an archive can never write elsewhere on the root filesystem.
+_PACKAGE_CACHE_FUNCTIONS = """cache_root=/var/cache/env4ai
+declare -A cache_paths=(
+  [apt]="var/cache/env4ai/apt"
+  [pip]="root/.cache/pip home/ubuntu/.cache/pip"
+  [uv]="root/.cache/uv home/ubuntu/.cache/uv"
+  [npm]="root/.npm home/ubuntu/.npm"
+  [go]="root/go/pkg/mod home/ubuntu/go/pkg/mod"
+)
+cache_host=${cache_url#https://}
+cache_host=${cache_host%%/*}
+cache_prefix=${cache_url#"https://$cache_host"}
+cache_region=${cache_host#*.s3.}
+cache_region=${cache_region%.amazonaws.com}
+cache_hmac() { printf '%s' "$2" | openssl dgst -sha256 -mac HMAC -macopt "hexkey:$1" -r | cut -d' ' -f1; }
+cache_signature() {
+  local key part
+  key=$(printf 'AWS4%s' "$1" | od -An -v -tx1 | tr -d ' \\n')
+  for part in "${2%%T*}" "$cache_region" s3 aws4_request; do
+    key=$(cache_hmac "$key" "$part")
+  done
+  cache_hmac "$key" "$(printf 'AWS4-HMAC-SHA256\\n%s\\n%s/%s/s3/aws4_request\\n%s' \\
+    "$2" "${2%%T*}" "$cache_region" "$(printf '%s' "$3" | sha256sum | cut -d' ' -f1)")"
+}
+cache_credentials() {
+  local token role
+  token=$(curl -fsS --max-time 5 -X PUT -H "X-aws-ec2-metadata-token-ttl-seconds: 300" \\
+    http://169.254.169.254/latest/api/token) || return 1
+  role=$(curl -fsS --max-time 5 -H "X-aws-ec2-metadata-token: $token" \\
+    http://169.254.169.254/latest/meta-data/iam/security-credentials/) || return 1
+  curl -fsS --max-time 5 -H "X-aws-ec2-metadata-token: $token" \\
+    "http://169.254.169.254/latest/meta-data/iam/security-credentials/$role" \\
+    | python3 -c 'import json, sys; c = json.load(sys.stdin); print(c["AccessKeyId"], c["SecretAccessKey"], c["Token"])'
+}
+cache_request() {
+  local method=$1 path="$cache_prefix/$2" file=$3 key_id secret token now canonical signature
+  read -r key_id secret token < <(cache_credentials) && [ -n "$token" ] || return 1
+  now=$(date -u +%Y%m%dT%H%M%SZ)
+  canonical="$method
+$path
+
+host:$cache_host
+x-amz-content-sha256:UNSIGNED-PAYLOAD
+x-amz-date:$now
+x-amz-security-token:$token
+
+host;x-amz-content-sha256;x-amz-date;x-amz-security-token
+UNSIGNED-PAYLOAD"
+  signature=$(cache_signature "$secret" "$now" "$canonical") || return 1
+  local auth="AWS4-HMAC-SHA256 Credential=$key_id/${now%%T*}/$cache_region/s3/aws4_request"
+  auth+=", SignedHeaders=host;x-amz-content-sha256;x-amz-date;x-amz-security-token, Signature=$signature"
+  local args=(-fsS --retry 2 -H "Authorization: $auth"
+    -H "x-amz-content-sha256: UNSIGNED-PAYLOAD" -H "x-amz-date: $now" -H "x-amz-security-token: $token")
+  if [ "$method" = PUT ]; then
+    curl "${args[@]}" --max-time 1800 -T "$file" "https://$cache_host$path"
+  else
+    curl "${args[@]}" --max-time 900 -o "$file" "https://$cache_host$path"
+  fi
+}
+cache_manifest() {
+  for path in ${cache_paths[$1]}; do
+    [ -d "/$path" ] && find "/$path" -type f -printf '%P %s\\n'
+  done | sort | sha256sum | cut -d' ' -f1
+}
+extract_package_cache() {
+  local kind=$1 archive=$2 target=$3 name path allowed staging link resolved status=0
+  while IFS= read -r name; do
+    allowed=0
+    for path in ${cache_paths[$kind]}; do
+      case "${name%/}/" in "$path"/*) allowed=1 ;; esac
+    done
+    case "/$name/" in //*|*/../*) allowed=0 ;; esac
+    [ "$allowed" = 1 ] || { echo "[bootstrap] package cache: $kind archive has unsafe entry $name"; return 1; }
+  done < <(tar -tzf "$archive") || return 1
+  staging=$(mktemp -d "$cache_root/staging.XXXXXX") || return 1
+  if tar -xzpf "$archive" -C "$staging"; then
+    while IFS= read -r -d '' link; do
+      resolved=$(readlink "$link")
+      case "$resolved" in /*) ;; *) resolved="$(dirname "/${link#"$staging"/}")/$resolved" ;; esac
+      resolved=$(realpath -m "$resolved")
+      allowed=0
+      for path in ${cache_paths[$kind]}; do
+        case "$resolved/" in "/$path"/*) allowed=1 ;; esac
+      done
+      [ "$allowed" = 1 ] || rm -f "$link"
+    done < <(find "$staging" -type l -print0)
+    for path in ${cache_paths[$kind]}; do
+      if [ -d "$staging/$path" ]; then
+        mkdir -p "$target/$path" && cp -a "$staging/$path/." "$target/$path/" || status=1
+      fi
+    done
+  else
+    status=1
+  fi
+  rm -rf "$staging"
+  return "$status"
+}
+restore_package_cache() {
+  mkdir -p "$cache_root/apt" "$cache_root/manifests"
+  for kind in "${!cache_paths[@]}"; do
+    if cache_request GET "$kind.tar.gz" "$cache_root/$kind.tar.gz" \\
+      && extract_package_cache "$kind" "$cache_root/$kind.tar.gz" /; then
+      echo "[bootstrap] package cache: restored $kind"
+    else
+      echo "[bootstrap] package cache: no $kind archive; using upstream"
+    fi
+    rm -f "$cache_root/$kind.tar.gz"
+    cache_manifest "$kind" >"$cache_root/manifests/$kind"
+  done
+  archives=/var/cache/apt/archives
+  printf '%s\\n' \\
+    "DPkg::Pre-Install-Pkgs {\\"xargs -r cp -nl -t $cache_root/apt || true\\";};" \\
+    "APT::Update::Post-Invoke-Success {\\"cp -nl $cache_root/apt/*.deb $archives/ 2>/dev/null || true\\";};" \\
+    >/etc/apt/apt.conf.d/01env4ai-package-cache
+  cp -nl "$cache_root"/apt/*.deb "$archives"/ 2>/dev/null || true
+}
+save_package_cache() {
+  for kind in "${!cache_paths[@]}"; do
+    if [ "$(cache_manifest "$kind")" = "$(cat "$cache_root/manifests/$kind" 2>/dev/null)" ]; then
+      continue
+    fi
+    paths=()
+    for path in ${cache_paths[$kind]}; do
+      [ -d "/$path" ] && paths+=("$path")
+    done
+    [ "${#paths[@]}" -gt 0 ] || continue
+    if tar -czf "$cache_root/$kind.tar.gz" -C / "${paths[@]}" \\
+      && cache_request PUT "$kind.tar.gz" "$cache_root/$kind.tar.gz"; then
+      echo "[bootstrap] package cache: saved $kind"
+    else
+      echo "[bootstrap] package cache: could not save $kind"
+    fi
+    rm -f "$cache_root/$kind.tar.gz"
+  done
+}
+"""
+# Reason: a volume restored from a snapshot loads each block from S3 on first read, so
+# reading the whole root disk once up front moves that cost off the first builds. It runs
+# as its own systemd unit so it outlives cloud-init and never delays the bootstrap scripts.
+_VOLUME_PREREAD_LAUNCHER = """mkdir -p /var/lib/env4ai
+cat >/var/lib/env4ai/volume-preread.sh <<'PREREAD'
+mark() { echo "env4ai-volume-preread: $*" 2>/dev/null >/dev/console || true; }
+root_source=$(findmnt -no SOURCE /)
+parent=$(lsblk -no PKNAME "$root_source" 2>/dev/null | head -n 1)
+device=/dev/${parent:-${root_source#/dev/}}
+mark "device=$device start=$(date +%s)"
+if command -v fio >/dev/null 2>&1; then
+  fio --filename="$device" --rw=read --bs=1M --iodepth=32 --ioengine=libaio --direct=1 \\
+    --name=env4ai-volume-preread >/dev/null
+else
+  dd if="$device" of=/dev/null bs=1M iflag=direct status=none
+fi
+status=$?
+mark "device=$device end=$(date +%s) exit=$status"
+PREREAD
+systemd-run --unit=env4ai-volume-preread --collect nice -n 10 bash /var/lib/env4ai/volume-preread.sh \\
+  || (nohup nice -n 10 bash /var/lib/env4ai/volume-preread.sh >/dev/null 2>&1 &)
+"""
 
 
 @dataclass(frozen=True, slots=True)
@@ -124,28 +386,267 @@ def _resolve_bootstrap_script_path(filename: str, *, verbose_resolution: bool =
     )
 
 
+@dataclass(frozen=True, slots=True)
+class BootstrapPartSize:
+    """Size and content hash of one bootstrap script part.
+
+    Args:
+        filename: Init script filename.
+        raw_bytes: Size of the MIME part before compression.
+        compressed_bytes: Size of the part gzip-compressed on its own.
+        sha256: Hex digest of the script contents.
+    """
+
+    filename: str
+    raw_bytes: int
+    compressed_bytes: int
+    sha256: str
+
+
 def build_bootstrap_user_data(
     bootstrap_files: tuple[str, ...],
     *,
     verbose_resolution: bool = False,
+    dependencies: Mapping[str, tuple[str, ...]] | None = None,
+    max_parallel: int = 4,
+    package_cache_url: str | None = None,
+    container_registry: str | None = None,
+    container_images: Sequence[str] = (),
+    volume_preread: bool = False,
 ) -> str:
-    """Build a base64-encoded userData script from ordered init files.
+    """Build base64-encoded, gzip-compressed multipart userData from ordered init files.
+
+    Each script is a ``text/cloud-config`` part that writes it to disk, and
+    a final ``text/x-shellscript`` part runs them. Without ``dependencies``
+    each script needs every script before it, so the runner executes them
+    one at a time in order. With them, the scripts run as a dependency graph
+    with at most ``max_parallel`` running at once.
 
     Args:
-        bootstrap_files: Ordered init script filenames to concatenate.
-        verbose_resolution: Whether to print resolved bootstrap script paths.
+        bootstrap_files: Ordered init script filenames to run.
+        verbose_resolution: Whether to print resolved bootstrap script paths
+            and the per-script size breakdown.
+        dependencies: Optional script -> required scripts map.
+        max_parallel: Maximum scripts run at once by the dependency runner.
+        package_cache_url: Optional package cache URL, the bucket URL plus the
+            environment's key prefix, the runner restores and saves package
+            manager caches through.
+        container_registry: Optional container pull-through cache registry
+            ``docker.sh`` configures the ECR credential helper for.
+        container_images: ``container_pull_references`` lines ``docker.sh`` pulls.
+        volume_preread: Whether the runner first starts a background read of
+            the whole root volume.
 
     Returns:
-        Base64-encoded bootstrap script payload.
+        Base64-encoded bootstrap payload.
+
+    Raises:
+        ValueError: If the compressed payload exceeds ``USER_DATA_LIMIT_BYTES``.
     """
-    user_data_script = ""
-    for filename in bootstrap_files:
-        script_path = _resolve_bootstrap_script_path(
+    scripts = [
+        (
             filename,
-            verbose_resolution=verbose_resolution,
+            _resolve_bootstrap_script_path(
+                filename,
+                verbose_resolution=verbose_resolution,
+            ).read_text(encoding="utf-8"),
+        )
+        for filename in bootstrap_files
+    ]
+    runner = render_bootstrap_runner(
+        bootstrap_files,
+        resolve_bootstrap_dependencies(bootstrap_files, dependencies or {}),
+        max_parallel=max_parallel,
+        package_cache_url=package_cache_url,
+        container_registry=container_registry,
+        container_images=container_images,
+        volume_preread=volume_preread,
+    )
+    parts = [_render_script_part(filename, content) for filename, content in scripts]
+    payload = gzip.compress(_render_multipart(parts, runner).encode("utf-8"), mtime=0)
+
+    sizes = [
+        BootstrapPartSize(
+            filename=filename,
+            raw_bytes=len(part.encode("utf-8")),
+            compressed_bytes=len(gzip.compress(part.encode("utf-8"), mtime=0)),
+            sha256=hashlib.sha256(content.encode("utf-8")).hexdigest(),
+        )
+        for (filename, content), part in zip(scripts, parts)
+    ]
+    breakdown = format_bootstrap_size_breakdown(sizes, payload_bytes=len(payload))
+    if len(payload) > USER_DATA_LIMIT_BYTES:
+        raise ValueError(
+            f"Bootstrap user data is {len(payload)} bytes compressed, over the EC2 limit of "
+            f"{USER_DATA_LIMIT_BYTES} bytes. Move work into a golden AMI or trim the largest scripts.\n{breakdown}"
+        )
+    if len(payload) >= USER_DATA_LIMIT_BYTES * USER_DATA_WARN_RATIO:
+        print(f"bootstrap: warning: user data is close to the EC2 limit.\n{breakdown}")
+    elif verbose_resolution:
+        print(breakdown)
+    return base64.b64encode(payload).decode("utf-8")
+
+
+def build_volume_preread_user_data() -> str:
+    """Build base64-encoded, gzip-compressed userData that only pre-reads the root volume.
+
+    Used for restored AMIs that skip the bootstrap scripts. Start and end
+    markers go to the serial console for ``parse_volume_preread``.
+
+    Returns:
+        Base64-encoded user-data payload.
+    """
+    script = "#!/bin/bash\n" + _VOLUME_PREREAD_LAUNCHER
+    return base64.b64encode(gzip.compress(script.encode("utf-8"), mtime=0)).decode("utf-8")
+
+
+def format_bootstrap_size_breakdown(sizes: Sequence[BootstrapPartSize], *, payload_bytes: int) -> str:
+    """Render per-script part sizes and hashes against the user-data limit."""
+    width = max([len("script"), *(len(size.filename) for size in sizes)])
+    lines = [f"bootstrap: {'script':<{width}}  {'raw':>7}  {'gzip':>7}  sha256"]
+    for size in sorted(sizes, key=lambda item: item.compressed_bytes, reverse=True):
+        lines.append(
+            f"bootstrap: {size.filename:<{width}}  {size.raw_bytes:>7}  {size.compressed_bytes:>7}  "
+            f"{size.sha256[:12]}"
         )
-        user_data_script += script_path.read_text(encoding="utf-8")
-    return base64.b64encode(user_data_script.encode("utf-8")).decode("utf-8")
+    lines.append(
+        f"bootstrap: compressed payload {payload_bytes} of {USER_DATA_LIMIT_BYTES} bytes "
+        f"({payload_bytes / USER_DATA_LIMIT_BYTES:.0%})"
+    )
+    return "\n".join(lines)
+
+
+def _render_script_part(filename: str, content: str) -> str:
+    """Render the cloud-config MIME part that writes one bootstrap script."""
+    # Reason: JSON is valid YAML and escapes script contents without block-scalar indentation rules.
+    cloud_config = json.dumps(
+        {
+            "write_files": [
+                {
+                    "path": f"{_BOOTSTRAP_SCRIPT_DIR}/{filename}",
+                    "permissions": "0755",
+                    "content": content,
+                }
+            ]
+        }
+    )
+    return "\n".join(
+        [
+            'Content-Type: text/cloud-config; charset="us-ascii"',
+            "MIME-Version: 1.0",
+            f"Merge-Type: {_MIME_MERGE_TYPE}",
+            f'Content-Disposition: attachment; filename="{filename}.cfg"',
+            f"X-Env4ai-Sha256: {hashlib.sha256(content.encode('utf-8')).hexdigest()}",
+            "",
+            "#cloud-config",
+            cloud_config,
+        ]
+    )
+
+
+def _render_multipart(parts: Sequence[str], runner: str) -> str:
+    """Join cloud-config parts and the runner into one multipart/mixed document."""
+    runner_part = "\n".join(
+        [
+            'Content-Type: text/x-shellscript; charset="utf-8"',
+            "MIME-Version: 1.0",
+            f'Content-Disposition: attachment; filename="{BOOTSTRAP_RUNNER_FILENAME}"',
+            "",
+            runner,
+        ]
+    )
+    sections = [
+        f'Content-Type: multipart/mixed; boundary="{_MIME_BOUNDARY}"',
+        "MIME-Version: 1.0",
+        "",
+    ]
+    for part in [*parts, runner_part]:
+        if _MIME_BOUNDARY in part:
+            raise ValueError(f"Bootstrap script content contains the MIME boundary '{_MIME_BOUNDARY}'.")
+        sections.append(f"--{_MIME_BOUNDARY}")
+        sections.append(part)
+    sections.append(f"--{_MIME_BOUNDARY}--")
+    return "\n".join(sections) + "\n"
+
+
+def render_bootstrap_runner(
+    script_names: Sequence[str],
+    needs: Mapping[str, tuple[str, ...]],
+    *,
+    max_parallel: int,
+    package_cache_url: str | None = None,
+    container_registry: str | None = None,
+    container_images: Sequence[str] = (),
+    volume_preread: bool = False,
+) -> str:
+    """Render the bash runner that executes bootstrap scripts as a dependency graph.
+
+    The scripts are expected under the bootstrap script directory, written
+    there by the user data's cloud-config parts. Each runs in its own
+    ``bash -euo pipefail`` process, with non-interactive apt settings, once
+    every script it needs has exited with status 0, and logs to
+    ``BOOTSTRAP_LOG_DIR/<name>.log``. Scripts whose needs failed are skipped,
+    and the runner exits non-zero when any script did not succeed.
+    Start/end timestamps and exit codes are written to the serial console for
+    ``parse_bootstrap_timings``.
+
+    With ``package_cache_url`` the runner first restores the apt, pip, uv,
+    npm and Go module caches from archives under that URL, and uploads the
+    archives whose contents changed once the scripts have finished.  Both
+    are signed with the instance role, and each archive may only restore
+    its own cache directories.
+    ``container_registry`` and ``container_images`` are written under
+    ``/etc/env4ai`` for ``docker.sh``. ``volume_preread`` starts a background
+    read of the root volume before any script runs.
+
+    Args:
+        script_names: Init script filenames in declared order.
+        needs: Full dependency graph from ``resolve_bootstrap_dependencies``.
+        max_parallel: Maximum scripts run at once.
+        package_cache_url: Optional package cache URL (bucket URL plus key prefix),
+            without a trailing slash.
+        container_registry: Optional container pull-through cache registry host.
+        container_images: ``container_pull_references`` lines for ``docker.sh`` to pull.
+        volume_preread: Whether to pre-read the root volume in the background.
+
+    Returns:
+        Runner script text.
+    """
+    lines = [
+        "#!/bin/bash",
+        "set -u",
+        f"log_dir={BOOTSTRAP_LOG_DIR}",
+        f"script_dir={_BOOTSTRAP_SCRIPT_DIR}",
+        f"max_jobs={max(1, max_parallel)}",
+        "export DEBIAN_FRONTEND=noninteractive APT_LISTCHANGES_FRONTEND=none NEEDRESTART_MODE=a",
+        'mkdir -p "$log_dir" "$script_dir"',
+        # Reason: status files left in an imaged log directory would mark scripts finished.
+        'rm -f "$log_dir"/*.status "$log_dir"/*.timing',
+        f"order=({' '.join(script_names)})",
+        "declare -A needs=(",
+    ]
+    lines.extend(f'  [{filename}]="{" ".join(needs.get(filename, ()))}"' for filename in script_names)
+    lines.append(")")
+    if container_registry or container_images:
+        lines.append(f"mkdir -p {_CONTAINER_CONFIG_DIR}")
+    if container_registry:
+        lines.append(f"echo {shlex.quote(container_registry)} >{_CONTAINER_CONFIG_DIR}/container-registry")
+    if container_images:
+        quoted_images = " ".join(shlex.quote(image) for image in container_images)
+        lines.append(f"printf '%s\\n' {quoted_images} >{_CONTAINER_CONFIG_DIR}/container-images")
+    if volume_preread:
+        lines.append(_VOLUME_PREREAD_LAUNCHER.rstrip("\n"))
+    if package_cache_url is None:
+        return "\n".join(lines) + "\n" + _BOOTSTRAP_RUNNER_LOOP + 'exit "$result"\n'
+    lines.append(f"cache_url={package_cache_url.rstrip('/')}")
+    return (
+        "\n".join(lines)
+        + "\n"
+        + _PACKAGE_CACHE_FUNCTIONS
+        + "restore_package_cache\n"
+        + _BOOTSTRAP_RUNNER_LOOP
+        + 'save_package_cache\nexit "$result"\n'
+    )
 
 
 def resolve_ami_id(
@@ -198,6 +699,12 @@ def build_spot_fleet_launch_specification(
     key_name: str | None = "aws_key",
     iam_instance_profile_arn: str | None = None,
     verbose_bootstrap_resolution: bool = False,
+    bootstrap_dependencies: Mapping[str, tuple[str, ...]] | None = None,
+    bootstrap_parallelism: int = 4,
+    package_cache_url: str | None = None,
+    container_registry: str | None = None,
+    container_images: Sequence[str] = (),
+    volume_preread: bool = False,
 ) -> dict[str, object]:
     """Build a reusable Spot Fleet launch specification payload.
 
@@ -212,6 +719,14 @@ def build_spot_fleet_launch_specification(
         key_name: Optional EC2 key pair name.
         iam_instance_profile_arn: Optional EC2 instance profile ARN.
         verbose_bootstrap_resolution: Whether to print resolved bootstrap paths.
+        bootstrap_dependencies: Optional script -> required scripts map that
+            switches user data to the parallel dependency runner.
+        bootstrap_parallelism: Maximum scripts run at once by that runner.
+        package_cache_url: Optional package cache bucket URL used by the bootstrap runner.
+        container_registry: Optional container pull-through cache registry host.
+        container_images: ``container_pull_references`` lines the bootstrap pulls.
+        volume_preread: Whether user data pre-reads the root volume, even when
+            the bootstrap scripts are omitted.
 
     Returns:
         Launch specification payload compatible with CDK Spot Fleet constructs.
@@ -241,5 +756,39 @@ def build_spot_fleet_launch_specification(
         launch_specification["user_data"] = build_bootstrap_user_data(
             bootstrap_files,
             verbose_resolution=verbose_bootstrap_resolution,
+            dependencies=bootstrap_dependencies,
+            max_parallel=bootstrap_parallelism,
+            package_cache_url=package_cache_url,
+            container_registry=container_registry,
+            container_images=container_images,
+            volume_preread=volume_preread,
         )
+    elif volume_preread:
+        launch_specification["user_data"] = build_volume_preread_user_data()
     return launch_specification
+
+
+def expand_launch_specification_for_instance_types(
+    launch_specification: dict[str, object],
+    instance_types: tuple[InstanceTypeOption, ...],
+) -> list[dict[str, object]]:
+    """Copy one launch specification per acceptable instance type.
+
+    Args:
+        launch_specification: Payload from ``build_spot_fleet_launch_specification``.
+        instance_types: Ordered instance types with their weights.
+
+    Returns:
+        One payload per instance type, in order.  A single type keeps the
+        payload unweighted.
+    """
+    if len(instance_types) <= 1:
+        return [dict(launch_specification)]
+    return [
+        {
+            **launch_specification,
+            "instance_type": option.instance_type,
+            "weighted_capacity": option.weight,
+        }
+        for option in instance_types
+    ]
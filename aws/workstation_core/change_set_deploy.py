@@ -0,0 +1,481 @@
+"""Direct CloudFormation change-set deploys with live stack event streaming."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+import json
+import logging
+from pathlib import Path
+import sys
+import time
+from typing import Any, Callable, TextIO
+
+from workstation_core.deploy_fingerprint import describe_stack_status
+from workstation_core.tracing import trace_span
+
+LOGGER = logging.getLogger(__name__)
+CHANGE_SET_DEPLOY_TIMEOUT_SECONDS = 45 * 60
+EVENT_POLL_INTERVAL_SECONDS = 2.0
+# Reason: CloudFormation rejects inline ``TemplateBody`` values above this size.
+MAX_TEMPLATE_BODY_BYTES = 51_200
+CDK_CAPABILITIES = ("CAPABILITY_IAM", "CAPABILITY_NAMED_IAM", "CAPABILITY_AUTO_EXPAND")
+_STACK_RESOURCE_TYPE = "AWS::CloudFormation::Stack"
+_SUCCESS_STACK_STATUSES = frozenset({"CREATE_COMPLETE", "UPDATE_COMPLETE", "IMPORT_COMPLETE"})
+_NO_CHANGE_REASONS = ("didn't contain changes", "No updates are to be performed")
+
+
+@dataclass(frozen=True, slots=True)
+class StackArtifact:
+    """Deployable stack read from a synthesized cloud assembly.
+
+    Args:
+        stack_name: CloudFormation stack name.
+        template_body: Template rendered as JSON text.
+        execution_role_arn: CDK bootstrap CloudFormation execution role, if any.
+        template_bucket: Bootstrap asset bucket used to stage large templates.
+        template_object_key: Object key for the staged template.
+        has_external_assets: Whether the stack needs file or image assets
+            published first, which only the CDK CLI does.
+    """
+
+    stack_name: str
+    template_body: str
+    execution_role_arn: str | None = None
+    template_bucket: str | None = None
+    template_object_key: str | None = None
+    has_external_assets: bool = False
+
+
+@dataclass(frozen=True, slots=True)
+class StackEvent:
+    """One ``describe_stack_events`` entry."""
+
+    event_id: str
+    logical_resource_id: str
+    resource_type: str
+    resource_status: str
+    timestamp: datetime | None
+    status_reason: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class ResourceTiming:
+    """How long CloudFormation spent on one resource during a deploy.
+
+    Args:
+        logical_resource_id: Logical id in the template.
+        resource_type: CloudFormation resource type.
+        final_status: Last status observed for the resource.
+        duration_seconds: Time from first ``*_IN_PROGRESS`` to final status.
+    """
+
+    logical_resource_id: str
+    resource_type: str
+    final_status: str
+    duration_seconds: float
+
+
+@dataclass(frozen=True, slots=True)
+class ChangeSetDeployResult:
+    """Outcome of one change-set deploy.
+
+    Args:
+        stack_name: CloudFormation stack name.
+        change_set_type: ``CREATE`` or ``UPDATE``.
+        changed: ``False`` when CloudFormation found nothing to change.
+        stack_status: Final stack status.
+        resource_timings: Per-resource timings, slowest first.
+        elapsed_seconds: Wall time spent in the deploy.
+    """
+
+    stack_name: str
+    change_set_type: str
+    changed: bool
+    stack_status: str
+    resource_timings: tuple[ResourceTiming, ...]
+    elapsed_seconds: float
+
+
+def _partition_for_region(region: str) -> str:
+    """Return the AWS partition for a region name."""
+    if region.startswith("cn-"):
+        return "aws-cn"
+    if region.startswith("us-gov-"):
+        return "aws-us-gov"
+    return "aws"
+
+
+def _substitute_placeholders(value: str, *, account: str, region: str) -> str:
+    """Replace CDK ``${AWS::...}`` placeholders with concrete values."""
+    return (
+        value.replace("${AWS::AccountId}", account)
+        .replace("${AWS::Region}", region)
+        .replace("${AWS::Partition}", _partition_for_region(region))
+    )
+
+
+def _read_json(path: Path) -> dict[str, Any]:
+    """Read one cloud assembly JSON file with an actionable error."""
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as err:
+        raise RuntimeError(
+            f"Unable to read cloud assembly file {path}. "
+            "Re-run the deploy so the CDK app is synthesized again."
+        ) from err
+
+
+def load_stack_artifact(assembly_dir: str | Path, stack_name: str) -> StackArtifact:
+    """Load a stack's template and deploy settings from a cloud assembly.
+
+    Args:
+        assembly_dir: Synthesized cloud assembly directory.
+        stack_name: Stack artifact id (the CDK construct id).
+
+    Returns:
+        Deployable stack artifact.
+
+    Raises:
+        RuntimeError: If the manifest or template cannot be read.
+    """
+    assembly_path = Path(assembly_dir)
+    manifest = _read_json(assembly_path / "manifest.json")
+    artifacts = manifest.get("artifacts", {})
+    artifact = artifacts.get(stack_name)
+    if not isinstance(artifact, dict) or artifact.get("type") != "aws:cloudformation:stack":
+        raise RuntimeError(f"Cloud assembly {assembly_path} has no stack named '{stack_name}'.")
+
+    properties = artifact.get("properties", {})
+    template_file = str(properties.get("templateFile") or f"{stack_name}.template.json")
+    template = _read_json(assembly_path / template_file)
+    # Reason: environment is ``aws://<account>/<region>`` for env-bound stacks.
+    _, _, environment = str(artifact.get("environment", "")).partition("://")
+    account, _, region = environment.partition("/")
+
+    execution_role_arn = properties.get("cloudFormationExecutionRoleArn")
+    if execution_role_arn:
+        execution_role_arn = _substitute_placeholders(str(execution_role_arn), account=account, region=region)
+
+    template_bucket: str | None = None
+    template_object_key: str | None = None
+    has_external_assets = False
+    for dependency in artifact.get("dependencies", []):
+        dependency_artifact = artifacts.get(dependency, {})
+        if dependency_artifact.get("type") != "cdk:asset-manifest":
+            continue
+        asset_file = str(dependency_artifact.get("properties", {}).get("file", ""))
+        asset_manifest = _read_json(assembly_path / asset_file)
+        if asset_manifest.get("dockerImages"):
+            has_external_assets = True
+        for asset in asset_manifest.get("files", {}).values():
+            if asset.get("source", {}).get("path") != template_file:
+                has_external_assets = True
+                continue
+            for destination in asset.get("destinations", {}).values():
+                template_bucket = _substitute_placeholders(
+                    str(destination.get("bucketName", "")), account=account, region=region
+                )
+                template_object_key = str(destination.get("objectKey", "")) or None
+                break
+
+    return StackArtifact(
+        stack_name=str(properties.get("stackName") or stack_name),
+        template_body=json.dumps(template, separators=(",", ":")),
+        execution_role_arn=execution_role_arn or None,
+        template_bucket=template_bucket or None,
+        template_object_key=template_object_key,
+        has_external_assets=has_external_assets,
+    )
+
+
+def _parse_stack_event(raw_event: dict[str, Any]) -> StackEvent:
+    """Convert one boto3 stack event into a ``StackEvent``."""
+    timestamp = raw_event.get("Timestamp")
+    return StackEvent(
+        event_id=str(raw_event.get("EventId", "")),
+        logical_resource_id=str(raw_event.get("LogicalResourceId", "")),
+        resource_type=str(raw_event.get("ResourceType", "")),
+        resource_status=str(raw_event.get("ResourceStatus", "")),
+        timestamp=timestamp if isinstance(timestamp, datetime) else None,
+        status_reason=str(raw_event.get("ResourceStatusReason", "")).strip() or None,
+    )
+
+
+class StackEventTail:
+    """Incrementally read new ``describe_stack_events`` entries for one stack.
+
+    CloudFormation returns events newest first.  Each poll pages with
+    ``NextToken`` only until it reaches the last event it already returned.
+    """
+
+    def __init__(self, cloudformation_client: Any, stack_name: str) -> None:
+        self._cloudformation_client = cloudformation_client
+        self._stack_name = stack_name
+        self.last_event_id: str | None = None
+
+    def prime(self) -> None:
+        """Mark every event that already exists as seen."""
+        response = self._cloudformation_client.describe_stack_events(StackName=self._stack_name)
+        events = response.get("StackEvents", [])
+        if events:
+            self.last_event_id = str(events[0].get("EventId", "")) or None
+
+    def poll(self) -> list[StackEvent]:
+        """Return events newer than the last seen one, oldest first."""
+        fresh: list[StackEvent] = []
+        next_token: str | None = None
+        while True:
+            request: dict[str, str] = {"StackName": self._stack_name}
+            if next_token:
+                request["NextToken"] = next_token
+            response = self._cloudformation_client.describe_stack_events(**request)
+            for raw_event in response.get("StackEvents", []):
+                if str(raw_event.get("EventId", "")) == self.last_event_id:
+                    next_token = None
+                    break
+                fresh.append(_parse_stack_event(raw_event))
+            else:
+                next_token = response.get("NextToken")
+            if not next_token:
+                break
+        if fresh:
+            self.last_event_id = fresh[0].event_id
+        fresh.reverse()
+        return fresh
+
+
+class _ResourceTimer:
+    """Track first-seen and final events per resource."""
+
+    def __init__(self) -> None:
+        self._started: dict[str, datetime] = {}
+        self._timings: dict[str, ResourceTiming] = {}
+
+    def observe(self, event: StackEvent) -> None:
+        """Fold one event into the per-resource timings."""
+        if event.resource_type == _STACK_RESOURCE_TYPE or event.timestamp is None:
+            return
+        started_at = self._started.setdefault(event.logical_resource_id, event.timestamp)
+        if event.resource_status.endswith(("_COMPLETE", "_FAILED")):
+            self._timings[event.logical_resource_id] = ResourceTiming(
+                logical_resource_id=event.logical_resource_id,
+                resource_type=event.resource_type,
+                final_status=event.resource_status,
+                duration_seconds=(event.timestamp - started_at).total_seconds(),
+            )
+
+    def timings(self) -> tuple[ResourceTiming, ...]:
+        """Return finished resource timings, slowest first."""
+        return tuple(sorted(self._timings.values(), key=lambda item: item.duration_seconds, reverse=True))
+
+
+def _template_arguments(artifact: StackArtifact, s3_client: Any | None) -> dict[str, str]:
+    """Return ``TemplateBody`` or, for large templates, a staged ``TemplateURL``."""
+    body = artifact.template_body.encode("utf-8")
+    if len(body) <= MAX_TEMPLATE_BODY_BYTES:
+        return {"TemplateBody": artifact.template_body}
+    if s3_client is None or not artifact.template_bucket or not artifact.template_object_key:
+        raise RuntimeError(
+            f"Template for '{artifact.stack_name}' is {len(body)} bytes, above the "
+            f"{MAX_TEMPLATE_BODY_BYTES}-byte inline limit, and no CDK bootstrap bucket is available "
+            "to stage it. Run `cdk bootstrap` or deploy with DEPLOY_ENGINE=cdk."
+        )
+    with trace_span("change_set.stage_template", bucket=artifact.template_bucket):
+        s3_client.put_object(
+            Bucket=artifact.template_bucket,
+            Key=artifact.template_object_key,
+            Body=body,
+        )
+    region = str(getattr(getattr(s3_client, "meta", None), "region_name", "") or "us-east-1")
+    return {
+        "TemplateURL": (
+            f"https://{artifact.template_bucket}.s3.{region}.amazonaws.com/{artifact.template_object_key}"
+        )
+    }
+
+
+def _format_event(event: StackEvent) -> str:
+    """Render one stack event as a progress line."""
+    timestamp = event.timestamp.strftime("%H:%M:%S") if event.timestamp is not None else "--:--:--"
+    line = f"  {timestamp} {event.resource_status:<28} {event.resource_type} {event.logical_resource_id}"
+    if event.status_reason:
+        line += f" ({event.status_reason})"
+    return line + "\n"
+
+
+def _wait_for_change_set(
+    cloudformation_client: Any,
+    change_set_id: str,
+    *,
+    deadline: float,
+    poll_interval_seconds: float,
+    monotonic: Callable[[], float],
+    sleeper: Callable[[float], None],
+) -> tuple[str, str]:
+    """Poll a change set until it is created or failed; return status and reason."""
+    while True:
+        response = cloudformation_client.describe_change_set(ChangeSetName=change_set_id)
+        status = str(response.get("Status", ""))
+        if status in {"CREATE_COMPLETE", "FAILED"}:
+            return status, str(response.get("StatusReason", "")).strip()
+        if monotonic() >= deadline:
+            raise RuntimeError(f"Timed out waiting for change set {change_set_id} (status: {status}).")
+        sleeper(poll_interval_seconds)
+
+
+def _cancel_update(cloudformation_client: Any, stack_name: str) -> None:
+    """Ask CloudFormation to stop an in-flight update (best effort)."""
+    try:
+        cloudformation_client.cancel_update_stack(StackName=stack_name)
+    except Exception as err:
+        LOGGER.warning("cancel_update_stack failed stack_name=%s error=%s", stack_name, err)
+
+
+def deploy_stack_artifact(
+    cloudformation_client: Any,
+    artifact: StackArtifact,
+    *,
+    s3_client: Any | None = None,
+    change_set_name: str | None = None,
+    timeout_seconds: float = CHANGE_SET_DEPLOY_TIMEOUT_SECONDS,
+    poll_interval_seconds: float = EVENT_POLL_INTERVAL_SECONDS,
+    monotonic: Callable[[], float] = time.monotonic,
+    sleeper: Callable[[float], None] = time.sleep,
+    out: TextIO = sys.stdout,
+) -> ChangeSetDeployResult:
+    """Deploy a synthesized stack through a CloudFormation change set.
+
+    Stack events are streamed to ``out`` as they arrive.  The first
+    ``*_FAILED`` resource event aborts the deploy: updates are cancelled so
+    CloudFormation rolls back straight away, and creates are left to roll
+    back on their own.
+
+    Args:
+        cloudformation_client: Boto3 CloudFormation client.
+        artifact: Stack loaded from the cloud assembly.
+        s3_client: Boto3 S3 client used to stage templates over the inline limit.
+        change_set_name: Change set name; defaults to a timestamped name.
+        timeout_seconds: Overall deadline.
+        poll_interval_seconds: Delay between event polls.
+        monotonic: Monotonic clock for deadlines.
+        sleeper: Sleep function.
+        out: Output stream for event lines.
+
+    Returns:
+        Deploy outcome including per-resource timings.
+
+    Raises:
+        RuntimeError: If the change set or the stack operation fails.
+    """
+    stack_name = artifact.stack_name
+    started_at = monotonic()
+    deadline = started_at + timeout_seconds
+
+    stack_status = describe_stack_status(cloudformation_client, stack_name)
+    if stack_status == "ROLLBACK_COMPLETE":
+        # Reason: a stack whose first create rolled back cannot be updated.
+        out.write(f"{stack_name} is in ROLLBACK_COMPLETE; deleting it before redeploying.\n")
+        with trace_span("change_set.delete_failed_stack", stack_name=stack_name):
+            cloudformation_client.delete_stack(StackName=stack_name)
+            cloudformation_client.get_waiter("stack_delete_complete").wait(StackName=stack_name)
+        stack_status = None
+    elif stack_status and stack_status.endswith("_IN_PROGRESS") and stack_status != "REVIEW_IN_PROGRESS":
+        raise RuntimeError(
+            f"Stack '{stack_name}' is busy ({stack_status}). Wait for it to settle and rerun the deploy."
+        )
+    change_set_type = "CREATE" if stack_status in {None, "REVIEW_IN_PROGRESS"} else "UPDATE"
+
+    request: dict[str, Any] = {
+        "StackName": stack_name,
+        "ChangeSetName": change_set_name or f"env4ai-{int(time.time())}",
+        "ChangeSetType": change_set_type,
+        "Capabilities": list(CDK_CAPABILITIES),
+        **_template_arguments(artifact, s3_client),
+    }
+    if artifact.execution_role_arn:
+        request["RoleARN"] = artifact.execution_role_arn
+    with trace_span("change_set.create", stack_name=stack_name, change_set_type=change_set_type):
+        change_set_id = str(cloudformation_client.create_change_set(**request)["Id"])
+        status, reason = _wait_for_change_set(
+            cloudformation_client,
+            change_set_id,
+            deadline=deadline,
+            poll_interval_seconds=poll_interval_seconds,
+            monotonic=monotonic,
+            sleeper=sleeper,
+        )
+    if status == "FAILED":
+        if any(marker in reason for marker in _NO_CHANGE_REASONS):
+            cloudformation_client.delete_change_set(ChangeSetName=change_set_id)
+            return ChangeSetDeployResult(
+                stack_name=stack_name,
+                change_set_type=change_set_type,
+                changed=False,
+                stack_status=stack_status or "",
+                resource_timings=(),
+                elapsed_seconds=monotonic() - started_at,
+            )
+        raise RuntimeError(f"Change set for '{stack_name}' failed: {reason or 'no reason given'}.")
+
+    tail = StackEventTail(cloudformation_client, stack_name)
+    tail.prime()
+    timer = _ResourceTimer()
+    cleanup_phase = False
+    with trace_span("change_set.execute", stack_name=stack_name, change_set_type=change_set_type):
+        cloudformation_client.execute_change_set(ChangeSetName=change_set_id)
+        out.write(f"Executing {change_set_type.lower()} change set for {stack_name}:\n")
+        while True:
+            for event in tail.poll():
+                out.write(_format_event(event))
+                timer.observe(event)
+                status = event.resource_status
+                if event.resource_type == _STACK_RESOURCE_TYPE and event.logical_resource_id == stack_name:
+                    if status in _SUCCESS_STACK_STATUSES:
+                        return ChangeSetDeployResult(
+                            stack_name=stack_name,
+                            change_set_type=change_set_type,
+                            changed=True,
+                            stack_status=status,
+                            resource_timings=timer.timings(),
+                            elapsed_seconds=monotonic() - started_at,
+                        )
+                    if status == "UPDATE_COMPLETE_CLEANUP_IN_PROGRESS":
+                        cleanup_phase = True
+                    elif "ROLLBACK" in status or status.endswith("_FAILED"):
+                        raise RuntimeError(
+                            f"Deploy of '{stack_name}' failed with stack status {status}"
+                            f"{f': {event.status_reason}' if event.status_reason else ''}."
+                        )
+                    continue
+                if not status.endswith("_FAILED"):
+                    continue
+                if cleanup_phase and status == "DELETE_FAILED":
+                    # Reason: cleanup failures leave the update itself complete.
+                    continue
+                if change_set_type == "UPDATE":
+                    _cancel_update(cloudformation_client, stack_name)
+                raise RuntimeError(
+                    f"Deploy of '{stack_name}' failed: {event.logical_resource_id} "
+                    f"({event.resource_type}) {status}: {event.status_reason or 'no reason given'}. "
+                    "CloudFormation is rolling the stack back; check the stack events before redeploying."
+                )
+            if monotonic() >= deadline:
+                raise RuntimeError(
+                    f"Timed out after {timeout_seconds:.0f} seconds waiting for '{stack_name}' to deploy. "
+                    "Check CloudFormation events and rerun when the stack is stable."
+                )
+            sleeper(poll_interval_seconds)
+
+
+def format_resource_timings(result: ChangeSetDeployResult, limit: int = 5) -> str:
+    """Render the slowest resources of a deploy as a short report."""
+    if not result.resource_timings:
+        return ""
+    lines = [f"Slowest resources for {result.stack_name}:"]
+    for timing in result.resource_timings[:limit]:
+        lines.append(
+            f"  {timing.logical_resource_id} ({timing.resource_type}): "
+            f"{timing.duration_seconds:.0f}s {timing.final_status}"
+        )
+    return "\n".join(lines) + "\n"
@@ -56,6 +56,28 @@ def get_shared_network_export_name(output_name: str) -> str:
     return f"{_SHARED_NETWORK_CONFIG.stack_name}:{normalized_output_name}"
 
 
+def get_package_cache_bucket_name(account: str, region: str) -> str:
+    """Return the shared package cache bucket name for an account and region.
+
+    The name is derived rather than imported so it stays a concrete string
+    inside the rendered bootstrap user data.
+    """
+    normalized_account = account.strip()
+    normalized_region = region.strip()
+    if not normalized_account or not normalized_region:
+        raise ValueError("account and region must be non-empty.")
+    return f"env4ai-package-cache-{normalized_account}-{normalized_region}"
+
+
+def get_container_cache_registry(account: str, region: str) -> str:
+    """Return the ECR registry host that serves the shared container pull-through cache."""
+    normalized_account = account.strip()
+    normalized_region = region.strip()
+    if not normalized_account or not normalized_region:
+        raise ValueError("account and region must be non-empty.")
+    return f"{normalized_account}.dkr.ecr.{normalized_region}.amazonaws.com"
+
+
 def validate_config(config: CoreConfig) -> None:
     """Validate a ``CoreConfig`` for required non-empty fields.
 
@@ -0,0 +1,94 @@
+"""Map container images onto the shared ECR pull-through cache."""
+
+from __future__ import annotations
+
+from typing import Sequence
+
+from botocore.client import BaseClient
+
+CONTAINER_CACHE_CREDENTIAL_SECRET = "ecr-pullthroughcache/docker-hub"
+# Reason: ECR names pull-through repositories ``<prefix>/<upstream path>``; these
+# prefixes are the ones the shared network stack creates rules for.
+CONTAINER_CACHE_UPSTREAMS: dict[str, str] = {
+    "docker-hub": "registry-1.docker.io",
+    "ecr-public": "public.ecr.aws",
+}
+_REGISTRY_PREFIXES = {
+    "docker.io": "docker-hub",
+    "index.docker.io": "docker-hub",
+    "registry-1.docker.io": "docker-hub",
+    "public.ecr.aws": "ecr-public",
+}
+
+
+def container_cache_reference(image: str, registry: str) -> str | None:
+    """Return the pull-through cache reference for an image.
+
+    Tags are kept in preference to digests because the cache creates its
+    repository on the first pull by tag; the cached manifest keeps the
+    upstream digest either way.
+
+    Args:
+        image: Image reference as written for ``docker pull``.
+        registry: ECR registry host of the pull-through cache.
+
+    Returns:
+        Cache reference, or ``None`` when the image's registry is not cached.
+    """
+    name, _, digest = image.strip().partition("@")
+    first, slash, rest = name.partition("/")
+    if slash and ("." in first or ":" in first or first == "localhost"):
+        upstream, path = first, rest
+    else:
+        upstream, path = "docker.io", name
+    prefix = _REGISTRY_PREFIXES.get(upstream)
+    if prefix is None or not path:
+        return None
+    if prefix == "docker-hub" and "/" not in path:
+        path = f"library/{path}"
+    repository, tag = path, ""
+    if ":" in path.rsplit("/", 1)[-1]:
+        repository, tag = path.rsplit(":", 1)
+    if tag:
+        return f"{registry}/{prefix}/{repository}:{tag}"
+    if digest:
+        return f"{registry}/{prefix}/{repository}@{digest}"
+    return f"{registry}/{prefix}/{repository}:latest"
+
+
+def container_pull_references(images: Sequence[str], registry: str | None) -> tuple[str, ...]:
+    """Return the ``container-images`` lines ``docker.sh`` pulls for an environment.
+
+    A cached image's line is ``<cache reference> <declared image>``: after the
+    pull ``docker.sh`` tags the cached image with the declared name, so
+    compose files that use it start from the local image.
+
+    Args:
+        images: Declared container images.
+        registry: Pull-through cache registry host, or ``None`` without the cache.
+
+    Returns:
+        Pull lines in declared order; uncached images are pulled as declared.
+    """
+    lines: list[str] = []
+    for image in images:
+        image = image.strip()
+        cache_reference = None if registry is None else container_cache_reference(image, registry)
+        lines.append(image if cache_reference is None else f"{cache_reference} {image}")
+    return tuple(lines)
+
+
+def resolve_container_cache_credential_arn(secretsmanager_client: BaseClient) -> str:
+    """Return the ARN of the Docker Hub credentials the pull-through cache uses.
+
+    Raises:
+        RuntimeError: If the secret is missing or cannot be read.
+    """
+    try:
+        response = secretsmanager_client.describe_secret(SecretId=CONTAINER_CACHE_CREDENTIAL_SECRET)
+    except Exception as err:
+        raise RuntimeError(
+            f"CONTAINER_CACHE needs Docker Hub credentials in the Secrets Manager secret "
+            f"'{CONTAINER_CACHE_CREDENTIAL_SECRET}' (JSON with 'username' and 'accessToken'): {err}"
+        ) from err
+    return str(response["ARN"])
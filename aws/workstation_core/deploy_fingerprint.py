@@ -0,0 +1,218 @@
+"""Template fingerprints used to skip ``cdk deploy`` for unchanged stacks."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+import hashlib
+import json
+import logging
+from pathlib import Path
+from typing import Any, Mapping
+
+LOGGER = logging.getLogger(__name__)
+DEFAULT_FINGERPRINT_DIR = Path.home() / ".config" / "env4ai" / "fingerprints"
+# Reason: only settled, non-rollback states hold the template we last deployed.
+SETTLED_STACK_STATUSES: frozenset[str] = frozenset(
+    {"CREATE_COMPLETE", "UPDATE_COMPLETE", "IMPORT_COMPLETE"}
+)
+
+
+@dataclass(frozen=True, slots=True)
+class StackDeployDecision:
+    """Whether one stack needs a deploy, and why.
+
+    Args:
+        stack_name: CloudFormation stack name.
+        should_deploy: ``False`` when the stack can be skipped.
+        reason: User-facing explanation for the decision.
+        fingerprint: Fingerprint of the synthesized template, when computed.
+    """
+
+    stack_name: str
+    should_deploy: bool
+    reason: str
+    fingerprint: str | None = None
+
+
+def compute_template_fingerprint(
+    template: Mapping[str, Any],
+    parameters: Mapping[str, str] | None = None,
+) -> str:
+    """Return a stable SHA-256 fingerprint for a template and its parameters.
+
+    Args:
+        template: Parsed CloudFormation template.
+        parameters: CloudFormation parameter values passed with the deploy.
+
+    Returns:
+        Hex digest of the canonical JSON rendering.
+    """
+    canonical = json.dumps(
+        {"template": template, "parameters": dict(parameters or {})},
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def load_synthesized_template(assembly_dir: str | Path, stack_name: str) -> dict[str, Any]:
+    """Load ``<stack_name>.template.json`` from a synthesized cloud assembly.
+
+    Raises:
+        RuntimeError: If the template file is missing or not valid JSON.
+    """
+    template_path = Path(assembly_dir) / f"{stack_name}.template.json"
+    try:
+        return json.loads(template_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as err:
+        raise RuntimeError(
+            f"Unable to read synthesized template for '{stack_name}' at {template_path}. "
+            "Re-run the deploy so the CDK app is synthesized again."
+        ) from err
+
+
+def _fingerprint_path(fingerprint_dir: Path, region: str, stack_name: str) -> Path:
+    """Return the local fingerprint record path for one stack."""
+    return fingerprint_dir / region / f"{stack_name}.json"
+
+
+def read_local_fingerprint(fingerprint_dir: Path, region: str, stack_name: str) -> str | None:
+    """Return the locally recorded fingerprint for a stack, if any."""
+    try:
+        record = json.loads(
+            _fingerprint_path(fingerprint_dir, region, stack_name).read_text(encoding="utf-8")
+        )
+    except (OSError, ValueError):
+        return None
+    value = record.get("fingerprint") if isinstance(record, dict) else None
+    return str(value) if value else None
+
+
+def record_local_fingerprint(
+    fingerprint_dir: Path,
+    region: str,
+    stack_name: str,
+    fingerprint: str,
+) -> None:
+    """Persist a stack fingerprint after a successful deploy (best effort)."""
+    path = _fingerprint_path(fingerprint_dir, region, stack_name)
+    record = {
+        "stack_name": stack_name,
+        "fingerprint": fingerprint,
+        "recorded_at": datetime.now(timezone.utc).isoformat(),
+    }
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(record, indent=2) + "\n", encoding="utf-8")
+    except OSError:
+        LOGGER.warning("Unable to record stack fingerprint path=%s", path, exc_info=True)
+
+
+def describe_stack_status(cloudformation_client: Any, stack_name: str) -> str | None:
+    """Return the stack status, or ``None`` when the stack does not exist."""
+    try:
+        response = cloudformation_client.describe_stacks(StackName=stack_name)
+    except Exception as err:
+        if "does not exist" in str(err):
+            return None
+        raise
+    stacks = response.get("Stacks", [])
+    if not stacks:
+        return None
+    return str(stacks[0].get("StackStatus", "")).strip() or None
+
+
+def _deployed_template_fingerprint(
+    cloudformation_client: Any,
+    stack_name: str,
+    parameters: Mapping[str, str] | None,
+) -> str | None:
+    """Fingerprint the deployed template, or ``None`` when it cannot be read."""
+    try:
+        response = cloudformation_client.get_template(StackName=stack_name, TemplateStage="Original")
+    except Exception as err:
+        LOGGER.debug("get_template failed stack_name=%s error=%s", stack_name, err)
+        return None
+    body = response.get("TemplateBody")
+    if isinstance(body, str):
+        try:
+            body = json.loads(body)
+        except ValueError:
+            return None
+    if not isinstance(body, dict):
+        return None
+    return compute_template_fingerprint(body, parameters)
+
+
+def decide_stack_deploy(
+    cloudformation_client: Any,
+    *,
+    stack_name: str,
+    template: Mapping[str, Any],
+    parameters: Mapping[str, str] | None = None,
+    force: bool = False,
+    fingerprint_dir: Path = DEFAULT_FINGERPRINT_DIR,
+) -> StackDeployDecision:
+    """Decide whether a synthesized stack differs from what is deployed.
+
+    The deployed template (``get_template``) is authoritative.  When it cannot
+    be read, the fingerprint recorded locally after the last successful deploy
+    is used instead.
+
+    Args:
+        cloudformation_client: Boto3 CloudFormation client.
+        stack_name: CloudFormation stack name.
+        template: Synthesized template for the stack.
+        parameters: CloudFormation parameter values passed with the deploy.
+        force: Deploy even when the fingerprints match.
+        fingerprint_dir: Root directory for locally recorded fingerprints.
+
+    Returns:
+        Deploy decision with a user-facing reason.
+    """
+    fingerprint = compute_template_fingerprint(template, parameters)
+    if force:
+        return StackDeployDecision(stack_name, True, "forced deploy requested", fingerprint)
+
+    stack_status = describe_stack_status(cloudformation_client, stack_name)
+    if stack_status is None:
+        return StackDeployDecision(stack_name, True, "stack does not exist yet", fingerprint)
+    if stack_status not in SETTLED_STACK_STATUSES:
+        return StackDeployDecision(
+            stack_name,
+            True,
+            f"stack status is {stack_status}",
+            fingerprint,
+        )
+
+    deployed_fingerprint = _deployed_template_fingerprint(cloudformation_client, stack_name, parameters)
+    if deployed_fingerprint is not None:
+        if deployed_fingerprint == fingerprint:
+            return StackDeployDecision(
+                stack_name,
+                False,
+                "synthesized template matches the deployed template",
+                fingerprint,
+            )
+        return StackDeployDecision(stack_name, True, "template changed", fingerprint)
+
+    region = str(getattr(getattr(cloudformation_client, "meta", None), "region_name", "") or "default")
+    if read_local_fingerprint(fingerprint_dir, region, stack_name) == fingerprint:
+        return StackDeployDecision(
+            stack_name,
+            False,
+            "synthesized template matches the last recorded deploy",
+            fingerprint,
+        )
+    return StackDeployDecision(stack_name, True, "no matching fingerprint on record", fingerprint)
+
+
+def format_deploy_report(decisions: list[StackDeployDecision]) -> str:
+    """Render deploy decisions as a short per-stack report."""
+    lines = ["Stack deploy report:"]
+    for decision in decisions:
+        action = "deployed" if decision.should_deploy else "skipped"
+        lines.append(f"  {decision.stack_name}: {action} ({decision.reason})")
+    return "\n".join(lines) + "\n"
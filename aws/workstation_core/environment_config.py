@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 import ipaddress
-from typing import Mapping
+from typing import Mapping, Sequence
 
 from workstation_core.config import get_shared_network_config
 
@@ -24,6 +24,21 @@ class AmiSelectorConfig:
     filters: Mapping[str, tuple[str, ...]]
 
 
+@dataclass(frozen=True, slots=True)
+class InstanceTypeOption:
+    """Fallback instance type the Spot Fleet may launch for an environment.
+
+    Args:
+        instance_type: EC2 instance type.
+        weight: Spot Fleet weighted capacity relative to the primary
+            ``instance_type`` (weight 1).  ``spot_price`` is a per-unit price,
+            so a type with weight 2 may cost up to twice ``spot_price``.
+    """
+
+    instance_type: str
+    weight: float = 1.0
+
+
 @dataclass(frozen=True, slots=True)
 class EnvironmentSpec:
     """Canonical workstation spec for one environment.
@@ -37,6 +52,19 @@ class EnvironmentSpec:
         instance_type: EC2 instance type for Spot launch.
         volume_size: Root EBS volume size in GiB.
         spot_price: Spot max price as a string (for example ``"0.1"``).
+        fallback_instance_types: Ordered alternative instance types the
+            fleet may launch when the primary type has no capacity.
+        availability_zone_count: Number of Availability Zones the workstation
+            subnet spans; ``subnet_cidr`` is split evenly across them.
+        bootstrap_dependencies: Optional map of bootstrap script -> scripts it
+            needs.  When set, user data runs the scripts as a dependency graph
+            in parallel; scripts without an entry wait for every earlier
+            script.  When unset, the scripts run in order as one script.
+        bootstrap_parallelism: Maximum scripts run at once by the dependency
+            graph runner.
+        container_images: Container images ``docker.sh`` pulls during
+            bootstrap, through the container cache when it is enabled, so
+            they are local on first start and in every saved AMI.
     """
 
     environment_key: str
@@ -49,6 +77,11 @@ class EnvironmentSpec:
     spot_price: str
     default_access_mode: str = "ssh"
     allowed_ssh_cidr: str | None = None
+    fallback_instance_types: tuple[InstanceTypeOption, ...] = ()
+    availability_zone_count: int = 1
+    bootstrap_dependencies: Mapping[str, tuple[str, ...]] | None = None
+    bootstrap_parallelism: int = 4
+    container_images: tuple[str, ...] = ()
 
     @property
     def stack_name(self) -> str:
@@ -81,6 +114,21 @@ class EnvironmentSpec:
         """
         return f"{self.display_name}{suffix}"
 
+    @property
+    def subnet_cidrs(self) -> tuple[str, ...]:
+        """Return one subnet CIDR per Availability Zone, split from ``subnet_cidr``."""
+        if self.availability_zone_count <= 1:
+            return (self.subnet_cidr,)
+        network = ipaddress.IPv4Network(self.subnet_cidr, strict=True)
+        prefixlen_diff = (self.availability_zone_count - 1).bit_length()
+        subnets = network.subnets(prefixlen_diff=prefixlen_diff)
+        return tuple(str(subnet) for _, subnet in zip(range(self.availability_zone_count), subnets))
+
+    @property
+    def instance_type_options(self) -> tuple[InstanceTypeOption, ...]:
+        """Return the primary instance type followed by the fallbacks, in order."""
+        return (InstanceTypeOption(self.instance_type), *self.fallback_instance_types)
+
     @property
     def resolved_allowed_ssh_cidr(self) -> str | None:
         """Return the normalized SSH ingress CIDR when one is configured."""
@@ -116,6 +164,47 @@ def _normalize_allowed_ssh_cidr(value: str | None) -> str | None:
         ) from exc
 
 
+def resolve_bootstrap_dependencies(
+    bootstrap_files: Sequence[str],
+    dependencies: Mapping[str, Sequence[str]],
+) -> dict[str, tuple[str, ...]]:
+    """Return the full dependency graph for ordered bootstrap scripts.
+
+    Scripts listed in ``dependencies`` need only the scripts named there;
+    every other script needs all scripts before it, as in a sequential run.
+
+    Args:
+        bootstrap_files: Ordered init script filenames.
+        dependencies: Declared script -> required scripts map.
+
+    Returns:
+        Map of every script to the scripts it needs, in ``bootstrap_files`` order.
+
+    Raises:
+        ValueError: If a script or dependency is not in ``bootstrap_files``, or
+            a dependency does not come earlier than the script needing it.
+    """
+    positions = {filename: index for index, filename in enumerate(bootstrap_files)}
+    for filename, needs in dependencies.items():
+        if filename not in positions:
+            raise ValueError(f"EnvironmentSpec.bootstrap_dependencies names unknown script '{filename}'.")
+        for dependency in needs:
+            if dependency not in positions:
+                raise ValueError(
+                    f"EnvironmentSpec.bootstrap_dependencies: '{filename}' needs unknown script '{dependency}'."
+                )
+            # Reason: requiring earlier scripts keeps the graph acyclic and bootstrap_files a valid order.
+            if positions[dependency] >= positions[filename]:
+                raise ValueError(
+                    f"EnvironmentSpec.bootstrap_dependencies: '{filename}' needs '{dependency}', "
+                    "which must come earlier in bootstrap_files."
+                )
+    return {
+        filename: tuple(dependencies[filename]) if filename in dependencies else tuple(bootstrap_files[:index])
+        for index, filename in enumerate(bootstrap_files)
+    }
+
+
 def validate_environment_spec(spec: EnvironmentSpec) -> None:
     """Validate required fields and constraints for an environment spec.
 
@@ -131,8 +220,29 @@ def validate_environment_spec(spec: EnvironmentSpec) -> None:
         raise ValueError("EnvironmentSpec.display_name must be non-empty.")
     if not spec.bootstrap_files:
         raise ValueError("EnvironmentSpec.bootstrap_files must contain at least one file.")
+    if len(set(spec.bootstrap_files)) != len(spec.bootstrap_files):
+        raise ValueError("EnvironmentSpec.bootstrap_files must not list a script more than once.")
+    if spec.bootstrap_dependencies:
+        resolve_bootstrap_dependencies(spec.bootstrap_files, spec.bootstrap_dependencies)
+    if spec.bootstrap_parallelism < 1:
+        raise ValueError("EnvironmentSpec.bootstrap_parallelism must be at least 1.")
+    for image in spec.container_images:
+        if not image.strip() or any(character.isspace() for character in image):
+            raise ValueError("EnvironmentSpec.container_images entries must be image references without spaces.")
+    if spec.container_images and "docker.sh" not in spec.bootstrap_files:
+        raise ValueError("EnvironmentSpec.container_images needs docker.sh in bootstrap_files to pull them.")
     if not spec.instance_type.strip():
         raise ValueError("EnvironmentSpec.instance_type must be non-empty.")
+    seen_instance_types: set[str] = set()
+    for option in spec.instance_type_options:
+        if not option.instance_type.strip():
+            raise ValueError("EnvironmentSpec.fallback_instance_types entries must name an instance type.")
+        if option.instance_type in seen_instance_types:
+            raise ValueError(f"EnvironmentSpec lists instance type '{option.instance_type}' more than once.")
+        seen_instance_types.add(option.instance_type)
+        # Reason: the fleet targets one capacity unit, so a weight below 1 would launch several instances.
+        if option.weight < 1:
+            raise ValueError("EnvironmentSpec.fallback_instance_types weights must be at least 1.")
     if not spec.subnet_cidr.strip():
         raise ValueError("EnvironmentSpec.subnet_cidr must be non-empty.")
     if spec.volume_size <= 0:
@@ -156,6 +266,16 @@ def validate_environment_spec(spec: EnvironmentSpec) -> None:
     except ValueError as exc:
         raise ValueError("EnvironmentSpec.subnet_cidr must be a valid IPv4 CIDR block.") from exc
 
+    if spec.availability_zone_count < 1:
+        raise ValueError("EnvironmentSpec.availability_zone_count must be at least 1.")
+    split_prefixlen = subnet_network.prefixlen + (spec.availability_zone_count - 1).bit_length()
+    # Reason: AWS rejects subnets smaller than /28.
+    if split_prefixlen > 28:
+        raise ValueError(
+            f"EnvironmentSpec.subnet_cidr {subnet_network.with_prefixlen} is too small to split across "
+            f"{spec.availability_zone_count} Availability Zones; each subnet must be /28 or larger."
+        )
+
     shared_network = ipaddress.IPv4Network(get_shared_network_config().vpc_cidr, strict=True)
     if not subnet_network.subnet_of(shared_network):
         raise ValueError(
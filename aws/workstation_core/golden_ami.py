@@ -0,0 +1,736 @@
+"""Golden AMIs: pre-bootstrapped images built as layers keyed by a hash chain of init scripts.
+
+Layer ``n`` of an environment is the base AMI with its first ``n`` bootstrap
+scripts applied on a root volume of the environment's size, tagged with the
+hash chain of the base AMI id, the volume size and those scripts.  Layers are
+content-addressed rather than environment-scoped, so any environment with the
+same volume size whose scripts start with the same prefix reuses them.
+"""
+
+from __future__ import annotations
+
+import base64
+from dataclasses import dataclass
+from datetime import datetime, timezone
+import hashlib
+import json
+import logging
+from pathlib import Path
+import sys
+import time
+from typing import Any, Callable, Sequence, TextIO
+
+from workstation_core.ami_lifecycle import wait_for_image_available
+from workstation_core.pending_ami import wait_for_image_snapshots
+
+LOGGER = logging.getLogger(__name__)
+GOLDEN_HASH_TAG = "env4ai:golden-hash"
+GOLDEN_ENVIRONMENT_TAG = "env4ai:environment"
+GOLDEN_BASE_AMI_TAG = "env4ai:base-ami"
+GOLDEN_LAYER_SCRIPT_TAG = "env4ai:layer-script"
+GOLDEN_LAYER_DEPTH_TAG = "env4ai:layer-depth"
+GOLDEN_BUILD_TIMEOUT_SECONDS = 60 * 60
+GOLDEN_BUILD_POLL_SECONDS = 15.0
+# Reason: EC2 rejects user data above 16 KiB before base64 encoding.
+MAX_USER_DATA_BYTES = 16 * 1024
+_BUILD_LAYER_MARKER = "env4ai-golden-layer:"
+_BUILD_INSTANCE_STATES = ("pending", "running", "stopping", "stopped")
+_BUILD_SCRIPT_DELIMITER = "ENV4AI_GOLDEN_LAYER_EOF"
+_BUILD_STATE_DIR = "/var/lib/env4ai/golden-build"
+_BUILD_RUNNER_PATH = "/var/lib/cloud/scripts/per-boot/env4ai-golden-layer.sh"
+# Reason: runs on every boot; each boot applies one queued layer script and powers off.
+# Scripts run in strict mode so a failed step fails the layer, and a failed layer
+# clears the queue so a later boot never builds on top of it.
+_BUILD_RUNNER = f"""#!/bin/bash
+state_dir="{_BUILD_STATE_DIR}/$(cat /var/lib/cloud/data/instance-id 2>/dev/null)"
+next="$(ls "$state_dir/queue" 2>/dev/null | sort | head -n 1)"
+if [ -z "$next" ]; then
+  rm -rf {_BUILD_STATE_DIR} {_BUILD_RUNNER_PATH}
+  exit 0
+fi
+export DEBIAN_FRONTEND=noninteractive APT_LISTCHANGES_FRONTEND=none NEEDRESTART_MODE=a
+bash -euo pipefail "$state_dir/queue/$next"
+status=$?
+rm -f "$state_dir/queue/$next"
+if [ "$status" -ne 0 ] || [ -z "$(ls "$state_dir/queue")" ]; then
+  rm -rf {_BUILD_STATE_DIR} {_BUILD_RUNNER_PATH}
+fi
+sync
+echo "{_BUILD_LAYER_MARKER} $next exit=$status" | tee /dev/console
+shutdown -h now
+"""
+
+
+@dataclass(frozen=True, slots=True)
+class GoldenImageStatus:
+    """Golden AMI state for an environment's current base AMI and scripts.
+
+    Args:
+        golden_hash: Hash chain of the base AMI id, volume size and ordered scripts.
+        base_ami_id: Base AMI resolved from ``default_ami_selector``.
+        image_id: Golden AMI id, when one exists for ``golden_hash``.
+        image_state: EC2 state of ``image_id`` (for example ``pending``).
+        build_instance_id: Builder instance still running for ``golden_hash``.
+        build_started_at: Launch time of ``build_instance_id``.
+        cached_layers: Leading scripts already available as a cached layer.
+        total_layers: Number of bootstrap scripts (one layer each).
+    """
+
+    golden_hash: str
+    base_ami_id: str
+    image_id: str | None = None
+    image_state: str | None = None
+    build_instance_id: str | None = None
+    build_started_at: datetime | None = None
+    cached_layers: int = 0
+    total_layers: int = 0
+
+    @property
+    def is_available(self) -> bool:
+        """Whether deploys can use the golden AMI right now."""
+        return self.image_id is not None and self.image_state == "available"
+
+    def describe(self, *, now: datetime | None = None) -> str:
+        """Render the status as one user-facing line."""
+        short_hash = self.golden_hash[:12]
+        if self.image_id is not None:
+            return f"Golden AMI: {self.image_state} ({self.image_id}, hash {short_hash})"
+        if self.build_instance_id is not None:
+            elapsed = ""
+            if self.build_started_at is not None:
+                current = now or datetime.now(timezone.utc)
+                elapsed = f", {(current - self.build_started_at).total_seconds() / 60:.0f}m elapsed"
+            return f"Golden AMI: building on {self.build_instance_id}{elapsed} (hash {short_hash})"
+        return (
+            f"Golden AMI: not built for the current scripts "
+            f"({self.cached_layers}/{self.total_layers} layers cached, hash {short_hash})"
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class GoldenImageChoice:
+    """Deploy-time decision about using a golden AMI.
+
+    Args:
+        image_id: Golden AMI to deploy, or ``None`` to bootstrap in user data.
+        reason: User-facing explanation for the decision.
+    """
+
+    image_id: str | None
+    reason: str
+
+
+def resolve_bootstrap_scripts(stack_dir: str | Path, bootstrap_files: Sequence[str]) -> tuple[tuple[str, bytes], ...]:
+    """Read init scripts using the synth's environment-local then ``common/init`` lookup.
+
+    Raises:
+        RuntimeError: If a script exists in neither location.
+    """
+    environment_dir = Path(stack_dir).resolve()
+    scripts: list[tuple[str, bytes]] = []
+    for filename in bootstrap_files:
+        local_path = environment_dir / "init" / filename
+        shared_path = environment_dir.parent / "common" / "init" / filename
+        path = local_path if local_path.is_file() else shared_path
+        try:
+            scripts.append((filename, path.read_bytes()))
+        except OSError as err:
+            raise RuntimeError(
+                f"Bootstrap script '{filename}' was not found. Searched: {local_path}, {shared_path}"
+            ) from err
+    return tuple(scripts)
+
+
+def compute_layer_hashes(
+    base_ami_id: str,
+    scripts: Sequence[tuple[str, bytes]],
+    *,
+    volume_size: int,
+) -> tuple[str, ...]:
+    """Return the hash chain of a base AMI id, root volume size and ordered init scripts.
+
+    Entry ``0`` hashes the base AMI id and volume size, and entry ``n``
+    extends entry ``n - 1`` with the name and content of script ``n``, so a
+    layer hash changes when the base AMI, the volume size, or any earlier
+    script's name, content, or order changes.
+    """
+    # Reason: a layer's snapshot fixes its root volume size; launches cannot shrink it.
+    digests = [hashlib.sha256(f"base:{base_ami_id}:volume:{volume_size}".encode("utf-8")).hexdigest()]
+    for filename, content in scripts:
+        script_digest = hashlib.sha256(content).hexdigest()
+        digests.append(hashlib.sha256(f"{digests[-1]}:{filename}:{script_digest}".encode("utf-8")).hexdigest())
+    return tuple(digests)
+
+
+def compute_golden_image_hash(base_ami_id: str, scripts: Sequence[tuple[str, bytes]], *, volume_size: int) -> str:
+    """Return the hash of the top layer, which keys the environment's golden AMI."""
+    return compute_layer_hashes(base_ami_id, scripts, volume_size=volume_size)[-1]
+
+
+def golden_image_name(environment_key: str, golden_hash: str) -> str:
+    """Return the AMI name for a golden image (``<environment>_golden-<hash>``)."""
+    return f"{environment_key}_golden-{golden_hash[:12]}"
+
+
+def layer_image_name(depth: int, layer_hash: str) -> str:
+    """Return the AMI name for an intermediate layer (``env4ai-layer-<depth>-<hash>``)."""
+    return f"env4ai-layer-{depth:02d}-{layer_hash[:12]}"
+
+
+def resolve_base_ami_id(ec2_client: Any, selector: Any) -> str:
+    """Return the newest available AMI matching an environment's ``default_ami_selector``.
+
+    Raises:
+        RuntimeError: If the lookup fails or matches no image.
+    """
+    filters = [
+        {"Name": "name", "Values": [str(selector.name)]},
+        {"Name": "state", "Values": ["available"]},
+        *({"Name": str(key), "Values": list(values)} for key, values in selector.filters.items()),
+    ]
+    try:
+        response = ec2_client.describe_images(Owners=[str(selector.owner)], Filters=filters)
+    except Exception as err:
+        raise RuntimeError(f"Failed to look up the base AMI '{selector.name}'.") from err
+    images = response.get("Images", [])
+    if not images:
+        raise RuntimeError(f"No available AMI matches '{selector.name}' for owner {selector.owner}.")
+    newest = max(images, key=lambda image: str(image.get("CreationDate", "")))
+    return str(newest["ImageId"])
+
+
+def find_golden_image(ec2_client: Any, golden_hash: str) -> tuple[str, str] | None:
+    """Return ``(image_id, state)`` of the owned image tagged with ``golden_hash``."""
+    response = ec2_client.describe_images(
+        Owners=["self"],
+        Filters=[{"Name": f"tag:{GOLDEN_HASH_TAG}", "Values": [golden_hash]}],
+    )
+    images = [image for image in response.get("Images", []) if str(image.get("State", "")) not in {"failed", "error"}]
+    if not images:
+        return None
+    newest = max(images, key=lambda image: str(image.get("CreationDate", "")))
+    return str(newest["ImageId"]), str(newest.get("State", ""))
+
+
+def find_cached_layer(ec2_client: Any, layer_hashes: Sequence[str]) -> tuple[int, str] | None:
+    """Return ``(depth, image_id)`` of the deepest available layer in ``layer_hashes``.
+
+    Args:
+        ec2_client: Boto3 EC2 client.
+        layer_hashes: Output of ``compute_layer_hashes``; entry ``0`` (the
+            base AMI itself) is never cached.
+    """
+    if len(layer_hashes) < 2:
+        return None
+    response = ec2_client.describe_images(
+        Owners=["self"],
+        Filters=[
+            {"Name": f"tag:{GOLDEN_HASH_TAG}", "Values": list(layer_hashes[1:])},
+            {"Name": "state", "Values": ["available"]},
+        ],
+    )
+    depth_by_hash = {layer_hash: depth for depth, layer_hash in enumerate(layer_hashes) if depth > 0}
+    cached: tuple[int, str] | None = None
+    for image in response.get("Images", []):
+        for tag in image.get("Tags", []):
+            depth = depth_by_hash.get(str(tag.get("Value", ""))) if tag.get("Key") == GOLDEN_HASH_TAG else None
+            if depth is not None and (cached is None or depth > cached[0]):
+                cached = (depth, str(image["ImageId"]))
+    return cached
+
+
+def find_golden_build(ec2_client: Any, golden_hash: str) -> tuple[str, datetime | None] | None:
+    """Return ``(instance_id, launch_time)`` of a builder instance for ``golden_hash``."""
+    response = ec2_client.describe_instances(
+        Filters=[
+            {"Name": f"tag:{GOLDEN_HASH_TAG}", "Values": [golden_hash]},
+            {"Name": "instance-state-name", "Values": list(_BUILD_INSTANCE_STATES)},
+        ]
+    )
+    for reservation in response.get("Reservations", []):
+        for instance in reservation.get("Instances", []):
+            launch_time = instance.get("LaunchTime")
+            return str(instance["InstanceId"]), launch_time if isinstance(launch_time, datetime) else None
+    return None
+
+
+def resolve_golden_image_status(
+    ec2_client: Any,
+    *,
+    stack_dir: str | Path,
+    environment_spec: Any,
+) -> GoldenImageStatus:
+    """Hash the environment's current base AMI, volume size and scripts and look up its golden AMI.
+
+    Raises:
+        RuntimeError: If the base AMI or scripts cannot be resolved.
+    """
+    base_ami_id = resolve_base_ami_id(ec2_client, environment_spec.default_ami_selector)
+    scripts = resolve_bootstrap_scripts(stack_dir, tuple(environment_spec.bootstrap_files))
+    layer_hashes = compute_layer_hashes(base_ami_id, scripts, volume_size=int(environment_spec.volume_size))
+    golden_hash = layer_hashes[-1]
+    image = find_golden_image(ec2_client, golden_hash)
+    if image is not None:
+        return GoldenImageStatus(
+            golden_hash,
+            base_ami_id,
+            image_id=image[0],
+            image_state=image[1],
+            cached_layers=len(scripts),
+            total_layers=len(scripts),
+        )
+    cached = find_cached_layer(ec2_client, layer_hashes)
+    cached_layers = cached[0] if cached is not None else 0
+    build = find_golden_build(ec2_client, golden_hash)
+    if build is not None:
+        return GoldenImageStatus(
+            golden_hash,
+            base_ami_id,
+            build_instance_id=build[0],
+            build_started_at=build[1],
+            cached_layers=cached_layers,
+            total_layers=len(scripts),
+        )
+    return GoldenImageStatus(golden_hash, base_ami_id, cached_layers=cached_layers, total_layers=len(scripts))
+
+
+def deployed_image_id(cloudformation_client: Any, stack_name: str) -> str | None:
+    """Return the Spot Fleet image id of a deployed stack, or ``None`` when it does not exist.
+
+    Raises:
+        RuntimeError: If the deployed template cannot be read.
+    """
+    try:
+        response = cloudformation_client.get_template(StackName=stack_name, TemplateStage="Original")
+    except Exception as err:
+        if "does not exist" in str(err):
+            return None
+        raise RuntimeError(f"Failed to read the deployed template of stack '{stack_name}'.") from err
+    body = response.get("TemplateBody")
+    if isinstance(body, str):
+        try:
+            body = json.loads(body)
+        except ValueError:
+            return None
+    if not isinstance(body, dict):
+        return None
+    for resource in body.get("Resources", {}).values():
+        if not isinstance(resource, dict) or resource.get("Type") != "AWS::EC2::SpotFleet":
+            continue
+        config = resource.get("Properties", {}).get("SpotFleetRequestConfigData", {})
+        for specification in config.get("LaunchSpecifications", []):
+            image_id = specification.get("ImageId")
+            if isinstance(image_id, str) and image_id:
+                return image_id
+    return None
+
+
+def _golden_hash_of_image(ec2_client: Any, image_id: str) -> str | None:
+    """Return the golden hash tag of an image, or ``None`` for other images."""
+    response = ec2_client.describe_images(ImageIds=[image_id])
+    for image in response.get("Images", []):
+        for tag in image.get("Tags", []):
+            if tag.get("Key") == GOLDEN_HASH_TAG:
+                return str(tag.get("Value", ""))
+    return None
+
+
+def choose_deploy_golden_image(
+    ec2_client: Any,
+    cloudformation_client: Any,
+    *,
+    stack_dir: str | Path,
+    stack_name: str,
+    environment_spec: Any,
+) -> GoldenImageChoice:
+    """Decide whether a default deploy should launch from a golden AMI.
+
+    New stacks use the golden AMI for the current base AMI and scripts when it
+    is available.  A stack deployed from a golden AMI keeps it, because
+    changing the launch specification replaces the Spot Fleet and its
+    instance.  A stack deployed from any other image skips the golden AMI, so
+    the deploy uses the default AMI and user-data bootstrap as it would
+    without golden AMIs.  Lookup errors fall back to the user-data bootstrap
+    instead of blocking the deploy.
+
+    Returns:
+        Golden AMI to deploy (or ``None``) with a user-facing reason.
+    """
+    try:
+        current_image_id = deployed_image_id(cloudformation_client, stack_name)
+        if current_image_id is not None:
+            deployed_hash = _golden_hash_of_image(ec2_client, current_image_id)
+            if deployed_hash is None:
+                return GoldenImageChoice(
+                    None,
+                    f"{stack_name} is deployed from {current_image_id}, not a golden AMI; "
+                    "skipping the golden AMI and deploying the default AMI.",
+                )
+            return GoldenImageChoice(
+                current_image_id,
+                f"{stack_name} is deployed from golden AMI {current_image_id}; keeping it.",
+            )
+        status = resolve_golden_image_status(ec2_client, stack_dir=stack_dir, environment_spec=environment_spec)
+    except Exception as err:
+        LOGGER.debug("Golden AMI lookup failed stack_name=%s error=%s", stack_name, err)
+        return GoldenImageChoice(None, f"Golden AMI lookup failed ({err}); bootstrapping in user data.")
+    if status.is_available:
+        return GoldenImageChoice(
+            status.image_id,
+            f"Using golden AMI {status.image_id} (hash {status.golden_hash[:12]}).",
+        )
+    return GoldenImageChoice(
+        None,
+        f"{status.describe()}; bootstrapping in user data. Run build_golden_ami.py to skip this next time.",
+    )
+
+
+def build_golden_user_data(layers: Sequence[tuple[str, bytes]]) -> str:
+    """Return base64 user data that queues layer scripts and applies the first one.
+
+    Each boot runs the next queued script, prints its exit code to the
+    console, and powers off so the layer can be imaged; the builder starts
+    the instance again for the next layer.  The queue is keyed by instance id
+    so instances launched from an intermediate layer ignore its leftovers.
+
+    Args:
+        layers: ``(layer_id, script content)`` pairs in apply order.
+
+    Raises:
+        RuntimeError: If the payload exceeds the EC2 user-data size limit.
+    """
+    queue_commands = []
+    for layer_id, content in layers:
+        body = content.decode("utf-8")
+        queue_commands.append(
+            f"cat > \"$state_dir/queue/{layer_id}\" <<'{_BUILD_SCRIPT_DELIMITER}'\n"
+            f"{body}{'' if body.endswith(chr(10)) else chr(10)}"
+            f"{_BUILD_SCRIPT_DELIMITER}\n"
+        )
+    script = (
+        "#!/bin/bash\n"
+        f'state_dir="{_BUILD_STATE_DIR}/$(cat /var/lib/cloud/data/instance-id)"\n'
+        'mkdir -p "$state_dir/queue"\n'
+        f"{''.join(queue_commands)}"
+        f"mkdir -p {Path(_BUILD_RUNNER_PATH).parent}\n"
+        f"cat > {_BUILD_RUNNER_PATH} <<'{_BUILD_SCRIPT_DELIMITER}'\n"
+        f"{_BUILD_RUNNER}"
+        f"{_BUILD_SCRIPT_DELIMITER}\n"
+        f"chmod 755 {_BUILD_RUNNER_PATH}\n"
+        f"exec {_BUILD_RUNNER_PATH}\n"
+    )
+    payload = script.encode("utf-8")
+    if len(payload) > MAX_USER_DATA_BYTES:
+        raise RuntimeError(
+            f"Golden build user data is {len(payload)} bytes; EC2 allows {MAX_USER_DATA_BYTES}. "
+            "Shorten the bootstrap scripts."
+        )
+    return base64.b64encode(payload).decode("utf-8")
+
+
+def _layer_id(depth: int, layer_hash: str) -> str:
+    """Return the queue entry name and console marker id of one layer."""
+    return f"{depth:02d}-{layer_hash[:12]}"
+
+
+def resolve_build_subnet_id(ec2_client: Any, cloudformation_client: Any, *, stack_name: str) -> str:
+    """Return a subnet with internet access for the builder instance.
+
+    Prefers a subnet of the deployed workstation stack, then the default VPC.
+
+    Raises:
+        RuntimeError: If neither exists.
+    """
+    try:
+        response = cloudformation_client.describe_stack_resources(StackName=stack_name)
+        for resource in response.get("StackResources", []):
+            if resource.get("ResourceType") == "AWS::EC2::Subnet" and resource.get("PhysicalResourceId"):
+                return str(resource["PhysicalResourceId"])
+    except Exception as err:
+        LOGGER.debug("No deployed workstation subnet stack_name=%s error=%s", stack_name, err)
+    response = ec2_client.describe_subnets(Filters=[{"Name": "default-for-az", "Values": ["true"]}])
+    subnets = response.get("Subnets", [])
+    if subnets:
+        return str(subnets[0]["SubnetId"])
+    raise RuntimeError(
+        f"No subnet found for the golden AMI build: {stack_name} is not deployed and the region has no default VPC. "
+        "Deploy the environment once or pass --subnet-id."
+    )
+
+
+def launch_golden_build(
+    ec2_client: Any,
+    *,
+    environment_key: str,
+    status: GoldenImageStatus,
+    source_image_id: str,
+    user_data: str,
+    instance_type: str,
+    volume_size: int,
+    subnet_id: str,
+) -> str:
+    """Launch an on-demand builder instance from ``source_image_id`` and return its id."""
+    tags = [
+        {"Key": "Name", "Value": f"{environment_key}-golden-build"},
+        {"Key": GOLDEN_HASH_TAG, "Value": status.golden_hash},
+        {"Key": GOLDEN_ENVIRONMENT_TAG, "Value": environment_key},
+        {"Key": GOLDEN_BASE_AMI_TAG, "Value": status.base_ami_id},
+    ]
+    try:
+        response = ec2_client.run_instances(
+            ImageId=source_image_id,
+            InstanceType=instance_type,
+            MinCount=1,
+            MaxCount=1,
+            UserData=user_data,
+            InstanceInitiatedShutdownBehavior="stop",
+            NetworkInterfaces=[{"DeviceIndex": 0, "SubnetId": subnet_id, "AssociatePublicIpAddress": True}],
+            BlockDeviceMappings=[
+                {
+                    "DeviceName": "/dev/sda1",
+                    "Ebs": {"DeleteOnTermination": True, "VolumeSize": volume_size, "VolumeType": "gp3"},
+                }
+            ],
+            TagSpecifications=[{"ResourceType": "instance", "Tags": tags}],
+        )
+    except Exception as err:
+        raise RuntimeError(f"Failed to launch the golden AMI builder for '{environment_key}'.") from err
+    return str(response["Instances"][0]["InstanceId"])
+
+
+def _instance_state(ec2_client: Any, instance_id: str) -> str:
+    """Return the EC2 state name of one instance."""
+    response = ec2_client.describe_instances(InstanceIds=[instance_id])
+    for reservation in response.get("Reservations", []):
+        for instance in reservation.get("Instances", []):
+            return str(instance.get("State", {}).get("Name", ""))
+    return "unknown"
+
+
+def _read_layer_exit_code(ec2_client: Any, instance_id: str, layer_id: str) -> int | None:
+    """Return the exit code the builder printed for ``layer_id``, if present."""
+    try:
+        response = ec2_client.get_console_output(InstanceId=instance_id, Latest=True)
+    except Exception:
+        # Reason: Latest=True is only supported on Nitro instances.
+        response = ec2_client.get_console_output(InstanceId=instance_id)
+    output = str(response.get("Output") or "")
+    prefix = f"{_BUILD_LAYER_MARKER} {layer_id} exit="
+    for line in reversed(output.splitlines()):
+        if prefix in line:
+            value = line.split(prefix, 1)[1].strip()
+            return int(value) if value.isdigit() else None
+    return None
+
+
+def wait_for_golden_layer(
+    ec2_client: Any,
+    instance_id: str,
+    *,
+    layer_id: str,
+    script_name: str,
+    timeout_seconds: float = GOLDEN_BUILD_TIMEOUT_SECONDS,
+    poll_interval_seconds: float = GOLDEN_BUILD_POLL_SECONDS,
+    monotonic: Callable[[], float] = time.monotonic,
+    sleeper: Callable[[float], None] = time.sleep,
+    out: TextIO = sys.stdout,
+) -> None:
+    """Wait for the builder to apply one layer and power off, and check its exit code.
+
+    Raises:
+        RuntimeError: If the builder terminates, times out, or reports a
+            non-zero exit code for the layer script.
+    """
+    started_at = monotonic()
+    deadline = started_at + timeout_seconds
+    last_state = ""
+    while True:
+        state = _instance_state(ec2_client, instance_id)
+        if state != last_state:
+            out.write(f"Golden layer {layer_id} ({script_name}): {state} ({monotonic() - started_at:.0f}s elapsed)\n")
+            last_state = state
+        if state == "stopped":
+            break
+        if state in {"shutting-down", "terminated"}:
+            raise RuntimeError(f"Golden AMI builder '{instance_id}' was {state} before the build finished.")
+        if monotonic() >= deadline:
+            raise RuntimeError(
+                f"Golden AMI builder '{instance_id}' was still {state} after {timeout_seconds:.0f} seconds "
+                f"applying {script_name}."
+            )
+        sleeper(poll_interval_seconds)
+
+    exit_code: int | None = None
+    for _attempt in range(3):
+        exit_code = _read_layer_exit_code(ec2_client, instance_id, layer_id)
+        if exit_code is not None:
+            break
+        # Reason: console output is captured asynchronously and can trail the stop.
+        sleeper(poll_interval_seconds)
+    if exit_code is None:
+        raise RuntimeError(
+            f"Golden AMI builder '{instance_id}' stopped without reporting an exit code for {script_name}."
+        )
+    if exit_code != 0:
+        raise RuntimeError(
+            f"Bootstrap script {script_name} failed with exit code {exit_code} on golden AMI builder "
+            f"'{instance_id}'. Check its console output with 'aws ec2 get-console-output'."
+        )
+
+
+def _create_layer_image(
+    ec2_client: Any,
+    *,
+    instance_id: str,
+    environment_key: str,
+    status: GoldenImageStatus,
+    depth: int,
+    layer_hash: str,
+    script_name: str,
+) -> str:
+    """Image the stopped builder as one layer and return the AMI id."""
+    is_top_layer = layer_hash == status.golden_hash
+    image_name = golden_image_name(environment_key, layer_hash) if is_top_layer else layer_image_name(depth, layer_hash)
+    try:
+        response = ec2_client.create_image(
+            InstanceId=instance_id,
+            Name=image_name,
+            Description=f"Layer {depth} ({script_name}) over {status.base_ami_id}, built for {environment_key}.",
+            TagSpecifications=[
+                {
+                    "ResourceType": "image",
+                    "Tags": [
+                        {"Key": GOLDEN_HASH_TAG, "Value": layer_hash},
+                        {"Key": GOLDEN_ENVIRONMENT_TAG, "Value": environment_key},
+                        {"Key": GOLDEN_BASE_AMI_TAG, "Value": status.base_ami_id},
+                        {"Key": GOLDEN_LAYER_SCRIPT_TAG, "Value": script_name},
+                        {"Key": GOLDEN_LAYER_DEPTH_TAG, "Value": str(depth)},
+                    ],
+                }
+            ],
+        )
+    except Exception as err:
+        raise RuntimeError(f"Failed to create golden AMI layer '{image_name}' from '{instance_id}'.") from err
+    return str(response["ImageId"])
+
+
+def _wait_until_not_stopped(
+    ec2_client: Any,
+    instance_id: str,
+    *,
+    timeout_seconds: float = 5 * 60,
+    poll_interval_seconds: float = 5.0,
+    monotonic: Callable[[], float] = time.monotonic,
+    sleeper: Callable[[float], None] = time.sleep,
+) -> None:
+    """Wait until a restarted builder leaves ``stopped`` so the next stop is a new layer."""
+    deadline = monotonic() + timeout_seconds
+    while _instance_state(ec2_client, instance_id) == "stopped":
+        if monotonic() >= deadline:
+            raise RuntimeError(f"Golden AMI builder '{instance_id}' did not start after {timeout_seconds:.0f} seconds.")
+        sleeper(poll_interval_seconds)
+
+
+def build_golden_image(
+    ec2_client: Any,
+    cloudformation_client: Any,
+    *,
+    stack_dir: str | Path,
+    stack_name: str,
+    environment_spec: Any,
+    subnet_id: str | None = None,
+    monotonic: Callable[[], float] = time.monotonic,
+    sleeper: Callable[[float], None] = time.sleep,
+    out: TextIO = sys.stdout,
+) -> str:
+    """Build (or reuse) the golden AMI for an environment and return its id.
+
+    The builder launches from the deepest cached layer of any environment
+    with the same root volume size and applies only the remaining scripts, imaging one layer per script.
+    An intermediate layer's instance restarts as soon as its snapshots have
+    started; the top layer is waited on until available.  The builder
+    instance is terminated once the build has finished or failed.
+
+    Raises:
+        RuntimeError: If a build is already running, or a script or image
+            creation fails.
+    """
+    environment_key = str(environment_spec.environment_key)
+    status = resolve_golden_image_status(ec2_client, stack_dir=stack_dir, environment_spec=environment_spec)
+    if status.image_id is not None:
+        out.write(f"{status.describe()}; nothing to build.\n")
+        if status.image_state != "available":
+            wait_for_image_available(ec2_client, image_id=status.image_id, monotonic=monotonic, sleeper=sleeper)
+        return status.image_id
+    if status.build_instance_id is not None:
+        raise RuntimeError(
+            f"A golden AMI build for {environment_key} is already running on {status.build_instance_id}. "
+            "Wait for it to finish, or terminate that instance and retry."
+        )
+
+    scripts = resolve_bootstrap_scripts(stack_dir, tuple(environment_spec.bootstrap_files))
+    layer_hashes = compute_layer_hashes(status.base_ami_id, scripts, volume_size=int(environment_spec.volume_size))
+    cached = find_cached_layer(ec2_client, layer_hashes)
+    start_depth, source_image_id = cached if cached is not None else (0, status.base_ami_id)
+    pending = [
+        (depth, layer_hashes[depth], scripts[depth - 1][0], scripts[depth - 1][1])
+        for depth in range(start_depth + 1, len(scripts) + 1)
+    ]
+    if not pending:
+        raise RuntimeError(f"{environment_key} has no bootstrap scripts to build a golden AMI from.")
+
+    instance_id = launch_golden_build(
+        ec2_client,
+        environment_key=environment_key,
+        status=status,
+        source_image_id=source_image_id,
+        user_data=build_golden_user_data(
+            [(_layer_id(depth, layer_hash), content) for depth, layer_hash, _name, content in pending]
+        ),
+        instance_type=str(environment_spec.instance_type),
+        volume_size=int(environment_spec.volume_size),
+        subnet_id=subnet_id or resolve_build_subnet_id(ec2_client, cloudformation_client, stack_name=stack_name),
+    )
+    reused = f"cached layer {start_depth}/{len(scripts)} ({source_image_id})" if start_depth else status.base_ami_id
+    out.write(f"Launched golden AMI builder {instance_id} from {reused}; {len(pending)} layer(s) to build.\n")
+
+    image_id = ""
+    try:
+        for depth, layer_hash, script_name, _content in pending:
+            wait_for_golden_layer(
+                ec2_client,
+                instance_id,
+                layer_id=_layer_id(depth, layer_hash),
+                script_name=script_name,
+                monotonic=monotonic,
+                sleeper=sleeper,
+                out=out,
+            )
+            image_id = _create_layer_image(
+                ec2_client,
+                instance_id=instance_id,
+                environment_key=environment_key,
+                status=status,
+                depth=depth,
+                layer_hash=layer_hash,
+                script_name=script_name,
+            )
+            out.write(f"Layer {depth}/{len(scripts)} ({script_name}) saved as {image_id}.\n")
+            if depth == len(scripts):
+                break
+            # Reason: snapshots capture the volume when they start, so the next layer can run meanwhile.
+            wait_for_image_snapshots(ec2_client, image_id=image_id, monotonic=monotonic, sleeper=sleeper)
+            try:
+                ec2_client.start_instances(InstanceIds=[instance_id])
+            except Exception as err:
+                raise RuntimeError(f"Failed to restart golden AMI builder '{instance_id}' for the next layer.") from err
+            _wait_until_not_stopped(ec2_client, instance_id, monotonic=monotonic, sleeper=sleeper)
+    finally:
+        try:
+            ec2_client.terminate_instances(InstanceIds=[instance_id])
+        except Exception:
+            LOGGER.warning("Unable to terminate golden AMI builder instance_id=%s", instance_id, exc_info=True)
+    wait_for_image_available(ec2_client, image_id=image_id, monotonic=monotonic, sleeper=sleeper)
+    out.write(f"Golden AMI {golden_image_name(environment_key, status.golden_hash)} ({image_id}) is available.\n")
+    return image_id
+
@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
+from contextlib import contextmanager
 from dataclasses import dataclass
 import importlib.util
 import os
 from pathlib import Path
 import subprocess
-from typing import Callable, TextIO
+from typing import Callable, Iterator, Mapping, Sequence, TextIO
+
+ScriptEntrypoint = Callable[[list[str]], int]
 
 
 @dataclass(frozen=True, slots=True)
@@ -76,6 +79,8 @@ class ActionAvailability:
 
 DEPLOY_DISABLED_REASON = "Unavailable: stack is already deployed."
 REQUIRES_DEPLOYED_REASON = "Unavailable: deploy the stack first."
+PAUSE_DISABLED_REASON = "Unavailable: workstation is not running."
+RESUME_DISABLED_REASON = "Unavailable: workstation is not paused."
 TERMINAL_DELETED_STACK_STATUSES: frozenset[str] = frozenset({"DELETE_COMPLETE"})
 
 
@@ -298,6 +303,9 @@ def parse_action_choice(input_value: str) -> str | None:
         "7": "switch_environment",
         "8": "destroy_shared_network",
         "9": "quit",
+        "10": "pause",
+        "11": "resume",
+        "12": "build_golden_ami",
         "d": "deploy_default",
         "p": "deploy_pick_ami",
         "s": "save_ami_only",
@@ -307,6 +315,9 @@ def parse_action_choice(input_value: str) -> str | None:
         "w": "switch_environment",
         "n": "destroy_shared_network",
         "q": "quit",
+        "z": "pause",
+        "u": "resume",
+        "g": "build_golden_ami",
     }
     return mapping.get(normalized)
 
@@ -340,6 +351,9 @@ def build_action_availability(
     """
     deploy_enabled = not state.is_deployed
     requires_deployed_enabled = state.is_deployed
+    stack_state = state.stack_state.strip().lower()
+    pause_enabled = stack_state == "running"
+    resume_enabled = stack_state == "paused"
     return {
         "deploy_default": ActionAvailability(
             enabled=deploy_enabled,
@@ -361,6 +375,15 @@ def build_action_availability(
             enabled=requires_deployed_enabled,
             disabled_reason=None if requires_deployed_enabled else REQUIRES_DEPLOYED_REASON,
         ),
+        "pause": ActionAvailability(
+            enabled=pause_enabled,
+            disabled_reason=None if pause_enabled else PAUSE_DISABLED_REASON,
+        ),
+        "resume": ActionAvailability(
+            enabled=resume_enabled,
+            disabled_reason=None if resume_enabled else RESUME_DISABLED_REASON,
+        ),
+        "build_golden_ami": ActionAvailability(enabled=True),
         "refresh": ActionAvailability(enabled=True),
         "switch_environment": ActionAvailability(enabled=True),
         "destroy_shared_network": ActionAvailability(enabled=True),
@@ -386,6 +409,70 @@ def run_script(
         ) from err
 
 
+@contextmanager
+def _scoped_process_state(cwd: Path, env_overrides: dict[str, str] | None) -> Iterator[None]:
+    """Apply a working directory and environment overrides for one in-process run."""
+    previous_cwd = os.getcwd()
+    previous_values = {key: os.environ.get(key) for key in (env_overrides or {})}
+    os.chdir(cwd)
+    os.environ.update(env_overrides or {})
+    try:
+        yield
+    finally:
+        os.chdir(previous_cwd)
+        for key, value in previous_values.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+
+def run_script_in_process(
+    command: Sequence[str],
+    *,
+    cwd: Path,
+    env_overrides: dict[str, str] | None = None,
+    entrypoints: Mapping[str, ScriptEntrypoint],
+) -> None:
+    """Run a ``uv run <script>.py`` command by calling the script entrypoint directly.
+
+    This skips uv environment resolution, interpreter start-up, and AWS
+    credential resolution for every action.  Commands without a registered
+    entrypoint fall back to ``run_script``.
+
+    Args:
+        command: Command that ``dispatch_action`` would otherwise spawn.
+        cwd: Working directory applied while the entrypoint runs.
+        env_overrides: Environment variables applied while the entrypoint runs.
+        entrypoints: Mapping of script stem (for example ``deploy_workstation``)
+            to a callable that accepts the script's CLI arguments.
+
+    Raises:
+        RuntimeError: If the entrypoint fails, returns or exits with a
+            non-zero status.
+    """
+    entrypoint: ScriptEntrypoint | None = None
+    if len(command) >= 3 and list(command[:2]) == ["uv", "run"] and command[2].endswith(".py"):
+        entrypoint = entrypoints.get(Path(command[2]).stem)
+    if entrypoint is None:
+        run_script(list(command), cwd=cwd, env_overrides=env_overrides)
+        return
+
+    with _scoped_process_state(cwd, env_overrides):
+        try:
+            status = entrypoint(list(command[3:]))
+        except SystemExit as err:
+            # Reason: argparse errors exit instead of raising; keep the menu alive.
+            status = err.code if isinstance(err.code, int) else 1
+        except RuntimeError:
+            raise
+        except Exception as err:
+            # Reason: the subprocess path reported any failure as a RuntimeError; the menu relies on that.
+            raise RuntimeError(f"Command failed ({type(err).__name__}: {err}): {' '.join(command)}") from err
+    if status:
+        raise RuntimeError(f"Command failed (exit code {status}): {' '.join(command)}")
+
+
 def _prompt_ami_tag(*, input_func: Callable[[str], str], out: TextIO) -> str:
     """Prompt for an AMI tag with retry behavior and quit support."""
     while True:
@@ -550,6 +637,19 @@ def dispatch_action(
         "--spot-fleet-logical-id",
         environment.spot_fleet_logical_id,
     ]
+    pause_command = [
+        "uv",
+        "run",
+        "../scripts/pause_workstation.py",
+        "--environment",
+        environment.environment_key,
+        "--stack-dir",
+        str(environment.stack_dir),
+        "--stack-name",
+        environment.stack_name,
+        "--spot-fleet-logical-id",
+        environment.spot_fleet_logical_id,
+    ]
     destroy_shared_network_command = [
         "uv",
         "run",
@@ -646,6 +746,32 @@ def dispatch_action(
         runner(stop_command, environment.stack_dir, env_overrides)
         return ActionResult()
 
+    if action == "pause":
+        runner(pause_command, environment.stack_dir, None)
+        return ActionResult()
+
+    if action == "resume":
+        runner([*pause_command, "--resume"], environment.stack_dir, None)
+        return ActionResult()
+
+    if action == "build_golden_ami":
+        runner(
+            [
+                "uv",
+                "run",
+                "../scripts/build_golden_ami.py",
+                "--environment",
+                environment.environment_key,
+                "--stack-dir",
+                str(environment.stack_dir),
+                "--stack-name",
+                environment.stack_name,
+            ],
+            environment.stack_dir,
+            None,
+        )
+        return ActionResult()
+
     if action == "refresh":
         return ActionResult()
 
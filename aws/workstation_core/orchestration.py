@@ -9,20 +9,70 @@ import os
 from pathlib import Path
 import subprocess
 import sys
+import threading
 import time
 from typing import Callable, Mapping, Sequence, TextIO
 
 import boto3
 from botocore.client import BaseClient
 
+from workstation_core.ami_catalog import catalog_environment_images, catalog_exact_image_id
 from workstation_core.ami_lifecycle import (
     AmiModeConfig,
     is_truthy,
     read_ami_mode_from_env,
     resolve_ami_selection,
+    validate_mode_arguments,
+)
+from workstation_core.assembly_cache import (
+    DEFAULT_ASSEMBLY_CACHE_DIR,
+    compute_assembly_cache_key,
+    find_assembly_with_stack,
+    find_cached_assembly,
+    staging_dir,
+    store_assembly,
+)
+from workstation_core.az_selection import (
+    availability_zone_names,
+    choose_workstation_availability_zones,
+    format_availability_zone_selection,
+    read_availability_zone_override,
+)
+from workstation_core.bootstrap_timing import (
+    BOOTSTRAP_WAIT_TIMEOUT_SECONDS,
+    print_bootstrap_report,
+    wait_for_bootstrap_complete,
+)
+from workstation_core.change_set_deploy import (
+    deploy_stack_artifact,
+    format_resource_timings,
+    load_stack_artifact,
 )
 from workstation_core.config import get_shared_network_config
-from workstation_core.elastic_ip import find_or_create_eip
+from workstation_core.container_cache import resolve_container_cache_credential_arn
+from workstation_core.deploy_fingerprint import (
+    DEFAULT_FINGERPRINT_DIR,
+    StackDeployDecision,
+    decide_stack_deploy,
+    format_deploy_report,
+    load_synthesized_template,
+    record_local_fingerprint,
+)
+from workstation_core.elastic_ip import create_eip, find_eip_by_name
+from workstation_core.golden_ami import choose_deploy_golden_image
+from workstation_core.pause import DEFAULT_LIFECYCLE_TIMING_DIR, find_fleet_instance, record_lifecycle_timing
+from workstation_core.pending_ami import check_pending_amis
+from workstation_core.preflight import DeployPreflight
+from workstation_core.readiness import print_connection_guidance, wait_for_workstation_ready
+from workstation_core.runtime_resolution import get_caller_account
+from workstation_core.tracing import child_process_environment, instrument_client, trace_span
+from workstation_core.volume_warming import (
+    disable_fast_snapshot_restores,
+    enable_fast_snapshot_restores,
+    read_volume_warm_mode,
+    report_root_volume_fast_restore,
+    wait_for_volume_preread,
+)
 
 
 @dataclass(frozen=True, slots=True)
@@ -50,6 +100,10 @@ class DeployWorkflowInputs:
         stack_name: CloudFormation stack name for post-deploy checks.
         profile: Optional AWS profile override.
         region: Optional AWS region override.
+        access_mode: Optional workstation access mode override.
+        force: Deploy even when the synthesized template is unchanged.
+        deploy_engine: Stack deploy engine (``changeset`` or ``cdk``); defaults
+            to ``DEPLOY_ENGINE`` and then ``cdk``.
     """
 
     environment: str
@@ -58,6 +112,8 @@ class DeployWorkflowInputs:
     profile: str | None = None
     region: str | None = None
     access_mode: str | None = None
+    force: bool = False
+    deploy_engine: str | None = None
 
 
 @dataclass(frozen=True, slots=True)
@@ -70,6 +126,8 @@ class StopOrchestrationInputs:
         spot_fleet_logical_id: Stack logical id for Spot Fleet lookup.
         ami_save: Whether AMI save-on-stop is enabled.
         ami_tag: User-provided AMI tag when save-on-stop is enabled.
+        fast_stop: Destroy once the AMI's snapshots have started instead of
+            waiting for the AMI to become available.
     """
 
     environment_key: str
@@ -77,12 +135,56 @@ class StopOrchestrationInputs:
     spot_fleet_logical_id: str
     ami_save: bool
     ami_tag: str | None = None
+    fast_stop: bool = False
+
+
+@dataclass(frozen=True, slots=True)
+class SharedNetworkFeatures:
+    """Optional shared-network resources a deploy needs.
+
+    Args:
+        package_cache: Whether the S3 package cache bucket is needed.
+        container_cache_credential_arn: Docker Hub credentials secret ARN when
+            the ECR pull-through cache is needed, otherwise ``None``.
+    """
+
+    package_cache: bool = False
+    container_cache_credential_arn: str | None = None
+
+    def context(self) -> dict[str, str]:
+        """Return the CDK context that enables these resources in the network stack."""
+        context: dict[str, str] = {}
+        if self.package_cache:
+            context["package_cache"] = "true"
+        if self.container_cache_credential_arn:
+            context["container_cache_credential_arn"] = self.container_cache_credential_arn
+        return context
+
+    def missing_from(self, outputs: Mapping[str, str]) -> list[str]:
+        """Return the requested resources the deployed stack's outputs do not show."""
+        missing: list[str] = []
+        if self.package_cache and "PackageCacheBucketName" not in outputs:
+            missing.append("package cache")
+        if self.container_cache_credential_arn and "ContainerCacheRegistry" not in outputs:
+            missing.append("container cache")
+        return missing
+
+    def merged_with(self, outputs: Mapping[str, str]) -> SharedNetworkFeatures:
+        """Return these features plus the ones the deployed stack already has."""
+        return SharedNetworkFeatures(
+            package_cache=self.package_cache or "PackageCacheBucketName" in outputs,
+            container_cache_credential_arn=(
+                self.container_cache_credential_arn or outputs.get("ContainerCacheCredentialArn")
+            ),
+        )
 
 
 LOGGER = logging.getLogger(__name__)
 DEPLOY_COMMAND_TIMEOUT_SECONDS = 45 * 60
-POST_DEPLOY_CHECK_TIMEOUT_SECONDS = 5 * 60
 DELETE_COMPLETE_STACK_STATUS = "DELETE_COMPLETE"
+_VALID_DEPLOY_ENGINES = frozenset({"changeset", "cdk"})
+# Reason: concurrent deploys in one process must create the shared network once.
+_SHARED_NETWORK_LOCK = threading.Lock()
 
 
 def validate_plan(plan: OrchestrationPlan) -> None:
@@ -153,6 +255,8 @@ def run_stop_orchestration(
     wait_for_image_available: Callable[[str], None],
     destroy_stack: Callable[[], None],
     release_eip: Callable[[], None] | None = None,
+    wait_for_image_snapshots: Callable[[str], tuple[str, ...]] | None = None,
+    record_pending_image: Callable[[str, str, tuple[str, ...]], None] | None = None,
 ) -> str | None:
     """Run stop-time AMI save orchestration and destroy gating.
 
@@ -163,6 +267,11 @@ def run_stop_orchestration(
         wait_for_image_available: Callback waiting for AMI to become available.
         destroy_stack: Callback executing the destroy operation.
         release_eip: Optional callback to release the associated Elastic IP after destroy.
+        wait_for_image_snapshots: Callback waiting for the AMI's snapshots to
+            start and returning their ids; required when ``inputs.fast_stop``
+            is set.
+        record_pending_image: Optional callback recording a fast-stop AMI id,
+            name and snapshot ids while the AMI may still be pending.
 
     Returns:
         Saved AMI id when AMI save is enabled, otherwise ``None``.
@@ -171,23 +280,37 @@ def run_stop_orchestration(
         RuntimeError: If save-on-stop fails.
     """
     validate_stop_inputs(inputs)
+    if inputs.ami_save and inputs.fast_stop and wait_for_image_snapshots is None:
+        raise ValueError("fast_stop requires a wait_for_image_snapshots callback.")
 
     saved_image_id: str | None = None
     if inputs.ami_save:
         image_name = build_stop_image_name(inputs.environment_key, inputs.ami_tag or "")
-        instance_id = resolve_running_instance_id().strip()
+        with trace_span("stop.resolve_running_instance"):
+            instance_id = resolve_running_instance_id().strip()
         if not instance_id:
             raise RuntimeError("Unable to resolve a running instance for AMI save-on-stop.")
-        saved_image_id = create_image(instance_id, image_name).strip()
+        with trace_span("stop.create_image", image_name=image_name, instance_id=instance_id):
+            saved_image_id = create_image(instance_id, image_name).strip()
         if not saved_image_id:
             raise RuntimeError("AMI save-on-stop failed: create_image returned an empty AMI id.")
-        wait_for_image_available(saved_image_id)
-
-    destroy_stack()
+        if inputs.fast_stop and wait_for_image_snapshots is not None:
+            # Reason: EBS snapshots are point-in-time once started, so the instance can go.
+            with trace_span("stop.wait_for_image_snapshots", image_id=saved_image_id):
+                snapshot_ids = wait_for_image_snapshots(saved_image_id)
+            if record_pending_image is not None:
+                record_pending_image(saved_image_id, image_name, snapshot_ids)
+        else:
+            with trace_span("stop.wait_for_image_available", image_id=saved_image_id):
+                wait_for_image_available(saved_image_id)
+
+    with trace_span("stop.destroy_stack", stack_name=inputs.stack_name):
+        destroy_stack()
 
     # Reason: release EIP after destroy so connectivity is preserved if destroy fails.
     if release_eip is not None:
-        release_eip()
+        with trace_span("stop.release_eip"):
+            release_eip()
 
     return saved_image_id
 
@@ -216,10 +339,18 @@ def load_environment_spec(stack_dir: str) -> object | None:
     return getattr(module, "ENVIRONMENT_SPEC", None)
 
 
-def make_ec2_client(profile: str | None, region: str | None) -> BaseClient:
-    """Create an EC2 client with optional profile and region overrides."""
-    session = _make_boto3_session(profile=profile, region=region)
-    return session.client("ec2")
+def make_ec2_client(
+    profile: str | None,
+    region: str | None,
+    session: boto3.Session | None = None,
+) -> BaseClient:
+    """Create an EC2 client with optional profile and region overrides.
+
+    An injected ``session`` is reused as-is so in-process callers resolve
+    credentials once.
+    """
+    session = session or _make_boto3_session(profile=profile, region=region)
+    return instrument_client(session.client("ec2"))
 
 
 def _make_boto3_session(profile: str | None, region: str | None) -> boto3.Session:
@@ -234,16 +365,74 @@ def _make_boto3_session(profile: str | None, region: str | None) -> boto3.Sessio
     return session
 
 
-def make_cloudformation_client(profile: str | None, region: str | None) -> BaseClient:
-    """Create a CloudFormation client with optional profile and region overrides."""
-    session = _make_boto3_session(profile=profile, region=region)
-    return session.client("cloudformation")
+def make_cloudformation_client(
+    profile: str | None,
+    region: str | None,
+    session: boto3.Session | None = None,
+) -> BaseClient:
+    """Create a CloudFormation client from an injected session or profile/region overrides."""
+    session = session or _make_boto3_session(profile=profile, region=region)
+    return instrument_client(session.client("cloudformation"))
+
+
+def make_ssm_client(
+    profile: str | None,
+    region: str | None,
+    session: boto3.Session | None = None,
+) -> BaseClient:
+    """Create an SSM client from an injected session or profile/region overrides."""
+    session = session or _make_boto3_session(profile=profile, region=region)
+    return instrument_client(session.client("ssm"))
+
+
+def make_s3_client(
+    profile: str | None,
+    region: str | None,
+    session: boto3.Session | None = None,
+) -> BaseClient:
+    """Create an S3 client from an injected session or profile/region overrides."""
+    session = session or _make_boto3_session(profile=profile, region=region)
+    return instrument_client(session.client("s3"))
+
+
+def make_sts_client(
+    profile: str | None,
+    region: str | None,
+    session: boto3.Session | None = None,
+) -> BaseClient:
+    """Create an STS client from an injected session or profile/region overrides."""
+    session = session or _make_boto3_session(profile=profile, region=region)
+    return instrument_client(session.client("sts"))
+
+
+def make_secretsmanager_client(
+    profile: str | None,
+    region: str | None,
+    session: boto3.Session | None = None,
+) -> BaseClient:
+    """Create a Secrets Manager client from an injected session or profile/region overrides."""
+    session = session or _make_boto3_session(profile=profile, region=region)
+    return instrument_client(session.client("secretsmanager"))
 
 
 def run_command(command: Sequence[str], cwd: str, timeout_seconds: int | None = None) -> None:
-    """Run a subprocess command and raise actionable errors for failures."""
+    """Run a subprocess command and raise actionable errors for failures.
+
+    The command runs inside a ``process`` span and inherits the trace context
+    so traced child scripts nest under it.
+    """
+    with trace_span("process", **{"process.command_line": " ".join(command), "process.cwd": cwd}):
+        _run_traced_command(command, cwd=cwd, timeout_seconds=timeout_seconds)
+
+
+def _run_traced_command(command: Sequence[str], cwd: str, timeout_seconds: int | None) -> None:
+    """Execute one command with trace-context environment propagation."""
+    child_env = child_process_environment()
     try:
-        subprocess.run(command, check=True, cwd=cwd, timeout=timeout_seconds)
+        if child_env is None:
+            subprocess.run(command, check=True, cwd=cwd, timeout=timeout_seconds)
+        else:
+            subprocess.run(command, check=True, cwd=cwd, timeout=timeout_seconds, env=child_env)
     except subprocess.TimeoutExpired as err:
         LOGGER.error(
             "Command timeout while waiting for completion command=%s cwd=%s timeout_seconds=%s",
@@ -267,80 +456,220 @@ def run_command(command: Sequence[str], cwd: str, timeout_seconds: int | None =
         ) from err
 
 
-def deploy_stack(
-    stack_dir: str,
-    stack_name: str,
+def build_deploy_context(
+    *,
     ami_id: str | None,
     bootstrap_on_restored_ami: bool,
     eip_allocation_id: str | None = None,
     access_mode: str | None = None,
     public_ip_enabled: bool | None = None,
-) -> None:
-    """Deploy CDK stack with optional AMI, bootstrap, and EIP context."""
-    command: list[str] = ["uv", "run", "cdk", "deploy", "--require-approval", "never", stack_name]
+    availability_zone_indexes: tuple[int, ...] | None = None,
+    package_cache: bool = False,
+    container_cache: bool = False,
+    volume_preread: bool = False,
+) -> dict[str, str]:
+    """Build the CDK context values passed to ``base_stack/app.py``.
+
+    Returns:
+        Ordered mapping of context key to value.
+    """
+    context: dict[str, str] = {}
     if ami_id:
-        command.extend(["-c", f"ami_id={ami_id}"])
+        context["ami_id"] = ami_id
         if bootstrap_on_restored_ami:
-            command.extend(["-c", "bootstrap_on_restored_ami=true"])
+            context["bootstrap_on_restored_ami"] = "true"
     if eip_allocation_id:
-        command.extend(["-c", f"eip_allocation_id={eip_allocation_id}"])
+        context["eip_allocation_id"] = eip_allocation_id
     if access_mode:
-        command.extend(["-c", f"access_mode={access_mode}"])
+        context["access_mode"] = access_mode
     if public_ip_enabled is not None:
-        command.extend(["-c", f"public_ip_enabled={'true' if public_ip_enabled else 'false'}"])
-    run_command(
-        command,
-        cwd=stack_dir,
-        timeout_seconds=DEPLOY_COMMAND_TIMEOUT_SECONDS,
-    )
+        context["public_ip_enabled"] = "true" if public_ip_enabled else "false"
+    if availability_zone_indexes:
+        context["availability_zone_indexes"] = ",".join(str(index) for index in availability_zone_indexes)
+    if package_cache:
+        context["package_cache"] = "true"
+    if container_cache:
+        context["container_cache"] = "true"
+    if volume_preread:
+        context["volume_preread"] = "true"
+    return context
+
+
+def _context_args(context: Mapping[str, str]) -> list[str]:
+    """Render CDK context values as ``-c key=value`` arguments."""
+    arguments: list[str] = []
+    for key, value in context.items():
+        arguments.extend(["-c", f"{key}={value}"])
+    return arguments
+
+
+def synthesize_assembly(
+    stack_dir: str,
+    context: Mapping[str, str],
+    output_dir: str | Path | None = None,
+    *,
+    environment_spec: object | None = None,
+    cache_dir: Path = DEFAULT_ASSEMBLY_CACHE_DIR,
+) -> Path:
+    """Synthesize the CDK app once into a cloud assembly directory.
 
+    Without ``output_dir`` the assembly comes from the content-addressed
+    assembly cache, and the CDK app only runs when no cached assembly matches
+    the spec, context, init scripts and app sources.
 
-def deploy_shared_network_stack(stack_dir: str) -> None:
-    """Deploy or update the shared network stack before environment deploy."""
+    Args:
+        stack_dir: CDK app directory.
+        context: CDK context values for the synth.
+        output_dir: Explicit assembly output directory; bypasses the cache.
+        environment_spec: Loaded ``ENVIRONMENT_SPEC`` used in the cache key.
+        cache_dir: Root directory of the assembly cache.
+
+    Returns:
+        Path to the synthesized cloud assembly.
+    """
+    if output_dir is not None:
+        _run_synth(stack_dir, context, Path(output_dir))
+        return Path(output_dir)
+
+    key = compute_assembly_cache_key(stack_dir, context, environment_spec)
+    cached = find_cached_assembly(cache_dir, key)
+    with trace_span("synth.cache", hit=cached is not None, key=key[:12]):
+        if cached is not None:
+            LOGGER.info("Reusing cached cloud assembly path=%s", cached)
+            return cached
+        staged = staging_dir(cache_dir, key)
+        _run_synth(stack_dir, context, staged)
+        return store_assembly(cache_dir, key, staged)
+
+
+def _run_synth(stack_dir: str, context: Mapping[str, str], assembly_dir: Path) -> None:
+    """Run ``cdk synth`` for the app in ``stack_dir`` into ``assembly_dir``."""
     run_command(
-        [
-            "uv",
-            "run",
-            "cdk",
-            "deploy",
-            "--require-approval",
-            "never",
-            get_shared_network_config().stack_name,
-        ],
+        ["uv", "run", "cdk", "synth", "--quiet", "--output", str(assembly_dir), *_context_args(context)],
         cwd=stack_dir,
         timeout_seconds=DEPLOY_COMMAND_TIMEOUT_SECONDS,
     )
 
 
-def run_post_deploy_check(
+def build_destroy_command(stack_name: str, cache_dir: Path = DEFAULT_ASSEMBLY_CACHE_DIR) -> list[str]:
+    """Build ``cdk destroy`` for a stack, reusing a cached assembly when one exists."""
+    command = ["uv", "run", "cdk", "destroy", "--force"]
+    assembly_dir = find_assembly_with_stack(cache_dir, stack_name)
+    if assembly_dir is not None:
+        command.extend(["--app", str(assembly_dir)])
+    command.append(stack_name)
+    return command
+
+
+def deploy_stack(
     stack_dir: str,
     stack_name: str,
+    ami_id: str | None,
+    bootstrap_on_restored_ami: bool,
     eip_allocation_id: str | None = None,
-    eip_public_ip: str | None = None,
     access_mode: str | None = None,
+    public_ip_enabled: bool | None = None,
+    app: str | None = None,
+    availability_zone_indexes: tuple[int, ...] | None = None,
 ) -> None:
-    """Run instance helper after a successful deploy.
+    """Deploy CDK stack with optional AMI, bootstrap, and EIP context.
 
-    Args:
-        stack_dir: CDK app directory to run the check from.
-        stack_name: CloudFormation stack name for instance lookup.
-        eip_allocation_id: Optional EIP allocation ID to associate with the instance.
-        eip_public_ip: Optional EIP public IP to show in SSH config output.
+    When ``app`` points at an already synthesized cloud assembly, the CDK CLI
+    deploys it directly instead of running the CDK app again.
     """
-    command = ["uv", "run", "../scripts/check_instance.py", "--stack-name", stack_name]
-    if eip_allocation_id:
-        command.extend(["--eip-allocation-id", eip_allocation_id])
-    if eip_public_ip:
-        command.extend(["--eip-public-ip", eip_public_ip])
-    if access_mode:
-        command.extend(["--access-mode", access_mode])
+    command: list[str] = ["uv", "run", "cdk", "deploy", "--require-approval", "never"]
+    if app:
+        command.extend(["--app", app])
+    command.append(stack_name)
+    command.extend(
+        _context_args(
+            build_deploy_context(
+                ami_id=ami_id,
+                bootstrap_on_restored_ami=bootstrap_on_restored_ami,
+                eip_allocation_id=eip_allocation_id,
+                access_mode=access_mode,
+                public_ip_enabled=public_ip_enabled,
+                availability_zone_indexes=availability_zone_indexes,
+            )
+        )
+    )
+    run_command(
+        command,
+        cwd=stack_dir,
+        timeout_seconds=DEPLOY_COMMAND_TIMEOUT_SECONDS,
+    )
+
+
+def deploy_shared_network_stack(stack_dir: str, context: Mapping[str, str] | None = None) -> None:
+    """Deploy or update the shared network stack before environment deploy."""
+    command = [
+        "uv",
+        "run",
+        "cdk",
+        "deploy",
+        "--require-approval",
+        "never",
+        get_shared_network_config().stack_name,
+    ]
+    if context:
+        command.extend(_context_args(context))
     run_command(
         command,
         cwd=stack_dir,
-        timeout_seconds=POST_DEPLOY_CHECK_TIMEOUT_SECONDS,
+        timeout_seconds=DEPLOY_COMMAND_TIMEOUT_SECONDS,
     )
 
 
+def ensure_shared_network_stack(
+    *,
+    stack_dir: str,
+    cloudformation_client: BaseClient,
+    exists: bool | None = None,
+    features: SharedNetworkFeatures | None = None,
+) -> StackDeployDecision:
+    """Deploy the shared network stack when it is missing.
+
+    Deploys are serialized by a process-wide lock and existence is checked
+    again once the lock is held, so concurrent environment deploys create the
+    stack only once. An existing stack is also updated when it lacks one of
+    the requested ``features``; the update keeps the features it already has.
+
+    Args:
+        stack_dir: Environment CDK app directory used to run ``cdk deploy``.
+        cloudformation_client: Boto3 CloudFormation client for the lookup.
+        exists: Result of an earlier existence lookup, when one was made.
+        features: Optional caches the workstation needs from the shared network.
+
+    Returns:
+        Deploy decision for the shared network stack.
+    """
+    stack_name = get_shared_network_config().stack_name
+    features = features or SharedNetworkFeatures()
+    if exists and not features.context():
+        return StackDeployDecision(stack_name, False, "shared network stack already exists")
+    with _SHARED_NETWORK_LOCK:
+        if shared_network_stack_exists(
+            profile=None,
+            region=None,
+            cloudformation_client=cloudformation_client,
+        ):
+            outputs = _shared_network_outputs(cloudformation_client)
+            missing = features.missing_from(outputs)
+            if not missing:
+                return StackDeployDecision(stack_name, False, "shared network stack already exists")
+            # Reason: the network stack only keeps the caches named in its deploy context.
+            features = features.merged_with(outputs)
+            reason = f"shared network stack had no {' or '.join(missing)}"
+        else:
+            reason = "shared network stack did not exist"
+        with trace_span("deploy.shared_network_deploy"):
+            if features.context():
+                deploy_shared_network_stack(stack_dir=stack_dir, context=features.context())
+            else:
+                deploy_shared_network_stack(stack_dir=stack_dir)
+    return StackDeployDecision(stack_name, True, reason)
+
+
 def _resolve_region(region_override: str | None, env: Mapping[str, str]) -> str | None:
     """Resolve region from CLI override then environment variables."""
     if region_override is not None:
@@ -377,6 +706,17 @@ def resolve_access_mode(
     return resolved
 
 
+def resolve_deploy_engine(*, cli_deploy_engine: str | None, env: Mapping[str, str]) -> str:
+    """Resolve the stack deploy engine from CLI, then ``DEPLOY_ENGINE``, then ``cdk``."""
+    if cli_deploy_engine and cli_deploy_engine.strip():
+        resolved = cli_deploy_engine.strip()
+    else:
+        resolved = env.get("DEPLOY_ENGINE", "").strip() or "cdk"
+    if resolved not in _VALID_DEPLOY_ENGINES:
+        raise RuntimeError("DEPLOY_ENGINE must be one of: changeset, cdk.")
+    return resolved
+
+
 def _parse_optional_bool_env(value: str | None, env_var: str) -> bool | None:
     """Parse an optional boolean environment variable into ``True``/``False``."""
     if value is None:
@@ -393,6 +733,51 @@ def _parse_optional_bool_env(value: str | None, env_var: str) -> bool | None:
     )
 
 
+def read_package_cache_enabled(env: Mapping[str, str]) -> bool:
+    """Return whether ``PACKAGE_CACHE`` asks for the shared package cache."""
+    return _parse_optional_bool_env(env.get("PACKAGE_CACHE"), "PACKAGE_CACHE") is True
+
+
+def read_container_cache_enabled(env: Mapping[str, str]) -> bool:
+    """Return whether ``CONTAINER_CACHE`` asks for the shared container pull-through cache."""
+    return _parse_optional_bool_env(env.get("CONTAINER_CACHE"), "CONTAINER_CACHE") is True
+
+
+def build_shared_network_features(
+    *,
+    package_cache: bool,
+    container_cache: bool,
+    profile: str | None,
+    region: str | None,
+    session: boto3.Session | None = None,
+) -> SharedNetworkFeatures:
+    """Resolve the shared-network features a deploy asked for.
+
+    Raises:
+        RuntimeError: If the container cache is requested without Docker Hub credentials.
+    """
+    credential_arn = None
+    if container_cache:
+        credential_arn = resolve_container_cache_credential_arn(
+            make_secretsmanager_client(profile=profile, region=region, session=session)
+        )
+    return SharedNetworkFeatures(package_cache=package_cache, container_cache_credential_arn=credential_arn)
+
+
+def read_bootstrap_wait_timeout(env: Mapping[str, str]) -> float:
+    """Return the ``BOOTSTRAP_TIMEOUT`` seconds, defaulting to ``BOOTSTRAP_WAIT_TIMEOUT_SECONDS``."""
+    raw_value = env.get("BOOTSTRAP_TIMEOUT", "").strip()
+    if not raw_value:
+        return BOOTSTRAP_WAIT_TIMEOUT_SECONDS
+    try:
+        timeout_seconds = float(raw_value)
+    except ValueError:
+        timeout_seconds = 0.0
+    if timeout_seconds <= 0:
+        raise RuntimeError("BOOTSTRAP_TIMEOUT must be a positive number of seconds.")
+    return timeout_seconds
+
+
 def resolve_public_ip_enabled(
     *,
     env: Mapping[str, str],
@@ -432,13 +817,35 @@ def _list_stack_names(cloudformation_client: BaseClient) -> set[str]:
     return stack_names
 
 
-def shared_network_stack_exists(profile: str | None, region: str | None) -> bool:
+def shared_network_stack_exists(
+    profile: str | None,
+    region: str | None,
+    session: boto3.Session | None = None,
+    cloudformation_client: BaseClient | None = None,
+) -> bool:
     """Return whether the shared network CloudFormation stack already exists."""
     shared_network = get_shared_network_config()
-    cloudformation_client = make_cloudformation_client(profile=profile, region=region)
+    if cloudformation_client is None:
+        cloudformation_client = make_cloudformation_client(profile=profile, region=region, session=session)
     return shared_network.stack_name in _list_stack_names(cloudformation_client)
 
 
+def _shared_network_outputs(cloudformation_client: BaseClient) -> dict[str, str]:
+    """Return the shared network stack's outputs by key, or nothing when it is missing."""
+    stack_name = get_shared_network_config().stack_name
+    try:
+        response = cloudformation_client.describe_stacks(StackName=stack_name)
+    except Exception as err:
+        if "does not exist" in str(err):
+            return {}
+        raise
+    return {
+        str(output.get("OutputKey", "")): str(output.get("OutputValue", ""))
+        for stack in response.get("Stacks", [])
+        for output in stack.get("Outputs", [])
+    }
+
+
 def _resolve_stack_dir(aws_root: Path) -> str:
     """Select a deterministic environment CDK directory for shared stack commands."""
     candidates = sorted(
@@ -469,17 +876,19 @@ def destroy_shared_network_stack(
     region: str | None,
     aws_root: str | Path | None = None,
     out: TextIO = sys.stdout,
+    session: boto3.Session | None = None,
 ) -> int:
     """Destroy the shared network stack after confirming no environment stacks remain."""
     shared_network = get_shared_network_config()
     aws_root_path = Path(aws_root) if aws_root is not None else Path(__file__).resolve().parents[1]
-    session = boto3.Session(profile_name=profile, region_name=region)
+    if session is None:
+        session = boto3.Session(profile_name=profile, region_name=region)
     if not session.region_name:
         raise RuntimeError(
             "Unable to resolve AWS region. Set --region, AWS_REGION, AWS_DEFAULT_REGION, or configure profile region."
         )
 
-    cloudformation_client = session.client("cloudformation")
+    cloudformation_client = instrument_client(session.client("cloudformation"))
     active_stack_names = _list_stack_names(cloudformation_client)
     if shared_network.stack_name not in active_stack_names:
         print(f"{shared_network.stack_name} does not exist; nothing to destroy.", file=out)
@@ -494,7 +903,7 @@ def destroy_shared_network_stack(
         )
 
     run_command(
-        ["uv", "run", "cdk", "destroy", "--force", shared_network.stack_name],
+        build_destroy_command(shared_network.stack_name),
         cwd=_resolve_stack_dir(aws_root_path),
         timeout_seconds=DEPLOY_COMMAND_TIMEOUT_SECONDS,
     )
@@ -502,11 +911,142 @@ def destroy_shared_network_stack(
     return 0
 
 
+def _resolve_once(resolve: Callable[[], str]) -> Callable[[], str]:
+    """Return a thread-safe wrapper that calls ``resolve`` at most once."""
+    lock = threading.Lock()
+    resolved: list[str] = []
+
+    def resolve_cached() -> str:
+        with lock:
+            if not resolved:
+                resolved.append(resolve())
+            return resolved[0]
+
+    return resolve_cached
+
+
+def build_deploy_preflight(
+    *,
+    ec2_client: BaseClient,
+    cloudformation_client: BaseClient,
+    sts_client: BaseClient,
+    environment_key: str,
+    mode: AmiModeConfig,
+    needs_elastic_ip: bool,
+    stack_name: str | None = None,
+    instance_type: str | None = None,
+    spot_price: str | None = None,
+    zone_count: int = 1,
+    stack_dir: str | None = None,
+    environment_spec: object | None = None,
+) -> DeployPreflight:
+    """Assemble the read-only lookups a deploy needs before it mutates anything.
+
+    AMI list-only runs never deploy, so they only prefetch the image list.
+    List, pick and load are served from the local AMI catalog, whose refresh
+    also surfaces missing AMI read permissions.
+
+    Args:
+        ec2_client: Boto3 EC2 client shared by EC2 lookups.
+        cloudformation_client: Boto3 CloudFormation client for the stack lookup.
+        sts_client: Boto3 STS client resolving the account that keys local
+            caches; it is only called when a cached lookup runs.
+        environment_key: Canonical environment key.
+        mode: Parsed AMI mode flags.
+        needs_elastic_ip: Whether the access mode uses an Elastic IP.
+        stack_name: Workstation stack name for the Availability Zone lookup.
+        instance_type: Instance type to rank Availability Zones for; the
+            lookup is skipped when unset.
+        spot_price: Spot Fleet maximum price from the environment spec.
+        zone_count: Number of workstation subnets, one per Availability Zone.
+        stack_dir: Environment CDK app directory holding the init scripts.
+        environment_spec: Loaded ``ENVIRONMENT_SPEC``; when set together with
+            ``stack_dir`` and ``stack_name``, default-mode deploys look up a
+            golden AMI.
+
+    Returns:
+        Unstarted preflight stage.
+    """
+    list_only = mode.ami_list and not mode.ami_pick
+    expected_name = f"{environment_key}_{mode.ami_load_tag}"
+    account_id = _resolve_once(lambda: get_caller_account(sts_client))
+    return DeployPreflight(
+        list_ami_images=(
+            (
+                lambda: catalog_environment_images(
+                    ec2_client,
+                    environment_key,
+                    account_id=account_id(),
+                    refresh=mode.ami_refresh,
+                )
+            )
+            if mode.ami_list
+            else None
+        ),
+        resolve_loaded_ami=(
+            (
+                lambda: catalog_exact_image_id(
+                    ec2_client,
+                    expected_name,
+                    environment_key,
+                    account_id=account_id(),
+                    refresh=mode.ami_refresh,
+                )
+            )
+            if mode.ami_load_tag
+            else None
+        ),
+        check_shared_network=(
+            None
+            if list_only
+            else lambda: shared_network_stack_exists(
+                profile=None,
+                region=None,
+                cloudformation_client=cloudformation_client,
+            )
+        ),
+        find_elastic_ip=(
+            (lambda: find_eip_by_name(ec2_client, environment_key))
+            if needs_elastic_ip and not list_only
+            else None
+        ),
+        select_availability_zone=(
+            (
+                lambda: choose_workstation_availability_zones(
+                    ec2_client,
+                    cloudformation_client,
+                    account_id=account_id(),
+                    stack_name=str(stack_name),
+                    instance_type=str(instance_type),
+                    zone_count=zone_count,
+                    max_price=spot_price,
+                )
+            )
+            if stack_name and instance_type and not list_only
+            else None
+        ),
+        choose_golden_image=(
+            (
+                lambda: choose_deploy_golden_image(
+                    ec2_client,
+                    cloudformation_client,
+                    stack_dir=str(stack_dir),
+                    stack_name=str(stack_name),
+                    environment_spec=environment_spec,
+                )
+            )
+            if stack_dir and stack_name and environment_spec is not None and not mode.ami_load_tag and not mode.ami_list
+            else None
+        ),
+    )
+
+
 def run_deploy_lifecycle(
     inputs: DeployWorkflowInputs,
     env: Mapping[str, str] | None = None,
     input_func: Callable[[str], str] = input,
     out: TextIO = sys.stdout,
+    session: boto3.Session | None = None,
 ) -> int:
     """Run the shared deploy lifecycle orchestration flow.
 
@@ -515,10 +1055,12 @@ def run_deploy_lifecycle(
         env: Optional environment mapping for AMI controls and AWS defaults.
         input_func: Input provider for interactive AMI selection.
         out: Output stream for user-facing status lines.
+        session: Optional boto3 session reused for every AWS client.
 
     Returns:
         Zero status code when orchestration completes.
     """
+    started_at = time.monotonic()
     environment = env or os.environ
     mode: AmiModeConfig = read_ami_mode_from_env(environment)
     profile = _resolve_profile(inputs.profile, environment)
@@ -536,38 +1078,259 @@ def run_deploy_lifecycle(
     )
     public_ip_enabled = resolve_public_ip_enabled(env=environment, access_mode=access_mode)
     needs_elastic_ip = requires_elastic_ip(access_mode)
-
-    ec2_client = make_ec2_client(profile=profile, region=region)
-    selection = resolve_ami_selection(
+    deploy_engine = resolve_deploy_engine(cli_deploy_engine=inputs.deploy_engine, env=environment)
+    availability_zone_indexes = read_availability_zone_override(environment)
+    zone_count = int(environment_spec.availability_zone_count) if environment_spec is not None else 1
+    use_golden_image = _parse_optional_bool_env(environment.get("GOLDEN_AMI"), "GOLDEN_AMI") is not False
+    wait_for_bootstrap = (
+        _parse_optional_bool_env(environment.get("WAIT_FOR_BOOTSTRAP"), "WAIT_FOR_BOOTSTRAP") is True
+    )
+    bootstrap_timeout_seconds = read_bootstrap_wait_timeout(environment)
+    package_cache = read_package_cache_enabled(environment)
+    container_cache = read_container_cache_enabled(environment)
+    volume_warm = read_volume_warm_mode(environment)
+    if availability_zone_indexes is not None and environment_spec is not None:
+        if len(availability_zone_indexes) != zone_count:
+            raise RuntimeError(
+                f"AZ_INDEX lists {len(availability_zone_indexes)} Availability Zones but the environment "
+                f"uses {zone_count}. Give one index per subnet."
+            )
+
+    ec2_client = make_ec2_client(profile=profile, region=region, session=session)
+    cloudformation_client = make_cloudformation_client(profile=profile, region=region, session=session)
+    sts_client = make_sts_client(profile=profile, region=region, session=session)
+    check_pending_amis(ec2_client, environment_key=environment_key, out=out)
+    validate_mode_arguments(
+        ami_load_tag=mode.ami_load_tag,
+        ami_list=mode.ami_list,
+        ami_pick=mode.ami_pick,
+    )
+    preflight = build_deploy_preflight(
         ec2_client=ec2_client,
+        cloudformation_client=cloudformation_client,
+        sts_client=sts_client,
         environment_key=environment_key,
         mode=mode,
-        input_func=input_func,
-        out=out,
+        needs_elastic_ip=needs_elastic_ip,
+        stack_name=inputs.stack_name,
+        instance_type=(
+            str(environment_spec.instance_type)
+            if environment_spec is not None and availability_zone_indexes is None
+            else None
+        ),
+        spot_price=str(environment_spec.spot_price) if environment_spec is not None else None,
+        zone_count=zone_count,
+        stack_dir=inputs.stack_dir,
+        environment_spec=environment_spec if use_golden_image else None,
+    )
+    with preflight:
+        with trace_span("deploy.ami_selection", environment=environment_key):
+            # Reason: interactive AMI picking overlaps with the remaining lookups.
+            selection = resolve_ami_selection(
+                ec2_client=ec2_client,
+                environment_key=environment_key,
+                mode=mode,
+                input_func=input_func,
+                out=out,
+                check_permissions=preflight.check_ami_permissions,
+                list_images=preflight.ami_images,
+                resolve_image_id=lambda _expected_name: preflight.loaded_ami_id(),
+            )
+        if not selection.should_deploy:
+            return 0
+        with trace_span("deploy.preflight"):
+            preflight_result = preflight.result()
+    if preflight_result.availability_zone is not None:
+        availability_zone_indexes = preflight_result.availability_zone.indexes
+        out.write(format_availability_zone_selection(preflight_result.availability_zone))
+    selected_ami_id = selection.selected_ami_id
+    if preflight_result.golden_image is not None:
+        # Reason: a golden AMI deploys as a selected image, so user-data bootstrap is skipped.
+        selected_ami_id = preflight_result.golden_image.image_id
+        out.write(f"{preflight_result.golden_image.reason}\n")
+    if volume_warm is not None and selected_ami_id is None:
+        out.write("AMI_WARM: this deploy launches from the default AMI; not warming its root volume.\n")
+        volume_warm = None
+
+    network_decision = ensure_shared_network_stack(
+        stack_dir=inputs.stack_dir,
+        cloudformation_client=cloudformation_client,
+        exists=preflight_result.shared_network_exists,
+        features=build_shared_network_features(
+            package_cache=package_cache,
+            container_cache=container_cache,
+            profile=profile,
+            region=region,
+            session=session,
+        ),
     )
-    if not selection.should_deploy:
-        return 0
-
-    if not shared_network_stack_exists(profile=profile, region=region):
-        deploy_shared_network_stack(stack_dir=inputs.stack_dir)
     eip_info: Mapping[str, str] | None = None
     if needs_elastic_ip:
-        eip_info = find_or_create_eip(ec2_client=ec2_client, name=environment_key)
-    deploy_stack(
-        stack_dir=inputs.stack_dir,
-        stack_name=inputs.stack_name,
-        ami_id=selection.selected_ami_id,
+        eip_info = preflight_result.existing_eip
+        if eip_info is None:
+            with trace_span("deploy.elastic_ip"):
+                eip_info = create_eip(ec2_client, environment_key)
+    deploy_context = build_deploy_context(
+        ami_id=selected_ami_id,
         bootstrap_on_restored_ami=mode.ami_bootstrap,
         eip_allocation_id=eip_info["allocation_id"] if eip_info is not None else None,
         access_mode=access_mode,
         public_ip_enabled=public_ip_enabled,
+        availability_zone_indexes=availability_zone_indexes,
+        package_cache=package_cache,
+        container_cache=container_cache,
+        volume_preread=volume_warm == "preread",
     )
-    time.sleep(5)
-    run_post_deploy_check(
-        stack_dir=inputs.stack_dir,
-        stack_name=inputs.stack_name,
-        eip_allocation_id=eip_info["allocation_id"] if eip_info is not None else None,
-        eip_public_ip=eip_info["public_ip"] if eip_info is not None else None,
+    with trace_span("deploy.synth", stack_name=inputs.stack_name):
+        assembly_dir = synthesize_assembly(
+            stack_dir=inputs.stack_dir,
+            context=deploy_context,
+            environment_spec=environment_spec,
+        )
+    with trace_span("deploy.fingerprint", stack_name=inputs.stack_name):
+        decision = decide_stack_deploy(
+            cloudformation_client,
+            stack_name=inputs.stack_name,
+            template=load_synthesized_template(assembly_dir, inputs.stack_name),
+            force=inputs.force or is_truthy(environment.get("FORCE_DEPLOY", "")),
+        )
+    fast_restore_lease = None
+    if decision.should_deploy and volume_warm == "fsr":
+        with trace_span("deploy.fast_snapshot_restore", image_id=selected_ami_id):
+            fast_restore_lease = enable_fast_snapshot_restores(
+                ec2_client,
+                image_id=str(selected_ami_id),
+                zone_names=availability_zone_names(
+                    ec2_client,
+                    availability_zone_indexes or tuple(range(zone_count)),
+                ),
+                out=out,
+            )
+    try:
+        if decision.should_deploy:
+            artifact = None
+            if deploy_engine == "changeset":
+                artifact = load_stack_artifact(assembly_dir, inputs.stack_name)
+                if artifact.has_external_assets:
+                    # Reason: publishing file/image assets is left to the CDK CLI.
+                    out.write(f"{inputs.stack_name} has assets to publish; deploying with cdk deploy.\n")
+                    artifact = None
+            if artifact is not None:
+                with trace_span("deploy.change_set", stack_name=inputs.stack_name):
+                    change_set_result = deploy_stack_artifact(
+                        cloudformation_client,
+                        artifact,
+                        s3_client=make_s3_client(profile=profile, region=region, session=session),
+                        timeout_seconds=DEPLOY_COMMAND_TIMEOUT_SECONDS,
+                        out=out,
+                    )
+                out.write(format_resource_timings(change_set_result))
+            else:
+                with trace_span("deploy.cdk_deploy", stack_name=inputs.stack_name):
+                    deploy_stack(
+                        stack_dir=inputs.stack_dir,
+                        stack_name=inputs.stack_name,
+                        ami_id=selected_ami_id,
+                        bootstrap_on_restored_ami=mode.ami_bootstrap,
+                        eip_allocation_id=eip_info["allocation_id"] if eip_info is not None else None,
+                        access_mode=access_mode,
+                        public_ip_enabled=public_ip_enabled,
+                        app=str(assembly_dir),
+                        availability_zone_indexes=availability_zone_indexes,
+                    )
+            if decision.fingerprint is not None:
+                record_local_fingerprint(
+                    DEFAULT_FINGERPRINT_DIR,
+                    str(cloudformation_client.meta.region_name),
+                    inputs.stack_name,
+                    decision.fingerprint,
+                )
+        out.write(format_deploy_report([network_decision, decision]))
+        spot_fleet_logical_id = f"{environment_key.capitalize()}SpotFleet"
+        ssh_alias = f"{environment_key}-workstation"
+        if environment_spec is not None:
+            spot_fleet_logical_id = str(environment_spec.spot_fleet_logical_id)
+            ssh_alias = str(environment_spec.ssh_alias)
+        if not decision.should_deploy:
+            # Reason: a skipped deploy leaves a paused instance stopped; the readiness wait would time out.
+            paused = find_fleet_instance(
+                cloudformation_client,
+                ec2_client,
+                stack_name=inputs.stack_name,
+                spot_fleet_logical_id=spot_fleet_logical_id,
+                states=("stopping", "stopped"),
+            )
+            if paused is not None:
+                raise RuntimeError(
+                    f"{inputs.stack_name} is paused (instance {paused.instance_id} is {paused.state}) and "
+                    f"its template is unchanged. Resume it with 'make {environment_key} ACTION=RESUME' "
+                    "or the 'Resume paused workstation' menu action."
+                )
+        with trace_span("deploy.wait_for_ready", access_mode=access_mode):
+            readiness = wait_for_workstation_ready(
+                cloudformation_client,
+                ec2_client,
+                stack_name=inputs.stack_name,
+                spot_fleet_logical_id=spot_fleet_logical_id,
+                access_mode=access_mode,
+                eip_allocation_id=eip_info["allocation_id"] if eip_info is not None else None,
+                eip_public_ip=eip_info["public_ip"] if eip_info is not None else None,
+                ssm_client=(
+                    make_ssm_client(profile=profile, region=region, session=session)
+                    if access_mode == "ssm"
+                    else None
+                ),
+                out=out,
+            )
+    finally:
+        # Reason: fast snapshot restore is billed per snapshot and zone hour; the volume exists once ready.
+        if fast_restore_lease is not None:
+            disable_fast_snapshot_restores(ec2_client, fast_restore_lease, out=out)
+    if fast_restore_lease is not None:
+        report_root_volume_fast_restore(ec2_client, readiness.instance_id, out=out)
+    print_connection_guidance(
+        readiness,
         access_mode=access_mode,
+        region=str(ec2_client.meta.region_name),
+        profile=profile,
+        ssh_alias=ssh_alias,
+        out=out,
+    )
+    volume_preread = decision.should_deploy and volume_warm == "preread"
+    if wait_for_bootstrap:
+        # Reason: only a fresh deploy with user data runs the bootstrap and prints its summary.
+        if decision.should_deploy and (selected_ami_id is None or mode.ami_bootstrap):
+            with trace_span("deploy.wait_for_bootstrap", instance_id=readiness.instance_id):
+                bootstrap_report = wait_for_bootstrap_complete(
+                    ec2_client,
+                    readiness.instance_id,
+                    timeout_seconds=bootstrap_timeout_seconds,
+                    out=out,
+                )
+            print_bootstrap_report(
+                bootstrap_report,
+                timing_dir=DEFAULT_LIFECYCLE_TIMING_DIR,
+                region=str(ec2_client.meta.region_name),
+                stack_name=inputs.stack_name,
+                out=out,
+            )
+        elif not volume_preread:
+            out.write("WAIT_FOR_BOOTSTRAP: this deploy ran no user-data bootstrap; not waiting for it.\n")
+        if volume_preread:
+            with trace_span("deploy.wait_for_volume_preread", instance_id=readiness.instance_id):
+                wait_for_volume_preread(ec2_client, readiness.instance_id, out=out)
+    elif volume_preread:
+        out.write(
+            f"Root volume pre-read is running on {readiness.instance_id}; "
+            "deploy with WAIT_FOR_BOOTSTRAP=1 to wait until the volume is fully initialized.\n"
+        )
+    deploy_seconds = time.monotonic() - started_at
+    out.write(f"Deploy completed in {deploy_seconds:.0f}s.\n")
+    record_lifecycle_timing(
+        DEFAULT_LIFECYCLE_TIMING_DIR,
+        str(cloudformation_client.meta.region_name),
+        inputs.stack_name,
+        action="deploy",
+        seconds=deploy_seconds,
     )
     return 0
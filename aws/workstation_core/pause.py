@@ -0,0 +1,336 @@
+"""Pause and resume a workstation by stopping and starting its Spot instance."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+import json
+import logging
+from pathlib import Path
+import sys
+import time
+from typing import Any, Callable, Sequence, TextIO
+
+LOGGER = logging.getLogger(__name__)
+DEFAULT_LIFECYCLE_TIMING_DIR = Path.home() / ".config" / "env4ai" / "lifecycle-timings"
+INSTANCE_STATE_TIMEOUT_SECONDS = 10 * 60
+_FLEET_REQUEST_TAG = "aws:ec2spot:fleet-request-id"
+
+
+@dataclass(frozen=True, slots=True)
+class FleetInstance:
+    """A Spot Fleet instance in any non-terminated state.
+
+    Args:
+        instance_id: EC2 instance id.
+        state: EC2 instance state name (for example ``stopped``).
+    """
+
+    instance_id: str
+    state: str
+
+
+@dataclass(frozen=True, slots=True)
+class InstanceTransition:
+    """Result of stopping or starting the workstation instance.
+
+    Args:
+        instance_id: EC2 instance id that changed state.
+        elapsed_seconds: Time from the API call until the target state.
+    """
+
+    instance_id: str
+    elapsed_seconds: float
+
+
+@dataclass(frozen=True, slots=True)
+class LifecycleTimings:
+    """Most recent deploy and resume durations for one stack.
+
+    Args:
+        deploy_seconds: Seconds from deploy start until the workstation was ready.
+        resume_seconds: Seconds from resume start until the workstation was ready.
+    """
+
+    deploy_seconds: float | None = None
+    resume_seconds: float | None = None
+
+
+def find_fleet_instance(
+    cloudformation_client: Any,
+    ec2_client: Any,
+    *,
+    stack_name: str,
+    spot_fleet_logical_id: str,
+    states: Sequence[str],
+) -> FleetInstance | None:
+    """Return the newest stack fleet instance in one of ``states``.
+
+    Stopped instances are looked up by the fleet request tag instead of
+    ``DescribeSpotFleetInstances`` so paused workstations are always found.
+
+    Args:
+        cloudformation_client: Boto3 CloudFormation client.
+        ec2_client: Boto3 EC2 client.
+        stack_name: Workstation CloudFormation stack name.
+        spot_fleet_logical_id: Spot Fleet logical id in the stack.
+        states: EC2 instance state names to match.
+
+    Returns:
+        Newest matching instance, or ``None`` when there is none.
+
+    Raises:
+        RuntimeError: If the fleet or its instances cannot be described.
+    """
+    try:
+        response = cloudformation_client.describe_stack_resource(
+            StackName=stack_name,
+            LogicalResourceId=spot_fleet_logical_id,
+        )
+    except Exception as err:
+        raise RuntimeError(
+            f"Failed to resolve Spot Fleet resource '{spot_fleet_logical_id}' in stack '{stack_name}'."
+        ) from err
+    spot_fleet_request_id = str(response.get("StackResourceDetail", {}).get("PhysicalResourceId", "")).strip()
+    if not spot_fleet_request_id:
+        return None
+
+    try:
+        described = ec2_client.describe_instances(
+            Filters=[
+                {"Name": f"tag:{_FLEET_REQUEST_TAG}", "Values": [spot_fleet_request_id]},
+                {"Name": "instance-state-name", "Values": list(states)},
+            ]
+        )
+    except Exception as err:
+        raise RuntimeError(f"Failed to describe instances of Spot Fleet request '{spot_fleet_request_id}'.") from err
+    instances = [
+        instance
+        for reservation in described.get("Reservations", [])
+        for instance in reservation.get("Instances", [])
+        if str(instance.get("InstanceId", "")).strip()
+    ]
+    if not instances:
+        return None
+
+    def launch_time(instance: dict[str, Any]) -> datetime:
+        value = instance.get("LaunchTime")
+        return value if isinstance(value, datetime) else datetime.min
+
+    newest = max(instances, key=launch_time)
+    return FleetInstance(
+        instance_id=str(newest["InstanceId"]).strip(),
+        state=str(newest.get("State", {}).get("Name", "")).strip(),
+    )
+
+
+def wait_for_instance_state(
+    ec2_client: Any,
+    *,
+    instance_id: str,
+    target_state: str,
+    timeout_seconds: float = INSTANCE_STATE_TIMEOUT_SECONDS,
+    poll_interval_seconds: float = 5.0,
+    monotonic: Callable[[], float] = time.monotonic,
+    sleeper: Callable[[float], None] = time.sleep,
+) -> None:
+    """Poll one instance until it reaches ``target_state``.
+
+    Raises:
+        RuntimeError: If the instance is terminated or the deadline passes.
+    """
+    deadline = monotonic() + timeout_seconds
+    while True:
+        try:
+            described = ec2_client.describe_instances(InstanceIds=[instance_id])
+        except Exception as err:
+            raise RuntimeError(f"Failed to describe instance '{instance_id}'.") from err
+        states = [
+            str(instance.get("State", {}).get("Name", "")).strip()
+            for reservation in described.get("Reservations", [])
+            for instance in reservation.get("Instances", [])
+        ]
+        state = states[0] if states else "unknown"
+        if state == target_state:
+            return
+        if state in {"shutting-down", "terminated"}:
+            raise RuntimeError(
+                f"Instance '{instance_id}' was {state} while waiting for '{target_state}'. "
+                "Spot may have reclaimed it; deploy the workstation again."
+            )
+        if monotonic() >= deadline:
+            raise RuntimeError(
+                f"Instance '{instance_id}' did not reach '{target_state}' after {timeout_seconds:.0f} seconds "
+                f"(last state: {state})."
+            )
+        sleeper(poll_interval_seconds)
+
+
+def pause_workstation(
+    cloudformation_client: Any,
+    ec2_client: Any,
+    *,
+    stack_name: str,
+    spot_fleet_logical_id: str,
+    timeout_seconds: float = INSTANCE_STATE_TIMEOUT_SECONDS,
+    monotonic: Callable[[], float] = time.monotonic,
+    sleeper: Callable[[float], None] = time.sleep,
+    out: TextIO = sys.stdout,
+) -> InstanceTransition:
+    """Stop the running workstation instance and wait until it is stopped.
+
+    The EBS root volume, Elastic IP allocation and stack are kept, so only
+    storage is billed while paused.
+
+    Raises:
+        RuntimeError: If no running instance exists or the stop fails.
+    """
+    instance = find_fleet_instance(
+        cloudformation_client,
+        ec2_client,
+        stack_name=stack_name,
+        spot_fleet_logical_id=spot_fleet_logical_id,
+        states=("pending", "running", "stopping", "stopped"),
+    )
+    if instance is None:
+        raise RuntimeError(f"No workstation instance found for stack '{stack_name}'. Deploy it first.")
+    if instance.state == "stopped":
+        raise RuntimeError(f"Workstation instance '{instance.instance_id}' is already paused.")
+
+    started_at = monotonic()
+    if instance.state != "stopping":
+        out.write(f"Stopping {instance.instance_id}...\n")
+        try:
+            ec2_client.stop_instances(InstanceIds=[instance.instance_id])
+        except Exception as err:
+            raise RuntimeError(
+                f"Failed to stop instance '{instance.instance_id}'. Spot Fleets must be of type 'maintain' "
+                "with the 'stop' interruption behavior; redeploy the stack if it predates pause support."
+            ) from err
+    wait_for_instance_state(
+        ec2_client,
+        instance_id=instance.instance_id,
+        target_state="stopped",
+        timeout_seconds=timeout_seconds,
+        monotonic=monotonic,
+        sleeper=sleeper,
+    )
+    return InstanceTransition(instance_id=instance.instance_id, elapsed_seconds=monotonic() - started_at)
+
+
+def start_paused_workstation(
+    cloudformation_client: Any,
+    ec2_client: Any,
+    *,
+    stack_name: str,
+    spot_fleet_logical_id: str,
+    timeout_seconds: float = INSTANCE_STATE_TIMEOUT_SECONDS,
+    monotonic: Callable[[], float] = time.monotonic,
+    sleeper: Callable[[float], None] = time.sleep,
+    out: TextIO = sys.stdout,
+) -> str:
+    """Start the stopped workstation instance and return its id.
+
+    An instance that is still stopping is waited for first, because EC2
+    rejects ``StartInstances`` until the stop completes.  Reachability and
+    Elastic IP association are left to the readiness waiter.
+
+    Raises:
+        RuntimeError: If no paused instance exists or the start fails.
+    """
+    instance = find_fleet_instance(
+        cloudformation_client,
+        ec2_client,
+        stack_name=stack_name,
+        spot_fleet_logical_id=spot_fleet_logical_id,
+        states=("stopping", "stopped"),
+    )
+    if instance is None:
+        raise RuntimeError(f"No paused workstation instance found for stack '{stack_name}'.")
+    if instance.state == "stopping":
+        out.write(f"Waiting for {instance.instance_id} to finish stopping...\n")
+        wait_for_instance_state(
+            ec2_client,
+            instance_id=instance.instance_id,
+            target_state="stopped",
+            timeout_seconds=timeout_seconds,
+            monotonic=monotonic,
+            sleeper=sleeper,
+        )
+
+    out.write(f"Starting {instance.instance_id}...\n")
+    try:
+        ec2_client.start_instances(InstanceIds=[instance.instance_id])
+    except Exception as err:
+        error_code = str(getattr(err, "response", {}).get("Error", {}).get("Code", ""))
+        if error_code == "InsufficientInstanceCapacity":
+            raise RuntimeError(
+                f"AWS has no Spot capacity to resume '{instance.instance_id}' right now. "
+                "Retry later, or destroy and redeploy to launch in another zone or instance type."
+            ) from err
+        raise RuntimeError(f"Failed to start instance '{instance.instance_id}'.") from err
+    return instance.instance_id
+
+
+def _timing_path(timing_dir: Path, region: str, stack_name: str) -> Path:
+    """Return the timing record path for one stack."""
+    return timing_dir / region / f"{stack_name}.json"
+
+
+def load_lifecycle_timings(timing_dir: Path, region: str, stack_name: str) -> LifecycleTimings:
+    """Load recorded deploy/resume durations, ignoring unreadable records."""
+    path = _timing_path(timing_dir, region, stack_name)
+    try:
+        record = json.loads(path.read_text(encoding="utf-8"))
+        deploy_seconds = record.get("deploy_seconds")
+        resume_seconds = record.get("resume_seconds")
+        return LifecycleTimings(
+            deploy_seconds=float(deploy_seconds) if deploy_seconds is not None else None,
+            resume_seconds=float(resume_seconds) if resume_seconds is not None else None,
+        )
+    except (OSError, ValueError, TypeError, AttributeError):
+        return LifecycleTimings()
+
+
+def record_lifecycle_timing(
+    timing_dir: Path,
+    region: str,
+    stack_name: str,
+    *,
+    action: str,
+    seconds: float,
+) -> None:
+    """Persist the latest ``deploy`` or ``resume`` duration (best effort)."""
+    if action not in {"deploy", "resume"}:
+        raise ValueError(f"Unsupported lifecycle timing action: {action}")
+    path = _timing_path(timing_dir, region, stack_name)
+    try:
+        record = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        record = {}
+    if not isinstance(record, dict):
+        record = {}
+    record.update(
+        {
+            "stack_name": stack_name,
+            f"{action}_seconds": round(seconds, 1),
+            f"{action}_recorded_at": datetime.now(timezone.utc).isoformat(),
+        }
+    )
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(record, indent=2) + "\n", encoding="utf-8")
+    except OSError:
+        LOGGER.warning("Unable to record lifecycle timing path=%s", path, exc_info=True)
+
+
+def format_lifecycle_timings(timings: LifecycleTimings) -> str:
+    """Render recorded durations as one status line, or ``""`` when none exist."""
+    parts = []
+    if timings.deploy_seconds is not None:
+        parts.append(f"deploy {timings.deploy_seconds:.0f}s")
+    if timings.resume_seconds is not None:
+        parts.append(f"resume {timings.resume_seconds:.0f}s")
+    if not parts:
+        return ""
+    return f"Last ready times: {', '.join(parts)}"
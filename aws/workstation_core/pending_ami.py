@@ -0,0 +1,223 @@
+"""Fast-stop AMI helpers: snapshot start checks and the pending-AMI ledger."""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+import json
+import logging
+from pathlib import Path
+import sys
+import time
+from typing import Any, Callable, TextIO
+
+LOGGER = logging.getLogger(__name__)
+DEFAULT_PENDING_AMI_DIR = Path.home() / ".config" / "env4ai" / "pending-amis"
+SNAPSHOT_START_TIMEOUT_SECONDS = 10 * 60
+_FAILED_IMAGE_STATES = frozenset({"failed", "deregistered", "error"})
+
+
+@dataclass(frozen=True, slots=True)
+class PendingAmi:
+    """AMI saved by a fast stop whose snapshots were still completing.
+
+    Args:
+        image_id: AMI id returned by ``CreateImage``.
+        image_name: AMI name (``<environment>_<tag>``).
+        environment_key: Canonical environment key.
+        snapshot_ids: EBS snapshots backing the image.
+        recorded_at: UTC timestamp of the stop.
+    """
+
+    image_id: str
+    image_name: str
+    environment_key: str
+    snapshot_ids: tuple[str, ...]
+    recorded_at: str
+
+
+def wait_for_image_snapshots(
+    ec2_client: Any,
+    *,
+    image_id: str,
+    timeout_seconds: int = SNAPSHOT_START_TIMEOUT_SECONDS,
+    poll_interval_seconds: int = 5,
+    monotonic: Callable[[], float] = time.monotonic,
+    sleeper: Callable[[float], None] = time.sleep,
+) -> tuple[str, ...]:
+    """Wait until every EBS snapshot of a pending AMI has been initiated.
+
+    EBS snapshots capture the volume at the moment they start, so once every
+    block device mapping has a snapshot the instance can be terminated while
+    the image finishes in the background.
+
+    Args:
+        ec2_client: Boto3 EC2 client.
+        image_id: AMI id returned by ``CreateImage``.
+        timeout_seconds: Maximum time to wait for the snapshots to appear.
+        poll_interval_seconds: Delay between ``DescribeImages`` calls.
+        monotonic: Monotonic clock for testability.
+        sleeper: Sleep function for testability.
+
+    Returns:
+        Snapshot ids backing the image.
+
+    Raises:
+        RuntimeError: If the image fails, a snapshot errors, or the snapshots
+            do not start before the timeout.
+    """
+    deadline = monotonic() + timeout_seconds
+    while monotonic() <= deadline:
+        try:
+            response = ec2_client.describe_images(ImageIds=[image_id])
+        except Exception as err:
+            raise RuntimeError(f"Failed while waiting for AMI '{image_id}' snapshots.") from err
+
+        images = response.get("Images", [])
+        if not images:
+            raise RuntimeError(f"AMI '{image_id}' was not found while waiting for its snapshots.")
+        image = images[0]
+        state = str(image.get("State", "")).strip()
+        if state in _FAILED_IMAGE_STATES:
+            raise RuntimeError(f"AMI '{image_id}' entered terminal state '{state}'.")
+
+        ebs_mappings = [mapping["Ebs"] for mapping in image.get("BlockDeviceMappings", []) if "Ebs" in mapping]
+        snapshot_ids = tuple(str(ebs.get("SnapshotId", "")).strip() for ebs in ebs_mappings)
+        if state == "available":
+            return snapshot_ids
+        if snapshot_ids and all(snapshot_ids) and _snapshots_started(ec2_client, image_id, snapshot_ids):
+            return snapshot_ids
+
+        sleeper(poll_interval_seconds)
+
+    raise RuntimeError(
+        f"Timed out waiting for AMI '{image_id}' snapshots to start after {timeout_seconds} seconds."
+    )
+
+
+def _snapshots_started(ec2_client: Any, image_id: str, snapshot_ids: tuple[str, ...]) -> bool:
+    """Return whether every snapshot exists and is pending or completed."""
+    try:
+        response = ec2_client.describe_snapshots(SnapshotIds=list(snapshot_ids))
+    except Exception as err:
+        error_code = str(getattr(err, "response", {}).get("Error", {}).get("Code", ""))
+        if error_code != "InvalidSnapshot.NotFound":
+            raise RuntimeError(f"Failed to describe the snapshots of AMI '{image_id}'.") from err
+        # Reason: snapshot ids can surface in DescribeImages slightly before DescribeSnapshots.
+        LOGGER.debug("DescribeSnapshots not ready image_id=%s", image_id)
+        return False
+    states = {
+        str(snapshot.get("SnapshotId", "")): str(snapshot.get("State", ""))
+        for snapshot in response.get("Snapshots", [])
+    }
+    if "error" in states.values():
+        raise RuntimeError(f"A snapshot of AMI '{image_id}' entered state 'error'.")
+    return all(states.get(snapshot_id) in {"pending", "completed"} for snapshot_id in snapshot_ids)
+
+
+def _ledger_region_dir(ledger_dir: Path, region: str) -> Path:
+    """Return the ledger directory for one region."""
+    return ledger_dir / region
+
+
+def record_pending_ami(
+    ledger_dir: Path,
+    region: str,
+    *,
+    image_id: str,
+    image_name: str,
+    environment_key: str,
+    snapshot_ids: tuple[str, ...] = (),
+) -> PendingAmi:
+    """Record a pending AMI in the local ledger (best effort)."""
+    entry = PendingAmi(
+        image_id=image_id,
+        image_name=image_name,
+        environment_key=environment_key,
+        snapshot_ids=tuple(snapshot_ids),
+        recorded_at=datetime.now(timezone.utc).isoformat(),
+    )
+    path = _ledger_region_dir(ledger_dir, region) / f"{image_id}.json"
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(asdict(entry), indent=2) + "\n", encoding="utf-8")
+    except OSError:
+        LOGGER.warning("Unable to record pending AMI path=%s", path, exc_info=True)
+    return entry
+
+
+def load_pending_amis(
+    ledger_dir: Path,
+    region: str,
+    *,
+    environment_key: str | None = None,
+) -> list[PendingAmi]:
+    """Return ledger entries for a region, optionally filtered by environment."""
+    region_dir = _ledger_region_dir(ledger_dir, region)
+    if not region_dir.is_dir():
+        return []
+    entries: list[PendingAmi] = []
+    for path in sorted(region_dir.glob("*.json")):
+        try:
+            record = json.loads(path.read_text(encoding="utf-8"))
+            entry = PendingAmi(
+                image_id=str(record["image_id"]),
+                image_name=str(record["image_name"]),
+                environment_key=str(record["environment_key"]),
+                snapshot_ids=tuple(record.get("snapshot_ids", ())),
+                recorded_at=str(record.get("recorded_at", "")),
+            )
+        except (OSError, ValueError, KeyError):
+            LOGGER.warning("Ignoring unreadable pending AMI record path=%s", path)
+            continue
+        if environment_key is None or entry.environment_key == environment_key:
+            entries.append(entry)
+    return entries
+
+
+def check_pending_amis(
+    ec2_client: Any,
+    *,
+    environment_key: str | None = None,
+    ledger_dir: Path = DEFAULT_PENDING_AMI_DIR,
+    out: TextIO = sys.stdout,
+) -> list[PendingAmi]:
+    """Report the final state of fast-stop AMIs and drop settled ledger entries.
+
+    Args:
+        ec2_client: Boto3 EC2 client for the ledger region.
+        environment_key: Optional environment filter.
+        ledger_dir: Root directory of the pending-AMI ledger.
+        out: Output stream for state lines.
+
+    Returns:
+        Entries whose AMI is still pending.
+    """
+    region = str(ec2_client.meta.region_name)
+    entries = load_pending_amis(ledger_dir, region, environment_key=environment_key)
+    if not entries:
+        return []
+    try:
+        # Reason: an image-id filter, unlike ImageIds, does not fail on deregistered images.
+        response = ec2_client.describe_images(
+            Owners=["self"],
+            Filters=[{"Name": "image-id", "Values": [entry.image_id for entry in entries]}],
+        )
+    except Exception:
+        LOGGER.warning("Unable to check pending AMIs region=%s", region, exc_info=True)
+        return entries
+    states = {str(image.get("ImageId", "")): str(image.get("State", "")) for image in response.get("Images", [])}
+
+    still_pending: list[PendingAmi] = []
+    for entry in entries:
+        state = states.get(entry.image_id, "deregistered")
+        if state == "pending":
+            out.write(f"AMI {entry.image_name} ({entry.image_id}) from a fast stop is still pending.\n")
+            still_pending.append(entry)
+            continue
+        if state == "available":
+            out.write(f"AMI {entry.image_name} ({entry.image_id}) from a fast stop is now available.\n")
+        else:
+            out.write(f"AMI {entry.image_name} ({entry.image_id}) from a fast stop ended in state '{state}'.\n")
+        (_ledger_region_dir(ledger_dir, region) / f"{entry.image_id}.json").unlink(missing_ok=True)
+    return still_pending
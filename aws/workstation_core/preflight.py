@@ -0,0 +1,194 @@
+"""Concurrent read-only lookups that run before a workstation deploy mutates anything."""
+
+from __future__ import annotations
+
+from concurrent.futures import Future, ThreadPoolExecutor
+import contextvars
+from dataclasses import dataclass
+import logging
+from typing import Any, Callable, Mapping
+
+from workstation_core.az_selection import AvailabilityZoneSelection
+from workstation_core.golden_ami import GoldenImageChoice
+from workstation_core.tracing import trace_span
+
+LOGGER = logging.getLogger(__name__)
+DEFAULT_PREFLIGHT_WORKERS = 4
+
+# Reason: errors are reported in the order the serial deploy flow used to hit them.
+_LOOKUP_ORDER: tuple[tuple[str, str], ...] = (
+    ("ami_permissions", "AMI permission preflight"),
+    ("ami_images", "AMI lookup"),
+    ("shared_network", "shared network lookup"),
+    ("elastic_ip", "Elastic IP lookup"),
+    ("availability_zone", "Availability Zone lookup"),
+    ("golden_image", "golden AMI lookup"),
+)
+
+
+@dataclass(frozen=True, slots=True)
+class DeployPreflightResult:
+    """Gathered results of the deploy preflight lookups.
+
+    Args:
+        shared_network_exists: Whether the shared network stack already exists.
+        existing_eip: Elastic IP tagged for the environment, when one was found.
+        ami_images: Environment AMIs listed for list/pick modes, when requested.
+        loaded_ami_id: Image id resolved for ``AMI_LOAD``, when requested.
+        availability_zone: Workstation subnet zones, when requested.
+        golden_image: Golden AMI decision for default-mode deploys, when requested.
+    """
+
+    shared_network_exists: bool | None
+    existing_eip: Mapping[str, str] | None
+    ami_images: tuple[dict[str, str], ...] | None
+    loaded_ami_id: str | None
+    availability_zone: AvailabilityZoneSelection | None = None
+    golden_image: GoldenImageChoice | None = None
+
+
+class DeployPreflight:
+    """Run independent deploy lookups concurrently in a bounded thread pool.
+
+    Lookups start as soon as ``start`` is called so they overlap with work the
+    caller does on the main thread, such as interactive AMI picking.  Callers
+    may block on single lookups (``ami_images``) or gather everything with
+    ``result``.  Boto3 clients used by lookups must be created before
+    ``start`` because client construction is not thread-safe.
+    """
+
+    def __init__(
+        self,
+        *,
+        check_ami_permissions: Callable[[], None] | None = None,
+        list_ami_images: Callable[[], list[dict[str, str]]] | None = None,
+        resolve_loaded_ami: Callable[[], str] | None = None,
+        check_shared_network: Callable[[], bool] | None = None,
+        find_elastic_ip: Callable[[], Mapping[str, str] | None] | None = None,
+        select_availability_zone: Callable[[], AvailabilityZoneSelection] | None = None,
+        choose_golden_image: Callable[[], GoldenImageChoice] | None = None,
+        max_workers: int = DEFAULT_PREFLIGHT_WORKERS,
+    ) -> None:
+        """Create a preflight stage.
+
+        Args:
+            check_ami_permissions: Raises when AMI read permissions are missing.
+            list_ami_images: Lists environment AMIs for list/pick modes.
+            resolve_loaded_ami: Resolves the ``AMI_LOAD`` image id.
+            check_shared_network: Returns whether the shared network stack exists.
+            find_elastic_ip: Returns the environment Elastic IP, if any.
+            select_availability_zone: Chooses the workstation subnet zones.
+            choose_golden_image: Decides whether to deploy from a golden AMI.
+            max_workers: Thread pool size bound.
+
+        Raises:
+            ValueError: If both AMI list and AMI load lookups are supplied.
+        """
+        if list_ami_images is not None and resolve_loaded_ami is not None:
+            raise ValueError("DeployPreflight accepts either list_ami_images or resolve_loaded_ami, not both.")
+        self._lookups: dict[str, Callable[[], Any]] = {}
+        for key, lookup in (
+            ("ami_permissions", check_ami_permissions),
+            ("ami_images", list_ami_images or resolve_loaded_ami),
+            ("shared_network", check_shared_network),
+            ("elastic_ip", find_elastic_ip),
+            ("availability_zone", select_availability_zone),
+            ("golden_image", choose_golden_image),
+        ):
+            if lookup is not None:
+                self._lookups[key] = lookup
+        self._ami_lookup_is_list = list_ami_images is not None
+        self._max_workers = max(1, min(max_workers, len(self._lookups) or 1))
+        self._executor: ThreadPoolExecutor | None = None
+        self._futures: dict[str, Future[Any]] = {}
+
+    def start(self) -> DeployPreflight:
+        """Submit every lookup to the thread pool and return ``self``."""
+        if self._executor is not None:
+            return self
+        self._executor = ThreadPoolExecutor(
+            max_workers=self._max_workers,
+            thread_name_prefix="env4ai-preflight",
+        )
+        for key, lookup in self._lookups.items():
+            # Reason: copy the caller's context so lookup spans nest under the active span.
+            context = contextvars.copy_context()
+            self._futures[key] = self._executor.submit(context.run, self._run_lookup, key, lookup)
+        return self
+
+    @staticmethod
+    def _run_lookup(key: str, lookup: Callable[[], Any]) -> Any:
+        """Run one lookup inside its own span."""
+        with trace_span(f"preflight.{key}"):
+            return lookup()
+
+    def close(self) -> None:
+        """Stop the pool without waiting; pending lookups are cancelled."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def __enter__(self) -> DeployPreflight:
+        return self.start()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _wait(self, key: str) -> Any:
+        """Block for one lookup result, re-raising its error unchanged."""
+        self.start()
+        future = self._futures.get(key)
+        if future is None:
+            raise RuntimeError(f"Preflight lookup '{key}' was not requested.")
+        return future.result()
+
+    def check_ami_permissions(self) -> None:
+        """Wait for the AMI permission check, re-raising its error."""
+        if "ami_permissions" in self._futures:
+            self._wait("ami_permissions")
+
+    def ami_images(self) -> list[dict[str, str]]:
+        """Wait for the AMI listing used by list/pick modes."""
+        return list(self._wait("ami_images"))
+
+    def loaded_ami_id(self) -> str:
+        """Wait for the ``AMI_LOAD`` image id resolution."""
+        return str(self._wait("ami_images"))
+
+    def result(self) -> DeployPreflightResult:
+        """Gather every lookup and return one typed result.
+
+        Returns:
+            Combined preflight result.
+
+        Raises:
+            RuntimeError: The single lookup error unchanged, or one error listing
+                every failed lookup in deploy order.
+        """
+        self.start()
+        values: dict[str, Any] = {}
+        errors: list[tuple[str, BaseException]] = []
+        for key, label in _LOOKUP_ORDER:
+            future = self._futures.get(key)
+            if future is None:
+                continue
+            try:
+                values[key] = future.result()
+            except Exception as err:
+                LOGGER.debug("Deploy preflight lookup failed key=%s error=%s", key, err)
+                errors.append((label, err))
+
+        if len(errors) == 1:
+            raise errors[0][1]
+        if errors:
+            details = "\n".join(f"  {index}. {label}: {err}" for index, (label, err) in enumerate(errors, start=1))
+            raise RuntimeError(f"Deploy preflight failed:\n{details}") from errors[0][1]
+
+        ami_value = values.get("ami_images")
+        return DeployPreflightResult(
+            shared_network_exists=values.get("shared_network"),
+            existing_eip=values.get("elastic_ip"),
+            ami_images=tuple(ami_value) if self._ami_lookup_is_list and ami_value is not None else None,
+            loaded_ami_id=str(ami_value) if not self._ami_lookup_is_list and ami_value is not None else None,
+            availability_zone=values.get("availability_zone"),
+            golden_image=values.get("golden_image"),
+        )
@@ -0,0 +1,436 @@
+"""Adaptive post-deploy readiness waiter for Spot Fleet workstations."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+import logging
+import random
+import sys
+import time
+from typing import Any, Callable, TextIO
+
+from botocore.exceptions import BotoCoreError, ClientError, NoCredentialsError
+
+from workstation_core.elastic_ip import associate_eip_with_instance
+from workstation_core.spot_fulfilment import (
+    CAPACITY_FAILURE_GRACE_SECONDS,
+    SpotFleetFailure,
+    SpotFleetFulfilmentMonitor,
+)
+from workstation_core.tracing import trace_span
+
+LOGGER = logging.getLogger(__name__)
+READINESS_TIMEOUT_SECONDS = 15 * 60
+INITIAL_POLL_DELAY_SECONDS = 1.0
+MAX_POLL_DELAY_SECONDS = 15.0
+_VALID_ACCESS_MODES = frozenset({"ssh", "ssm", "both"})
+# Reason: these never clear by themselves, so waiting out the deadline only hides them.
+_FATAL_ERROR_CODES = frozenset(
+    {
+        "AccessDenied",
+        "AccessDeniedException",
+        "AuthFailure",
+        "ExpiredToken",
+        "ExpiredTokenException",
+        "InvalidClientTokenId",
+        "RequestExpired",
+        "SignatureDoesNotMatch",
+        "UnauthorizedOperation",
+        "UnauthorizedException",
+        "UnrecognizedClientException",
+    }
+)
+
+
+@dataclass(frozen=True, slots=True)
+class WorkstationReadiness:
+    """Reachability details for a workstation that finished launching.
+
+    Args:
+        instance_id: Running EC2 instance id.
+        public_ip: Address to connect to (Elastic IP when associated), if any.
+        elastic_ip_associated: Whether the configured Elastic IP is now attached.
+        ssm_online: Whether Systems Manager reports the instance as ``Online``.
+        elapsed_seconds: Time spent waiting for readiness.
+    """
+
+    instance_id: str
+    public_ip: str | None
+    elastic_ip_associated: bool
+    ssm_online: bool
+    elapsed_seconds: float
+
+
+@dataclass(frozen=True, slots=True)
+class _InstanceObservation:
+    """One poll's view of the newest fleet instance."""
+
+    instance_id: str | None
+    state: str
+    public_ip: str | None
+
+
+def compute_backoff_delay(
+    attempt: int,
+    *,
+    initial_delay_seconds: float = INITIAL_POLL_DELAY_SECONDS,
+    max_delay_seconds: float = MAX_POLL_DELAY_SECONDS,
+    rng: Callable[[], float] = random.random,
+) -> float:
+    """Return an exponential backoff delay with equal jitter.
+
+    Args:
+        attempt: Zero-based poll attempt number.
+        initial_delay_seconds: Delay ceiling for the first attempt.
+        max_delay_seconds: Upper bound for any delay.
+        rng: Random source returning values in ``[0, 1)``.
+
+    Returns:
+        Delay in seconds between half and all of the capped exponential delay.
+    """
+    capped = min(max_delay_seconds, initial_delay_seconds * (2 ** max(attempt, 0)))
+    return capped / 2 + rng() * capped / 2
+
+
+def _is_transient_lookup_error(err: ClientError | BotoCoreError) -> bool:
+    """Return whether a lookup error may clear while the stack finishes launching.
+
+    Authorization, credential and request-validation errors are permanent.
+    CloudFormation reports a resource it has not created yet as a
+    ``ValidationError`` saying it does not exist, so that one is transient.
+    """
+    if isinstance(err, NoCredentialsError):
+        return False
+    if not isinstance(err, ClientError):
+        return True
+    error = err.response.get("Error", {})
+    code = str(error.get("Code", "")).strip()
+    if code == "ValidationError":
+        return "does not exist" in str(error.get("Message", ""))
+    return code not in _FATAL_ERROR_CODES and not code.startswith("InvalidParameter")
+
+
+def _resolve_spot_fleet_request_id(
+    cloudformation_client: Any,
+    *,
+    stack_name: str,
+    spot_fleet_logical_id: str,
+) -> str | None:
+    """Return the fleet request id, or ``None`` while CloudFormation has none yet."""
+    response = cloudformation_client.describe_stack_resource(
+        StackName=stack_name,
+        LogicalResourceId=spot_fleet_logical_id,
+    )
+    physical_id = str(
+        response.get("StackResourceDetail", {}).get("PhysicalResourceId", "")
+    ).strip()
+    return physical_id or None
+
+
+def _observe_newest_instance(ec2_client: Any, spot_fleet_request_id: str) -> _InstanceObservation:
+    """Describe the newest active fleet instance."""
+    fleet_instances = ec2_client.describe_spot_fleet_instances(
+        SpotFleetRequestId=spot_fleet_request_id
+    )
+    instance_ids = [
+        str(item.get("InstanceId", "")).strip()
+        for item in fleet_instances.get("ActiveInstances", [])
+        if str(item.get("InstanceId", "")).strip()
+    ]
+    if not instance_ids:
+        return _InstanceObservation(instance_id=None, state="awaiting fulfilment", public_ip=None)
+
+    described = ec2_client.describe_instances(InstanceIds=instance_ids)
+    instances = [
+        instance
+        for reservation in described.get("Reservations", [])
+        for instance in reservation.get("Instances", [])
+    ]
+    if not instances:
+        return _InstanceObservation(instance_id=None, state="awaiting instance record", public_ip=None)
+
+    def launch_time(instance: dict[str, Any]) -> datetime:
+        value = instance.get("LaunchTime")
+        return value if isinstance(value, datetime) else datetime.min
+
+    newest = max(instances, key=launch_time)
+    public_ip = str(newest.get("PublicIpAddress", "")).strip()
+    return _InstanceObservation(
+        instance_id=str(newest.get("InstanceId", "")).strip() or None,
+        state=str(newest.get("State", {}).get("Name", "unknown")).strip() or "unknown",
+        public_ip=public_ip or None,
+    )
+
+
+def _is_ssm_online(ssm_client: Any, instance_id: str) -> bool:
+    """Return whether Systems Manager lists the instance as ``Online``."""
+    response = ssm_client.describe_instance_information(
+        Filters=[{"Key": "InstanceIds", "Values": [instance_id]}]
+    )
+    return any(
+        str(item.get("PingStatus", "")).strip() == "Online"
+        for item in response.get("InstanceInformationList", [])
+    )
+
+
+def wait_for_workstation_ready(
+    cloudformation_client: Any,
+    ec2_client: Any,
+    *,
+    stack_name: str,
+    spot_fleet_logical_id: str,
+    access_mode: str,
+    eip_allocation_id: str | None = None,
+    eip_public_ip: str | None = None,
+    ssm_client: Any | None = None,
+    timeout_seconds: float = READINESS_TIMEOUT_SECONDS,
+    initial_delay_seconds: float = INITIAL_POLL_DELAY_SECONDS,
+    max_delay_seconds: float = MAX_POLL_DELAY_SECONDS,
+    capacity_grace_seconds: float = CAPACITY_FAILURE_GRACE_SECONDS,
+    monotonic: Callable[[], float] = time.monotonic,
+    sleeper: Callable[[float], None] = time.sleep,
+    rng: Callable[[], float] = random.random,
+    out: TextIO = sys.stdout,
+) -> WorkstationReadiness:
+    """Poll the stack's Spot Fleet until the workstation is reachable.
+
+    The Elastic IP is associated as soon as the instance reports ``running``.
+    SSH-capable access modes are ready once a public address exists; ``ssm``
+    mode is ready once Systems Manager reports the instance online (or once it
+    is running when no SSM client is supplied).  Lookup errors and missing
+    resources are treated as "not ready yet" until the deadline passes, but
+    authorization, credential and validation errors are raised at once.
+    While the fleet has no instance its request history is checked, and the
+    wait aborts early on fulfilment errors that will not clear by themselves.
+
+    Args:
+        cloudformation_client: Boto3 CloudFormation client.
+        ec2_client: Boto3 EC2 client.
+        stack_name: Workstation CloudFormation stack name.
+        spot_fleet_logical_id: Spot Fleet logical id in the stack.
+        access_mode: Workstation access mode (``ssh``, ``ssm``, or ``both``).
+        eip_allocation_id: Optional Elastic IP allocation to associate.
+        eip_public_ip: Public address of ``eip_allocation_id`` for display.
+        ssm_client: Optional Boto3 SSM client for ``ssm`` readiness checks.
+        timeout_seconds: Overall deadline.
+        initial_delay_seconds: First backoff delay ceiling.
+        max_delay_seconds: Maximum backoff delay.
+        capacity_grace_seconds: How long capacity errors may persist before
+            the wait aborts.
+        monotonic: Monotonic clock for deadlines.
+        sleeper: Sleep function.
+        rng: Random source for jitter.
+        out: Output stream for progress lines.
+
+    Returns:
+        Readiness details for the running workstation.
+
+    Raises:
+        RuntimeError: If the workstation is not ready before the deadline or
+            the Spot Fleet cannot be fulfilled.
+        ClientError: If a lookup fails with a permanent AWS error.
+        BotoCoreError: If AWS credentials are missing.
+    """
+    if access_mode not in _VALID_ACCESS_MODES:
+        raise RuntimeError("ACCESS_MODE must be one of: ssh, ssm, both.")
+
+    started_at = monotonic()
+    deadline = started_at + timeout_seconds
+    spot_fleet_request_id: str | None = None
+    fulfilment_monitor: SpotFleetFulfilmentMonitor | None = None
+    associated_instance_id: str | None = None
+    last_status = ""
+    attempt = 0
+
+    while True:
+        status = "awaiting Spot Fleet request"
+        fulfilment_failure: SpotFleetFailure | None = None
+        try:
+            with trace_span("readiness.poll", attempt=attempt):
+                if spot_fleet_request_id is None:
+                    spot_fleet_request_id = _resolve_spot_fleet_request_id(
+                        cloudformation_client,
+                        stack_name=stack_name,
+                        spot_fleet_logical_id=spot_fleet_logical_id,
+                    )
+                if spot_fleet_request_id is not None:
+                    observation = _observe_newest_instance(ec2_client, spot_fleet_request_id)
+                    status = observation.state
+                    if observation.instance_id is None:
+                        if fulfilment_monitor is None:
+                            fulfilment_monitor = SpotFleetFulfilmentMonitor(
+                                ec2_client,
+                                spot_fleet_request_id,
+                                capacity_grace_seconds=capacity_grace_seconds,
+                                monotonic=monotonic,
+                            )
+                        fulfilment_failure = _check_fulfilment(fulfilment_monitor)
+                        if fulfilment_monitor.latest_failure is not None:
+                            latest = fulfilment_monitor.latest_failure
+                            status = f"{status}; Spot Fleet reported {latest.error_code}. {latest.remediation}"
+                    readiness = _evaluate_observation(
+                        observation,
+                        ec2_client=ec2_client,
+                        ssm_client=ssm_client,
+                        access_mode=access_mode,
+                        eip_allocation_id=eip_allocation_id,
+                        eip_public_ip=eip_public_ip,
+                        associated_instance_id=associated_instance_id,
+                        elapsed_seconds=monotonic() - started_at,
+                    )
+                    if eip_allocation_id and observation.state == "running":
+                        associated_instance_id = observation.instance_id
+                    if readiness is not None:
+                        return readiness
+        except (ClientError, BotoCoreError) as err:
+            # Reason: eventual consistency right after deploy surfaces as lookup
+            # errors; keep polling until the deadline instead of failing early.
+            if not _is_transient_lookup_error(err):
+                raise
+            LOGGER.debug("Readiness poll failed stack_name=%s error=%s", stack_name, err)
+            status = f"lookup pending ({type(err).__name__})"
+
+        now = monotonic()
+        if status != last_status:
+            out.write(f"Waiting for workstation: {status} ({now - started_at:.0f}s elapsed)\n")
+            last_status = status
+        if fulfilment_failure is not None and spot_fleet_request_id is not None:
+            raise RuntimeError(fulfilment_failure.format(spot_fleet_request_id))
+        if now >= deadline:
+            raise RuntimeError(
+                f"Workstation for stack '{stack_name}' was not ready after {timeout_seconds:.0f} seconds "
+                f"(last status: {status}). Check the Spot Fleet request history and rerun check_instance.py."
+            )
+        delay = compute_backoff_delay(
+            attempt,
+            initial_delay_seconds=initial_delay_seconds,
+            max_delay_seconds=max_delay_seconds,
+            rng=rng,
+        )
+        sleeper(min(delay, max(deadline - now, 0.0)))
+        attempt += 1
+
+
+def _check_fulfilment(monitor: SpotFleetFulfilmentMonitor) -> SpotFleetFailure | None:
+    """Poll the fleet request history, treating transient lookup errors as no failure."""
+    try:
+        with trace_span("readiness.spot_fulfilment", spot_fleet_request_id=monitor.spot_fleet_request_id):
+            return monitor.poll()
+    except (ClientError, BotoCoreError) as err:
+        if not _is_transient_lookup_error(err):
+            raise
+        LOGGER.debug(
+            "Spot Fleet history poll failed spot_fleet_request_id=%s error=%s",
+            monitor.spot_fleet_request_id,
+            err,
+        )
+        return None
+
+
+def _evaluate_observation(
+    observation: _InstanceObservation,
+    *,
+    ec2_client: Any,
+    ssm_client: Any | None,
+    access_mode: str,
+    eip_allocation_id: str | None,
+    eip_public_ip: str | None,
+    associated_instance_id: str | None,
+    elapsed_seconds: float,
+) -> WorkstationReadiness | None:
+    """Advance readiness for one observation and return it once reachable."""
+    if observation.instance_id is None or observation.state != "running":
+        return None
+
+    elastic_ip_associated = False
+    if eip_allocation_id:
+        if associated_instance_id != observation.instance_id:
+            with trace_span("readiness.associate_eip", instance_id=observation.instance_id):
+                associate_eip_with_instance(ec2_client, eip_allocation_id, observation.instance_id)
+        elastic_ip_associated = True
+
+    public_ip = (eip_public_ip if elastic_ip_associated else None) or observation.public_ip
+    if access_mode in {"ssh", "both"}:
+        if not public_ip:
+            return None
+        return WorkstationReadiness(
+            instance_id=observation.instance_id,
+            public_ip=public_ip,
+            elastic_ip_associated=elastic_ip_associated,
+            ssm_online=False,
+            elapsed_seconds=elapsed_seconds,
+        )
+
+    ssm_online = False
+    if ssm_client is not None:
+        ssm_online = _is_ssm_online(ssm_client, observation.instance_id)
+        if not ssm_online:
+            return None
+    return WorkstationReadiness(
+        instance_id=observation.instance_id,
+        public_ip=public_ip,
+        elastic_ip_associated=elastic_ip_associated,
+        ssm_online=ssm_online,
+        elapsed_seconds=elapsed_seconds,
+    )
+
+
+def build_ssh_config_snippet(host_alias: str, ip_address: str, ssh_user: str, identity_file: str) -> str:
+    """Build an SSH config snippet for user guidance."""
+    return (
+        f"Host {host_alias}\n"
+        f"  HostName {ip_address}\n"
+        f"  User {ssh_user}\n"
+        f"  IdentityFile {identity_file}\n"
+        f"  IdentitiesOnly yes\n"
+    )
+
+
+def build_ssm_start_session_command(region: str, instance_id: str, profile: str | None) -> str:
+    """Build the AWS CLI command used to start an SSM session."""
+    command = ["aws", "ssm", "start-session", "--region", region]
+    if profile:
+        command.extend(["--profile", profile])
+    command.extend(["--target", instance_id])
+    return " ".join(command)
+
+
+def print_connection_guidance(
+    readiness: WorkstationReadiness,
+    *,
+    access_mode: str,
+    region: str,
+    profile: str | None,
+    ssh_alias: str,
+    ssh_user: str = "ubuntu",
+    identity_file: str = "~/.ssh/aws_key.pem",
+    out: TextIO = sys.stdout,
+) -> None:
+    """Print SSH and/or SSM connection instructions for a ready workstation."""
+    out.write(f"Workstation ready: {readiness.instance_id} after {readiness.elapsed_seconds:.0f}s\n")
+    out.write(f"Region: {region}\n")
+    if readiness.elastic_ip_associated and readiness.public_ip:
+        out.write(f"Elastic IP associated: {readiness.public_ip}\n")
+    if access_mode in {"ssm", "both"}:
+        out.write("\nStart an SSM session:\n\n")
+        out.write(
+            build_ssm_start_session_command(
+                region=region,
+                instance_id=readiness.instance_id,
+                profile=profile,
+            )
+            + "\n"
+        )
+    if access_mode == "ssm" or not readiness.public_ip:
+        return
+    out.write(f"Public IP: {readiness.public_ip}\n")
+    out.write("\nAdd this to ~/.ssh/config:\n\n")
+    out.write(
+        build_ssh_config_snippet(
+            host_alias=ssh_alias,
+            ip_address=readiness.public_ip,
+            ssh_user=ssh_user,
+            identity_file=identity_file,
+        )
+    )
@@ -5,7 +5,7 @@ from __future__ import annotations
 import configparser
 import os
 from pathlib import Path
-from typing import Mapping
+from typing import Any, Mapping
 
 
 def get_profile_name(env: Mapping[str, str] | None = None) -> str:
@@ -141,6 +141,24 @@ def get_account(
     )
 
 
+def get_caller_account(sts_client: Any) -> str:
+    """Return the account id of the credentials behind an STS client.
+
+    Local caches of account-specific lookups are keyed by this id, so two
+    profiles never share entries.
+
+    Raises:
+        RuntimeError: If the caller identity cannot be read.
+    """
+    try:
+        account = str(sts_client.get_caller_identity().get("Account", "")).strip()
+    except Exception as err:
+        raise RuntimeError("Unable to resolve the AWS account of the current credentials.") from err
+    if not account:
+        raise RuntimeError("STS GetCallerIdentity returned no account id.")
+    return account
+
+
 def parse_optional_text_context(value: object | None) -> str | None:
     """Parse optional CDK context text into a trimmed value.
 
@@ -185,3 +203,28 @@ def parse_optional_bool_context(value: object, context_key: str) -> bool:
         f"Invalid boolean context value for '{context_key}': {value!r}. "
         "Use one of: true/false, 1/0, yes/no, on/off."
     )
+
+
+def parse_optional_index_list_context(value: object | None, context_key: str) -> tuple[int, ...] | None:
+    """Parse optional comma-separated CDK context text into non-negative integers.
+
+    Args:
+        value: Raw context value from CDK (for example ``"1,0"``).
+        context_key: Context key name for error messaging.
+
+    Returns:
+        Parsed indexes in order, or ``None`` when the context is unset or blank.
+
+    Raises:
+        RuntimeError: If any entry is not a non-negative integer.
+    """
+    text_value = parse_optional_text_context(value)
+    if text_value is None:
+        return None
+    entries = [entry.strip() for entry in text_value.split(",")]
+    if not all(entry.isdigit() for entry in entries):
+        raise RuntimeError(
+            f"Invalid index context value for '{context_key}': {value!r}. "
+            "Use comma-separated non-negative integers."
+        )
+    return tuple(int(entry) for entry in entries)
@@ -0,0 +1,188 @@
+"""Detect Spot Fleet requests that cannot be fulfilled."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+import logging
+import time
+from typing import Any, Callable
+
+LOGGER = logging.getLogger(__name__)
+# Reason: capacity errors sometimes clear on the next fleet evaluation cycle.
+CAPACITY_FAILURE_GRACE_SECONDS = 60.0
+_PRICE_REMEDIATION = (
+    "The fleet's maximum price (spot_price in the environment spec) is below the current Spot price. "
+    "Raise spot_price or choose a cheaper instance_type."
+)
+_CAPACITY_REMEDIATION = (
+    "AWS has no Spot capacity for this instance type in the subnet's Availability Zone. "
+    "Retry later, add fallback_instance_types, or spread the environment across more Availability Zones "
+    "with availability_zone_count."
+)
+_LAUNCH_SPEC_REMEDIATION = (
+    "The launch specification cannot be used. Check the AMI, key pair, security groups and "
+    "instance type in the error description."
+)
+_CONFIGURATION_REMEDIATION = "Fix the Spot Fleet request configuration or IAM fleet role named in the error."
+_LIMIT_REMEDIATION = "The account's Spot vCPU limit is reached. Stop other Spot instances or request a limit increase."
+# Reason: these errors repeat on every evaluation until the request itself changes.
+_FATAL_ERROR_CODES: dict[str, str] = {
+    "price-too-low": _PRICE_REMEDIATION,
+    "launchSpecUnusable": _LAUNCH_SPEC_REMEDIATION,
+    "spotFleetRequestConfigurationInvalid": _CONFIGURATION_REMEDIATION,
+    "iamFleetRoleInvalid": _CONFIGURATION_REMEDIATION,
+    "spotInstanceCountLimitExceeded": _LIMIT_REMEDIATION,
+}
+_CAPACITY_ERROR_CODES: dict[str, str] = {
+    "capacityNotAvailable": _CAPACITY_REMEDIATION,
+    "capacity-not-available": _CAPACITY_REMEDIATION,
+    "constraintNotFulfillable": _CAPACITY_REMEDIATION,
+    "launchSpecTemporarilyBlacklisted": _CAPACITY_REMEDIATION,
+    "allLaunchSpecsTemporarilyBlacklisted": _CAPACITY_REMEDIATION,
+}
+_FAILED_REQUEST_STATES = frozenset({"failed", "cancelled", "cancelled_running", "cancelled_terminating"})
+
+
+@dataclass(frozen=True, slots=True)
+class SpotFleetFailure:
+    """A classified Spot Fleet fulfilment error.
+
+    Args:
+        error_code: Spot Fleet event subtype (for example ``price-too-low``).
+        description: AWS event description.
+        remediation: Suggested fix for the user.
+        fatal: Whether the error persists until the request changes.
+    """
+
+    error_code: str
+    description: str
+    remediation: str
+    fatal: bool
+
+    def format(self, spot_fleet_request_id: str) -> str:
+        """Render the failure as a one-paragraph user-facing message."""
+        detail = f": {self.description}" if self.description else ""
+        return (
+            f"Spot Fleet request '{spot_fleet_request_id}' reported {self.error_code}{detail}. "
+            f"{self.remediation}"
+        )
+
+
+def classify_spot_fleet_error(error_code: str, description: str = "") -> SpotFleetFailure:
+    """Classify one Spot Fleet history error event.
+
+    ``launchSpecUnusable`` events whose description names a more specific
+    cause (for example ``price-too-low``) are classified by that cause.
+    """
+    code = error_code.strip()
+    for specific_code in (*_FATAL_ERROR_CODES, *_CAPACITY_ERROR_CODES):
+        if specific_code != code and description.startswith(specific_code):
+            code = specific_code
+            break
+    if code in _FATAL_ERROR_CODES:
+        return SpotFleetFailure(code, description, _FATAL_ERROR_CODES[code], True)
+    if code in _CAPACITY_ERROR_CODES:
+        return SpotFleetFailure(code, description, _CAPACITY_ERROR_CODES[code], False)
+    return SpotFleetFailure(
+        code or "unknown",
+        description,
+        "Check the Spot Fleet request history in the EC2 console.",
+        False,
+    )
+
+
+class SpotFleetFulfilmentMonitor:
+    """Poll a Spot Fleet request for fulfilment errors.
+
+    Fatal errors (for example ``price-too-low``) abort on the first event.
+    Capacity errors abort once the fleet is still unfulfilled
+    ``capacity_grace_seconds`` after the first one.
+    """
+
+    def __init__(
+        self,
+        ec2_client: Any,
+        spot_fleet_request_id: str,
+        *,
+        capacity_grace_seconds: float = CAPACITY_FAILURE_GRACE_SECONDS,
+        monotonic: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._ec2_client = ec2_client
+        self.spot_fleet_request_id = spot_fleet_request_id
+        self._capacity_grace_seconds = capacity_grace_seconds
+        self._monotonic = monotonic
+        self._history_start: datetime | None = None
+        self._first_failure_at: float | None = None
+        self.latest_failure: SpotFleetFailure | None = None
+
+    def poll(self) -> SpotFleetFailure | None:
+        """Read new history events and return a failure that warrants aborting.
+
+        Returns:
+            The latest failure once it is fatal or has outlasted the capacity
+            grace period, otherwise ``None``.
+        """
+        response = self._ec2_client.describe_spot_fleet_requests(SpotFleetRequestIds=[self.spot_fleet_request_id])
+        configs = response.get("SpotFleetRequestConfigs", [])
+        if not configs:
+            return None
+        config = configs[0]
+        if str(config.get("ActivityStatus", "")) == "fulfilled":
+            self._first_failure_at = None
+            self.latest_failure = None
+            return None
+        if self._history_start is None:
+            self._history_start = config.get("CreateTime")
+
+        for record in self._read_error_events():
+            information = record.get("EventInformation", {})
+            self.latest_failure = classify_spot_fleet_error(
+                str(information.get("EventSubType", "")),
+                str(information.get("EventDescription", "")).strip(),
+            )
+            if self._first_failure_at is None:
+                self._first_failure_at = self._monotonic()
+
+        request_state = str(config.get("SpotFleetRequestState", ""))
+        if request_state in _FAILED_REQUEST_STATES:
+            return self.latest_failure or SpotFleetFailure(
+                request_state,
+                f"the request is {request_state}",
+                _CONFIGURATION_REMEDIATION,
+                True,
+            )
+        if self.latest_failure is None or self._first_failure_at is None:
+            return None
+        if self.latest_failure.fatal:
+            return self.latest_failure
+        if self._monotonic() - self._first_failure_at >= self._capacity_grace_seconds:
+            return self.latest_failure
+        return None
+
+    def _read_error_events(self) -> list[dict[str, Any]]:
+        """Return error events newer than the last poll, oldest first."""
+        if self._history_start is None:
+            return []
+        records: list[dict[str, Any]] = []
+        request: dict[str, Any] = {
+            "SpotFleetRequestId": self.spot_fleet_request_id,
+            "StartTime": self._history_start,
+            "EventType": "error",
+        }
+        while True:
+            response = self._ec2_client.describe_spot_fleet_request_history(**request)
+            records.extend(response.get("HistoryRecords", []))
+            next_token = response.get("NextToken")
+            if not next_token:
+                break
+            request["NextToken"] = next_token
+
+        # Reason: StartTime is inclusive, so drop events already seen at the boundary.
+        new_records = sorted(
+            (record for record in records if record.get("Timestamp") and record["Timestamp"] > self._history_start),
+            key=lambda record: record["Timestamp"],
+        )
+        if new_records:
+            self._history_start = new_records[-1]["Timestamp"]
+        return new_records
@@ -0,0 +1,200 @@
+"""Unit tests for the local AMI catalog."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from pathlib import Path
+import tempfile
+import unittest
+from unittest.mock import Mock
+
+from botocore.exceptions import ClientError
+
+from workstation_core.ami_catalog import (
+    catalog_environment_images,
+    catalog_exact_image_id,
+    expire_ami_catalog,
+    load_ami_catalog,
+)
+
+_REFRESHED_AT = datetime(2026, 10, 16, 23, 55, tzinfo=timezone.utc).timestamp()
+_ACCOUNT = "111111111111"
+
+
+def _image(image_id: str, created: str, state: str = "available") -> dict[str, str]:
+    """Return one ``describe_images`` entry."""
+    return {"ImageId": image_id, "Name": f"gastown_{image_id}", "State": state, "CreationDate": created}
+
+
+def _ec2_client(*responses: list[list[dict[str, str]]]) -> Mock:
+    """Return an EC2 client whose paginated lookups return one page list per call."""
+    ec2_client = Mock()
+    ec2_client.meta.region_name = "us-west-2"
+    ec2_client.get_paginator.return_value.paginate.side_effect = [
+        [{"Images": page} for page in pages] for pages in responses
+    ]
+    return ec2_client
+
+
+def _filters(ec2_client: Mock, call: int) -> dict[str, list[str]]:
+    """Return the filters of one paginated lookup keyed by filter name."""
+    kwargs = ec2_client.get_paginator.return_value.paginate.call_args_list[call].kwargs
+    return {item["Name"]: item["Values"] for item in kwargs["Filters"]}
+
+
+class AmiCatalogTests(unittest.TestCase):
+    """Validate catalog fills, incremental refreshes and lookups."""
+
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.catalog_dir = Path(tmp.name)
+
+    def _images(self, ec2_client: Mock, now: float, **kwargs: object) -> list[dict[str, str]]:
+        """List catalog images at wall-clock time ``now``."""
+        return catalog_environment_images(
+            ec2_client, "gastown", account_id=_ACCOUNT, catalog_dir=self.catalog_dir, clock=lambda: now, **kwargs
+        )
+
+    def test_first_lookup_pages_through_every_image_and_caches_them(self) -> None:
+        """Expected: all pages are merged newest first and a fresh catalog skips the API."""
+        ec2_client = _ec2_client(
+            [[_image("ami-old", "2026-09-01T00:00:00.000Z")], [_image("ami-new", "2026-10-01T00:00:00.000Z")]]
+        )
+
+        first = self._images(ec2_client, _REFRESHED_AT)
+        cached = self._images(ec2_client, _REFRESHED_AT + 60)
+
+        self.assertEqual(["ami-new", "ami-old"], [image["image_id"] for image in first])
+        self.assertEqual(first, cached)
+        ec2_client.get_paginator.assert_called_once_with("describe_images")
+        kwargs = ec2_client.get_paginator.return_value.paginate.call_args.kwargs
+        self.assertEqual(["self"], kwargs["Owners"])
+        self.assertEqual({"name": ["gastown_*"]}, _filters(ec2_client, 0))
+
+    def test_expired_catalog_only_lists_images_created_since_the_last_refresh(self) -> None:
+        """Expected: the refresh filters by creation day, across midnight, and merges new images."""
+        ec2_client = _ec2_client(
+            [[_image("ami-old", "2026-09-01T00:00:00.000Z")]],
+            [[_image("ami-new", "2026-10-17T00:05:00.000Z")]],
+        )
+        self._images(ec2_client, _REFRESHED_AT)
+
+        images = self._images(ec2_client, _REFRESHED_AT + 15 * 60)
+
+        self.assertEqual(["ami-new", "ami-old"], [image["image_id"] for image in images])
+        self.assertEqual(
+            {"name": ["gastown_*"], "creation-date": ["2026-10-16T*", "2026-10-17T*"]},
+            _filters(ec2_client, 1),
+        )
+
+    def test_incremental_refresh_rechecks_pending_images(self) -> None:
+        """Edge: pending images are re-read by id and dropped once they no longer exist."""
+        ec2_client = _ec2_client(
+            [
+                [
+                    _image("ami-done", "2026-10-16T20:00:00.000Z", "pending"),
+                    _image("ami-gone", "2026-10-16T21:00:00.000Z", "pending"),
+                ]
+            ],
+            [[_image("ami-done", "2026-10-16T20:00:00.000Z")]],
+            [[]],
+        )
+        self._images(ec2_client, _REFRESHED_AT)
+
+        images = self._images(ec2_client, _REFRESHED_AT + 15 * 60)
+
+        self.assertEqual([("ami-done", "available")], [(image["image_id"], image["state"]) for image in images])
+        self.assertEqual(["ami-gone", "ami-done"], _filters(ec2_client, 1)["image-id"])
+
+    def test_explicit_refresh_and_expiry_bypass_a_fresh_catalog(self) -> None:
+        """Expected: ``refresh`` lists everything again; an expired catalog refreshes incrementally."""
+        ec2_client = _ec2_client(
+            [[_image("ami-old", "2026-09-01T00:00:00.000Z")]],
+            [[_image("ami-old", "2026-09-01T00:00:00.000Z")]],
+            [[_image("ami-saved", "2026-10-16T23:58:00.000Z", "pending")]],
+        )
+        self._images(ec2_client, _REFRESHED_AT)
+
+        self._images(ec2_client, _REFRESHED_AT + 60, refresh=True)
+        expire_ami_catalog(ec2_client, "gastown", catalog_dir=self.catalog_dir)
+        self.assertTrue(load_ami_catalog(self.catalog_dir, _ACCOUNT, "us-west-2", "gastown").stale)
+        images = self._images(ec2_client, _REFRESHED_AT + 120)
+
+        self.assertEqual({"name": ["gastown_*"]}, _filters(ec2_client, 1))
+        self.assertIn("creation-date", _filters(ec2_client, 2))
+        self.assertEqual("ami-saved", images[0]["image_id"])
+        self.assertFalse(load_ami_catalog(self.catalog_dir, _ACCOUNT, "us-west-2", "gastown").stale)
+
+    def _exact(self, ec2_client: Mock, expected_name: str) -> str:
+        """Resolve ``expected_name`` through the catalog at ``_REFRESHED_AT``."""
+        return catalog_exact_image_id(
+            ec2_client,
+            expected_name,
+            "gastown",
+            account_id=_ACCOUNT,
+            catalog_dir=self.catalog_dir,
+            clock=lambda: _REFRESHED_AT,
+        )
+
+    def test_exact_lookup_uses_the_catalog_and_falls_back_for_pending_images(self) -> None:
+        """Expected: available images are confirmed by id; pending ones are checked live and refused."""
+        ready = _image("ami-ready", "2026-10-01T00:00:00.000Z")
+        busy = _image("ami-busy", "2026-10-16T20:00:00.000Z", "pending")
+        ec2_client = _ec2_client([[ready, busy]], [[ready]])
+        ec2_client.describe_images.return_value = {"Images": [busy]}
+
+        image_id = self._exact(ec2_client, "gastown_ami-ready")
+        ec2_client.describe_images.assert_not_called()
+        self.assertEqual({"image-id": ["ami-ready"]}, _filters(ec2_client, 1))
+        with self.assertRaisesRegex(RuntimeError, "still pending"):
+            self._exact(ec2_client, "gastown_ami-busy")
+
+        self.assertEqual("ami-ready", image_id)
+
+    def test_exact_lookup_falls_back_when_a_cached_image_was_deregistered(self) -> None:
+        """Edge: an id the catalog still lists as available but EC2 no longer describes is resolved live."""
+        ec2_client = _ec2_client([[_image("ami-gone", "2026-10-01T00:00:00.000Z")]], [[]])
+        ec2_client.describe_images.return_value = {"Images": []}
+
+        with self.assertRaisesRegex(RuntimeError, "was not found"):
+            self._exact(ec2_client, "gastown_ami-gone")
+
+        ec2_client.describe_images.assert_called_once_with(
+            Owners=["self"], Filters=[{"Name": "name", "Values": ["gastown_ami-gone"]}]
+        )
+
+    def test_catalogs_are_kept_per_account_and_expired_for_every_account(self) -> None:
+        """Expected: another account never reads this account's catalog; a save expires both."""
+        ec2_client = _ec2_client(
+            [[_image("ami-mine", "2026-10-01T00:00:00.000Z")]],
+            [[_image("ami-theirs", "2026-10-02T00:00:00.000Z")]],
+        )
+
+        mine = self._images(ec2_client, _REFRESHED_AT)
+        theirs = catalog_environment_images(
+            ec2_client, "gastown", account_id="222222222222", catalog_dir=self.catalog_dir, clock=lambda: _REFRESHED_AT
+        )
+        expire_ami_catalog(ec2_client, "gastown", catalog_dir=self.catalog_dir)
+
+        self.assertEqual(["ami-mine"], [image["image_id"] for image in mine])
+        self.assertEqual(["ami-theirs"], [image["image_id"] for image in theirs])
+        self.assertTrue((self.catalog_dir / _ACCOUNT / "us-west-2" / "gastown.json").is_file())
+        for account_id in (_ACCOUNT, "222222222222"):
+            self.assertTrue(load_ami_catalog(self.catalog_dir, account_id, "us-west-2", "gastown").stale)
+
+    def test_refresh_reports_missing_describe_images_permission(self) -> None:
+        """Failure: access denied during a refresh names the missing permission."""
+        ec2_client = _ec2_client()
+        ec2_client.get_paginator.return_value.paginate.side_effect = ClientError(
+            error_response={"Error": {"Code": "UnauthorizedOperation", "Message": "Denied"}},
+            operation_name="DescribeImages",
+        )
+
+        with self.assertRaisesRegex(RuntimeError, "ec2:DescribeImages"):
+            self._images(ec2_client, _REFRESHED_AT)
+        self.assertIsNone(load_ami_catalog(self.catalog_dir, _ACCOUNT, "us-west-2", "gastown"))
+
+
+if __name__ == "__main__":
+    unittest.main()
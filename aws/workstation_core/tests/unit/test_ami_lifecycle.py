@@ -13,6 +13,7 @@ from workstation_core.ami_lifecycle import (
     pick_image_interactively,
     print_image_list,
     resolve_ami_selection,
+    resolve_exact_image_id,
     run_ami_permission_preflight,
     validate_mode_arguments,
 )
@@ -46,6 +47,16 @@ class AmiLifecycleTests(unittest.TestCase):
         self.assertEqual("ami-load", result.selected_ami_id)
         self.assertIn("Resolved AMI gastown_20260301 -> ami-load", output.getvalue())
 
+    def test_resolve_exact_image_id_refuses_pending_ami(self) -> None:
+        """Failure: AMI_LOAD never deploys a fast-stop AMI that is still completing."""
+        ec2_client = Mock()
+        ec2_client.describe_images.return_value = {
+            "Images": [{"ImageId": "ami-load", "Name": "gastown_20260301", "State": "pending"}]
+        }
+
+        with self.assertRaisesRegex(RuntimeError, "still pending"):
+            resolve_exact_image_id(ec2_client, expected_name="gastown_20260301")
+
     def test_resolve_ami_selection_list_mode_without_pick_lists_and_exits(self) -> None:
         """Edge: list-only mode prints AMIs and exits without running deploy."""
         ec2_client = Mock()
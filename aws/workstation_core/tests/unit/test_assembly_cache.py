@@ -0,0 +1,163 @@
+"""Unit tests for the content-addressed cloud assembly cache."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+import json
+import os
+from pathlib import Path
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from workstation_core.assembly_cache import (
+    compute_assembly_cache_key,
+    find_assembly_with_stack,
+    find_cached_assembly,
+    prune_assembly_cache,
+    store_assembly,
+)
+from workstation_core.environment_config import AmiSelectorConfig, EnvironmentSpec
+from workstation_core.orchestration import synthesize_assembly
+
+ENV = {"CDK_DEFAULT_ACCOUNT": "123456789012", "CDK_DEFAULT_REGION": "us-west-2"}
+SPEC = EnvironmentSpec(
+    environment_key="gastown",
+    display_name="Gastown",
+    bootstrap_files=("deps.sh", "python.sh"),
+    default_ami_selector=AmiSelectorConfig(owner="1", name="ubuntu-*", filters={"architecture": ("x86_64",)}),
+    subnet_cidr="10.0.1.0/24",
+    instance_type="t3.large",
+    volume_size=16,
+    spot_price="0.1",
+)
+
+
+def _write_manifest(assembly_dir: Path, stack_name: str, environment: str) -> None:
+    """Write a minimal cloud assembly manifest for one stack."""
+    assembly_dir.mkdir(parents=True, exist_ok=True)
+    (assembly_dir / "manifest.json").write_text(
+        json.dumps({"artifacts": {stack_name: {"type": "aws:cloudformation:stack", "environment": environment}}}),
+        encoding="utf-8",
+    )
+
+
+class AssemblyCacheKeyTests(unittest.TestCase):
+    """Validate which inputs change the cache key."""
+
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = Path(tmp.name)
+        self.stack_dir = self.root / "gastown"
+        (self.stack_dir / "init").mkdir(parents=True)
+        (self.root / "common" / "init").mkdir(parents=True)
+        (self.stack_dir / "init" / "deps.sh").write_text("echo deps\n", encoding="utf-8")
+        (self.root / "common" / "init" / "python.sh").write_text("echo python\n", encoding="utf-8")
+        (self.stack_dir / "cdk.json").write_text("{}", encoding="utf-8")
+
+    def _key(self, context: dict[str, str], spec: EnvironmentSpec = SPEC) -> str:
+        return compute_assembly_cache_key(self.stack_dir, context, spec, env=ENV, aws_root=self.root)
+
+    def test_key_is_stable_for_identical_inputs(self) -> None:
+        """Expected: the same spec, context and scripts give the same key."""
+        self.assertEqual(self._key({"access_mode": "ssh"}), self._key({"access_mode": "ssh"}))
+
+    def test_key_changes_with_context_values(self) -> None:
+        """Expected: a different AMI or access mode forces a new synth."""
+        self.assertNotEqual(self._key({"access_mode": "ssh"}), self._key({"access_mode": "ssm"}))
+
+    def test_key_changes_when_a_shared_init_script_changes(self) -> None:
+        """Expected: editing a common init script invalidates the cached assembly."""
+        before = self._key({})
+        (self.root / "common" / "init" / "python.sh").write_text("echo python3\n", encoding="utf-8")
+
+        self.assertNotEqual(before, self._key({}))
+
+    def test_key_changes_with_environment_spec(self) -> None:
+        """Edge: spec fields that shape the template are part of the key."""
+        bigger = replace(SPEC, volume_size=32)
+
+        self.assertNotEqual(self._key({}), self._key({}, bigger))
+
+
+class AssemblyCacheStorageTests(unittest.TestCase):
+    """Validate lookups, storage and pruning."""
+
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.cache_dir = Path(tmp.name) / "assemblies"
+
+    def test_store_then_find_returns_cached_assembly(self) -> None:
+        """Expected: a stored synth is returned for the same key."""
+        staged = self.cache_dir / ".abc.tmp"
+        _write_manifest(staged, "GastownWorkstationStack", "aws://123456789012/us-west-2")
+
+        stored = store_assembly(self.cache_dir, "abc", staged)
+
+        self.assertEqual(stored, find_cached_assembly(self.cache_dir, "abc"))
+        self.assertIsNone(find_cached_assembly(self.cache_dir, "other"))
+
+    def test_find_assembly_with_stack_ignores_other_accounts_and_regions(self) -> None:
+        """Failure: destroy never reuses an assembly bound to another region."""
+        _write_manifest(self.cache_dir / "east", "GastownWorkstationStack", "aws://123456789012/us-east-1")
+
+        self.assertIsNone(find_assembly_with_stack(self.cache_dir, "GastownWorkstationStack", env=ENV))
+
+        _write_manifest(self.cache_dir / "west", "GastownWorkstationStack", "aws://123456789012/us-west-2")
+        self.assertEqual(
+            self.cache_dir / "west",
+            find_assembly_with_stack(self.cache_dir, "GastownWorkstationStack", env=ENV),
+        )
+
+    def test_prune_keeps_most_recently_used_assemblies(self) -> None:
+        """Edge: pruning removes the least recently used entries first."""
+        for index, name in enumerate(("old", "mid", "new")):
+            _write_manifest(self.cache_dir / name, "S", "aws://1/r")
+            os.utime(self.cache_dir / name, (index, index))
+
+        prune_assembly_cache(self.cache_dir, keep=2)
+
+        self.assertEqual(["mid", "new"], sorted(path.name for path in self.cache_dir.iterdir()))
+
+
+class SynthesizeAssemblyCacheTests(unittest.TestCase):
+    """Validate that synth only runs on a cache miss."""
+
+    def test_cache_hit_skips_cdk_synth(self) -> None:
+        """Expected: a matching key reuses the cached assembly without running the CDK app."""
+        with tempfile.TemporaryDirectory() as tmp:
+            cache_dir = Path(tmp)
+            _write_manifest(cache_dir / "k1", "GastownWorkstationStack", "aws://1/r")
+            with (
+                patch("workstation_core.orchestration.compute_assembly_cache_key", return_value="k1"),
+                patch("workstation_core.orchestration.run_command") as run_command,
+            ):
+                result = synthesize_assembly("/tmp/gastown", {}, cache_dir=cache_dir)
+
+        self.assertEqual(cache_dir / "k1", result)
+        run_command.assert_not_called()
+
+    def test_cache_miss_synthesizes_into_the_cache(self) -> None:
+        """Expected: a miss runs ``cdk synth`` once and stores the result under the key."""
+        def fake_synth(command: list[str], cwd: str, timeout_seconds: int) -> None:
+            output_dir = Path(command[command.index("--output") + 1])
+            _write_manifest(output_dir, "GastownWorkstationStack", "aws://1/r")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            cache_dir = Path(tmp)
+            with (
+                patch("workstation_core.orchestration.compute_assembly_cache_key", return_value="k2"),
+                patch("workstation_core.orchestration.run_command", side_effect=fake_synth) as run_command,
+            ):
+                result = synthesize_assembly("/tmp/gastown", {"access_mode": "ssh"}, cache_dir=cache_dir)
+            stored = (result / "manifest.json").is_file()
+
+        self.assertEqual(cache_dir / "k2", result)
+        self.assertTrue(stored)
+        self.assertIn("access_mode=ssh", run_command.call_args.args[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
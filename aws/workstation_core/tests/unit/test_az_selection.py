@@ -0,0 +1,263 @@
+"""Unit tests for Spot-aware Availability Zone selection."""
+
+from __future__ import annotations
+
+from pathlib import Path
+import tempfile
+import unittest
+from unittest.mock import Mock
+
+from workstation_core.az_selection import (
+    availability_zone_names,
+    AvailabilityZoneCandidate,
+    choose_workstation_availability_zones,
+    deployed_availability_zone_indexes,
+    rank_availability_zones,
+    read_availability_zone_override,
+    select_availability_zones,
+)
+
+_ACCOUNT = "111111111111"
+
+
+def _ec2_client(prices: dict[str, str], scores: dict[str, int] | None = None) -> Mock:
+    """Return an EC2 client mock for a three-zone region."""
+    client = Mock()
+    client.meta.region_name = "us-west-2"
+    client.describe_availability_zones.return_value = {
+        "AvailabilityZones": [
+            {"ZoneName": "us-west-2c", "ZoneId": "usw2-az3", "OptInStatus": "opt-in-not-required"},
+            {"ZoneName": "us-west-2a", "ZoneId": "usw2-az1", "OptInStatus": "opt-in-not-required"},
+            {"ZoneName": "us-west-2b", "ZoneId": "usw2-az2", "OptInStatus": "opt-in-not-required"},
+            {"ZoneName": "us-west-2-lax-1a", "ZoneId": "usw2-lax1-az1", "OptInStatus": "opted-in"},
+        ]
+    }
+    client.describe_spot_price_history.return_value = {
+        "SpotPriceHistory": [
+            {"AvailabilityZone": zone_name, "SpotPrice": price} for zone_name, price in prices.items()
+        ]
+    }
+    if scores is None:
+        client.get_spot_placement_scores.side_effect = RuntimeError("AccessDenied")
+    else:
+        client.get_spot_placement_scores.return_value = {
+            "SpotPlacementScores": [
+                {"Region": "us-west-2", "AvailabilityZoneId": zone_id, "Score": score}
+                for zone_id, score in scores.items()
+            ]
+        }
+    return client
+
+
+class RankAvailabilityZonesTests(unittest.TestCase):
+    """Validate zone ordering."""
+
+    def test_prefers_placement_score_then_price(self) -> None:
+        """Expected: a higher score wins over a lower price; price breaks score ties."""
+        candidates = [
+            AvailabilityZoneCandidate(0, "a", "az1", 0.03, 3),
+            AvailabilityZoneCandidate(1, "b", "az2", 0.05, 9),
+            AvailabilityZoneCandidate(2, "c", "az3", 0.04, 9),
+        ]
+
+        ranked = rank_availability_zones(candidates)
+
+        self.assertEqual([2, 1, 0], [candidate.index for candidate in ranked])
+
+    def test_drops_unoffered_and_overpriced_zones(self) -> None:
+        """Edge: zones without a price or above the fleet max price are never chosen."""
+        candidates = [
+            AvailabilityZoneCandidate(0, "a", "az1", None, 10),
+            AvailabilityZoneCandidate(1, "b", "az2", 0.2, 10),
+            AvailabilityZoneCandidate(2, "c", "az3", 0.09, None),
+        ]
+
+        ranked = rank_availability_zones(candidates, max_price=0.1)
+
+        self.assertEqual([2], [candidate.index for candidate in ranked])
+
+
+class SelectAvailabilityZoneTests(unittest.TestCase):
+    """Validate API reads, caching and fallbacks."""
+
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.cache_dir = Path(tmp.name)
+
+    def test_selects_best_zone_in_get_azs_order(self) -> None:
+        """Expected: indexes follow sorted zone names and the best zone is chosen."""
+        client = _ec2_client(
+            {"us-west-2a": "0.05", "us-west-2b": "0.04", "us-west-2c": "0.03"},
+            {"usw2-az1": 9, "usw2-az2": 9, "usw2-az3": 4},
+        )
+
+        selection = select_availability_zones(
+            client, account_id=_ACCOUNT, instance_type="t3.large", max_price="0.1", cache_dir=self.cache_dir
+        )
+
+        self.assertEqual(((1,), ("us-west-2b",)), (selection.indexes, selection.zone_names))
+        self.assertEqual(["us-west-2a", "us-west-2b", "us-west-2c"], [c.zone_name for c in selection.candidates])
+
+    def test_placement_score_failure_falls_back_to_price(self) -> None:
+        """Edge: without placement scores the cheapest zone wins."""
+        client = _ec2_client({"us-west-2a": "0.05", "us-west-2c": "0.03"})
+
+        selection = select_availability_zones(
+            client, account_id=_ACCOUNT, instance_type="t3.large", cache_dir=self.cache_dir
+        )
+
+        self.assertEqual((2,), selection.indexes)
+
+    def test_fresh_cache_skips_api_calls(self) -> None:
+        """Expected: a second selection inside the TTL reuses the cached signals."""
+        client = _ec2_client({"us-west-2a": "0.05"}, {"usw2-az1": 5})
+        select_availability_zones(
+            client, account_id=_ACCOUNT, instance_type="t3.large", cache_dir=self.cache_dir, clock=lambda: 1000.0
+        )
+        client.reset_mock()
+
+        selection = select_availability_zones(
+            client, account_id=_ACCOUNT, instance_type="t3.large", cache_dir=self.cache_dir, clock=lambda: 1060.0
+        )
+
+        self.assertEqual((0,), selection.indexes)
+        client.describe_spot_price_history.assert_not_called()
+
+    def test_expired_cache_is_refreshed(self) -> None:
+        """Edge: signals older than the TTL are read again."""
+        client = _ec2_client({"us-west-2a": "0.05"}, {"usw2-az1": 5})
+        select_availability_zones(
+            client, account_id=_ACCOUNT, instance_type="t3.large", cache_dir=self.cache_dir, clock=lambda: 0.0
+        )
+
+        select_availability_zones(
+            client,
+            account_id=_ACCOUNT,
+            instance_type="t3.large",
+            cache_dir=self.cache_dir,
+            ttl_seconds=60,
+            clock=lambda: 61.0,
+        )
+
+        self.assertEqual(2, client.describe_spot_price_history.call_count)
+
+    def test_cache_is_kept_per_account(self) -> None:
+        """Edge: zone names map to different physical zones per account, so accounts never share signals."""
+        client = _ec2_client({"us-west-2a": "0.05"}, {"usw2-az1": 5})
+        select_availability_zones(
+            client, account_id=_ACCOUNT, instance_type="t3.large", cache_dir=self.cache_dir, clock=lambda: 0.0
+        )
+
+        select_availability_zones(
+            client, account_id="222222222222", instance_type="t3.large", cache_dir=self.cache_dir, clock=lambda: 1.0
+        )
+
+        self.assertEqual(2, client.describe_spot_price_history.call_count)
+        self.assertTrue((self.cache_dir / _ACCOUNT / "us-west-2" / "t3.large.json").is_file())
+
+    def test_multi_zone_selection_fills_with_unranked_zones(self) -> None:
+        """Edge: subnets beyond the usable zones go to the remaining zones in index order."""
+        client = _ec2_client({"us-west-2c": "0.03"}, {"usw2-az3": 7})
+
+        selection = select_availability_zones(
+            client, account_id=_ACCOUNT, instance_type="t3.large", zone_count=2, cache_dir=self.cache_dir
+        )
+
+        self.assertEqual((2, 0), selection.indexes)
+
+    def test_more_zones_than_the_region_has_raises(self) -> None:
+        """Failure: a zone count above the region's zones cannot be satisfied."""
+        client = _ec2_client({"us-west-2a": "0.05"}, {"usw2-az1": 5})
+
+        with self.assertRaisesRegex(RuntimeError, "has 3 Availability Zones; the environment needs 4"):
+            select_availability_zones(
+                client, account_id=_ACCOUNT, instance_type="t3.large", zone_count=4, cache_dir=self.cache_dir
+            )
+
+    def test_zone_names_follow_get_azs_order(self) -> None:
+        """Expected: indexes resolve to default zone names sorted like ``Fn::GetAZs``."""
+        client = _ec2_client({})
+
+        self.assertEqual(("us-west-2c", "us-west-2a"), availability_zone_names(client, (2, 0)))
+        with self.assertRaisesRegex(RuntimeError, "index 3 does not exist"):
+            availability_zone_names(client, (3,))
+
+    def test_no_affordable_zone_raises(self) -> None:
+        """Failure: every zone above the max price is reported."""
+        client = _ec2_client({"us-west-2a": "0.5"}, {"usw2-az1": 5})
+
+        with self.assertRaisesRegex(RuntimeError, "at or below 0.1"):
+            select_availability_zones(
+                client, account_id=_ACCOUNT, instance_type="t3.large", max_price="0.1", cache_dir=self.cache_dir
+            )
+
+
+class ChooseWorkstationAvailabilityZoneTests(unittest.TestCase):
+    """Validate the deploy-time zone decision."""
+
+    def test_deployed_stack_keeps_its_zone(self) -> None:
+        """Expected: an existing subnet is not moved to a better zone."""
+        cloudformation = Mock()
+        cloudformation.get_template.return_value = {
+            "TemplateBody": {
+                "Resources": {
+                    "GastownSubnet": {
+                        "Type": "AWS::EC2::Subnet",
+                        "Properties": {"AvailabilityZone": {"Fn::Select": [2, {"Fn::GetAZs": ""}]}},
+                    }
+                }
+            }
+        }
+        ec2 = _ec2_client({"us-west-2a": "0.01"}, {"usw2-az1": 10})
+
+        selection = choose_workstation_availability_zones(
+            ec2, cloudformation, account_id=_ACCOUNT, stack_name="GastownWorkstationStack", instance_type="t3.large"
+        )
+
+        self.assertEqual((2,), selection.indexes)
+        ec2.describe_spot_price_history.assert_not_called()
+
+    def test_selection_errors_fall_back_to_first_zone(self) -> None:
+        """Failure: missing Spot signals never block a deploy."""
+        cloudformation = Mock()
+        cloudformation.get_template.side_effect = RuntimeError("Stack with id X does not exist")
+        ec2 = Mock()
+        ec2.meta.region_name = "us-west-2"
+        ec2.describe_availability_zones.side_effect = RuntimeError("AccessDenied")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            selection = choose_workstation_availability_zones(
+                ec2,
+                cloudformation,
+                account_id=_ACCOUNT,
+                stack_name="S",
+                instance_type="t3.large",
+                zone_count=2,
+                cache_dir=Path(tmp),
+            )
+
+        self.assertEqual((0, 1), selection.indexes)
+        self.assertIn("AccessDenied", selection.reason)
+
+    def test_unreadable_deployed_template_raises(self) -> None:
+        """Failure: a template read error stops the deploy instead of moving the workstation."""
+        cloudformation = Mock()
+        cloudformation.get_template.side_effect = RuntimeError("Throttling")
+
+        with self.assertRaisesRegex(RuntimeError, "deployed template"):
+            deployed_availability_zone_indexes(cloudformation, "S")
+
+    def test_az_index_override_is_validated(self) -> None:
+        """Failure: AZ_INDEX must be a non-negative integer."""
+        self.assertIsNone(read_availability_zone_override({}))
+        self.assertEqual((1,), read_availability_zone_override({"AZ_INDEX": " 1 "}))
+        self.assertEqual((2, 0), read_availability_zone_override({"AZ_INDEX": "2, 0"}))
+        with self.assertRaisesRegex(RuntimeError, "Invalid AZ_INDEX"):
+            read_availability_zone_override({"AZ_INDEX": "-1"})
+        with self.assertRaisesRegex(RuntimeError, "Invalid AZ_INDEX"):
+            read_availability_zone_override({"AZ_INDEX": "1,1"})
+
+
+if __name__ == "__main__":
+    unittest.main()
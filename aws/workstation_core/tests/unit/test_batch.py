@@ -0,0 +1,207 @@
+"""Unit tests for concurrent multi-environment batch runs."""
+
+from __future__ import annotations
+
+import io
+from pathlib import Path
+import threading
+import unittest
+from unittest.mock import Mock, patch
+
+from workstation_core.batch import (
+    BatchEnvironmentResult,
+    PrefixedWriter,
+    format_batch_report,
+    resolve_batch_targets,
+    run_batch,
+    run_batch_deploy,
+    run_batch_stop,
+)
+from workstation_core.deploy_fingerprint import StackDeployDecision
+from workstation_core.interactive_workstation import EnvironmentTarget
+
+
+def _target(key: str) -> EnvironmentTarget:
+    """Return a discovered environment target for ``key``."""
+    display_name = key.capitalize()
+    return EnvironmentTarget(
+        environment_key=key,
+        display_name=display_name,
+        stack_dir=Path(f"/tmp/{key}"),
+        stack_name=f"{display_name}WorkstationStack",
+        spot_fleet_logical_id=f"{display_name}SpotFleet",
+        ssh_alias=f"{key}-workstation",
+        default_access_mode="ssh",
+    )
+
+
+TARGETS = [_target("gastown"), _target("builder"), _target("openclaw")]
+
+
+class BatchRunTests(unittest.TestCase):
+    """Validate target resolution, concurrency and reporting."""
+
+    def test_resolve_batch_targets_keeps_order_and_drops_duplicates(self) -> None:
+        """Expected: requested keys map onto discovered environments once each."""
+        targets = resolve_batch_targets(["openclaw", "gastown", "openclaw"], TARGETS)
+
+        self.assertEqual(["openclaw", "gastown"], [target.environment_key for target in targets])
+
+    def test_resolve_batch_targets_rejects_unknown_keys(self) -> None:
+        """Failure: unknown keys list the available environments."""
+        with self.assertRaisesRegex(RuntimeError, "Unknown environment\\(s\\): nope. Available: builder"):
+            resolve_batch_targets(["nope"], TARGETS)
+
+    def test_run_batch_runs_environments_concurrently(self) -> None:
+        """Expected: every environment is in flight at the same time."""
+        barrier = threading.Barrier(len(TARGETS), timeout=5)
+
+        results = run_batch(
+            TARGETS,
+            action="deploy",
+            run_environment=lambda target, writer: barrier.wait(),
+            max_workers=3,
+            out=io.StringIO(),
+        )
+
+        self.assertTrue(all(result.succeeded for result in results))
+
+    def test_run_batch_captures_failures_without_stopping_others(self) -> None:
+        """Failure: one failing environment is reported while the rest complete."""
+
+        def run_environment(target: EnvironmentTarget, writer: io.StringIO) -> None:
+            writer.write(f"deploying {target.stack_name}\n")
+            if target.environment_key == "builder":
+                raise RuntimeError("Spot capacity not available")
+
+        out = io.StringIO()
+        results = run_batch(TARGETS, action="deploy", run_environment=run_environment, out=out)
+
+        self.assertEqual([True, False, True], [result.succeeded for result in results])
+        self.assertEqual("Spot capacity not available", results[1].error)
+        self.assertIn("[builder ] deploying BuilderWorkstationStack\n", out.getvalue())
+
+    def test_prefixed_writer_only_emits_complete_lines(self) -> None:
+        """Edge: partial writes are buffered until the line ends."""
+        out = io.StringIO()
+        writer = PrefixedWriter(out, "[a] ", threading.Lock())
+
+        writer.write("one")
+        self.assertEqual("", out.getvalue())
+        writer.write(" two\nthree")
+        writer.flush()
+
+        self.assertEqual("[a] one two\n[a] three\n", out.getvalue())
+
+    def test_format_batch_report_lists_each_environment(self) -> None:
+        """Expected: the summary table includes result, time and error."""
+        report = format_batch_report(
+            "deploy",
+            [
+                BatchEnvironmentResult("gastown", "GastownWorkstationStack", True, 312.4),
+                BatchEnvironmentResult("builder", "BuilderWorkstationStack", False, 45.0, "boom"),
+            ],
+            320.0,
+        )
+
+        self.assertIn("gastown      ok        312s", report)
+        self.assertIn("builder      failed     45s  boom", report)
+        self.assertIn("Total wall time: 320s", report)
+
+
+class BatchDeployTests(unittest.TestCase):
+    """Validate the shared-network step and per-environment deploy fan-out."""
+
+    def test_run_batch_deploy_deploys_shared_network_once_then_each_environment(self) -> None:
+        """Expected: one shared-network step precedes every environment lifecycle."""
+        decision = StackDeployDecision("Env4aiNetworkStack", True, "shared network stack did not exist")
+
+        with (
+            patch("workstation_core.batch.make_cloudformation_client", return_value=Mock()),
+            patch("workstation_core.batch.ensure_shared_network_stack", return_value=decision) as ensure_network,
+            patch("workstation_core.batch.run_deploy_lifecycle", return_value=0) as run_deploy_lifecycle,
+        ):
+            results = run_batch_deploy(TARGETS, env={"AWS_REGION": "us-west-2"}, out=io.StringIO())
+
+        ensure_network.assert_called_once()
+        self.assertEqual(3, run_deploy_lifecycle.call_count)
+        self.assertEqual(
+            {"gastown", "builder", "openclaw"},
+            {call.args[0].environment for call in run_deploy_lifecycle.call_args_list},
+        )
+        self.assertTrue(all(result.succeeded for result in results))
+
+    def test_run_batch_deploy_rejects_interactive_ami_modes(self) -> None:
+        """Failure: AMI pick prompts cannot run concurrently."""
+        with patch("workstation_core.batch.ensure_shared_network_stack") as ensure_network:
+            with self.assertRaisesRegex(RuntimeError, "non-interactive"):
+                run_batch_deploy(TARGETS, env={"AMI_PICK": "1"}, out=io.StringIO())
+
+        ensure_network.assert_not_called()
+
+
+class BatchStopTests(unittest.TestCase):
+    """Validate overlapping AMI saves and per-environment destroys."""
+
+    def _run_stop(self, calls: list[str], *, fail_create_for: str | None = None, **kwargs: object):
+        def create_image(ec2_client: object, *, instance_id: str, image_name: str) -> str:
+            calls.append(f"create {image_name}")
+            if image_name.startswith(f"{fail_create_for}_"):
+                raise RuntimeError("CreateImage throttled")
+            return f"ami-{image_name}"
+
+        def wait_for_image(ec2_client: object, *, image_id: str) -> None:
+            calls.append(f"wait {image_id}")
+
+        with (
+            patch("workstation_core.batch.make_ec2_client", return_value=Mock()),
+            patch("workstation_core.batch.make_cloudformation_client", return_value=Mock()),
+            patch("workstation_core.batch.resolve_running_instance_id", return_value="i-1"),
+            patch("workstation_core.batch.create_image_from_instance", side_effect=create_image),
+            patch("workstation_core.batch.wait_for_image_available", side_effect=wait_for_image),
+            patch("workstation_core.batch.build_destroy_command", side_effect=lambda name: ["destroy", name]),
+            patch(
+                "workstation_core.batch.run_command",
+                side_effect=lambda command, cwd, timeout_seconds: calls.append(" ".join(command)),
+            ),
+            patch("workstation_core.batch.destroy_shared_network_stack") as destroy_network,
+        ):
+            results = run_batch_stop(
+                TARGETS,
+                env={"AMI_SAVE": "1", "AMI_TAG": "20260302", "AWS_REGION": "us-west-2"},
+                out=io.StringIO(),
+                **kwargs,
+            )
+        return results, destroy_network
+
+    def test_all_images_start_before_any_wait(self) -> None:
+        """Expected: every CreateImage is issued before the first availability wait."""
+        calls: list[str] = []
+
+        results, _ = self._run_stop(calls)
+
+        first_wait = min(index for index, call in enumerate(calls) if call.startswith("wait"))
+        self.assertEqual(3, sum(call.startswith("create") for call in calls[:first_wait]))
+        self.assertEqual(3, sum(call.startswith("destroy") for call in calls))
+        self.assertTrue(all(result.succeeded for result in results))
+
+    def test_failed_image_start_leaves_that_stack_running(self) -> None:
+        """Failure: an environment without a started AMI is never destroyed."""
+        calls: list[str] = []
+
+        results, destroy_network = self._run_stop(calls, fail_create_for="builder", destroy_shared_network=True)
+
+        self.assertEqual([True, False, True], [result.succeeded for result in results])
+        self.assertNotIn("destroy BuilderWorkstationStack", calls)
+        destroy_network.assert_not_called()
+
+    def test_shared_network_destroy_runs_after_every_stack_is_gone(self) -> None:
+        """Expected: the optional shared-network teardown runs once at the end."""
+        results, destroy_network = self._run_stop([], destroy_shared_network=True)
+
+        self.assertTrue(all(result.succeeded for result in results))
+        destroy_network.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
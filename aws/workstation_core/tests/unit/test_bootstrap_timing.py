@@ -0,0 +1,228 @@
+"""Unit tests for bootstrap timing telemetry."""
+
+from __future__ import annotations
+
+import base64
+import gzip
+import io
+from pathlib import Path
+import tempfile
+import unittest
+from unittest.mock import Mock
+
+from workstation_core.bootstrap_timing import (
+    BOOTSTRAP_TIMING_HISTORY_LIMIT,
+    BootstrapScriptTiming,
+    BootstrapTimingReport,
+    describe_bootstrap_launch,
+    format_bootstrap_timings,
+    load_bootstrap_timing_history,
+    parse_bootstrap_timings,
+    record_bootstrap_timings,
+    report_bootstrap_timings,
+    wait_for_bootstrap_complete,
+)
+from workstation_core.cdk_helpers import build_volume_preread_user_data
+
+
+def _report(instance_id: str, seconds: int, *, complete: bool = True) -> BootstrapTimingReport:
+    """Build a report with one script that ran for ``seconds``."""
+    return BootstrapTimingReport(
+        instance_id=instance_id,
+        scripts=(BootstrapScriptTiming("deps.sh", started_at=100, finished_at=100 + seconds, exit_code=0),),
+        complete=complete,
+    )
+
+
+class BootstrapTimingTests(unittest.TestCase):
+    """Validate console marker parsing, history and rendering."""
+
+    def test_parse_prefers_the_final_summary_line(self) -> None:
+        """Expected: the summary carries every script even when early markers scrolled away."""
+        output = "\n".join(
+            [
+                "env4ai-bootstrap: gui.sh end=400 exit=0",
+                "[   12.3] env4ai-bootstrap-summary: deps.sh=100,220,0 gui.sh=220,400,0 dev.sh=400,410,2 x.sh=skipped",
+            ]
+        )
+
+        report = parse_bootstrap_timings("i-1", output)
+
+        self.assertTrue(report.complete)
+        self.assertEqual(["deps.sh", "gui.sh", "dev.sh", "x.sh"], [timing.script for timing in report.scripts])
+        self.assertEqual(120, report.scripts[0].duration_seconds)
+        self.assertEqual("failed (exit 2)", report.scripts[2].status)
+        self.assertEqual("skipped", report.scripts[3].status)
+        self.assertEqual(310, report.total_seconds)
+
+    def test_parse_without_summary_reports_bootstrap_in_progress(self) -> None:
+        """Edge: start/end markers describe finished and still-running scripts."""
+        output = "\n".join(
+            [
+                "env4ai-bootstrap: deps.sh start=100",
+                "apt noise",
+                "env4ai-bootstrap: deps.sh end=150 exit=0",
+                "env4ai-bootstrap: android.sh start=150",
+            ]
+        )
+
+        report = parse_bootstrap_timings("i-1", output)
+
+        self.assertFalse(report.complete)
+        self.assertEqual("ok", report.scripts[0].status)
+        self.assertEqual(50, report.scripts[0].duration_seconds)
+        self.assertEqual("running", report.scripts[1].status)
+        self.assertIsNone(report.scripts[1].duration_seconds)
+
+    def test_parse_returns_none_without_markers(self) -> None:
+        """Edge: instances launched without the runner report nothing."""
+        self.assertIsNone(parse_bootstrap_timings("i-1", "cloud-init finished\n"))
+
+    def test_record_replaces_same_instance_and_caps_history(self) -> None:
+        """Expected: one record per instance, newest last, and at most the history limit."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            timing_dir = Path(tmpdir)
+            record_bootstrap_timings(timing_dir, "us-west-2", "Stack", _report("i-1", 10))
+            record_bootstrap_timings(timing_dir, "us-west-2", "Stack", _report("i-1", 20))
+            record_bootstrap_timings(timing_dir, "us-west-2", "Stack", _report("i-2", 30, complete=False))
+            history = load_bootstrap_timing_history(timing_dir, "us-west-2", "Stack")
+            for index in range(BOOTSTRAP_TIMING_HISTORY_LIMIT + 5):
+                record_bootstrap_timings(timing_dir, "us-west-2", "Stack", _report(f"i-{index + 10}", index))
+            capped = load_bootstrap_timing_history(timing_dir, "us-west-2", "Stack")
+
+        self.assertEqual(1, len(history))
+        self.assertEqual(20, history[0]["scripts"]["deps.sh"]["seconds"])
+        self.assertEqual(BOOTSTRAP_TIMING_HISTORY_LIMIT, len(capped))
+
+    def test_report_prints_table_with_previous_deploy_durations(self) -> None:
+        """Expected: the table compares each script with the previous instance's run."""
+        ec2_client = Mock()
+        ec2_client.get_console_output.return_value = {"Output": "env4ai-bootstrap-summary: deps.sh=100,190,0"}
+        out = io.StringIO()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            timing_dir = Path(tmpdir)
+            record_bootstrap_timings(timing_dir, "us-west-2", "Stack", _report("i-old", 120))
+
+            report = report_bootstrap_timings(
+                ec2_client,
+                timing_dir=timing_dir,
+                region="us-west-2",
+                stack_name="Stack",
+                instance_id="i-new",
+                out=out,
+            )
+            history = load_bootstrap_timing_history(timing_dir, "us-west-2", "Stack")
+
+        self.assertIsNotNone(report)
+        self.assertIn("Bootstrap timings (i-new, complete):", out.getvalue())
+        self.assertRegex(out.getvalue(), r"deps\.sh\s+90s\s+120s\s+ok")
+        self.assertEqual(["i-old", "i-new"], [run["instance_id"] for run in history])
+
+    def test_report_ignores_console_errors(self) -> None:
+        """Failure: an unreadable console is logged and reported as no timings."""
+        ec2_client = Mock()
+        ec2_client.get_console_output.side_effect = RuntimeError("AccessDenied")
+        out = io.StringIO()
+
+        with self.assertLogs("workstation_core.bootstrap_timing", level="WARNING"):
+            report = report_bootstrap_timings(
+                ec2_client,
+                timing_dir=Path("/nonexistent"),
+                region="us-west-2",
+                stack_name="Stack",
+                instance_id="i-1",
+                out=out,
+            )
+
+        self.assertIsNone(report)
+        self.assertEqual("", out.getvalue())
+
+    def test_wait_returns_report_once_summary_appears(self) -> None:
+        """Expected: progress is printed on change and the complete report is returned."""
+        ec2_client = Mock()
+        ec2_client.get_console_output.side_effect = [
+            {"Output": ""},
+            {"Output": "env4ai-bootstrap: deps.sh start=100"},
+            {"Output": "env4ai-bootstrap-summary: deps.sh=100,160,0"},
+        ]
+        clock = iter([0.0, 0.0, 15.0, 30.0, 30.0])
+        out = io.StringIO()
+
+        report = wait_for_bootstrap_complete(
+            ec2_client,
+            "i-1",
+            monotonic=lambda: next(clock),
+            sleeper=lambda _seconds: None,
+            out=out,
+        )
+
+        self.assertTrue(report.complete)
+        self.assertIn("no bootstrap output on the console yet", out.getvalue())
+        self.assertIn("0 script(s) finished, running deps.sh (15s elapsed)", out.getvalue())
+        self.assertIn("Bootstrap finished on i-1", out.getvalue())
+
+    def test_wait_fails_fast_when_a_script_exits_non_zero(self) -> None:
+        """Failure: a failed script aborts the wait before the runner finishes."""
+        ec2_client = Mock()
+        ec2_client.get_console_output.return_value = {
+            "Output": "env4ai-bootstrap: deps.sh start=100\nenv4ai-bootstrap: deps.sh end=130 exit=100\n"
+            "env4ai-bootstrap: gui.sh start=100\n",
+        }
+        sleeper = Mock()
+
+        with self.assertRaisesRegex(RuntimeError, "deps.sh exited with status 100 on i-1"):
+            wait_for_bootstrap_complete(ec2_client, "i-1", sleeper=sleeper, out=io.StringIO())
+
+        sleeper.assert_not_called()
+
+    def test_wait_times_out_with_last_status(self) -> None:
+        """Failure: the deadline error names what was still running."""
+        ec2_client = Mock()
+        ec2_client.get_console_output.return_value = {"Output": "env4ai-bootstrap: android.sh start=100"}
+        clock = iter([0.0, 0.0, 61.0])
+
+        with self.assertRaisesRegex(RuntimeError, r"within 60 seconds \(last status: 0 script\(s\) finished, running"):
+            wait_for_bootstrap_complete(
+                ec2_client,
+                "i-1",
+                timeout_seconds=60,
+                monotonic=lambda: next(clock),
+                sleeper=lambda _seconds: None,
+                out=io.StringIO(),
+            )
+
+    def test_describe_launch_finds_the_runner_in_compressed_user_data(self) -> None:
+        """Expected: only user data carrying the runner counts; golden and restored launches do not."""
+        runner_part = b'Content-Disposition: attachment; filename="env4ai-bootstrap-runner.sh"\n'
+        ec2_client = Mock()
+        ec2_client.describe_instances.return_value = {
+            "Reservations": [{"Instances": [{"InstanceId": "i-1", "ImageId": "ami-golden"}]}]
+        }
+        ec2_client.describe_instance_attribute.side_effect = [
+            {"UserData": {"Value": base64.b64encode(gzip.compress(runner_part)).decode()}},
+            {"UserData": {"Value": build_volume_preread_user_data()}},
+            {"InstanceId": "i-1"},
+        ]
+
+        launches = [describe_bootstrap_launch(ec2_client, "i-1") for _attempt in range(3)]
+
+        self.assertEqual([True, False, False], [launch.has_runner for launch in launches])
+        self.assertEqual("ami-golden", launches[0].image_id)
+        ec2_client.describe_instance_attribute.assert_called_with(InstanceId="i-1", Attribute="userData")
+
+    def test_format_marks_unknown_values(self) -> None:
+        """Edge: scripts without a previous run or an exit yet render as ``-``."""
+        report = BootstrapTimingReport(
+            instance_id="i-1",
+            scripts=(BootstrapScriptTiming("android.sh", started_at=10),),
+            complete=False,
+        )
+
+        lines = format_bootstrap_timings(report)
+
+        self.assertEqual("Bootstrap timings (i-1, in progress):", lines[0])
+        self.assertRegex(lines[2], r"android\.sh\s+-\s+-\s+running")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,21 +2,46 @@
 
 from __future__ import annotations
 
+import base64
 import contextlib
+import email
+import gzip
+import hashlib
 import io
+import json
 import os
 from pathlib import Path
+import shlex
+import shutil
+import subprocess
+import tarfile
 import tempfile
 import unittest
 from unittest import mock
 
 from workstation_core.cdk_helpers import (
+    BOOTSTRAP_LOG_DIR,
     build_bootstrap_user_data,
     build_spot_fleet_launch_specification,
+    expand_launch_specification_for_instance_types,
+    render_bootstrap_runner,
     resolve_ami_id,
     resolve_subnet_availability_zone,
 )
-from workstation_core.environment_config import AmiSelectorConfig, EnvironmentSpec
+from workstation_core.container_cache import container_pull_references
+from workstation_core.environment_config import AmiSelectorConfig, EnvironmentSpec, InstanceTypeOption
+
+
+def _decode_user_data(encoded: str) -> tuple[str, dict[str, str]]:
+    """Return the runner script and the written script contents from multipart user data."""
+    message = email.message_from_bytes(gzip.decompress(base64.b64decode(encoded)))
+    parts = message.get_payload()
+    scripts = {}
+    for part in parts[:-1]:
+        cloud_config = json.loads(part.get_payload().removeprefix("#cloud-config\n"))
+        entry = cloud_config["write_files"][0]
+        scripts[entry["path"].rsplit("/", 1)[1]] = entry["content"]
+    return parts[-1].get_payload(), scripts
 
 
 class CdkHelpersTests(unittest.TestCase):
@@ -40,8 +65,8 @@ class CdkHelpersTests(unittest.TestCase):
             spot_price="0.1",
         )
 
-    def test_build_bootstrap_user_data_concatenates_files_in_order(self) -> None:
-        """Expected: bootstrap helper concatenates and base64-encodes init scripts."""
+    def test_build_bootstrap_user_data_runs_files_in_order(self) -> None:
+        """Expected: without dependencies each script needs every earlier one and reports its timing."""
         with tempfile.TemporaryDirectory() as tmpdir:
             environment_dir = Path(tmpdir) / "aws" / "gastown"
             init_dir = environment_dir / "init"
@@ -56,7 +81,264 @@ class CdkHelpersTests(unittest.TestCase):
             finally:
                 os.chdir(original_cwd)
 
-        self.assertEqual("b25lCnR3bwo=", encoded)
+        runner, scripts = _decode_user_data(encoded)
+        self.assertEqual({"deps.sh": "one\n", "build.sh": "two\n"}, scripts)
+        self.assertIn("order=(deps.sh build.sh)", runner)
+        self.assertIn('[build.sh]="deps.sh"', runner)
+        self.assertIn("env4ai-bootstrap-summary:", runner)
+
+    def test_build_bootstrap_user_data_renders_dependency_runner_when_declared(self) -> None:
+        """Expected: declared dependencies switch user data to the bounded-parallel runner."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            environment_dir = Path(tmpdir) / "aws" / "gastown"
+            init_dir = environment_dir / "init"
+            init_dir.mkdir(parents=True)
+            (init_dir / "deps.sh").write_text("one\n", encoding="utf-8")
+            (init_dir / "agents.sh").write_text("two\n", encoding="utf-8")
+            (init_dir / "build.sh").write_text("three\n", encoding="utf-8")
+
+            original_cwd = os.getcwd()
+            try:
+                os.chdir(environment_dir)
+                encoded = build_bootstrap_user_data(
+                    ("deps.sh", "agents.sh", "build.sh"),
+                    dependencies={"agents.sh": ("deps.sh",), "build.sh": ("deps.sh",)},
+                    max_parallel=2,
+                )
+            finally:
+                os.chdir(original_cwd)
+
+        runner, scripts = _decode_user_data(encoded)
+        self.assertTrue(runner.startswith("#!/bin/bash"))
+        self.assertIn("max_jobs=2", runner)
+        self.assertIn("order=(deps.sh agents.sh build.sh)", runner)
+        self.assertIn('[agents.sh]="deps.sh"', runner)
+        self.assertIn('[deps.sh]=""', runner)
+        self.assertIn(BOOTSTRAP_LOG_DIR, runner)
+        self.assertEqual("one\n", scripts["deps.sh"])
+
+    def test_render_bootstrap_runner_restores_and_saves_package_cache_around_scripts(self) -> None:
+        """Expected: a package cache URL wraps the scripts in restore and save steps."""
+        runner = render_bootstrap_runner(
+            ("deps.sh",),
+            {"deps.sh": ()},
+            max_parallel=1,
+            package_cache_url="https://env4ai-package-cache-1-us-west-2.s3.us-west-2.amazonaws.com/gastown/",
+        )
+
+        self.assertIn("cache_url=https://env4ai-package-cache-1-us-west-2.s3.us-west-2.amazonaws.com/gastown\n", runner)
+        self.assertLess(runner.index("\nrestore_package_cache\n"), runner.index("declare -A state=()"))
+        self.assertTrue(runner.endswith('\nsave_package_cache\nexit "$result"\n'))
+        self.assertIn("/etc/apt/apt.conf.d/01env4ai-package-cache", runner)
+        self.assertIn("[go]=", runner)
+
+    @staticmethod
+    def _run_package_cache_functions(commands: str, cache_root: Path) -> subprocess.CompletedProcess[str]:
+        """Run ``commands`` in bash after the runner's package cache functions."""
+        runner = render_bootstrap_runner(
+            ("deps.sh",),
+            {"deps.sh": ()},
+            max_parallel=1,
+            package_cache_url="https://env4ai-package-cache-1-us-east-1.s3.us-east-1.amazonaws.com/gastown",
+        )
+        functions = runner[runner.index("cache_url=") : runner.index("\nrestore_package_cache\n")]
+        return subprocess.run(
+            ["bash", "-c", f"{functions}\ncache_root={cache_root}\n{commands}"],
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+
+    @unittest.skipUnless(shutil.which("bash") and shutil.which("openssl"), "bash and openssl are required")
+    def test_package_cache_requests_are_signed_with_sigv4(self) -> None:
+        """Expected: the runner's signer reproduces the published S3 SigV4 example."""
+        canonical_request = "\n".join(
+            [
+                "GET",
+                "/test.txt",
+                "",
+                "host:examplebucket.s3.amazonaws.com",
+                "range:bytes=0-9",
+                f"x-amz-content-sha256:{hashlib.sha256(b'').hexdigest()}",
+                "x-amz-date:20130524T000000Z",
+                "",
+                "host;range;x-amz-content-sha256;x-amz-date",
+                hashlib.sha256(b"").hexdigest(),
+            ]
+        )
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            result = self._run_package_cache_functions(
+                "echo \"$cache_host $cache_prefix $cache_region\"\n"
+                "cache_region=us-east-1\n"
+                "cache_signature wJalrXUtnFEMI/K7MDENG/bPxRfiCYEXAMPLEKEY 20130524T000000Z "
+                f"{shlex.quote(canonical_request)}",
+                Path(tmpdir),
+            )
+
+        self.assertEqual(
+            [
+                "env4ai-package-cache-1-us-east-1.s3.us-east-1.amazonaws.com /gastown us-east-1",
+                "f0e8bdb87c964420e857bd35b5d6ed310bd44f0170aba48dd91039c6036bdb41",
+            ],
+            result.stdout.splitlines(),
+        )
+
+    @unittest.skipUnless(shutil.which("bash") and shutil.which("tar"), "bash and tar are required")
+    def test_package_cache_restore_only_copies_allow_listed_paths(self) -> None:
+        """Failure: archives with absolute, parent or foreign paths are refused; escaping links are dropped."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            archives = {
+                "good": [
+                    ("root/.cache/pip/wheel.whl", tarfile.REGTYPE, ""),
+                    ("root/.cache/pip/latest", tarfile.SYMTYPE, "/root/.cache/pip/wheel.whl"),
+                    ("root/.cache/pip/passwd", tarfile.SYMTYPE, "../../../etc/passwd"),
+                ],
+                "absolute": [("/etc/cron.d/evil", tarfile.REGTYPE, "")],
+                "parent": [("root/.cache/pip/../../../etc/cron.d/evil", tarfile.REGTYPE, "")],
+                "foreign": [("etc/cron.d/evil", tarfile.REGTYPE, "")],
+            }
+            for name, members in archives.items():
+                with tarfile.open(root / f"{name}.tar.gz", "w:gz") as archive:
+                    for member_name, member_type, link_name in members:
+                        member = tarfile.TarInfo(member_name)
+                        member.type = member_type
+                        member.linkname = link_name
+                        archive.addfile(member, io.BytesIO(b""))
+
+            result = self._run_package_cache_functions(
+                "for name in good absolute parent foreign; do\n"
+                f'  mkdir -p "{root}/$name.target"\n'
+                f'  extract_package_cache pip "{root}/$name.tar.gz" "{root}/$name.target"; echo "$name=$?"\n'
+                "done",
+                root,
+            )
+
+            self.assertIn("good=0", result.stdout)
+            for name in ("absolute", "parent", "foreign"):
+                self.assertIn(f"{name}=1", result.stdout)
+                self.assertEqual([], list((root / f"{name}.target").iterdir()))
+            pip_cache = root / "good.target" / "root" / ".cache" / "pip"
+            self.assertEqual(["latest", "wheel.whl"], sorted(path.name for path in pip_cache.iterdir()))
+            self.assertEqual([], list(root.glob("staging.*")))
+
+    @unittest.skipUnless(shutil.which("bash"), "bash is required to run the bootstrap runner")
+    def test_bootstrap_runner_fails_a_script_on_its_first_failed_command(self) -> None:
+        """Failure: a command failing mid-script fails the script, skips its dependents and the runner."""
+        runner = render_bootstrap_runner(
+            ("deps.sh", "agents.sh"), {"deps.sh": (), "agents.sh": ("deps.sh",)}, max_parallel=2
+        )
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            script_dir = root / "scripts"
+            script_dir.mkdir()
+            (script_dir / "deps.sh").write_text(
+                'false | cat\ntouch "$ROOT/deps.done"\n', encoding="utf-8"
+            )
+            (script_dir / "agents.sh").write_text('touch "$ROOT/agents.done"\n', encoding="utf-8")
+            local_runner = runner.replace(f"log_dir={BOOTSTRAP_LOG_DIR}", f"log_dir={root}/logs").replace(
+                "script_dir=/var/lib/env4ai/bootstrap", f"script_dir={script_dir}"
+            )
+            result = subprocess.run(
+                ["bash", "-c", local_runner],
+                capture_output=True,
+                text=True,
+                env={"PATH": "/usr/bin:/bin", "ROOT": str(root)},
+                check=False,
+            )
+
+            self.assertEqual(1, result.returncode)
+            self.assertIn("[bootstrap] deps.sh exit=1", result.stdout)
+            self.assertIn("[bootstrap] agents.sh skipped: deps.sh did not succeed", result.stdout)
+            self.assertFalse((root / "deps.done").exists())
+            self.assertFalse((root / "agents.done").exists())
+
+    def test_render_bootstrap_runner_omits_package_cache_by_default(self) -> None:
+        """Edge: without a cache URL the runner never touches package caches."""
+        runner = render_bootstrap_runner(("deps.sh",), {"deps.sh": ()}, max_parallel=1)
+
+        self.assertNotIn("cache_url", runner)
+        self.assertNotIn("package_cache", runner)
+        self.assertTrue(runner.endswith('\nexit "$result"\n'))
+
+    def test_render_bootstrap_runner_writes_container_cache_files_before_scripts(self) -> None:
+        """Expected: docker.sh finds the cache registry and images to pull under /etc/env4ai."""
+        runner = render_bootstrap_runner(
+            ("docker.sh",),
+            {"docker.sh": ()},
+            max_parallel=1,
+            container_registry="1.dkr.ecr.us-west-2.amazonaws.com",
+            container_images=("1.dkr.ecr.us-west-2.amazonaws.com/docker-hub/library/postgres:17",),
+        )
+
+        self.assertIn("echo 1.dkr.ecr.us-west-2.amazonaws.com >/etc/env4ai/container-registry\n", runner)
+        self.assertIn(
+            "printf '%s\\n' 1.dkr.ecr.us-west-2.amazonaws.com/docker-hub/library/postgres:17 "
+            ">/etc/env4ai/container-images\n",
+            runner,
+        )
+        self.assertLess(runner.index("/etc/env4ai/container-images"), runner.index("declare -A state=()"))
+        plain_runner = render_bootstrap_runner(("docker.sh",), {"docker.sh": ()}, max_parallel=1)
+        self.assertNotIn("container-registry", plain_runner)
+
+    def test_cached_images_are_tagged_with_their_declared_names(self) -> None:
+        """Expected: the images file keeps declared names and docker.sh tags each cached pull with them."""
+        registry = "1.dkr.ecr.us-west-2.amazonaws.com"
+        pinned = "postgres:17.9@sha256:abc"
+        runner = render_bootstrap_runner(
+            ("docker.sh",),
+            {"docker.sh": ()},
+            max_parallel=1,
+            container_registry=registry,
+            container_images=container_pull_references((pinned, "ghcr.io/org/tool:1"), registry),
+        )
+        images_line = next(line for line in runner.splitlines() if line.endswith("/container-images"))
+        docker_sh = (Path(__file__).resolve().parents[3] / "common" / "init" / "docker.sh").read_text(
+            encoding="utf-8"
+        )
+        pull_block = docker_sh[docker_sh.index("# Each line is") : docker_sh.index("apt-get clean")]
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            (root / "docker").write_text(
+                '#!/bin/bash\necho "$*" >>"$DOCKER_CALLS"\n[ "$1 $2" != "image inspect" ] || [ "$3" = "$PINNED" ]\n',
+                encoding="utf-8",
+            )
+            (root / "docker").chmod(0o755)
+            script = "\n".join(
+                (
+                    images_line.replace("/etc/env4ai", str(root)),
+                    'log() { echo "$*"; }',
+                    f"CONTAINER_IMAGES_FILE={root}/container-images",
+                    pull_block,
+                )
+            )
+            env = {
+                **os.environ,
+                "PATH": f"{root}:{os.environ['PATH']}",
+                "DOCKER_CALLS": str(root / "calls"),
+                "PINNED": pinned,
+            }
+            result = subprocess.run(
+                ["bash", "-euo", "pipefail", "-c", script], env=env, capture_output=True, text=True, check=False
+            )
+            images_file = (root / "container-images").read_text(encoding="utf-8")
+            calls = (root / "calls").read_text(encoding="utf-8").splitlines()
+
+        self.assertEqual(0, result.returncode, result.stderr)
+        self.assertEqual(f"{registry}/docker-hub/library/postgres:17.9 {pinned}\nghcr.io/org/tool:1\n", images_file)
+        self.assertEqual(
+            [
+                f"pull --quiet {registry}/docker-hub/library/postgres:17.9",
+                f"tag {registry}/docker-hub/library/postgres:17.9 postgres:17.9",
+                f"image inspect {pinned}",
+                "pull --quiet ghcr.io/org/tool:1",
+            ],
+            calls,
+        )
+        self.assertNotIn("does not resolve", result.stdout)
 
     def test_build_bootstrap_user_data_falls_back_to_shared_scripts(self) -> None:
         """Edge: shared init scripts are used when the environment-local file is absent."""
@@ -76,7 +358,8 @@ class CdkHelpersTests(unittest.TestCase):
             finally:
                 os.chdir(original_cwd)
 
-        self.assertEqual("b25lCnR3bwo=", encoded)
+        _, scripts = _decode_user_data(encoded)
+        self.assertEqual({"deps.sh": "one\n", "build.sh": "two\n"}, scripts)
 
     def test_build_bootstrap_user_data_prefers_local_script_and_logs_collision(self) -> None:
         """Edge: local init scripts override shared ones and collisions are reported."""
@@ -98,7 +381,8 @@ class CdkHelpersTests(unittest.TestCase):
             finally:
                 os.chdir(original_cwd)
 
-        self.assertEqual("bG9jYWwK", encoded)
+        _, scripts = _decode_user_data(encoded)
+        self.assertEqual({"agents.sh": "local\n"}, scripts)
         self.assertIn("found in both", output.getvalue())
         self.assertIn("using", output.getvalue())
 
@@ -123,6 +407,50 @@ class CdkHelpersTests(unittest.TestCase):
         self.assertIn("bootstrap: deps.sh ->", output.getvalue())
         self.assertIn(str(script_path), output.getvalue())
 
+    def test_build_bootstrap_user_data_warns_with_size_breakdown_near_limit(self) -> None:
+        """Edge: a payload near the limit prints per-script sizes and hashes."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            environment_dir = Path(tmpdir) / "aws" / "gastown"
+            init_dir = environment_dir / "init"
+            init_dir.mkdir(parents=True)
+            (init_dir / "deps.sh").write_text("echo deps\n", encoding="utf-8")
+
+            original_cwd = os.getcwd()
+            output = io.StringIO()
+            try:
+                os.chdir(environment_dir)
+                encoded = build_bootstrap_user_data(("deps.sh",))
+                payload_bytes = len(base64.b64decode(encoded))
+                with (
+                    mock.patch("workstation_core.cdk_helpers.USER_DATA_LIMIT_BYTES", payload_bytes + 10),
+                    contextlib.redirect_stdout(output),
+                ):
+                    build_bootstrap_user_data(("deps.sh",))
+            finally:
+                os.chdir(original_cwd)
+
+        self.assertIn("close to the EC2 limit", output.getvalue())
+        self.assertRegex(output.getvalue(), r"bootstrap: deps\.sh\s+\d+\s+\d+\s+[0-9a-f]{12}")
+        self.assertIn(f"compressed payload {payload_bytes} of {payload_bytes + 10} bytes", output.getvalue())
+
+    def test_build_bootstrap_user_data_raises_when_payload_exceeds_limit(self) -> None:
+        """Failure: an oversized compressed payload fails synth with the breakdown."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            environment_dir = Path(tmpdir) / "aws" / "gastown"
+            init_dir = environment_dir / "init"
+            init_dir.mkdir(parents=True)
+            (init_dir / "deps.sh").write_text(os.urandom(16 * 1024).hex(), encoding="utf-8")
+
+            original_cwd = os.getcwd()
+            try:
+                os.chdir(environment_dir)
+                with self.assertRaisesRegex(ValueError, "over the EC2 limit of 16384 bytes") as exc_info:
+                    build_bootstrap_user_data(("deps.sh",))
+            finally:
+                os.chdir(original_cwd)
+
+        self.assertIn("bootstrap: deps.sh", str(exc_info.exception))
+
     def test_build_bootstrap_user_data_raises_clear_error_when_script_is_missing(self) -> None:
         """Failure: missing bootstrap scripts report all searched locations."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -159,6 +487,31 @@ class CdkHelpersTests(unittest.TestCase):
         self.assertEqual([{"groupId": "sg-12345"}], launch_spec["security_groups"])
         self.assertNotIn("user_data", launch_spec)
 
+    def test_build_launch_spec_pre_reads_restored_volume_without_bootstrap(self) -> None:
+        """Expected: a restored AMI without bootstrap still gets the root volume pre-read as user data."""
+        launch_spec = build_spot_fleet_launch_specification(
+            ami_id="ami-12345",
+            instance_type="t3.large",
+            security_group_ids=["sg-12345"],
+            subnet_id="subnet-12345",
+            volume_size=100,
+            include_bootstrap_user_data=False,
+            bootstrap_files=("deps.sh",),
+            volume_preread=True,
+        )
+
+        script = gzip.decompress(base64.b64decode(launch_spec["user_data"])).decode("utf-8")
+        self.assertTrue(script.startswith("#!/bin/bash\n"))
+        self.assertIn("systemd-run --unit=env4ai-volume-preread", script)
+        self.assertIn('mark "device=$device end=$(date +%s) exit=$status"', script)
+        self.assertNotIn("deps.sh", script)
+
+    def test_render_bootstrap_runner_starts_volume_preread_before_scripts(self) -> None:
+        """Expected: with bootstrap enabled the runner launches the pre-read before the first script."""
+        runner = render_bootstrap_runner(("deps.sh",), {"deps.sh": ()}, max_parallel=1, volume_preread=True)
+
+        self.assertLess(runner.index("env4ai-volume-preread"), runner.index("declare -A state=()"))
+
     def test_build_launch_spec_can_omit_key_name_and_include_instance_profile(self) -> None:
         """Expected: access-mode helpers can disable key pairs and attach instance profiles."""
         launch_spec = build_spot_fleet_launch_specification(
@@ -183,6 +536,37 @@ class CdkHelpersTests(unittest.TestCase):
             launch_spec["security_groups"],
         )
 
+    def test_expand_launch_spec_emits_one_weighted_spec_per_instance_type(self) -> None:
+        """Expected: fallback types reuse the launch spec with their own type and weight."""
+        launch_spec = build_spot_fleet_launch_specification(
+            ami_id="ami-12345",
+            instance_type="t3.large",
+            security_group_ids=["sg-12345"],
+            subnet_id="subnet-12345",
+            volume_size=100,
+            include_bootstrap_user_data=False,
+            bootstrap_files=("deps.sh",),
+        )
+
+        specs = expand_launch_specification_for_instance_types(
+            launch_spec,
+            (InstanceTypeOption("t3.large"), InstanceTypeOption("m5.xlarge", weight=2)),
+        )
+
+        self.assertEqual(
+            [("t3.large", 1.0), ("m5.xlarge", 2)],
+            [(spec["instance_type"], spec["weighted_capacity"]) for spec in specs],
+        )
+        self.assertEqual(["subnet-12345", "subnet-12345"], [spec["subnet_id"] for spec in specs])
+
+    def test_expand_launch_spec_keeps_single_type_unweighted(self) -> None:
+        """Edge: environments without fallbacks keep their launch spec unchanged."""
+        launch_spec = {"instance_type": "t3.large", "image_id": "ami-12345"}
+
+        specs = expand_launch_specification_for_instance_types(launch_spec, (InstanceTypeOption("t3.large"),))
+
+        self.assertEqual([launch_spec], specs)
+
     def test_resolve_ami_id_rejects_invalid_source(self) -> None:
         """Failure: unsupported AMI source values are rejected immediately."""
         with self.assertRaisesRegex(
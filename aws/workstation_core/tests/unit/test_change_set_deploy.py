@@ -0,0 +1,263 @@
+"""Unit tests for the direct CloudFormation change-set deploy engine."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+import io
+import json
+from pathlib import Path
+import tempfile
+import unittest
+from unittest.mock import Mock
+
+from workstation_core.change_set_deploy import (
+    MAX_TEMPLATE_BODY_BYTES,
+    StackArtifact,
+    StackEventTail,
+    deploy_stack_artifact,
+    format_resource_timings,
+    load_stack_artifact,
+)
+
+STACK = "GastownWorkstationStack"
+_T0 = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _event(event_id: str, logical_id: str, status: str, seconds: int, reason: str | None = None) -> dict:
+    """Return one raw ``describe_stack_events`` entry."""
+    event = {
+        "EventId": event_id,
+        "LogicalResourceId": logical_id,
+        "ResourceType": "AWS::CloudFormation::Stack" if logical_id == STACK else "AWS::EC2::SpotFleet",
+        "ResourceStatus": status,
+        "Timestamp": _T0 + timedelta(seconds=seconds),
+    }
+    if reason:
+        event["ResourceStatusReason"] = reason
+    return event
+
+
+def _client(stack_status: str | None, event_pages: list[list[dict]]) -> Mock:
+    """Return a CloudFormation mock that replays newest-first event pages per poll."""
+    client = Mock()
+    if stack_status is None:
+        client.describe_stacks.side_effect = RuntimeError("Stack with id X does not exist")
+    else:
+        client.describe_stacks.return_value = {"Stacks": [{"StackStatus": stack_status}]}
+    client.create_change_set.return_value = {"Id": "arn:changeset/1"}
+    client.describe_change_set.return_value = {"Status": "CREATE_COMPLETE"}
+    client.describe_stack_events.side_effect = [{"StackEvents": page} for page in event_pages]
+    return client
+
+
+class _FakeClock:
+    """Monotonic clock advanced by the injected sleeper."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+class ChangeSetDeployTests(unittest.TestCase):
+    """Validate change-set creation, event tailing, and fail-fast behavior."""
+
+    def _deploy(self, client: Mock, artifact: StackArtifact | None = None, **kwargs: object):
+        clock = _FakeClock()
+        return deploy_stack_artifact(
+            client,
+            artifact or StackArtifact(stack_name=STACK, template_body="{}"),
+            monotonic=clock.monotonic,
+            sleeper=clock.sleep,
+            out=io.StringIO(),
+            **kwargs,
+        )
+
+    def test_update_streams_events_and_reports_resource_timings(self) -> None:
+        """Expected: update completes on the stack event and times each resource."""
+        client = _client(
+            "UPDATE_COMPLETE",
+            [
+                [_event("old", STACK, "UPDATE_COMPLETE", 0)],
+                [_event("e1", "Fleet", "UPDATE_IN_PROGRESS", 10)],
+                [
+                    _event("e3", STACK, "UPDATE_COMPLETE", 60),
+                    _event("e2", "Fleet", "UPDATE_COMPLETE", 55),
+                    _event("e1", "Fleet", "UPDATE_IN_PROGRESS", 10),
+                ],
+            ],
+        )
+
+        result = self._deploy(client, change_set_name="cs")
+
+        self.assertTrue(result.changed)
+        self.assertEqual("UPDATE", result.change_set_type)
+        self.assertEqual("UPDATE_COMPLETE", result.stack_status)
+        self.assertEqual(1, len(result.resource_timings))
+        self.assertEqual(45.0, result.resource_timings[0].duration_seconds)
+        self.assertEqual("UPDATE", client.create_change_set.call_args.kwargs["ChangeSetType"])
+        client.execute_change_set.assert_called_once_with(ChangeSetName="arn:changeset/1")
+        self.assertIn("Fleet (AWS::EC2::SpotFleet): 45s", format_resource_timings(result))
+
+    def test_first_failed_event_cancels_update_and_raises(self) -> None:
+        """Failure: the first *_FAILED resource aborts without waiting for rollback."""
+        client = _client(
+            "UPDATE_COMPLETE",
+            [
+                [],
+                [_event("e1", "Fleet", "UPDATE_FAILED", 5, "Spot capacity not available")],
+            ],
+        )
+
+        with self.assertRaisesRegex(RuntimeError, "Fleet .*UPDATE_FAILED: Spot capacity not available"):
+            self._deploy(client)
+
+        client.cancel_update_stack.assert_called_once_with(StackName=STACK)
+
+    def test_missing_stack_creates_change_set_without_cancel_on_failure(self) -> None:
+        """Edge: first deploys use CREATE and leave rollback to CloudFormation."""
+        client = _client(None, [[], [_event("e1", "Fleet", "CREATE_FAILED", 5, "boom")]])
+
+        with self.assertRaisesRegex(RuntimeError, "CREATE_FAILED: boom"):
+            self._deploy(client)
+
+        self.assertEqual("CREATE", client.create_change_set.call_args.kwargs["ChangeSetType"])
+        client.cancel_update_stack.assert_not_called()
+
+    def test_empty_change_set_is_deleted_and_reported_unchanged(self) -> None:
+        """Edge: a change set with no changes is cleaned up instead of executed."""
+        client = _client("UPDATE_COMPLETE", [])
+        client.describe_change_set.return_value = {
+            "Status": "FAILED",
+            "StatusReason": "The submitted information didn't contain changes.",
+        }
+
+        result = self._deploy(client)
+
+        self.assertFalse(result.changed)
+        client.delete_change_set.assert_called_once_with(ChangeSetName="arn:changeset/1")
+        client.execute_change_set.assert_not_called()
+
+    def test_busy_stack_is_rejected_before_creating_a_change_set(self) -> None:
+        """Failure: an in-progress stack operation is not interrupted."""
+        client = _client("UPDATE_IN_PROGRESS", [])
+
+        with self.assertRaisesRegex(RuntimeError, "busy"):
+            self._deploy(client)
+
+        client.create_change_set.assert_not_called()
+
+    def test_large_template_is_staged_in_the_bootstrap_bucket(self) -> None:
+        """Edge: templates over the inline limit are passed by TemplateURL."""
+        client = _client("UPDATE_COMPLETE", [[], [_event("e1", STACK, "UPDATE_COMPLETE", 5)]])
+        s3_client = Mock()
+        s3_client.meta.region_name = "us-west-2"
+        artifact = StackArtifact(
+            stack_name=STACK,
+            template_body="x" * (MAX_TEMPLATE_BODY_BYTES + 1),
+            template_bucket="cdk-hnb-assets-123-us-west-2",
+            template_object_key="abc.json",
+        )
+
+        self._deploy(client, artifact, s3_client=s3_client)
+
+        s3_client.put_object.assert_called_once()
+        self.assertEqual(
+            "https://cdk-hnb-assets-123-us-west-2.s3.us-west-2.amazonaws.com/abc.json",
+            client.create_change_set.call_args.kwargs["TemplateURL"],
+        )
+
+
+class StackEventTailTests(unittest.TestCase):
+    """Validate incremental event paging."""
+
+    def test_poll_pages_until_last_seen_event_and_returns_oldest_first(self) -> None:
+        """Expected: NextToken is followed only until the last seen event id."""
+        client = Mock()
+        client.describe_stack_events.side_effect = [
+            {"StackEvents": [_event("e0", STACK, "UPDATE_COMPLETE", 0)]},
+            {"StackEvents": [_event("e3", "Fleet", "UPDATE_COMPLETE", 3)], "NextToken": "t1"},
+            {"StackEvents": [_event("e2", "Fleet", "UPDATE_IN_PROGRESS", 2), _event("e0", STACK, "x", 0)],
+             "NextToken": "t2"},
+        ]
+        tail = StackEventTail(client, STACK)
+
+        tail.prime()
+        events = tail.poll()
+
+        self.assertEqual(["e2", "e3"], [event.event_id for event in events])
+        self.assertEqual("e3", tail.last_event_id)
+        self.assertEqual("t1", client.describe_stack_events.call_args.kwargs["NextToken"])
+
+
+class LoadStackArtifactTests(unittest.TestCase):
+    """Validate cloud assembly parsing."""
+
+    def test_reads_template_role_and_bucket_with_placeholders_resolved(self) -> None:
+        """Expected: bootstrap role and template bucket resolve to the stack account/region."""
+        with tempfile.TemporaryDirectory() as tmp:
+            assembly = Path(tmp)
+            (assembly / f"{STACK}.template.json").write_text(json.dumps({"Resources": {}}), encoding="utf-8")
+            (assembly / f"{STACK}.assets.json").write_text(
+                json.dumps(
+                    {
+                        "files": {
+                            "abc": {
+                                "source": {"path": f"{STACK}.template.json"},
+                                "destinations": {
+                                    "d": {
+                                        "bucketName": "cdk-hnb-assets-${AWS::AccountId}-${AWS::Region}",
+                                        "objectKey": "abc.json",
+                                    }
+                                },
+                            }
+                        }
+                    }
+                ),
+                encoding="utf-8",
+            )
+            (assembly / "manifest.json").write_text(
+                json.dumps(
+                    {
+                        "artifacts": {
+                            f"{STACK}.assets": {
+                                "type": "cdk:asset-manifest",
+                                "properties": {"file": f"{STACK}.assets.json"},
+                            },
+                            STACK: {
+                                "type": "aws:cloudformation:stack",
+                                "environment": "aws://123456789012/us-west-2",
+                                "properties": {
+                                    "templateFile": f"{STACK}.template.json",
+                                    "cloudFormationExecutionRoleArn": (
+                                        "arn:${AWS::Partition}:iam::${AWS::AccountId}:role/cdk-hnb-cfn-exec-role"
+                                    ),
+                                },
+                                "dependencies": [f"{STACK}.assets"],
+                            },
+                        }
+                    }
+                ),
+                encoding="utf-8",
+            )
+
+            artifact = load_stack_artifact(assembly, STACK)
+
+        self.assertEqual(STACK, artifact.stack_name)
+        self.assertEqual("arn:aws:iam::123456789012:role/cdk-hnb-cfn-exec-role", artifact.execution_role_arn)
+        self.assertEqual("cdk-hnb-assets-123456789012-us-west-2", artifact.template_bucket)
+        self.assertFalse(artifact.has_external_assets)
+
+    def test_missing_manifest_raises_actionable_error(self) -> None:
+        """Failure: an unsynthesized directory asks for a fresh synth."""
+        with tempfile.TemporaryDirectory() as tmp:
+            with self.assertRaisesRegex(RuntimeError, "synthesized again"):
+                load_stack_artifact(tmp, STACK)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,55 @@
+"""Unit tests for container pull-through cache references."""
+
+from __future__ import annotations
+
+import unittest
+from unittest.mock import Mock
+
+from workstation_core.container_cache import (
+    container_cache_reference,
+    container_pull_references,
+    resolve_container_cache_credential_arn,
+)
+
+REGISTRY = "111111111111.dkr.ecr.us-west-2.amazonaws.com"
+
+
+class ContainerCacheTests(unittest.TestCase):
+    """Validate image reference mapping onto ECR pull-through repositories."""
+
+    def test_reference_maps_docker_hub_images_under_the_cache_prefix(self) -> None:
+        """Expected: official images gain ``library/`` and tags win over pinned digests."""
+        cases = (
+            ("postgres:17.9@sha256:abc", f"{REGISTRY}/docker-hub/library/postgres:17.9"),
+            ("teslamate/grafana:3.0.0", f"{REGISTRY}/docker-hub/teslamate/grafana:3.0.0"),
+            ("docker.io/library/redis", f"{REGISTRY}/docker-hub/library/redis:latest"),
+            ("public.ecr.aws/nginx/nginx@sha256:def", f"{REGISTRY}/ecr-public/nginx/nginx@sha256:def"),
+        )
+        for image, expected in cases:
+            with self.subTest(image=image):
+                self.assertEqual(expected, container_cache_reference(image, REGISTRY))
+
+    def test_reference_leaves_uncached_registries_alone(self) -> None:
+        """Edge: registries without a pull-through rule keep their original reference."""
+        self.assertIsNone(container_cache_reference("ghcr.io/org/tool:1", REGISTRY))
+        self.assertIsNone(container_cache_reference("localhost:5000/tool", REGISTRY))
+        self.assertEqual(
+            ("ghcr.io/org/tool:1", f"{REGISTRY}/docker-hub/library/postgres:17 postgres:17"),
+            container_pull_references(("ghcr.io/org/tool:1", "postgres:17"), REGISTRY),
+        )
+
+    def test_pull_references_without_cache_are_the_declared_images(self) -> None:
+        """Expected: without the cache the bootstrap pulls the images from their registries."""
+        self.assertEqual(("postgres:17",), container_pull_references((" postgres:17 ",), None))
+
+    def test_credential_lookup_explains_missing_secret(self) -> None:
+        """Failure: a missing Docker Hub secret names the secret to create."""
+        client = Mock()
+        client.describe_secret.side_effect = RuntimeError("ResourceNotFoundException")
+
+        with self.assertRaisesRegex(RuntimeError, "'ecr-pullthroughcache/docker-hub'.*accessToken"):
+            resolve_container_cache_credential_arn(client)
+
+
+if __name__ == "__main__":
+    unittest.main()
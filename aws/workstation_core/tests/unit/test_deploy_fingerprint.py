@@ -0,0 +1,131 @@
+"""Unit tests for template-fingerprint deploy skipping."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+import tempfile
+import unittest
+from unittest.mock import Mock
+
+from botocore.exceptions import ClientError
+
+from workstation_core.deploy_fingerprint import (
+    compute_template_fingerprint,
+    decide_stack_deploy,
+    format_deploy_report,
+    load_synthesized_template,
+    record_local_fingerprint,
+)
+
+TEMPLATE = {"Resources": {"Fleet": {"Type": "AWS::EC2::SpotFleet", "Properties": {"A": 1}}}}
+
+
+def _cloudformation_client(status: str | None, template_body: object | None) -> Mock:
+    """Return a CloudFormation mock with a stack status and deployed template."""
+    client = Mock()
+    client.meta.region_name = "us-west-2"
+    if status is None:
+        client.describe_stacks.side_effect = ClientError(
+            {"Error": {"Code": "ValidationError", "Message": "Stack with id X does not exist"}},
+            "DescribeStacks",
+        )
+    else:
+        client.describe_stacks.return_value = {"Stacks": [{"StackStatus": status}]}
+    if template_body is None:
+        client.get_template.side_effect = ClientError(
+            {"Error": {"Code": "AccessDenied", "Message": "denied"}},
+            "GetTemplate",
+        )
+    else:
+        client.get_template.return_value = {"TemplateBody": template_body}
+    return client
+
+
+class DeployFingerprintTests(unittest.TestCase):
+    """Validate fingerprinting, comparison sources, and reporting."""
+
+    def test_fingerprint_ignores_key_order_but_not_values_or_parameters(self) -> None:
+        """Expected: canonical JSON makes key order irrelevant; values and parameters matter."""
+        reordered = json.loads(json.dumps(TEMPLATE, sort_keys=False))
+        changed = {"Resources": {"Fleet": {"Type": "AWS::EC2::SpotFleet", "Properties": {"A": 2}}}}
+
+        self.assertEqual(compute_template_fingerprint(TEMPLATE), compute_template_fingerprint(reordered))
+        self.assertNotEqual(compute_template_fingerprint(TEMPLATE), compute_template_fingerprint(changed))
+        self.assertNotEqual(
+            compute_template_fingerprint(TEMPLATE),
+            compute_template_fingerprint(TEMPLATE, {"Env": "dev"}),
+        )
+
+    def test_decide_skips_when_deployed_template_matches(self) -> None:
+        """Expected: a settled stack with an identical deployed template is skipped."""
+        client = _cloudformation_client("UPDATE_COMPLETE", json.dumps(TEMPLATE))
+
+        decision = decide_stack_deploy(client, stack_name="GastownWorkstationStack", template=TEMPLATE)
+
+        self.assertFalse(decision.should_deploy)
+        self.assertIn("deployed template", decision.reason)
+
+    def test_decide_deploys_missing_changed_forced_and_unsettled_stacks(self) -> None:
+        """Edge: missing, changed, rolled-back, and forced stacks all deploy."""
+        changed_body = {"Resources": {}}
+        cases = [
+            (_cloudformation_client(None, None), False, "does not exist"),
+            (_cloudformation_client("UPDATE_COMPLETE", changed_body), False, "template changed"),
+            (_cloudformation_client("UPDATE_ROLLBACK_COMPLETE", TEMPLATE), False, "UPDATE_ROLLBACK_COMPLETE"),
+            (_cloudformation_client("UPDATE_COMPLETE", TEMPLATE), True, "forced"),
+        ]
+        for client, force, reason in cases:
+            with self.subTest(reason=reason):
+                decision = decide_stack_deploy(
+                    client,
+                    stack_name="GastownWorkstationStack",
+                    template=TEMPLATE,
+                    force=force,
+                )
+                self.assertTrue(decision.should_deploy)
+                self.assertIn(reason, decision.reason)
+
+    def test_decide_falls_back_to_local_fingerprint_when_template_unreadable(self) -> None:
+        """Edge: without get_template access the locally recorded fingerprint is used."""
+        client = _cloudformation_client("CREATE_COMPLETE", None)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            fingerprint_dir = Path(tmpdir)
+            first = decide_stack_deploy(
+                client,
+                stack_name="GastownWorkstationStack",
+                template=TEMPLATE,
+                fingerprint_dir=fingerprint_dir,
+            )
+            record_local_fingerprint(fingerprint_dir, "us-west-2", "GastownWorkstationStack", first.fingerprint)
+            second = decide_stack_deploy(
+                client,
+                stack_name="GastownWorkstationStack",
+                template=TEMPLATE,
+                fingerprint_dir=fingerprint_dir,
+            )
+
+        self.assertTrue(first.should_deploy)
+        self.assertFalse(second.should_deploy)
+        self.assertIn("last recorded deploy", second.reason)
+
+    def test_load_synthesized_template_raises_actionable_error_when_missing(self) -> None:
+        """Failure: a missing assembly template raises a runtime error naming the stack."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with self.assertRaisesRegex(RuntimeError, "synthesized template for 'GastownWorkstationStack'"):
+                load_synthesized_template(tmpdir, "GastownWorkstationStack")
+
+    def test_format_deploy_report_lists_each_stack(self) -> None:
+        """Expected: the report shows one line per stack with its reason."""
+        client = _cloudformation_client("UPDATE_COMPLETE", TEMPLATE)
+        decision = decide_stack_deploy(client, stack_name="GastownWorkstationStack", template=TEMPLATE)
+
+        self.assertEqual(
+            "Stack deploy report:\n"
+            "  GastownWorkstationStack: skipped (synthesized template matches the deployed template)\n",
+            format_deploy_report([decision]),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,15 +3,55 @@
 from __future__ import annotations
 
 import io
+from pathlib import Path
 import unittest
 from unittest.mock import Mock, patch
 
-from workstation_core.orchestration import DeployWorkflowInputs, run_deploy_lifecycle
+from workstation_core.az_selection import AvailabilityZoneSelection
+from workstation_core.change_set_deploy import ChangeSetDeployResult, StackArtifact
+from workstation_core.deploy_fingerprint import StackDeployDecision
+from workstation_core.golden_ami import GoldenImageChoice
+from workstation_core.pause import FleetInstance
+from workstation_core.orchestration import (
+    DeployWorkflowInputs,
+    resolve_deploy_engine,
+    run_deploy_lifecycle,
+)
 
 
 class DeployOrchestrationTests(unittest.TestCase):
     """Validate shared deploy orchestration behavior."""
 
+    def setUp(self) -> None:
+        """Stub synth and fingerprint helpers so no CDK CLI runs."""
+        self.decide_stack_deploy = self._start_patch(
+            "workstation_core.orchestration.decide_stack_deploy",
+            return_value=StackDeployDecision("GastownWorkstationStack", True, "template changed", "abc"),
+        )
+        self.synthesize_assembly = self._start_patch(
+            "workstation_core.orchestration.synthesize_assembly",
+            return_value=Path("/tmp/gastown/cdk.out"),
+        )
+        self._start_patch("workstation_core.orchestration.load_synthesized_template", return_value={})
+        self.record_local_fingerprint = self._start_patch(
+            "workstation_core.orchestration.record_local_fingerprint"
+        )
+        self.record_lifecycle_timing = self._start_patch(
+            "workstation_core.orchestration.record_lifecycle_timing"
+        )
+        self.choose_deploy_golden_image = self._start_patch(
+            "workstation_core.orchestration.choose_deploy_golden_image",
+            return_value=GoldenImageChoice(None, "Golden AMI: not built; bootstrapping in user data."),
+        )
+        self.sts_client = self._start_patch("workstation_core.orchestration.make_sts_client").return_value
+        self.sts_client.get_caller_identity.return_value = {"Account": "111111111111"}
+
+    def _start_patch(self, target: str, **kwargs: object) -> Mock:
+        """Start a patcher that is undone after the test."""
+        patcher = patch(target, **kwargs)
+        self.addCleanup(patcher.stop)
+        return patcher.start()
+
     @staticmethod
     def _inputs() -> DeployWorkflowInputs:
         """Return common test inputs."""
@@ -22,22 +62,26 @@ class DeployOrchestrationTests(unittest.TestCase):
             profile=None,
             region=None,
             access_mode=None,
+            deploy_engine="cdk",
         )
 
     def test_run_deploy_lifecycle_runs_default_deploy_path_without_ami_flags(self) -> None:
-        """Expected: no AMI controls triggers default deploy + post check flow with EIP."""
+        """Expected: no AMI controls triggers default deploy + readiness wait with EIP."""
         env = {"AWS_REGION": "us-west-2"}
         selection = Mock(should_deploy=True, selected_ami_id=None)
         eip_info = {"allocation_id": "eipalloc-abc123", "public_ip": "1.2.3.4"}
 
         with (
             patch("workstation_core.orchestration.make_ec2_client", return_value=Mock()),
+            patch("workstation_core.orchestration.make_cloudformation_client", return_value=Mock()),
             patch("workstation_core.orchestration.resolve_ami_selection", return_value=selection),
             patch("workstation_core.orchestration.shared_network_stack_exists", return_value=False),
-            patch("workstation_core.orchestration.find_or_create_eip", return_value=eip_info),
+            patch("workstation_core.orchestration.find_eip_by_name", return_value=eip_info),
             patch("workstation_core.orchestration.deploy_shared_network_stack") as deploy_shared_network_stack,
             patch("workstation_core.orchestration.deploy_stack") as deploy_stack,
-            patch("workstation_core.orchestration.run_post_deploy_check") as post_check,
+            patch("workstation_core.orchestration.make_ssm_client", return_value=Mock()),
+            patch("workstation_core.orchestration.wait_for_workstation_ready") as wait_for_ready,
+            patch("workstation_core.orchestration.print_connection_guidance"),
         ):
             result = run_deploy_lifecycle(inputs=self._inputs(), env=env, out=io.StringIO())
 
@@ -51,14 +95,22 @@ class DeployOrchestrationTests(unittest.TestCase):
             eip_allocation_id="eipalloc-abc123",
             access_mode="ssh",
             public_ip_enabled=True,
+            app="/tmp/gastown/cdk.out",
+            availability_zone_indexes=None,
         )
-        post_check.assert_called_once_with(
-            stack_dir="/tmp/gastown",
-            stack_name="GastownWorkstationStack",
-            eip_allocation_id="eipalloc-abc123",
-            eip_public_ip="1.2.3.4",
-            access_mode="ssh",
+        wait_for_ready.assert_called_once()
+        self.assertEqual(
+            {
+                "stack_name": "GastownWorkstationStack",
+                "spot_fleet_logical_id": "GastownSpotFleet",
+                "access_mode": "ssh",
+                "eip_allocation_id": "eipalloc-abc123",
+                "eip_public_ip": "1.2.3.4",
+                "ssm_client": None,
+            },
+            {key: value for key, value in wait_for_ready.call_args.kwargs.items() if key != "out"},
         )
+        self.assertEqual("deploy", self.record_lifecycle_timing.call_args.kwargs["action"])
 
     def test_run_deploy_lifecycle_deploys_shared_network_when_missing(self) -> None:
         """Expected: first-use deploy creates the shared network before the workstation."""
@@ -68,12 +120,15 @@ class DeployOrchestrationTests(unittest.TestCase):
 
         with (
             patch("workstation_core.orchestration.make_ec2_client", return_value=Mock()),
+            patch("workstation_core.orchestration.make_cloudformation_client", return_value=Mock()),
             patch("workstation_core.orchestration.resolve_ami_selection", return_value=selection),
             patch("workstation_core.orchestration.shared_network_stack_exists", return_value=False),
-            patch("workstation_core.orchestration.find_or_create_eip", return_value=eip_info),
+            patch("workstation_core.orchestration.find_eip_by_name", return_value=eip_info),
             patch("workstation_core.orchestration.deploy_shared_network_stack") as deploy_shared_network_stack,
             patch("workstation_core.orchestration.deploy_stack") as deploy_stack,
-            patch("workstation_core.orchestration.run_post_deploy_check"),
+            patch("workstation_core.orchestration.make_ssm_client", return_value=Mock()),
+            patch("workstation_core.orchestration.wait_for_workstation_ready"),
+            patch("workstation_core.orchestration.print_connection_guidance"),
         ):
             result = run_deploy_lifecycle(inputs=self._inputs(), env=env, out=io.StringIO())
 
@@ -89,12 +144,15 @@ class DeployOrchestrationTests(unittest.TestCase):
 
         with (
             patch("workstation_core.orchestration.make_ec2_client", return_value=Mock()),
+            patch("workstation_core.orchestration.make_cloudformation_client", return_value=Mock()),
             patch("workstation_core.orchestration.resolve_ami_selection", return_value=selection),
             patch("workstation_core.orchestration.shared_network_stack_exists", return_value=True),
-            patch("workstation_core.orchestration.find_or_create_eip", return_value=eip_info),
+            patch("workstation_core.orchestration.find_eip_by_name", return_value=eip_info),
             patch("workstation_core.orchestration.deploy_shared_network_stack") as deploy_shared_network_stack,
             patch("workstation_core.orchestration.deploy_stack") as deploy_stack,
-            patch("workstation_core.orchestration.run_post_deploy_check"),
+            patch("workstation_core.orchestration.make_ssm_client", return_value=Mock()),
+            patch("workstation_core.orchestration.wait_for_workstation_ready"),
+            patch("workstation_core.orchestration.print_connection_guidance"),
         ):
             result = run_deploy_lifecycle(inputs=self._inputs(), env=env, out=io.StringIO())
 
@@ -102,22 +160,150 @@ class DeployOrchestrationTests(unittest.TestCase):
         deploy_shared_network_stack.assert_not_called()
         deploy_stack.assert_called_once()
 
+    def test_run_deploy_lifecycle_adds_package_cache_to_existing_shared_network(self) -> None:
+        """Expected: PACKAGE_CACHE updates a network stack without the bucket and sets the context."""
+        env = {"AWS_REGION": "us-west-2", "PACKAGE_CACHE": "1"}
+        selection = Mock(should_deploy=True, selected_ami_id=None)
+        eip_info = {"allocation_id": "eipalloc-abc123", "public_ip": "1.2.3.4"}
+        cloudformation_client = Mock()
+        cloudformation_client.describe_stacks.return_value = {
+            "Stacks": [{"Outputs": [{"OutputKey": "VpcId", "OutputValue": "vpc-1"}]}]
+        }
+        out = io.StringIO()
+
+        with (
+            patch("workstation_core.orchestration.make_ec2_client", return_value=Mock()),
+            patch("workstation_core.orchestration.make_cloudformation_client", return_value=cloudformation_client),
+            patch("workstation_core.orchestration.resolve_ami_selection", return_value=selection),
+            patch("workstation_core.orchestration.shared_network_stack_exists", return_value=True),
+            patch("workstation_core.orchestration.find_eip_by_name", return_value=eip_info),
+            patch("workstation_core.orchestration.deploy_shared_network_stack") as deploy_shared_network_stack,
+            patch("workstation_core.orchestration.deploy_stack"),
+            patch("workstation_core.orchestration.wait_for_workstation_ready"),
+            patch("workstation_core.orchestration.print_connection_guidance"),
+        ):
+            result = run_deploy_lifecycle(inputs=self._inputs(), env=env, out=out)
+
+        self.assertEqual(0, result)
+        deploy_shared_network_stack.assert_called_once_with(
+            stack_dir="/tmp/gastown",
+            context={"package_cache": "true"},
+        )
+        self.assertEqual("true", self.synthesize_assembly.call_args.kwargs["context"]["package_cache"])
+        self.assertIn("shared network stack had no package cache", out.getvalue())
+
+    def test_run_deploy_lifecycle_keeps_shared_network_that_has_package_cache(self) -> None:
+        """Edge: a network stack that already outputs the bucket is not redeployed."""
+        env = {"AWS_REGION": "us-west-2", "PACKAGE_CACHE": "true"}
+        selection = Mock(should_deploy=True, selected_ami_id=None)
+        eip_info = {"allocation_id": "eipalloc-abc123", "public_ip": "1.2.3.4"}
+        cloudformation_client = Mock()
+        cloudformation_client.describe_stacks.return_value = {
+            "Stacks": [{"Outputs": [{"OutputKey": "PackageCacheBucketName", "OutputValue": "bucket"}]}]
+        }
+
+        with (
+            patch("workstation_core.orchestration.make_ec2_client", return_value=Mock()),
+            patch("workstation_core.orchestration.make_cloudformation_client", return_value=cloudformation_client),
+            patch("workstation_core.orchestration.resolve_ami_selection", return_value=selection),
+            patch("workstation_core.orchestration.shared_network_stack_exists", return_value=True),
+            patch("workstation_core.orchestration.find_eip_by_name", return_value=eip_info),
+            patch("workstation_core.orchestration.deploy_shared_network_stack") as deploy_shared_network_stack,
+            patch("workstation_core.orchestration.deploy_stack"),
+            patch("workstation_core.orchestration.wait_for_workstation_ready"),
+            patch("workstation_core.orchestration.print_connection_guidance"),
+        ):
+            result = run_deploy_lifecycle(inputs=self._inputs(), env=env, out=io.StringIO())
+
+        self.assertEqual(0, result)
+        deploy_shared_network_stack.assert_not_called()
+
+    def test_run_deploy_lifecycle_adds_container_cache_and_keeps_package_cache(self) -> None:
+        """Expected: CONTAINER_CACHE redeploys the network with the Docker Hub secret and its existing bucket."""
+        env = {"AWS_REGION": "us-west-2", "CONTAINER_CACHE": "1"}
+        selection = Mock(should_deploy=True, selected_ami_id=None)
+        eip_info = {"allocation_id": "eipalloc-abc123", "public_ip": "1.2.3.4"}
+        cloudformation_client = Mock()
+        cloudformation_client.describe_stacks.return_value = {
+            "Stacks": [{"Outputs": [{"OutputKey": "PackageCacheBucketName", "OutputValue": "bucket"}]}]
+        }
+        secretsmanager_client = Mock()
+        secretsmanager_client.describe_secret.return_value = {"ARN": "arn:secret:docker-hub-AbCdEf"}
+
+        with (
+            patch("workstation_core.orchestration.make_ec2_client", return_value=Mock()),
+            patch("workstation_core.orchestration.make_cloudformation_client", return_value=cloudformation_client),
+            patch("workstation_core.orchestration.make_secretsmanager_client", return_value=secretsmanager_client),
+            patch("workstation_core.orchestration.resolve_ami_selection", return_value=selection),
+            patch("workstation_core.orchestration.shared_network_stack_exists", return_value=True),
+            patch("workstation_core.orchestration.find_eip_by_name", return_value=eip_info),
+            patch("workstation_core.orchestration.deploy_shared_network_stack") as deploy_shared_network_stack,
+            patch("workstation_core.orchestration.deploy_stack"),
+            patch("workstation_core.orchestration.wait_for_workstation_ready"),
+            patch("workstation_core.orchestration.print_connection_guidance"),
+        ):
+            result = run_deploy_lifecycle(inputs=self._inputs(), env=env, out=io.StringIO())
+
+        self.assertEqual(0, result)
+        deploy_shared_network_stack.assert_called_once_with(
+            stack_dir="/tmp/gastown",
+            context={"package_cache": "true", "container_cache_credential_arn": "arn:secret:docker-hub-AbCdEf"},
+        )
+        context = self.synthesize_assembly.call_args.kwargs["context"]
+        self.assertEqual("true", context["container_cache"])
+        self.assertNotIn("package_cache", context)
+
+    def test_run_deploy_lifecycle_requires_docker_hub_secret_for_container_cache(self) -> None:
+        """Failure: the container cache cannot be created without Docker Hub credentials."""
+        env = {"AWS_REGION": "us-west-2", "CONTAINER_CACHE": "1"}
+        selection = Mock(should_deploy=True, selected_ami_id=None)
+        secretsmanager_client = Mock()
+        secretsmanager_client.describe_secret.side_effect = RuntimeError("ResourceNotFoundException")
+
+        with (
+            patch("workstation_core.orchestration.make_ec2_client", return_value=Mock()),
+            patch("workstation_core.orchestration.make_cloudformation_client", return_value=Mock()),
+            patch("workstation_core.orchestration.make_secretsmanager_client", return_value=secretsmanager_client),
+            patch("workstation_core.orchestration.resolve_ami_selection", return_value=selection),
+            patch("workstation_core.orchestration.shared_network_stack_exists", return_value=True),
+            patch("workstation_core.orchestration.find_eip_by_name", return_value=None),
+            patch("workstation_core.orchestration.deploy_shared_network_stack") as deploy_shared_network_stack,
+            patch("workstation_core.orchestration.deploy_stack") as deploy_stack,
+        ):
+            with self.assertRaisesRegex(RuntimeError, "ecr-pullthroughcache/docker-hub"):
+                run_deploy_lifecycle(inputs=self._inputs(), env=env, out=io.StringIO())
+
+        deploy_shared_network_stack.assert_not_called()
+        deploy_stack.assert_not_called()
+
+    def test_run_deploy_lifecycle_rejects_invalid_package_cache_flag(self) -> None:
+        """Failure: PACKAGE_CACHE must be a boolean value."""
+        with self.assertRaisesRegex(RuntimeError, "PACKAGE_CACHE"):
+            run_deploy_lifecycle(
+                inputs=self._inputs(),
+                env={"AWS_REGION": "us-west-2", "PACKAGE_CACHE": "maybe"},
+                out=io.StringIO(),
+            )
+
     def test_run_deploy_lifecycle_prefers_cli_access_mode(self) -> None:
         """Expected: CLI access mode override wins over env and environment defaults."""
         env = {"AWS_REGION": "us-west-2", "ACCESS_MODE": "ssh"}
         selection = Mock(should_deploy=True, selected_ami_id=None)
         eip_info = {"allocation_id": "eipalloc-abc123", "public_ip": "1.2.3.4"}
-        environment_spec = Mock(environment_key="gastown", default_access_mode="both")
+        environment_spec = Mock(environment_key="gastown", default_access_mode="both", availability_zone_count=1)
 
         with (
             patch("workstation_core.orchestration.load_environment_spec", return_value=environment_spec),
             patch("workstation_core.orchestration.make_ec2_client", return_value=Mock()),
+            patch("workstation_core.orchestration.make_cloudformation_client", return_value=Mock()),
             patch("workstation_core.orchestration.resolve_ami_selection", return_value=selection),
             patch("workstation_core.orchestration.shared_network_stack_exists", return_value=False),
-            patch("workstation_core.orchestration.find_or_create_eip", return_value=eip_info),
+            patch("workstation_core.orchestration.find_eip_by_name", return_value=eip_info),
             patch("workstation_core.orchestration.deploy_shared_network_stack"),
             patch("workstation_core.orchestration.deploy_stack") as deploy_stack,
-            patch("workstation_core.orchestration.run_post_deploy_check"),
+            patch("workstation_core.orchestration.make_ssm_client", return_value=Mock()),
+            patch("workstation_core.orchestration.wait_for_workstation_ready"),
+            patch("workstation_core.orchestration.print_connection_guidance"),
         ):
             result = run_deploy_lifecycle(
                 inputs=DeployWorkflowInputs(
@@ -125,6 +311,7 @@ class DeployOrchestrationTests(unittest.TestCase):
                     stack_dir="/tmp/gastown",
                     stack_name="GastownWorkstationStack",
                     access_mode="ssm",
+                    deploy_engine="cdk",
                 ),
                 env=env,
                 out=io.StringIO(),
@@ -134,6 +321,339 @@ class DeployOrchestrationTests(unittest.TestCase):
         self.assertEqual("ssm", deploy_stack.call_args.kwargs["access_mode"])
         self.assertFalse(deploy_stack.call_args.kwargs["public_ip_enabled"])
 
+    def test_run_deploy_lifecycle_az_index_override_skips_zone_selection(self) -> None:
+        """Expected: AZ_INDEX pins the subnet zone without querying Spot signals."""
+        env = {"AWS_REGION": "us-west-2", "ACCESS_MODE": "ssm", "AZ_INDEX": "2,0"}
+        selection = Mock(should_deploy=True, selected_ami_id=None)
+        environment_spec = Mock(
+            environment_key="gastown",
+            instance_type="t3.large",
+            spot_price="0.1",
+            availability_zone_count=2,
+        )
+
+        with (
+            patch("workstation_core.orchestration.load_environment_spec", return_value=environment_spec),
+            patch("workstation_core.orchestration.make_ec2_client", return_value=Mock()),
+            patch("workstation_core.orchestration.make_cloudformation_client", return_value=Mock()),
+            patch("workstation_core.orchestration.resolve_ami_selection", return_value=selection),
+            patch("workstation_core.orchestration.shared_network_stack_exists", return_value=True),
+            patch("workstation_core.orchestration.choose_workstation_availability_zones") as choose_zone,
+            patch("workstation_core.orchestration.deploy_stack") as deploy_stack,
+            patch("workstation_core.orchestration.make_ssm_client", return_value=Mock()),
+            patch("workstation_core.orchestration.wait_for_workstation_ready"),
+            patch("workstation_core.orchestration.print_connection_guidance"),
+        ):
+            result = run_deploy_lifecycle(
+                inputs=DeployWorkflowInputs(
+                    environment="gastown",
+                    stack_dir="/tmp/gastown",
+                    stack_name="GastownWorkstationStack",
+                    deploy_engine="cdk",
+                ),
+                env=env,
+                out=io.StringIO(),
+            )
+
+        self.assertEqual(0, result)
+        choose_zone.assert_not_called()
+        self.assertEqual((2, 0), deploy_stack.call_args.kwargs["availability_zone_indexes"])
+
+    def test_run_deploy_lifecycle_rejects_az_index_override_of_wrong_length(self) -> None:
+        """Failure: AZ_INDEX must name one zone per environment subnet."""
+        environment_spec = Mock(environment_key="gastown", default_access_mode="ssh", availability_zone_count=2)
+
+        with (
+            patch("workstation_core.orchestration.load_environment_spec", return_value=environment_spec),
+            self.assertRaisesRegex(RuntimeError, "AZ_INDEX lists 1 Availability Zones"),
+        ):
+            run_deploy_lifecycle(inputs=self._inputs(), env={"AZ_INDEX": "1"}, out=io.StringIO())
+
+    def test_run_deploy_lifecycle_passes_selected_availability_zones(self) -> None:
+        """Expected: the preflight zone choice reaches the CDK context and is reported."""
+        env = {"AWS_REGION": "us-west-2", "ACCESS_MODE": "ssm"}
+        selection = Mock(should_deploy=True, selected_ami_id=None)
+        environment_spec = Mock(
+            environment_key="gastown",
+            instance_type="t3.large",
+            spot_price="0.1",
+            availability_zone_count=2,
+        )
+        zone = AvailabilityZoneSelection((1, 0), ("us-west-2b", "us-west-2a"), "best placement score 9, Spot price 0.04")
+        out = io.StringIO()
+
+        with (
+            patch("workstation_core.orchestration.load_environment_spec", return_value=environment_spec),
+            patch("workstation_core.orchestration.make_ec2_client", return_value=Mock()),
+            patch("workstation_core.orchestration.make_cloudformation_client", return_value=Mock()),
+            patch("workstation_core.orchestration.resolve_ami_selection", return_value=selection),
+            patch("workstation_core.orchestration.shared_network_stack_exists", return_value=True),
+            patch(
+                "workstation_core.orchestration.choose_workstation_availability_zones",
+                return_value=zone,
+            ) as choose_zone,
+            patch("workstation_core.orchestration.deploy_stack") as deploy_stack,
+            patch("workstation_core.orchestration.make_ssm_client", return_value=Mock()),
+            patch("workstation_core.orchestration.wait_for_workstation_ready"),
+            patch("workstation_core.orchestration.print_connection_guidance"),
+        ):
+            run_deploy_lifecycle(
+                inputs=DeployWorkflowInputs(
+                    environment="gastown",
+                    stack_dir="/tmp/gastown",
+                    stack_name="GastownWorkstationStack",
+                    deploy_engine="cdk",
+                ),
+                env=env,
+                out=out,
+            )
+
+        self.assertEqual("t3.large", choose_zone.call_args.kwargs["instance_type"])
+        self.assertEqual(2, choose_zone.call_args.kwargs["zone_count"])
+        self.assertEqual("111111111111", choose_zone.call_args.kwargs["account_id"])
+        self.assertEqual((1, 0), deploy_stack.call_args.kwargs["availability_zone_indexes"])
+        self.assertIn("us-west-2b (index 1), us-west-2a (index 0)", out.getvalue())
+
+    def test_run_deploy_lifecycle_deploys_matching_golden_image(self) -> None:
+        """Expected: a default-mode deploy launches from the golden AMI chosen in preflight."""
+        env = {"AWS_REGION": "us-west-2", "ACCESS_MODE": "ssm", "AZ_INDEX": "0"}
+        selection = Mock(should_deploy=True, selected_ami_id=None)
+        environment_spec = Mock(environment_key="gastown", availability_zone_count=1)
+        self.choose_deploy_golden_image.return_value = GoldenImageChoice("ami-golden", "Using golden AMI ami-golden.")
+        out = io.StringIO()
+
+        with (
+            patch("workstation_core.orchestration.load_environment_spec", return_value=environment_spec),
+            patch("workstation_core.orchestration.make_ec2_client", return_value=Mock()),
+            patch("workstation_core.orchestration.make_cloudformation_client", return_value=Mock()),
+            patch("workstation_core.orchestration.resolve_ami_selection", return_value=selection),
+            patch("workstation_core.orchestration.shared_network_stack_exists", return_value=True),
+            patch("workstation_core.orchestration.deploy_stack") as deploy_stack,
+            patch("workstation_core.orchestration.make_ssm_client", return_value=Mock()),
+            patch("workstation_core.orchestration.wait_for_workstation_ready"),
+            patch("workstation_core.orchestration.print_connection_guidance"),
+        ):
+            run_deploy_lifecycle(inputs=self._inputs(), env=env, out=out)
+
+        self.assertEqual("/tmp/gastown", self.choose_deploy_golden_image.call_args.kwargs["stack_dir"])
+        self.assertEqual("ami-golden", deploy_stack.call_args.kwargs["ami_id"])
+        self.assertIn("Using golden AMI ami-golden.", out.getvalue())
+
+    def test_run_deploy_lifecycle_golden_ami_opt_out_skips_lookup(self) -> None:
+        """Edge: GOLDEN_AMI=0 keeps the user-data bootstrap without looking up golden AMIs."""
+        env = {"AWS_REGION": "us-west-2", "ACCESS_MODE": "ssm", "AZ_INDEX": "0", "GOLDEN_AMI": "0"}
+        selection = Mock(should_deploy=True, selected_ami_id=None)
+        environment_spec = Mock(environment_key="gastown", availability_zone_count=1)
+
+        with (
+            patch("workstation_core.orchestration.load_environment_spec", return_value=environment_spec),
+            patch("workstation_core.orchestration.make_ec2_client", return_value=Mock()),
+            patch("workstation_core.orchestration.make_cloudformation_client", return_value=Mock()),
+            patch("workstation_core.orchestration.resolve_ami_selection", return_value=selection),
+            patch("workstation_core.orchestration.shared_network_stack_exists", return_value=True),
+            patch("workstation_core.orchestration.deploy_stack") as deploy_stack,
+            patch("workstation_core.orchestration.make_ssm_client", return_value=Mock()),
+            patch("workstation_core.orchestration.wait_for_workstation_ready"),
+            patch("workstation_core.orchestration.print_connection_guidance"),
+        ):
+            run_deploy_lifecycle(inputs=self._inputs(), env=env, out=io.StringIO())
+
+        self.choose_deploy_golden_image.assert_not_called()
+        self.assertIsNone(deploy_stack.call_args.kwargs["ami_id"])
+
+    def test_run_deploy_lifecycle_waits_for_bootstrap_when_requested(self) -> None:
+        """Expected: WAIT_FOR_BOOTSTRAP waits for the runner summary with the configured timeout."""
+        env = {
+            "AWS_REGION": "us-west-2",
+            "ACCESS_MODE": "ssm",
+            "GOLDEN_AMI": "0",
+            "WAIT_FOR_BOOTSTRAP": "1",
+            "BOOTSTRAP_TIMEOUT": "600",
+        }
+        selection = Mock(should_deploy=True, selected_ami_id=None)
+        readiness = Mock(instance_id="i-123")
+        report = Mock(instance_id="i-123")
+
+        with (
+            patch("workstation_core.orchestration.make_ec2_client", return_value=Mock()),
+            patch("workstation_core.orchestration.make_cloudformation_client", return_value=Mock()),
+            patch("workstation_core.orchestration.resolve_ami_selection", return_value=selection),
+            patch("workstation_core.orchestration.shared_network_stack_exists", return_value=True),
+            patch("workstation_core.orchestration.deploy_stack"),
+            patch("workstation_core.orchestration.make_ssm_client", return_value=Mock()),
+            patch("workstation_core.orchestration.wait_for_workstation_ready", return_value=readiness),
+            patch("workstation_core.orchestration.print_connection_guidance"),
+            patch("workstation_core.orchestration.wait_for_bootstrap_complete", return_value=report) as wait,
+            patch("workstation_core.orchestration.print_bootstrap_report") as print_report,
+        ):
+            run_deploy_lifecycle(inputs=self._inputs(), env=env, out=io.StringIO())
+
+        self.assertEqual("i-123", wait.call_args.args[1])
+        self.assertEqual(600.0, wait.call_args.kwargs["timeout_seconds"])
+        self.assertIs(report, print_report.call_args.args[0])
+
+    def test_run_deploy_lifecycle_does_not_wait_for_bootstrap_on_golden_image(self) -> None:
+        """Edge: a golden AMI deploy has no user-data bootstrap, so there is nothing to wait for."""
+        env = {"AWS_REGION": "us-west-2", "ACCESS_MODE": "ssm", "AZ_INDEX": "0", "WAIT_FOR_BOOTSTRAP": "1"}
+        selection = Mock(should_deploy=True, selected_ami_id=None)
+        environment_spec = Mock(environment_key="gastown", availability_zone_count=1)
+        self.choose_deploy_golden_image.return_value = GoldenImageChoice("ami-golden", "Using golden AMI ami-golden.")
+        out = io.StringIO()
+
+        with (
+            patch("workstation_core.orchestration.load_environment_spec", return_value=environment_spec),
+            patch("workstation_core.orchestration.make_ec2_client", return_value=Mock()),
+            patch("workstation_core.orchestration.make_cloudformation_client", return_value=Mock()),
+            patch("workstation_core.orchestration.resolve_ami_selection", return_value=selection),
+            patch("workstation_core.orchestration.shared_network_stack_exists", return_value=True),
+            patch("workstation_core.orchestration.deploy_stack"),
+            patch("workstation_core.orchestration.make_ssm_client", return_value=Mock()),
+            patch("workstation_core.orchestration.wait_for_workstation_ready"),
+            patch("workstation_core.orchestration.print_connection_guidance"),
+            patch("workstation_core.orchestration.wait_for_bootstrap_complete") as wait,
+        ):
+            run_deploy_lifecycle(inputs=self._inputs(), env=env, out=out)
+
+        wait.assert_not_called()
+        self.assertIn("ran no user-data bootstrap", out.getvalue())
+
+    def test_run_deploy_lifecycle_enables_fast_snapshot_restore_around_launch(self) -> None:
+        """Expected: AMI_WARM=fsr enables restores before the deploy and disables them once ready."""
+        env = {"AWS_REGION": "us-west-2", "ACCESS_MODE": "ssm", "AZ_INDEX": "1", "AMI_WARM": "fsr"}
+        selection = Mock(should_deploy=True, selected_ami_id="ami-saved")
+        readiness = Mock(instance_id="i-123")
+        lease = Mock()
+        calls = Mock()
+        ec2_client = Mock()
+
+        with (
+            patch("workstation_core.orchestration.make_ec2_client", return_value=ec2_client),
+            patch("workstation_core.orchestration.make_cloudformation_client", return_value=Mock()),
+            patch("workstation_core.orchestration.resolve_ami_selection", return_value=selection),
+            patch("workstation_core.orchestration.shared_network_stack_exists", return_value=True),
+            patch("workstation_core.orchestration.availability_zone_names", return_value=("us-west-2b",)) as names,
+            patch("workstation_core.orchestration.enable_fast_snapshot_restores", calls.enable),
+            patch("workstation_core.orchestration.deploy_stack", calls.deploy),
+            patch("workstation_core.orchestration.disable_fast_snapshot_restores", calls.disable),
+            patch("workstation_core.orchestration.report_root_volume_fast_restore", calls.report),
+            patch("workstation_core.orchestration.make_ssm_client", return_value=Mock()),
+            patch("workstation_core.orchestration.wait_for_workstation_ready", return_value=readiness),
+            patch("workstation_core.orchestration.print_connection_guidance"),
+        ):
+            calls.enable.return_value = lease
+            run_deploy_lifecycle(inputs=self._inputs(), env=env, out=io.StringIO())
+
+        names.assert_called_once_with(ec2_client, (1,))
+        self.assertEqual(["enable", "deploy", "disable", "report"], [call[0] for call in calls.mock_calls])
+        self.assertEqual("ami-saved", calls.enable.call_args.kwargs["image_id"])
+        self.assertEqual(("us-west-2b",), calls.enable.call_args.kwargs["zone_names"])
+        self.assertIs(lease, calls.disable.call_args.args[1])
+        self.assertEqual("i-123", calls.report.call_args.args[1])
+
+    def test_run_deploy_lifecycle_disables_fast_snapshot_restore_when_launch_fails(self) -> None:
+        """Failure: a failed launch still turns off the fast snapshot restores it enabled."""
+        env = {"AWS_REGION": "us-west-2", "ACCESS_MODE": "ssm", "AZ_INDEX": "0", "AMI_WARM": "fsr"}
+        selection = Mock(should_deploy=True, selected_ami_id="ami-saved")
+        lease = Mock()
+
+        with (
+            patch("workstation_core.orchestration.make_ec2_client", return_value=Mock()),
+            patch("workstation_core.orchestration.make_cloudformation_client", return_value=Mock()),
+            patch("workstation_core.orchestration.resolve_ami_selection", return_value=selection),
+            patch("workstation_core.orchestration.shared_network_stack_exists", return_value=True),
+            patch("workstation_core.orchestration.availability_zone_names", return_value=("us-west-2a",)),
+            patch("workstation_core.orchestration.enable_fast_snapshot_restores", return_value=lease),
+            patch("workstation_core.orchestration.deploy_stack"),
+            patch("workstation_core.orchestration.disable_fast_snapshot_restores") as disable,
+            patch("workstation_core.orchestration.make_ssm_client", return_value=Mock()),
+            patch(
+                "workstation_core.orchestration.wait_for_workstation_ready",
+                side_effect=RuntimeError("Spot Fleet failed"),
+            ),
+        ):
+            with self.assertRaisesRegex(RuntimeError, "Spot Fleet failed"):
+                run_deploy_lifecycle(inputs=self._inputs(), env=env, out=io.StringIO())
+
+        self.assertIs(lease, disable.call_args.args[1])
+
+    def test_run_deploy_lifecycle_waits_for_volume_preread_on_restored_ami(self) -> None:
+        """Expected: AMI_WARM=preread adds the pre-read to user data and WAIT_FOR_BOOTSTRAP waits for it."""
+        env = {
+            "AWS_REGION": "us-west-2",
+            "ACCESS_MODE": "ssm",
+            "AZ_INDEX": "0",
+            "AMI_WARM": "preread",
+            "WAIT_FOR_BOOTSTRAP": "1",
+        }
+        selection = Mock(should_deploy=True, selected_ami_id="ami-saved")
+        readiness = Mock(instance_id="i-123")
+        out = io.StringIO()
+
+        with (
+            patch("workstation_core.orchestration.make_ec2_client", return_value=Mock()),
+            patch("workstation_core.orchestration.make_cloudformation_client", return_value=Mock()),
+            patch("workstation_core.orchestration.resolve_ami_selection", return_value=selection),
+            patch("workstation_core.orchestration.shared_network_stack_exists", return_value=True),
+            patch("workstation_core.orchestration.enable_fast_snapshot_restores") as enable,
+            patch("workstation_core.orchestration.deploy_stack"),
+            patch("workstation_core.orchestration.make_ssm_client", return_value=Mock()),
+            patch("workstation_core.orchestration.wait_for_workstation_ready", return_value=readiness),
+            patch("workstation_core.orchestration.print_connection_guidance"),
+            patch("workstation_core.orchestration.wait_for_bootstrap_complete") as wait_for_bootstrap,
+            patch("workstation_core.orchestration.wait_for_volume_preread") as wait_for_preread,
+        ):
+            run_deploy_lifecycle(inputs=self._inputs(), env=env, out=out)
+
+        context = self.synthesize_assembly.call_args.kwargs["context"]
+        self.assertEqual("true", context["volume_preread"])
+        enable.assert_not_called()
+        wait_for_bootstrap.assert_not_called()
+        self.assertEqual("i-123", wait_for_preread.call_args.args[1])
+        self.assertNotIn("ran no user-data bootstrap", out.getvalue())
+
+    def test_run_deploy_lifecycle_ignores_volume_warming_for_default_ami(self) -> None:
+        """Edge: a fresh AMI deploy has nothing restored to warm, so AMI_WARM only prints a note."""
+        env = {"AWS_REGION": "us-west-2", "ACCESS_MODE": "ssm", "GOLDEN_AMI": "0", "AMI_WARM": "preread"}
+        selection = Mock(should_deploy=True, selected_ami_id=None)
+        out = io.StringIO()
+
+        with (
+            patch("workstation_core.orchestration.make_ec2_client", return_value=Mock()),
+            patch("workstation_core.orchestration.make_cloudformation_client", return_value=Mock()),
+            patch("workstation_core.orchestration.resolve_ami_selection", return_value=selection),
+            patch("workstation_core.orchestration.shared_network_stack_exists", return_value=True),
+            patch("workstation_core.orchestration.deploy_stack"),
+            patch("workstation_core.orchestration.make_ssm_client", return_value=Mock()),
+            patch("workstation_core.orchestration.wait_for_workstation_ready"),
+            patch("workstation_core.orchestration.print_connection_guidance"),
+        ):
+            run_deploy_lifecycle(inputs=self._inputs(), env=env, out=out)
+
+        self.assertNotIn("volume_preread", self.synthesize_assembly.call_args.kwargs["context"])
+        self.assertIn("AMI_WARM: this deploy launches from the default AMI", out.getvalue())
+
+    def test_run_deploy_lifecycle_rejects_unknown_volume_warm_mode(self) -> None:
+        """Failure: AMI_WARM only accepts fsr or preread."""
+        with patch("workstation_core.orchestration.make_ec2_client") as make_ec2_client:
+            with self.assertRaisesRegex(RuntimeError, "Invalid AMI_WARM value 'hydrate'"):
+                run_deploy_lifecycle(
+                    inputs=self._inputs(),
+                    env={"AWS_REGION": "us-west-2", "AMI_WARM": "hydrate"},
+                    out=io.StringIO(),
+                )
+
+        make_ec2_client.assert_not_called()
+
+    def test_run_deploy_lifecycle_rejects_invalid_bootstrap_timeout(self) -> None:
+        """Failure: a non-positive BOOTSTRAP_TIMEOUT aborts before any AWS call."""
+        env = {"AWS_REGION": "us-west-2", "ACCESS_MODE": "ssm", "BOOTSTRAP_TIMEOUT": "soon"}
+
+        with patch("workstation_core.orchestration.make_ec2_client") as make_ec2_client:
+            with self.assertRaisesRegex(RuntimeError, "BOOTSTRAP_TIMEOUT must be a positive number"):
+                run_deploy_lifecycle(inputs=self._inputs(), env=env, out=io.StringIO())
+
+        make_ec2_client.assert_not_called()
+
     def test_run_deploy_lifecycle_skips_eip_allocation_for_ssm_mode(self) -> None:
         """Expected: SSM-only deploys do not allocate or pass through EIP data."""
         env = {"AWS_REGION": "us-west-2", "ACCESS_MODE": "ssm"}
@@ -141,16 +661,19 @@ class DeployOrchestrationTests(unittest.TestCase):
 
         with (
             patch("workstation_core.orchestration.make_ec2_client", return_value=Mock()),
+            patch("workstation_core.orchestration.make_cloudformation_client", return_value=Mock()),
             patch("workstation_core.orchestration.resolve_ami_selection", return_value=selection),
             patch("workstation_core.orchestration.shared_network_stack_exists", return_value=True),
-            patch("workstation_core.orchestration.find_or_create_eip") as find_or_create_eip,
+            patch("workstation_core.orchestration.find_eip_by_name") as find_eip_by_name,
             patch("workstation_core.orchestration.deploy_stack") as deploy_stack,
-            patch("workstation_core.orchestration.run_post_deploy_check") as post_check,
+            patch("workstation_core.orchestration.make_ssm_client", return_value=Mock()),
+            patch("workstation_core.orchestration.wait_for_workstation_ready") as wait_for_ready,
+            patch("workstation_core.orchestration.print_connection_guidance"),
         ):
             result = run_deploy_lifecycle(inputs=self._inputs(), env=env, out=io.StringIO())
 
         self.assertEqual(0, result)
-        find_or_create_eip.assert_not_called()
+        find_eip_by_name.assert_not_called()
         deploy_stack.assert_called_once_with(
             stack_dir="/tmp/gastown",
             stack_name="GastownWorkstationStack",
@@ -159,14 +682,13 @@ class DeployOrchestrationTests(unittest.TestCase):
             eip_allocation_id=None,
             access_mode="ssm",
             public_ip_enabled=False,
+            app="/tmp/gastown/cdk.out",
+            availability_zone_indexes=None,
         )
-        post_check.assert_called_once_with(
-            stack_dir="/tmp/gastown",
-            stack_name="GastownWorkstationStack",
-            eip_allocation_id=None,
-            eip_public_ip=None,
-            access_mode="ssm",
-        )
+        wait_for_ready.assert_called_once()
+        self.assertEqual("ssm", wait_for_ready.call_args.kwargs["access_mode"])
+        self.assertIsNone(wait_for_ready.call_args.kwargs["eip_allocation_id"])
+        self.assertIsNotNone(wait_for_ready.call_args.kwargs["ssm_client"])
 
     def test_run_deploy_lifecycle_keeps_eip_allocation_for_both_mode(self) -> None:
         """Edge: dual-access deploys still allocate and pass through EIP data."""
@@ -176,18 +698,21 @@ class DeployOrchestrationTests(unittest.TestCase):
 
         with (
             patch("workstation_core.orchestration.make_ec2_client", return_value=Mock()),
+            patch("workstation_core.orchestration.make_cloudformation_client", return_value=Mock()),
             patch("workstation_core.orchestration.resolve_ami_selection", return_value=selection),
             patch("workstation_core.orchestration.shared_network_stack_exists", return_value=True),
-            patch("workstation_core.orchestration.find_or_create_eip", return_value=eip_info) as find_or_create_eip,
+            patch("workstation_core.orchestration.find_eip_by_name", return_value=eip_info) as find_eip_by_name,
             patch("workstation_core.orchestration.deploy_stack") as deploy_stack,
-            patch("workstation_core.orchestration.run_post_deploy_check") as post_check,
+            patch("workstation_core.orchestration.make_ssm_client", return_value=Mock()),
+            patch("workstation_core.orchestration.wait_for_workstation_ready") as wait_for_ready,
+            patch("workstation_core.orchestration.print_connection_guidance"),
         ):
             result = run_deploy_lifecycle(inputs=self._inputs(), env=env, out=io.StringIO())
 
         self.assertEqual(0, result)
-        find_or_create_eip.assert_called_once()
+        find_eip_by_name.assert_called_once()
         self.assertEqual("eipalloc-abc123", deploy_stack.call_args.kwargs["eip_allocation_id"])
-        self.assertEqual("1.2.3.4", post_check.call_args.kwargs["eip_public_ip"])
+        self.assertEqual("1.2.3.4", wait_for_ready.call_args.kwargs["eip_public_ip"])
         self.assertTrue(deploy_stack.call_args.kwargs["public_ip_enabled"])
 
     def test_run_deploy_lifecycle_allows_public_ip_without_eip_for_ssm_mode(self) -> None:
@@ -197,43 +722,177 @@ class DeployOrchestrationTests(unittest.TestCase):
 
         with (
             patch("workstation_core.orchestration.make_ec2_client", return_value=Mock()),
+            patch("workstation_core.orchestration.make_cloudformation_client", return_value=Mock()),
             patch("workstation_core.orchestration.resolve_ami_selection", return_value=selection),
             patch("workstation_core.orchestration.shared_network_stack_exists", return_value=True),
-            patch("workstation_core.orchestration.find_or_create_eip") as find_or_create_eip,
+            patch("workstation_core.orchestration.find_eip_by_name") as find_eip_by_name,
             patch("workstation_core.orchestration.deploy_stack") as deploy_stack,
-            patch("workstation_core.orchestration.run_post_deploy_check") as post_check,
+            patch("workstation_core.orchestration.make_ssm_client", return_value=Mock()),
+            patch("workstation_core.orchestration.wait_for_workstation_ready") as wait_for_ready,
+            patch("workstation_core.orchestration.print_connection_guidance"),
         ):
             result = run_deploy_lifecycle(inputs=self._inputs(), env=env, out=io.StringIO())
 
         self.assertEqual(0, result)
-        find_or_create_eip.assert_not_called()
+        find_eip_by_name.assert_not_called()
         self.assertTrue(deploy_stack.call_args.kwargs["public_ip_enabled"])
-        post_check.assert_called_once_with(
-            stack_dir="/tmp/gastown",
-            stack_name="GastownWorkstationStack",
-            eip_allocation_id=None,
-            eip_public_ip=None,
-            access_mode="ssm",
-        )
+        wait_for_ready.assert_called_once()
+        self.assertEqual("ssm", wait_for_ready.call_args.kwargs["access_mode"])
+        self.assertIsNone(wait_for_ready.call_args.kwargs["eip_allocation_id"])
+        self.assertIsNotNone(wait_for_ready.call_args.kwargs["ssm_client"])
 
     def test_run_deploy_lifecycle_exits_early_for_list_only_mode(self) -> None:
-        """Edge: AMI list-only mode does not invoke deploy or post-check commands."""
+        """Edge: AMI list-only mode does not invoke deploy or readiness waiting."""
         env = {"AWS_REGION": "us-west-2", "AMI_LIST": "1"}
         selection = Mock(should_deploy=False, selected_ami_id=None)
 
         with (
             patch("workstation_core.orchestration.make_ec2_client", return_value=Mock()),
+            patch("workstation_core.orchestration.make_cloudformation_client", return_value=Mock()),
             patch("workstation_core.orchestration.resolve_ami_selection", return_value=selection),
             patch("workstation_core.orchestration.deploy_shared_network_stack") as deploy_shared_network_stack,
             patch("workstation_core.orchestration.deploy_stack") as deploy_stack,
-            patch("workstation_core.orchestration.run_post_deploy_check") as post_check,
+            patch("workstation_core.orchestration.make_ssm_client", return_value=Mock()),
+            patch("workstation_core.orchestration.wait_for_workstation_ready") as wait_for_ready,
+            patch("workstation_core.orchestration.print_connection_guidance"),
         ):
             result = run_deploy_lifecycle(inputs=self._inputs(), env=env, out=io.StringIO())
 
         self.assertEqual(0, result)
         deploy_shared_network_stack.assert_not_called()
         deploy_stack.assert_not_called()
-        post_check.assert_not_called()
+        wait_for_ready.assert_not_called()
+
+    def test_run_deploy_lifecycle_creates_eip_only_after_preflight_finds_none(self) -> None:
+        """Expected: a missing Elastic IP is created after the read-only preflight succeeds."""
+        env = {"AWS_REGION": "us-west-2"}
+        selection = Mock(should_deploy=True, selected_ami_id=None)
+        created = {"allocation_id": "eipalloc-new", "public_ip": "5.6.7.8"}
+
+        with (
+            patch("workstation_core.orchestration.make_ec2_client", return_value=Mock()),
+            patch("workstation_core.orchestration.make_cloudformation_client", return_value=Mock()),
+            patch("workstation_core.orchestration.resolve_ami_selection", return_value=selection),
+            patch("workstation_core.orchestration.shared_network_stack_exists", return_value=True),
+            patch("workstation_core.orchestration.find_eip_by_name", return_value=None),
+            patch("workstation_core.orchestration.create_eip", return_value=created) as create_eip,
+            patch("workstation_core.orchestration.deploy_stack") as deploy_stack,
+            patch("workstation_core.orchestration.wait_for_workstation_ready"),
+            patch("workstation_core.orchestration.print_connection_guidance"),
+        ):
+            result = run_deploy_lifecycle(inputs=self._inputs(), env=env, out=io.StringIO())
+
+        self.assertEqual(0, result)
+        create_eip.assert_called_once()
+        self.assertEqual("eipalloc-new", deploy_stack.call_args.kwargs["eip_allocation_id"])
+
+    def test_run_deploy_lifecycle_skips_cdk_deploy_when_template_unchanged(self) -> None:
+        """Expected: an unchanged synthesized template skips cdk deploy and is reported."""
+        env = {"AWS_REGION": "us-west-2"}
+        selection = Mock(should_deploy=True, selected_ami_id=None)
+        eip_info = {"allocation_id": "eipalloc-abc123", "public_ip": "1.2.3.4"}
+        self.decide_stack_deploy.return_value = StackDeployDecision(
+            "GastownWorkstationStack",
+            False,
+            "synthesized template matches the deployed template",
+            "abc",
+        )
+        out = io.StringIO()
+
+        with (
+            patch("workstation_core.orchestration.make_ec2_client", return_value=Mock()),
+            patch("workstation_core.orchestration.make_cloudformation_client", return_value=Mock()),
+            patch("workstation_core.orchestration.resolve_ami_selection", return_value=selection),
+            patch("workstation_core.orchestration.shared_network_stack_exists", return_value=True),
+            patch("workstation_core.orchestration.find_eip_by_name", return_value=eip_info),
+            patch("workstation_core.orchestration.find_fleet_instance", return_value=None),
+            patch("workstation_core.orchestration.deploy_stack") as deploy_stack,
+            patch("workstation_core.orchestration.wait_for_workstation_ready"),
+            patch("workstation_core.orchestration.print_connection_guidance"),
+        ):
+            result = run_deploy_lifecycle(inputs=self._inputs(), env=env, out=out)
+
+        self.assertEqual(0, result)
+        deploy_stack.assert_not_called()
+        self.record_local_fingerprint.assert_not_called()
+        self.assertIn(
+            "GastownWorkstationStack: skipped (synthesized template matches the deployed template)",
+            out.getvalue(),
+        )
+        self.assertIn("Env4aiNetworkStack: skipped (shared network stack already exists)", out.getvalue())
+
+    def test_run_deploy_lifecycle_points_paused_unchanged_stack_to_resume(self) -> None:
+        """Failure: a skipped deploy of a paused stack stops before the readiness wait and names resume."""
+        env = {"AWS_REGION": "us-west-2"}
+        selection = Mock(should_deploy=True, selected_ami_id=None)
+        self.decide_stack_deploy.return_value = StackDeployDecision(
+            "GastownWorkstationStack",
+            False,
+            "synthesized template matches the deployed template",
+            "abc",
+        )
+
+        with (
+            patch("workstation_core.orchestration.make_ec2_client", return_value=Mock()),
+            patch("workstation_core.orchestration.make_cloudformation_client", return_value=Mock()),
+            patch("workstation_core.orchestration.resolve_ami_selection", return_value=selection),
+            patch("workstation_core.orchestration.shared_network_stack_exists", return_value=True),
+            patch(
+                "workstation_core.orchestration.find_eip_by_name",
+                return_value={"allocation_id": "eipalloc-abc123", "public_ip": "1.2.3.4"},
+            ),
+            patch(
+                "workstation_core.orchestration.find_fleet_instance",
+                return_value=FleetInstance("i-paused", "stopped"),
+            ) as find_fleet_instance,
+            patch("workstation_core.orchestration.deploy_stack"),
+            patch("workstation_core.orchestration.wait_for_workstation_ready") as wait_for_ready,
+            patch("workstation_core.orchestration.print_connection_guidance"),
+        ):
+            with self.assertRaisesRegex(RuntimeError, r"i-paused is stopped.*ACTION=RESUME.*Resume paused workstation"):
+                run_deploy_lifecycle(inputs=self._inputs(), env=env, out=io.StringIO())
+
+        self.assertEqual(("stopping", "stopped"), find_fleet_instance.call_args.kwargs["states"])
+        wait_for_ready.assert_not_called()
+
+    def test_run_deploy_lifecycle_forwards_force_deploy_env(self) -> None:
+        """Edge: FORCE_DEPLOY=1 asks the fingerprint check to deploy regardless."""
+        env = {"AWS_REGION": "us-west-2", "FORCE_DEPLOY": "1"}
+        selection = Mock(should_deploy=True, selected_ami_id=None)
+
+        with (
+            patch("workstation_core.orchestration.make_ec2_client", return_value=Mock()),
+            patch("workstation_core.orchestration.make_cloudformation_client", return_value=Mock()),
+            patch("workstation_core.orchestration.resolve_ami_selection", return_value=selection),
+            patch("workstation_core.orchestration.shared_network_stack_exists", return_value=True),
+            patch("workstation_core.orchestration.find_eip_by_name", return_value=None),
+            patch("workstation_core.orchestration.create_eip", return_value={"allocation_id": "a", "public_ip": "b"}),
+            patch("workstation_core.orchestration.deploy_stack"),
+            patch("workstation_core.orchestration.wait_for_workstation_ready"),
+            patch("workstation_core.orchestration.print_connection_guidance"),
+        ):
+            run_deploy_lifecycle(inputs=self._inputs(), env=env, out=io.StringIO())
+
+        self.assertTrue(self.decide_stack_deploy.call_args.kwargs["force"])
+
+    def test_run_deploy_lifecycle_list_only_skips_network_and_eip_lookups(self) -> None:
+        """Edge: AMI list-only runs only prefetch the image list."""
+        env = {"AWS_REGION": "us-west-2", "AMI_LIST": "1", "AMI_REFRESH": "1"}
+        ec2_client = Mock()
+
+        with (
+            patch("workstation_core.orchestration.make_ec2_client", return_value=ec2_client),
+            patch("workstation_core.orchestration.make_cloudformation_client", return_value=Mock()),
+            patch("workstation_core.orchestration.catalog_environment_images", return_value=[]) as list_images,
+            patch("workstation_core.orchestration.shared_network_stack_exists") as network_exists,
+            patch("workstation_core.orchestration.find_eip_by_name") as find_eip_by_name,
+        ):
+            result = run_deploy_lifecycle(inputs=self._inputs(), env=env, out=io.StringIO())
+
+        self.assertEqual(0, result)
+        network_exists.assert_not_called()
+        find_eip_by_name.assert_not_called()
+        list_images.assert_called_once_with(ec2_client, "gastown", account_id="111111111111", refresh=True)
 
     def test_run_deploy_lifecycle_propagates_ami_resolution_failure(self) -> None:
         """Failure: AMI selection failures abort orchestration before deploy mutation."""
@@ -241,18 +900,21 @@ class DeployOrchestrationTests(unittest.TestCase):
 
         with (
             patch("workstation_core.orchestration.make_ec2_client", return_value=Mock()),
+            patch("workstation_core.orchestration.make_cloudformation_client", return_value=Mock()),
             patch(
                 "workstation_core.orchestration.resolve_ami_selection",
                 side_effect=RuntimeError("Requested AMI 'gastown_missing' was not found."),
             ),
-            patch("workstation_core.orchestration.find_or_create_eip") as find_or_create_eip,
+            patch("workstation_core.orchestration.shared_network_stack_exists", return_value=True),
+            patch("workstation_core.orchestration.find_eip_by_name", return_value=None),
+            patch("workstation_core.orchestration.create_eip") as create_eip,
             patch("workstation_core.orchestration.deploy_shared_network_stack") as deploy_shared_network_stack,
             patch("workstation_core.orchestration.deploy_stack") as deploy_stack,
         ):
             with self.assertRaisesRegex(RuntimeError, "Requested AMI 'gastown_missing' was not found."):
                 run_deploy_lifecycle(inputs=self._inputs(), env=env, out=io.StringIO())
 
-        find_or_create_eip.assert_not_called()
+        create_eip.assert_not_called()
         deploy_shared_network_stack.assert_not_called()
         deploy_stack.assert_not_called()
 
@@ -263,8 +925,10 @@ class DeployOrchestrationTests(unittest.TestCase):
 
         with (
             patch("workstation_core.orchestration.make_ec2_client", return_value=Mock()),
+            patch("workstation_core.orchestration.make_cloudformation_client", return_value=Mock()),
             patch("workstation_core.orchestration.resolve_ami_selection", return_value=selection),
-            patch("workstation_core.orchestration.find_or_create_eip") as find_or_create_eip,
+            patch("workstation_core.orchestration.find_eip_by_name", return_value=None),
+            patch("workstation_core.orchestration.create_eip") as create_eip,
             patch("workstation_core.orchestration.shared_network_stack_exists", return_value=False),
             patch(
                 "workstation_core.orchestration.deploy_shared_network_stack",
@@ -275,9 +939,88 @@ class DeployOrchestrationTests(unittest.TestCase):
             with self.assertRaisesRegex(RuntimeError, "network deploy failed"):
                 run_deploy_lifecycle(inputs=self._inputs(), env=env, out=io.StringIO())
 
-        find_or_create_eip.assert_not_called()
+        create_eip.assert_not_called()
         deploy_stack.assert_not_called()
 
+    def test_run_deploy_lifecycle_uses_change_set_engine_when_requested(self) -> None:
+        """Expected: DEPLOY_ENGINE=changeset deploys the synthesized stack through a change set."""
+        env = {"AWS_REGION": "us-west-2", "DEPLOY_ENGINE": "changeset"}
+        selection = Mock(should_deploy=True, selected_ami_id=None)
+        cloudformation_client = Mock()
+        artifact = StackArtifact(stack_name="GastownWorkstationStack", template_body="{}")
+        out = io.StringIO()
+
+        with (
+            patch("workstation_core.orchestration.make_ec2_client", return_value=Mock()),
+            patch("workstation_core.orchestration.make_cloudformation_client", return_value=cloudformation_client),
+            patch("workstation_core.orchestration.make_s3_client", return_value=Mock()),
+            patch("workstation_core.orchestration.resolve_ami_selection", return_value=selection),
+            patch("workstation_core.orchestration.shared_network_stack_exists", return_value=True),
+            patch("workstation_core.orchestration.find_eip_by_name", return_value={"allocation_id": "a", "public_ip": "b"}),
+            patch("workstation_core.orchestration.load_stack_artifact", return_value=artifact) as load_stack_artifact,
+            patch(
+                "workstation_core.orchestration.deploy_stack_artifact",
+                return_value=ChangeSetDeployResult("GastownWorkstationStack", "UPDATE", True, "UPDATE_COMPLETE", (), 1.0),
+            ) as deploy_stack_artifact,
+            patch("workstation_core.orchestration.deploy_stack") as deploy_stack,
+            patch("workstation_core.orchestration.wait_for_workstation_ready"),
+            patch("workstation_core.orchestration.print_connection_guidance"),
+        ):
+            inputs = DeployWorkflowInputs(
+                environment="gastown",
+                stack_dir="/tmp/gastown",
+                stack_name="GastownWorkstationStack",
+            )
+            result = run_deploy_lifecycle(inputs=inputs, env=env, out=out)
+
+        self.assertEqual(0, result)
+        load_stack_artifact.assert_called_once_with(Path("/tmp/gastown/cdk.out"), "GastownWorkstationStack")
+        self.assertIs(cloudformation_client, deploy_stack_artifact.call_args.args[0])
+        self.assertIs(artifact, deploy_stack_artifact.call_args.args[1])
+        deploy_stack.assert_not_called()
+        self.record_local_fingerprint.assert_called_once()
+
+    def test_run_deploy_lifecycle_falls_back_to_cdk_for_stacks_with_assets(self) -> None:
+        """Edge: stacks needing asset publishing still deploy through the CDK CLI."""
+        env = {"AWS_REGION": "us-west-2", "DEPLOY_ENGINE": "changeset"}
+        selection = Mock(should_deploy=True, selected_ami_id=None)
+        artifact = StackArtifact(stack_name="GastownWorkstationStack", template_body="{}", has_external_assets=True)
+
+        with (
+            patch("workstation_core.orchestration.make_ec2_client", return_value=Mock()),
+            patch("workstation_core.orchestration.make_cloudformation_client", return_value=Mock()),
+            patch("workstation_core.orchestration.resolve_ami_selection", return_value=selection),
+            patch("workstation_core.orchestration.shared_network_stack_exists", return_value=True),
+            patch("workstation_core.orchestration.find_eip_by_name", return_value={"allocation_id": "a", "public_ip": "b"}),
+            patch("workstation_core.orchestration.load_stack_artifact", return_value=artifact),
+            patch("workstation_core.orchestration.deploy_stack_artifact") as deploy_stack_artifact,
+            patch("workstation_core.orchestration.deploy_stack") as deploy_stack,
+            patch("workstation_core.orchestration.wait_for_workstation_ready"),
+            patch("workstation_core.orchestration.print_connection_guidance"),
+        ):
+            inputs = DeployWorkflowInputs(
+                environment="gastown",
+                stack_dir="/tmp/gastown",
+                stack_name="GastownWorkstationStack",
+            )
+            run_deploy_lifecycle(inputs=inputs, env=env, out=io.StringIO())
+
+        deploy_stack_artifact.assert_not_called()
+        deploy_stack.assert_called_once()
+
+    def test_resolve_deploy_engine_defaults_to_cdk(self) -> None:
+        """Expected: change sets are opt-in; without a flag or DEPLOY_ENGINE stacks use cdk deploy."""
+        self.assertEqual("cdk", resolve_deploy_engine(cli_deploy_engine=None, env={}))
+        self.assertEqual(
+            "changeset",
+            resolve_deploy_engine(cli_deploy_engine="changeset", env={"DEPLOY_ENGINE": "cdk"}),
+        )
+
+    def test_resolve_deploy_engine_rejects_unknown_engine(self) -> None:
+        """Failure: unsupported DEPLOY_ENGINE values fail before any AWS call."""
+        with self.assertRaisesRegex(RuntimeError, "DEPLOY_ENGINE must be one of"):
+            resolve_deploy_engine(cli_deploy_engine=None, env={"DEPLOY_ENGINE": "terraform"})
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -9,6 +9,8 @@ import unittest
 from workstation_core import (
     AmiSelectorConfig,
     EnvironmentSpec,
+    InstanceTypeOption,
+    resolve_bootstrap_dependencies,
     validate_environment_spec,
 )
 
@@ -119,6 +121,142 @@ class EnvironmentSpecTests(unittest.TestCase):
                 )
             )
 
+    def test_resolve_bootstrap_dependencies_defaults_undeclared_scripts_to_sequential(self) -> None:
+        """Expected: undeclared scripts need every earlier script; declared ones only their needs."""
+        graph = resolve_bootstrap_dependencies(
+            ("deps.sh", "agents.sh", "build.sh", "finish.sh"),
+            {"agents.sh": ("deps.sh",), "build.sh": ("deps.sh",)},
+        )
+
+        self.assertEqual(
+            {
+                "deps.sh": (),
+                "agents.sh": ("deps.sh",),
+                "build.sh": ("deps.sh",),
+                "finish.sh": ("deps.sh", "agents.sh", "build.sh"),
+            },
+            graph,
+        )
+
+    def test_validate_environment_spec_rejects_invalid_bootstrap_graph(self) -> None:
+        """Failure: unknown or later dependencies and non-positive parallelism are rejected."""
+        base = dict(
+            environment_key="broken",
+            display_name="Broken",
+            bootstrap_files=("deps.sh", "build.sh"),
+            default_ami_selector=AmiSelectorConfig(
+                owner="099720109477",
+                name="ubuntu/images/hvm-ssd/ubuntu-jammy-22.04-amd64-server-*",
+                filters={"architecture": ("x86_64",)},
+            ),
+            subnet_cidr="10.0.9.0/24",
+            instance_type="t3.large",
+            volume_size=40,
+            spot_price="0.1",
+        )
+        cases = (
+            ({"bootstrap_dependencies": {"build.sh": ("missing.sh",)}}, "unknown script 'missing.sh'"),
+            ({"bootstrap_dependencies": {"deps.sh": ("build.sh",)}}, "must come earlier"),
+            ({"bootstrap_parallelism": 0}, "bootstrap_parallelism must be at least 1"),
+            ({"container_images": ("postgres:17",)}, "needs docker.sh"),
+            ({"container_images": ("postgres 17",)}, "without spaces"),
+        )
+        for overrides, message in cases:
+            with self.subTest(message=message):
+                with self.assertRaisesRegex(ValueError, message):
+                    validate_environment_spec(EnvironmentSpec(**base, **overrides))
+
+    def test_instance_type_options_list_primary_then_fallbacks(self) -> None:
+        """Expected: the primary instance type leads the ordered fallback list."""
+        spec = EnvironmentSpec(
+            environment_key="fleet",
+            display_name="Fleet",
+            bootstrap_files=("deps.sh",),
+            default_ami_selector=AmiSelectorConfig(
+                owner="099720109477",
+                name="ubuntu/images/hvm-ssd/ubuntu-jammy-22.04-amd64-server-*",
+                filters={"architecture": ("x86_64",)},
+            ),
+            subnet_cidr="10.0.9.0/24",
+            instance_type="t3.large",
+            volume_size=16,
+            spot_price="0.1",
+            fallback_instance_types=(InstanceTypeOption("m5.large"), InstanceTypeOption("m5.xlarge", weight=2)),
+        )
+
+        validate_environment_spec(spec)
+        self.assertEqual(
+            ["t3.large", "m5.large", "m5.xlarge"],
+            [option.instance_type for option in spec.instance_type_options],
+        )
+
+    def test_validate_environment_spec_rejects_bad_fallback_instance_types(self) -> None:
+        """Failure: duplicate types and fractional weights are rejected."""
+        base = dict(
+            environment_key="fleet",
+            display_name="Fleet",
+            bootstrap_files=("deps.sh",),
+            default_ami_selector=AmiSelectorConfig(
+                owner="099720109477",
+                name="ubuntu/images/hvm-ssd/ubuntu-jammy-22.04-amd64-server-*",
+                filters={"architecture": ("x86_64",)},
+            ),
+            subnet_cidr="10.0.9.0/24",
+            instance_type="t3.large",
+            volume_size=16,
+            spot_price="0.1",
+        )
+        with self.assertRaisesRegex(ValueError, "'t3.large' more than once"):
+            validate_environment_spec(
+                EnvironmentSpec(**base, fallback_instance_types=(InstanceTypeOption("t3.large"),))
+            )
+        with self.assertRaisesRegex(ValueError, "weights must be at least 1"):
+            validate_environment_spec(
+                EnvironmentSpec(**base, fallback_instance_types=(InstanceTypeOption("m5.large", weight=0.5),))
+            )
+
+    def test_subnet_cidrs_split_subnet_cidr_across_availability_zones(self) -> None:
+        """Expected: each Availability Zone gets an equal, non-overlapping slice of subnet_cidr."""
+        spec = EnvironmentSpec(
+            environment_key="multi",
+            display_name="Multi",
+            bootstrap_files=("deps.sh",),
+            default_ami_selector=AmiSelectorConfig(
+                owner="099720109477",
+                name="ubuntu/images/hvm-ssd/ubuntu-jammy-22.04-amd64-server-*",
+                filters={"architecture": ("x86_64",)},
+            ),
+            subnet_cidr="10.0.9.0/24",
+            instance_type="t3.large",
+            volume_size=16,
+            spot_price="0.1",
+            availability_zone_count=3,
+        )
+
+        validate_environment_spec(spec)
+        self.assertEqual(("10.0.9.0/26", "10.0.9.64/26", "10.0.9.128/26"), spec.subnet_cidrs)
+
+    def test_validate_environment_spec_rejects_split_below_minimum_subnet_size(self) -> None:
+        """Failure: a subnet_cidr too small for the zone count is rejected."""
+        with self.assertRaisesRegex(ValueError, "too small to split across 2 Availability Zones"):
+            validate_environment_spec(
+                EnvironmentSpec(
+                    environment_key="tiny",
+                    display_name="Tiny",
+                    bootstrap_files=("deps.sh",),
+                    default_ami_selector=AmiSelectorConfig(
+                        owner="099720109477",
+                        name="ubuntu/images/hvm-ssd/ubuntu-jammy-22.04-amd64-server-*",
+                        filters={"architecture": ("x86_64",)},
+                    ),
+                    subnet_cidr="10.0.9.0/28",
+                    instance_type="t3.large",
+                    volume_size=16,
+                    spot_price="0.1",
+                    availability_zone_count=2,
+                )
+            )
+
     def test_validate_environment_spec_rejects_invalid_subnet_cidr(self) -> None:
         """Failure: malformed subnet CIDRs are rejected with actionable guidance."""
         with self.assertRaisesRegex(
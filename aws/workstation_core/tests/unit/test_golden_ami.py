@@ -0,0 +1,444 @@
+"""Unit tests for golden AMI layer hashing, lookup, and builds."""
+
+from __future__ import annotations
+
+import base64
+import io
+import json
+from pathlib import Path
+import shutil
+import subprocess
+import tempfile
+import unittest
+from unittest.mock import Mock, patch
+
+from workstation_core.golden_ami import (
+    GOLDEN_HASH_TAG,
+    GoldenImageStatus,
+    build_golden_image,
+    build_golden_user_data,
+    choose_deploy_golden_image,
+    compute_golden_image_hash,
+    compute_layer_hashes,
+    find_cached_layer,
+    resolve_bootstrap_scripts,
+)
+
+
+def _environment_spec(**overrides: object) -> Mock:
+    """Return an environment spec mock with one shared and one local script."""
+    selector = Mock(owner="099720109477", filters={})
+    # Reason: ``name`` is reserved by the Mock constructor.
+    selector.name = "ubuntu/*"
+    fields: dict[str, object] = {
+        "environment_key": "gastown",
+        "bootstrap_files": ("common.sh", "local.sh"),
+        "default_ami_selector": selector,
+        "instance_type": "t3.large",
+        "volume_size": 40,
+    }
+    return Mock(**{**fields, **overrides})
+
+
+def _write_scripts(root: Path) -> Path:
+    """Create an environment dir with one local and one shared init script."""
+    stack_dir = root / "gastown"
+    (stack_dir / "init").mkdir(parents=True)
+    (root / "common" / "init").mkdir(parents=True)
+    (stack_dir / "init" / "local.sh").write_text("echo local\n", encoding="utf-8")
+    (root / "common" / "init" / "common.sh").write_text("echo common\n", encoding="utf-8")
+    return stack_dir
+
+
+def _layer_hashes(stack_dir: Path) -> tuple[str, ...]:
+    """Return the layer hashes of the test environment over ``ami-base``."""
+    return compute_layer_hashes(
+        "ami-base", resolve_bootstrap_scripts(stack_dir, ("common.sh", "local.sh")), volume_size=40
+    )
+
+
+def _ec2_client(*, layers: dict[str, str] | None = None, builds: list[dict] | None = None) -> Mock:
+    """Return an EC2 client mock resolving a base AMI and owned layer images by hash tag."""
+    client = Mock()
+    owned = layers or {}
+
+    def describe_images(**kwargs: object) -> dict:
+        if kwargs.get("Owners") == ["self"]:
+            hashes = next(item["Values"] for item in kwargs["Filters"] if item["Name"] == f"tag:{GOLDEN_HASH_TAG}")
+            return {
+                "Images": [
+                    {"ImageId": image_id, "State": "available", "Tags": [{"Key": GOLDEN_HASH_TAG, "Value": layer}]}
+                    for layer, image_id in owned.items()
+                    if layer in hashes
+                ]
+            }
+        return {
+            "Images": [
+                {"ImageId": "ami-old", "CreationDate": "2026-01-01T00:00:00.000Z"},
+                {"ImageId": "ami-base", "CreationDate": "2026-06-01T00:00:00.000Z"},
+            ]
+        }
+
+    client.describe_images.side_effect = describe_images
+    client.describe_instances.return_value = {"Reservations": [{"Instances": builds}] if builds else []}
+    return client
+
+
+def _states(*names: str) -> list[dict]:
+    """Return ``describe_instances`` responses for one instance in each state."""
+    return [{"Reservations": [{"Instances": [{"State": {"Name": name}}]}]} for name in names]
+
+
+class GoldenImageHashTests(unittest.TestCase):
+    """Validate the content hash chain that keys golden AMI layers."""
+
+    def test_hash_changes_with_base_ami_volume_size_content_and_order(self) -> None:
+        """Expected: base AMI id, volume size, script content, and script order all change the hash."""
+        scripts = (("a.sh", b"echo a\n"), ("b.sh", b"echo b\n"))
+        baseline = compute_golden_image_hash("ami-1", scripts, volume_size=16)
+
+        self.assertEqual(baseline, compute_golden_image_hash("ami-1", scripts, volume_size=16))
+        self.assertNotEqual(baseline, compute_golden_image_hash("ami-2", scripts, volume_size=16))
+        self.assertNotEqual(baseline, compute_golden_image_hash("ami-1", scripts, volume_size=30))
+        self.assertNotEqual(
+            baseline, compute_golden_image_hash("ami-1", (scripts[0], ("b.sh", b"echo B\n")), volume_size=16)
+        )
+        self.assertNotEqual(baseline, compute_golden_image_hash("ami-1", tuple(reversed(scripts)), volume_size=16))
+
+    def test_layers_are_shared_up_to_the_first_differing_script(self) -> None:
+        """Expected: environments sharing leading scripts share those layer hashes only."""
+        shared = (("python.sh", b"py\n"), ("nodejs.sh", b"node\n"))
+        first = compute_layer_hashes("ami-1", (*shared, ("deps.sh", b"a\n")), volume_size=16)
+        second = compute_layer_hashes("ami-1", (*shared, ("deps.sh", b"b\n")), volume_size=16)
+
+        self.assertEqual(first[:3], second[:3])
+        self.assertNotEqual(first[3], second[3])
+        self.assertEqual(
+            first[-1], compute_golden_image_hash("ami-1", (*shared, ("deps.sh", b"a\n")), volume_size=16)
+        )
+
+    def test_scripts_resolve_local_then_common(self) -> None:
+        """Expected: scripts are read from the environment dir first, then common/init."""
+        with tempfile.TemporaryDirectory() as tmp:
+            stack_dir = _write_scripts(Path(tmp))
+
+            scripts = resolve_bootstrap_scripts(stack_dir, ("common.sh", "local.sh"))
+
+        self.assertEqual((("common.sh", b"echo common\n"), ("local.sh", b"echo local\n")), scripts)
+
+    def test_missing_script_raises(self) -> None:
+        """Failure: an unknown script names both searched paths."""
+        with tempfile.TemporaryDirectory() as tmp:
+            with self.assertRaisesRegex(RuntimeError, "Bootstrap script 'missing.sh' was not found"):
+                resolve_bootstrap_scripts(Path(tmp) / "gastown", ("missing.sh",))
+
+    def test_find_cached_layer_returns_deepest_available_layer(self) -> None:
+        """Expected: the longest cached prefix wins regardless of which environment built it."""
+        hashes = ("h0", "h1", "h2", "h3")
+        ec2_client = _ec2_client(layers={"h1": "ami-l1", "h2": "ami-l2"})
+
+        self.assertEqual((2, "ami-l2"), find_cached_layer(ec2_client, hashes))
+        self.assertIsNone(find_cached_layer(_ec2_client(), hashes))
+
+
+class GoldenUserDataTests(unittest.TestCase):
+    """Validate the builder user data."""
+
+    def test_user_data_queues_layers_and_runs_the_first(self) -> None:
+        """Expected: every layer is queued and the per-boot runner reports each exit code."""
+        script = base64.b64decode(
+            build_golden_user_data((("01-aaa", b"#!/usr/bin/env bash\necho a\n"), ("02-bbb", b"echo b")))
+        ).decode()
+
+        self.assertIn('cat > "$state_dir/queue/01-aaa"', script)
+        self.assertIn("echo b\n", script)
+        self.assertIn("/var/lib/cloud/scripts/per-boot/", script)
+        self.assertIn('env4ai-golden-layer: $next exit=$status', script)
+        self.assertIn('bash -euo pipefail "$state_dir/queue/$next"', script)
+        self.assertIn("export DEBIAN_FRONTEND=noninteractive", script)
+        self.assertTrue(script.endswith("exec /var/lib/cloud/scripts/per-boot/env4ai-golden-layer.sh\n"))
+
+    @unittest.skipUnless(shutil.which("bash"), "bash is required to run the builder script")
+    def test_failed_step_fails_the_layer_and_clears_the_queue(self) -> None:
+        """Failure: a failing command mid-script reports a non-zero exit even when the last step succeeds."""
+        script = base64.b64decode(
+            build_golden_user_data(
+                (("01-aaa", b"false | cat\necho applied > \"$MARKER\"\n"), ("02-bbb", b"echo b\n"))
+            )
+        ).decode()
+
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / "instance-id").write_text("i-builder\n", encoding="utf-8")
+            local = (
+                script.replace("/var/lib/env4ai/golden-build", f"{root}/state")
+                .replace("/var/lib/cloud/scripts/per-boot", f"{root}/per-boot")
+                .replace("/var/lib/cloud/data/instance-id", f"{root}/instance-id")
+                .replace("/dev/console", "/dev/null")
+                .replace("shutdown -h now", "true")
+            )
+            result = subprocess.run(
+                ["bash", "-c", local],
+                capture_output=True,
+                text=True,
+                env={"PATH": "/usr/bin:/bin", "MARKER": f"{root}/marker"},
+                check=False,
+            )
+
+            self.assertIn("env4ai-golden-layer: 01-aaa exit=1", result.stdout)
+            self.assertFalse((root / "marker").exists())
+            self.assertFalse((root / "state").exists())
+
+    def test_oversized_user_data_raises(self) -> None:
+        """Failure: scripts beyond the EC2 user-data limit are rejected before launch."""
+        with self.assertRaisesRegex(RuntimeError, "EC2 allows"):
+            build_golden_user_data((("01-big", b"x" * 20000),))
+
+
+class ChooseDeployGoldenImageTests(unittest.TestCase):
+    """Validate the deploy-time golden AMI decision."""
+
+    def _choose(self, ec2_client: Mock, cloudformation_client: Mock, stack_dir: Path):
+        return choose_deploy_golden_image(
+            ec2_client,
+            cloudformation_client,
+            stack_dir=stack_dir,
+            stack_name="GastownWorkstationStack",
+            environment_spec=_environment_spec(),
+        )
+
+    def test_new_stack_uses_available_golden_image(self) -> None:
+        """Expected: a first deploy launches from the golden AMI matching the current hash."""
+        cloudformation_client = Mock()
+        cloudformation_client.get_template.side_effect = RuntimeError("Stack does not exist")
+        with tempfile.TemporaryDirectory() as tmp:
+            stack_dir = _write_scripts(Path(tmp))
+            ec2_client = _ec2_client(layers={_layer_hashes(stack_dir)[-1]: "ami-golden"})
+            choice = self._choose(ec2_client, cloudformation_client, stack_dir)
+
+        self.assertEqual("ami-golden", choice.image_id)
+
+    def test_deployed_non_golden_stack_skips_the_golden_image(self) -> None:
+        """Edge: a stack not deployed from a golden AMI is not moved onto one; the default AMI is used."""
+        cloudformation_client = Mock()
+        template = {
+            "Resources": {
+                "Fleet": {
+                    "Type": "AWS::EC2::SpotFleet",
+                    "Properties": {"SpotFleetRequestConfigData": {"LaunchSpecifications": [{"ImageId": "ami-base"}]}},
+                }
+            }
+        }
+        cloudformation_client.get_template.return_value = {"TemplateBody": json.dumps(template)}
+        ec2_client = Mock()
+        ec2_client.describe_images.return_value = {"Images": [{"ImageId": "ami-base", "Tags": []}]}
+
+        choice = self._choose(ec2_client, cloudformation_client, Path("/tmp/gastown"))
+
+        self.assertIsNone(choice.image_id)
+        self.assertIn("not a golden AMI; skipping the golden AMI and deploying the default AMI", choice.reason)
+        self.assertNotIn("keeping", choice.reason)
+
+    def test_lookup_error_falls_back_to_user_data(self) -> None:
+        """Failure: golden AMI lookup errors never block the deploy."""
+        cloudformation_client = Mock()
+        cloudformation_client.get_template.side_effect = RuntimeError("AccessDenied")
+
+        choice = self._choose(Mock(), cloudformation_client, Path("/tmp/gastown"))
+
+        self.assertIsNone(choice.image_id)
+        self.assertIn("bootstrapping in user data", choice.reason)
+
+
+class _Clock:
+    """Deterministic monotonic clock advanced by the sleeper."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+class BuildGoldenImageTests(unittest.TestCase):
+    """Validate the layered builder workflow."""
+
+    def _build(
+        self,
+        ec2_client: Mock,
+        stack_dir: Path,
+        clock: _Clock | None = None,
+        environment_spec: Mock | None = None,
+    ) -> str:
+        clock = clock or _Clock()
+        return build_golden_image(
+            ec2_client,
+            Mock(),
+            stack_dir=stack_dir,
+            stack_name="GastownWorkstationStack",
+            environment_spec=environment_spec or _environment_spec(),
+            subnet_id="subnet-1",
+            monotonic=clock.monotonic,
+            sleeper=clock.sleep,
+            out=io.StringIO(),
+        )
+
+    def test_existing_image_is_reused(self) -> None:
+        """Expected: an available golden AMI for the current hash is not rebuilt."""
+        with tempfile.TemporaryDirectory() as tmp:
+            stack_dir = _write_scripts(Path(tmp))
+            ec2_client = _ec2_client(layers={_layer_hashes(stack_dir)[-1]: "ami-golden"})
+            image_id = self._build(ec2_client, stack_dir)
+
+        self.assertEqual("ami-golden", image_id)
+        ec2_client.run_instances.assert_not_called()
+
+    def test_builds_every_layer_from_base_and_terminates_builder(self) -> None:
+        """Expected: each script is imaged as a layer and the builder restarts between layers."""
+        ec2_client = _ec2_client()
+        ec2_client.run_instances.return_value = {"Instances": [{"InstanceId": "i-build"}]}
+        ec2_client.create_image.side_effect = [{"ImageId": "ami-l1"}, {"ImageId": "ami-l2"}]
+        with (
+            tempfile.TemporaryDirectory() as tmp,
+            patch("workstation_core.golden_ami.wait_for_image_snapshots") as wait_for_snapshots,
+            patch("workstation_core.golden_ami.wait_for_image_available") as wait_for_image,
+        ):
+            stack_dir = _write_scripts(Path(tmp))
+            hashes = _layer_hashes(stack_dir)
+            ec2_client.describe_instances.side_effect = [
+                {"Reservations": []},
+                *_states("running", "stopped", "pending", "running", "stopped"),
+            ]
+            ec2_client.get_console_output.side_effect = [
+                {"Output": f"env4ai-golden-layer: 01-{hashes[1][:12]} exit=0\n"},
+                {"Output": f"env4ai-golden-layer: 02-{hashes[2][:12]} exit=0\n"},
+            ]
+            image_id = self._build(ec2_client, stack_dir)
+
+        self.assertEqual("ami-l2", image_id)
+        self.assertEqual("ami-base", ec2_client.run_instances.call_args.kwargs["ImageId"])
+        self.assertEqual("stop", ec2_client.run_instances.call_args.kwargs["InstanceInitiatedShutdownBehavior"])
+        layer_tags = [
+            next(tag["Value"] for tag in call.kwargs["TagSpecifications"][0]["Tags"] if tag["Key"] == GOLDEN_HASH_TAG)
+            for call in ec2_client.create_image.call_args_list
+        ]
+        self.assertEqual([hashes[1], hashes[2]], layer_tags)
+        self.assertEqual("gastown_golden-" + hashes[2][:12], ec2_client.create_image.call_args.kwargs["Name"])
+        wait_for_snapshots.assert_called_once()
+        ec2_client.start_instances.assert_called_once_with(InstanceIds=["i-build"])
+        wait_for_image.assert_called_once()
+        ec2_client.terminate_instances.assert_called_once_with(InstanceIds=["i-build"])
+
+    def test_edited_last_script_rebuilds_only_the_top_layer(self) -> None:
+        """Expected: the deepest cached layer is the launch image and only later scripts run."""
+        with (
+            tempfile.TemporaryDirectory() as tmp,
+            patch("workstation_core.golden_ami.wait_for_image_available"),
+        ):
+            stack_dir = _write_scripts(Path(tmp))
+            hashes = _layer_hashes(stack_dir)
+            ec2_client = _ec2_client(layers={hashes[1]: "ami-l1"})
+            ec2_client.run_instances.return_value = {"Instances": [{"InstanceId": "i-build"}]}
+            ec2_client.create_image.return_value = {"ImageId": "ami-top"}
+            ec2_client.describe_instances.side_effect = [{"Reservations": []}, *_states("stopped")]
+            ec2_client.get_console_output.return_value = {
+                "Output": f"env4ai-golden-layer: 02-{hashes[2][:12]} exit=0\n"
+            }
+            image_id = self._build(ec2_client, stack_dir)
+
+        self.assertEqual("ami-top", image_id)
+        self.assertEqual("ami-l1", ec2_client.run_instances.call_args.kwargs["ImageId"])
+        user_data = base64.b64decode(ec2_client.run_instances.call_args.kwargs["UserData"]).decode()
+        self.assertIn("echo local\n", user_data)
+        self.assertNotIn("echo common\n", user_data)
+        ec2_client.create_image.assert_called_once()
+        ec2_client.start_instances.assert_not_called()
+
+    def test_environment_with_the_same_prefix_and_volume_reuses_another_environments_layer(self) -> None:
+        """Expected: a shared leading script is reused across environments only at the same volume size."""
+        with (
+            tempfile.TemporaryDirectory() as tmp,
+            patch("workstation_core.golden_ami.wait_for_image_available"),
+        ):
+            stack_dir = _write_scripts(Path(tmp))
+            (Path(tmp) / "common" / "init" / "other.sh").write_text("echo other\n", encoding="utf-8")
+            other_dir = Path(tmp) / "other"
+            launches = {}
+            # Gastown's 40 GiB layer 1 covers common.sh; at 16 GiB both layers are built from the base.
+            for volume_size, built_depths in ((40, (2,)), (16, (1, 2))):
+                spec = _environment_spec(
+                    environment_key="other", bootstrap_files=("common.sh", "other.sh"), volume_size=volume_size
+                )
+                other_hashes = compute_layer_hashes(
+                    "ami-base", resolve_bootstrap_scripts(other_dir, spec.bootstrap_files), volume_size=volume_size
+                )
+                ec2_client = _ec2_client(layers={_layer_hashes(stack_dir)[1]: "ami-gastown-l1"})
+                ec2_client.run_instances.return_value = {"Instances": [{"InstanceId": "i-build"}]}
+                ec2_client.create_image.return_value = {"ImageId": "ami-top"}
+                ec2_client.describe_instances.side_effect = [{"Reservations": []}, *_states("stopped", "stopped")]
+                ec2_client.get_console_output.side_effect = [
+                    {"Output": f"env4ai-golden-layer: {depth:02d}-{other_hashes[depth][:12]} exit=0\n"}
+                    for depth in built_depths
+                ]
+                with patch("workstation_core.golden_ami.wait_for_image_snapshots"), patch(
+                    "workstation_core.golden_ami._wait_until_not_stopped"
+                ):
+                    self._build(ec2_client, other_dir, environment_spec=spec)
+                launch = ec2_client.run_instances.call_args.kwargs
+                launches[volume_size] = (launch["ImageId"], launch["BlockDeviceMappings"][0]["Ebs"]["VolumeSize"])
+
+        self.assertEqual(("ami-gastown-l1", 40), launches[40])
+        self.assertEqual(("ami-base", 16), launches[16])
+
+    def test_failed_layer_raises_and_terminates_builder(self) -> None:
+        """Failure: a non-zero script exit code is reported and that layer is not imaged."""
+        ec2_client = _ec2_client()
+        ec2_client.run_instances.return_value = {"Instances": [{"InstanceId": "i-build"}]}
+        ec2_client.describe_instances.side_effect = [{"Reservations": []}, *_states("stopped")]
+        with tempfile.TemporaryDirectory() as tmp:
+            stack_dir = _write_scripts(Path(tmp))
+            hashes = _layer_hashes(stack_dir)
+            ec2_client.get_console_output.return_value = {
+                "Output": f"env4ai-golden-layer: 01-{hashes[1][:12]} exit=2\n"
+            }
+            with self.assertRaisesRegex(RuntimeError, "common.sh failed with exit code 2"):
+                self._build(ec2_client, stack_dir)
+
+        ec2_client.create_image.assert_not_called()
+        ec2_client.terminate_instances.assert_called_once_with(InstanceIds=["i-build"])
+
+    def test_running_build_is_not_duplicated(self) -> None:
+        """Failure: a second build for the same hash is refused while one is running."""
+        ec2_client = _ec2_client(builds=[{"InstanceId": "i-other"}])
+        with tempfile.TemporaryDirectory() as tmp:
+            with self.assertRaisesRegex(RuntimeError, "already running on i-other"):
+                self._build(ec2_client, _write_scripts(Path(tmp)))
+
+        ec2_client.run_instances.assert_not_called()
+
+
+class GoldenImageStatusTests(unittest.TestCase):
+    """Validate the user-facing status line."""
+
+    def test_describe_reports_build_in_progress(self) -> None:
+        """Expected: a running builder is reported with its instance id."""
+        status = GoldenImageStatus("a" * 64, "ami-base", build_instance_id="i-build")
+
+        self.assertEqual("Golden AMI: building on i-build (hash aaaaaaaaaaaa)", status.describe())
+        self.assertFalse(status.is_available)
+
+    def test_describe_reports_cached_layers(self) -> None:
+        """Expected: a missing golden AMI reports how many layers are already cached."""
+        status = GoldenImageStatus("b" * 64, "ami-base", cached_layers=8, total_layers=9)
+
+        self.assertEqual(
+            "Golden AMI: not built for the current scripts (8/9 layers cached, hash bbbbbbbbbbbb)",
+            status.describe(),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
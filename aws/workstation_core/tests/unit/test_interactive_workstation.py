@@ -3,9 +3,13 @@
 from __future__ import annotations
 
 import io
+import os
 from pathlib import Path
 import tempfile
 import unittest
+from unittest.mock import patch
+
+from botocore.exceptions import ClientError
 
 from workstation_core.interactive_workstation import (
     EnvironmentTarget,
@@ -16,6 +20,7 @@ from workstation_core.interactive_workstation import (
     discover_environments,
     dispatch_action,
     parse_action_choice,
+    run_script_in_process,
 )
 
 
@@ -274,6 +279,63 @@ class InteractiveWorkstationHelpersTests(unittest.TestCase):
         self.assertEqual("destroy_shared_network", parse_action_choice("8"))
         self.assertEqual("destroy_shared_network", parse_action_choice("n"))
 
+    def test_build_action_availability_gates_pause_and_resume_on_instance_state(self) -> None:
+        """Expected: pause needs a running workstation and resume a paused one."""
+        running = build_action_availability(
+            InteractiveEnvironmentState(stack_state="running", stack_status="CREATE_COMPLETE", is_deployed=True)
+        )
+        paused = build_action_availability(
+            InteractiveEnvironmentState(stack_state="paused", stack_status="CREATE_COMPLETE", is_deployed=True)
+        )
+
+        self.assertTrue(running["pause"].enabled)
+        self.assertFalse(running["resume"].enabled)
+        self.assertFalse(paused["pause"].enabled)
+        self.assertTrue(paused["resume"].enabled)
+        self.assertFalse(paused["deploy_default"].enabled)
+
+    def test_dispatch_action_resume_runs_pause_script_with_resume_flag(self) -> None:
+        """Expected: resume reuses the pause script with ``--resume``."""
+        environment = self._targets()[0]
+        calls: list[tuple[list[str], Path, dict[str, str] | None]] = []
+
+        dispatch_action(
+            "resume",
+            environment,
+            input_func=lambda _: "",
+            out=io.StringIO(),
+            runner=lambda command, cwd, env: calls.append((command, cwd, env)),
+        )
+
+        self.assertEqual(1, len(calls))
+        command, cwd, env_overrides = calls[0]
+        self.assertEqual(["uv", "run", "../scripts/pause_workstation.py"], command[:3])
+        self.assertEqual("--resume", command[-1])
+        self.assertEqual(environment.stack_dir, cwd)
+        self.assertIsNone(env_overrides)
+        self.assertEqual("pause", parse_action_choice("10"))
+        self.assertEqual("resume", parse_action_choice("u"))
+
+    def test_dispatch_action_build_golden_ami_runs_builder_script(self) -> None:
+        """Expected: the golden AMI action runs the builder script for the environment."""
+        environment = self._targets()[0]
+        calls: list[tuple[list[str], Path, dict[str, str] | None]] = []
+
+        dispatch_action(
+            "build_golden_ami",
+            environment,
+            input_func=lambda _: "",
+            out=io.StringIO(),
+            runner=lambda command, cwd, env: calls.append((command, cwd, env)),
+        )
+
+        self.assertEqual(1, len(calls))
+        command, cwd, _env_overrides = calls[0]
+        self.assertEqual(["uv", "run", "../scripts/build_golden_ami.py"], command[:3])
+        self.assertEqual(environment.stack_name, command[-1])
+        self.assertEqual(environment.stack_dir, cwd)
+        self.assertEqual("build_golden_ami", parse_action_choice("g"))
+
     def test_derive_is_deployed_false_for_not_found_stack_state(self) -> None:
         """Edge: stack-not-found always reports not deployed."""
         self.assertFalse(
@@ -448,6 +510,68 @@ class InteractiveWorkstationHelpersTests(unittest.TestCase):
                 runner=lambda _command, _cwd, _env: (_ for _ in ()).throw(RuntimeError("backend boom")),
             )
 
+    def test_run_script_in_process_calls_entrypoint_with_scoped_env_and_cwd(self) -> None:
+        """Expected: registered scripts run in-process with overrides applied and then restored."""
+        seen: list[tuple[list[str], str, str | None]] = []
+
+        def entrypoint(argv: list[str]) -> int:
+            seen.append((argv, os.getcwd(), os.environ.get("AMI_LIST")))
+            return 0
+
+        previous_cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as tmpdir, patch.dict(os.environ, {}, clear=False):
+            os.environ.pop("AMI_LIST", None)
+            run_script_in_process(
+                ["uv", "run", "../scripts/deploy_workstation.py", "--environment", "gastown"],
+                cwd=Path(tmpdir),
+                env_overrides={"AMI_LIST": "1"},
+                entrypoints={"deploy_workstation": entrypoint},
+            )
+            self.assertNotIn("AMI_LIST", os.environ)
+            expected_cwd = str(Path(tmpdir).resolve())
+
+        self.assertEqual([(["--environment", "gastown"], expected_cwd, "1")], seen)
+        self.assertEqual(previous_cwd, os.getcwd())
+
+    def test_run_script_in_process_falls_back_to_subprocess_for_unknown_scripts(self) -> None:
+        """Edge: commands without a registered entrypoint still run as subprocesses."""
+        with patch("workstation_core.interactive_workstation.run_script") as run_script:
+            run_script_in_process(
+                ["uv", "run", "../scripts/other.py"],
+                cwd=Path("/tmp"),
+                entrypoints={},
+            )
+
+        run_script.assert_called_once_with(["uv", "run", "../scripts/other.py"], cwd=Path("/tmp"), env_overrides=None)
+
+    def test_run_script_in_process_raises_on_non_zero_exit(self) -> None:
+        """Failure: non-zero entrypoint status and argparse exits surface as runtime errors."""
+        def failing_entrypoint(argv: list[str]) -> int:
+            raise SystemExit(2)
+
+        with self.assertRaisesRegex(RuntimeError, r"Command failed \(exit code 2\)"):
+            run_script_in_process(
+                ["uv", "run", "../scripts/stop_workstation.py", "--bogus"],
+                cwd=Path(os.getcwd()),
+                entrypoints={"stop_workstation": failing_entrypoint},
+            )
+
+    def test_run_script_in_process_wraps_aws_errors_for_the_menu(self) -> None:
+        """Failure: AWS client errors raised in-process become runtime errors the menu reports."""
+        denied = ClientError({"Error": {"Code": "AccessDenied", "Message": "Denied"}}, "DescribeStacks")
+
+        def failing_entrypoint(argv: list[str]) -> int:
+            raise denied
+
+        with self.assertRaisesRegex(RuntimeError, r"Command failed \(ClientError: .*AccessDenied") as caught:
+            run_script_in_process(
+                ["uv", "run", "../scripts/check_instance.py"],
+                cwd=Path(os.getcwd()),
+                entrypoints={"check_instance": failing_entrypoint},
+            )
+
+        self.assertIs(denied, caught.exception.__cause__)
+
     def test_parse_action_choice_accepts_shortcut_alias(self) -> None:
         """Expected: action parser maps aliases to canonical action keys."""
         self.assertEqual("quit", parse_action_choice("q"))
@@ -0,0 +1,233 @@
+"""Unit tests for pausing and resuming workstation Spot instances."""
+
+from __future__ import annotations
+
+import io
+from pathlib import Path
+import tempfile
+import unittest
+from unittest.mock import Mock
+
+from workstation_core.pause import (
+    LifecycleTimings,
+    find_fleet_instance,
+    format_lifecycle_timings,
+    load_lifecycle_timings,
+    pause_workstation,
+    record_lifecycle_timing,
+    start_paused_workstation,
+)
+
+
+def _instances(*entries: tuple[str, str]) -> dict:
+    """Return one ``describe_instances`` response for ``(instance_id, state)`` pairs."""
+    return {
+        "Reservations": [
+            {"Instances": [{"InstanceId": instance_id, "State": {"Name": state}} for instance_id, state in entries]}
+        ]
+    }
+
+
+def _cloudformation_client() -> Mock:
+    """Return a CloudFormation client mock that resolves the fleet request id."""
+    client = Mock()
+    client.describe_stack_resource.return_value = {
+        "StackResourceDetail": {"PhysicalResourceId": "sfr-123"}
+    }
+    return client
+
+
+class _Clock:
+    """Deterministic monotonic clock advanced by the sleeper."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+class FindFleetInstanceTests(unittest.TestCase):
+    """Validate fleet instance lookup by request tag."""
+
+    def test_filters_by_fleet_request_tag_and_state(self) -> None:
+        """Expected: stopped fleet instances are found through the fleet request tag."""
+        ec2_client = Mock()
+        ec2_client.describe_instances.return_value = _instances(("i-1", "stopped"))
+
+        instance = find_fleet_instance(
+            _cloudformation_client(),
+            ec2_client,
+            stack_name="GastownWorkstationStack",
+            spot_fleet_logical_id="GastownSpotFleet",
+            states=("stopped",),
+        )
+
+        self.assertEqual(("i-1", "stopped"), (instance.instance_id, instance.state))
+        ec2_client.describe_instances.assert_called_once_with(
+            Filters=[
+                {"Name": "tag:aws:ec2spot:fleet-request-id", "Values": ["sfr-123"]},
+                {"Name": "instance-state-name", "Values": ["stopped"]},
+            ]
+        )
+
+    def test_missing_stack_resource_raises(self) -> None:
+        """Failure: an unreadable stack resource surfaces as a runtime error."""
+        cloudformation_client = Mock()
+        cloudformation_client.describe_stack_resource.side_effect = RuntimeError("does not exist")
+
+        with self.assertRaisesRegex(RuntimeError, "Failed to resolve Spot Fleet resource"):
+            find_fleet_instance(
+                cloudformation_client,
+                Mock(),
+                stack_name="S",
+                spot_fleet_logical_id="F",
+                states=("stopped",),
+            )
+
+
+class PauseWorkstationTests(unittest.TestCase):
+    """Validate the stop path."""
+
+    def test_stops_running_instance_and_waits_until_stopped(self) -> None:
+        """Expected: pause stops the instance and reports the time until it is stopped."""
+        clock = _Clock()
+        ec2_client = Mock()
+        ec2_client.describe_instances.side_effect = [
+            _instances(("i-1", "running")),
+            _instances(("i-1", "stopping")),
+            _instances(("i-1", "stopped")),
+        ]
+
+        transition = pause_workstation(
+            _cloudformation_client(),
+            ec2_client,
+            stack_name="S",
+            spot_fleet_logical_id="F",
+            monotonic=clock.monotonic,
+            sleeper=clock.sleep,
+            out=io.StringIO(),
+        )
+
+        ec2_client.stop_instances.assert_called_once_with(InstanceIds=["i-1"])
+        self.assertEqual("i-1", transition.instance_id)
+        self.assertEqual(5.0, transition.elapsed_seconds)
+
+    def test_already_paused_raises(self) -> None:
+        """Failure: pausing a stopped instance is rejected without an API call."""
+        ec2_client = Mock()
+        ec2_client.describe_instances.return_value = _instances(("i-1", "stopped"))
+
+        with self.assertRaisesRegex(RuntimeError, "already paused"):
+            pause_workstation(
+                _cloudformation_client(), ec2_client, stack_name="S", spot_fleet_logical_id="F", out=io.StringIO()
+            )
+        ec2_client.stop_instances.assert_not_called()
+
+    def test_reclaimed_instance_raises(self) -> None:
+        """Failure: an instance terminated while stopping is reported instead of waited on."""
+        ec2_client = Mock()
+        ec2_client.describe_instances.side_effect = [
+            _instances(("i-1", "running")),
+            _instances(("i-1", "terminated")),
+        ]
+
+        with self.assertRaisesRegex(RuntimeError, "terminated"):
+            pause_workstation(
+                _cloudformation_client(), ec2_client, stack_name="S", spot_fleet_logical_id="F", out=io.StringIO()
+            )
+
+
+class StartPausedWorkstationTests(unittest.TestCase):
+    """Validate the start path."""
+
+    def test_starts_stopped_instance(self) -> None:
+        """Expected: resume starts the same instance that was paused."""
+        ec2_client = Mock()
+        ec2_client.describe_instances.return_value = _instances(("i-1", "stopped"))
+
+        instance_id = start_paused_workstation(
+            _cloudformation_client(), ec2_client, stack_name="S", spot_fleet_logical_id="F", out=io.StringIO()
+        )
+
+        self.assertEqual("i-1", instance_id)
+        ec2_client.start_instances.assert_called_once_with(InstanceIds=["i-1"])
+
+    def test_waits_for_stopping_instance_before_start(self) -> None:
+        """Edge: an instance still stopping is waited for because EC2 rejects starting it."""
+        clock = _Clock()
+        ec2_client = Mock()
+        ec2_client.describe_instances.side_effect = [
+            _instances(("i-1", "stopping")),
+            _instances(("i-1", "stopped")),
+        ]
+
+        start_paused_workstation(
+            _cloudformation_client(),
+            ec2_client,
+            stack_name="S",
+            spot_fleet_logical_id="F",
+            monotonic=clock.monotonic,
+            sleeper=clock.sleep,
+            out=io.StringIO(),
+        )
+
+        ec2_client.start_instances.assert_called_once_with(InstanceIds=["i-1"])
+
+    def test_insufficient_capacity_is_actionable(self) -> None:
+        """Failure: a Spot capacity shortage on start names the recovery options."""
+        error = RuntimeError("boom")
+        error.response = {"Error": {"Code": "InsufficientInstanceCapacity"}}
+        ec2_client = Mock()
+        ec2_client.describe_instances.return_value = _instances(("i-1", "stopped"))
+        ec2_client.start_instances.side_effect = error
+
+        with self.assertRaisesRegex(RuntimeError, "no Spot capacity to resume"):
+            start_paused_workstation(
+                _cloudformation_client(), ec2_client, stack_name="S", spot_fleet_logical_id="F", out=io.StringIO()
+            )
+
+    def test_no_paused_instance_raises(self) -> None:
+        """Failure: resume without a stopped instance is rejected."""
+        ec2_client = Mock()
+        ec2_client.describe_instances.return_value = {"Reservations": []}
+
+        with self.assertRaisesRegex(RuntimeError, "No paused workstation instance"):
+            start_paused_workstation(
+                _cloudformation_client(), ec2_client, stack_name="S", spot_fleet_logical_id="F", out=io.StringIO()
+            )
+
+
+class LifecycleTimingTests(unittest.TestCase):
+    """Validate the local deploy/resume timing record."""
+
+    def test_records_deploy_and_resume_side_by_side(self) -> None:
+        """Expected: the latest deploy and resume durations are kept together per stack."""
+        with tempfile.TemporaryDirectory() as tmp:
+            timing_dir = Path(tmp)
+            record_lifecycle_timing(timing_dir, "us-west-2", "S", action="deploy", seconds=812.4)
+            record_lifecycle_timing(timing_dir, "us-west-2", "S", action="resume", seconds=41.2)
+
+            timings = load_lifecycle_timings(timing_dir, "us-west-2", "S")
+
+        self.assertEqual(LifecycleTimings(deploy_seconds=812.4, resume_seconds=41.2), timings)
+        self.assertEqual("Last ready times: deploy 812s, resume 41s", format_lifecycle_timings(timings))
+
+    def test_missing_or_corrupt_record_is_empty(self) -> None:
+        """Edge: unreadable records yield no timings and an empty status line."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "us-west-2" / "S.json"
+            path.parent.mkdir(parents=True)
+            path.write_text("{not json", encoding="utf-8")
+
+            timings = load_lifecycle_timings(Path(tmp), "us-west-2", "S")
+
+        self.assertEqual(LifecycleTimings(), timings)
+        self.assertEqual("", format_lifecycle_timings(timings))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,139 @@
+"""Unit tests for fast-stop snapshot checks and the pending-AMI ledger."""
+
+from __future__ import annotations
+
+import io
+from pathlib import Path
+import tempfile
+import unittest
+from unittest.mock import Mock
+
+from workstation_core.pending_ami import (
+    check_pending_amis,
+    load_pending_amis,
+    record_pending_ami,
+    wait_for_image_snapshots,
+)
+
+
+def _image(state: str, *snapshot_ids: str) -> dict:
+    """Return one ``describe_images`` response for a single image."""
+    mappings = [
+        {"DeviceName": f"/dev/sd{index}", "Ebs": {"SnapshotId": snapshot_id}}
+        for index, snapshot_id in enumerate(snapshot_ids)
+    ]
+    return {"Images": [{"ImageId": "ami-1", "State": state, "BlockDeviceMappings": mappings}]}
+
+
+class WaitForImageSnapshotsTests(unittest.TestCase):
+    """Validate the snapshot-start gate used by fast stop."""
+
+    def test_returns_once_every_snapshot_has_started(self) -> None:
+        """Expected: the wait ends as soon as all block devices have started snapshots."""
+        ec2_client = Mock()
+        ec2_client.describe_images.side_effect = [
+            _image("pending", ""),
+            _image("pending", "snap-1", "snap-2"),
+        ]
+        ec2_client.describe_snapshots.return_value = {
+            "Snapshots": [
+                {"SnapshotId": "snap-1", "State": "pending"},
+                {"SnapshotId": "snap-2", "State": "completed"},
+            ]
+        }
+        sleeper = Mock()
+
+        snapshot_ids = wait_for_image_snapshots(ec2_client, image_id="ami-1", sleeper=sleeper)
+
+        self.assertEqual(("snap-1", "snap-2"), snapshot_ids)
+        sleeper.assert_called_once()
+
+    def test_failed_image_raises(self) -> None:
+        """Failure: a failed image stops the wait so the stack is not destroyed."""
+        ec2_client = Mock()
+        ec2_client.describe_images.return_value = _image("failed")
+
+        with self.assertRaisesRegex(RuntimeError, "terminal state 'failed'"):
+            wait_for_image_snapshots(ec2_client, image_id="ami-1", sleeper=Mock())
+
+    def test_times_out_when_snapshots_never_start(self) -> None:
+        """Failure: a stuck image times out instead of destroying the stack."""
+        ec2_client = Mock()
+        ec2_client.describe_images.return_value = _image("pending", "")
+        now = [0.0]
+
+        def sleeper(seconds: float) -> None:
+            now[0] += seconds
+
+        with self.assertRaisesRegex(RuntimeError, "Timed out"):
+            wait_for_image_snapshots(
+                ec2_client,
+                image_id="ami-1",
+                timeout_seconds=10,
+                monotonic=lambda: now[0],
+                sleeper=sleeper,
+            )
+
+
+class PendingAmiLedgerTests(unittest.TestCase):
+    """Validate recording and settling pending AMIs."""
+
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.ledger_dir = Path(tmp.name)
+        self.ec2_client = Mock()
+        self.ec2_client.meta.region_name = "us-west-2"
+
+    def _record(self, region: str, image_id: str, image_name: str, environment_key: str) -> None:
+        record_pending_ami(
+            self.ledger_dir,
+            region,
+            image_id=image_id,
+            image_name=image_name,
+            environment_key=environment_key,
+        )
+
+    def test_settled_amis_are_reported_and_removed(self) -> None:
+        """Expected: available AMIs leave the ledger while pending ones stay."""
+        self._record("us-west-2", "ami-1", "gastown_a", "gastown")
+        self._record("us-west-2", "ami-2", "gastown_b", "gastown")
+        self.ec2_client.describe_images.return_value = {
+            "Images": [{"ImageId": "ami-1", "State": "available"}, {"ImageId": "ami-2", "State": "pending"}]
+        }
+        out = io.StringIO()
+
+        still_pending = check_pending_amis(self.ec2_client, ledger_dir=self.ledger_dir, out=out)
+
+        self.assertEqual(["ami-2"], [entry.image_id for entry in still_pending])
+        self.assertEqual(["ami-2"], [entry.image_id for entry in load_pending_amis(self.ledger_dir, "us-west-2")])
+        self.assertIn("gastown_a (ami-1) from a fast stop is now available", out.getvalue())
+
+    def test_missing_image_is_reported_as_deregistered(self) -> None:
+        """Edge: an AMI that vanished is reported once and dropped."""
+        self._record("us-west-2", "ami-1", "gastown_a", "gastown")
+        self.ec2_client.describe_images.return_value = {"Images": []}
+        out = io.StringIO()
+
+        self.assertEqual([], check_pending_amis(self.ec2_client, ledger_dir=self.ledger_dir, out=out))
+        self.assertIn("ended in state 'deregistered'", out.getvalue())
+        self.assertEqual([], load_pending_amis(self.ledger_dir, "us-west-2"))
+
+    def test_other_environments_and_regions_are_not_checked(self) -> None:
+        """Edge: an empty filtered ledger makes no AWS calls."""
+        self._record("us-east-1", "ami-1", "gastown_a", "gastown")
+        self._record("us-west-2", "ami-2", "builder_a", "builder")
+
+        still_pending = check_pending_amis(
+            self.ec2_client,
+            environment_key="gastown",
+            ledger_dir=self.ledger_dir,
+            out=io.StringIO(),
+        )
+
+        self.assertEqual([], still_pending)
+        self.ec2_client.describe_images.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
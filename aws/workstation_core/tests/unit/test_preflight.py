@@ -0,0 +1,92 @@
+"""Unit tests for the concurrent deploy preflight stage."""
+
+from __future__ import annotations
+
+import threading
+import unittest
+
+from workstation_core.preflight import DeployPreflight
+
+
+class DeployPreflightTests(unittest.TestCase):
+    """Validate concurrency, result gathering, and error ordering."""
+
+    def test_lookups_run_concurrently_and_gather_into_typed_result(self) -> None:
+        """Expected: independent lookups overlap and land in one result."""
+        barrier = threading.Barrier(3, timeout=5)
+
+        def shared_network() -> bool:
+            barrier.wait()
+            return True
+
+        def elastic_ip() -> dict[str, str]:
+            barrier.wait()
+            return {"allocation_id": "eipalloc-1", "public_ip": "1.2.3.4"}
+
+        def images() -> list[dict[str, str]]:
+            barrier.wait()
+            return [{"image_id": "ami-1", "name": "gastown_a"}]
+
+        with DeployPreflight(
+            check_shared_network=shared_network,
+            find_elastic_ip=elastic_ip,
+            list_ami_images=images,
+        ) as preflight:
+            result = preflight.result()
+
+        self.assertTrue(result.shared_network_exists)
+        self.assertEqual("eipalloc-1", result.existing_eip["allocation_id"])
+        self.assertEqual(({"image_id": "ami-1", "name": "gastown_a"},), result.ami_images)
+        self.assertIsNone(result.loaded_ami_id)
+
+    def test_ami_images_are_available_before_slow_lookups_finish(self) -> None:
+        """Edge: AMI picking can start while slower lookups are still running."""
+        release = threading.Event()
+
+        def slow_shared_network() -> bool:
+            return release.wait(timeout=5)
+
+        with DeployPreflight(
+            check_shared_network=slow_shared_network,
+            list_ami_images=lambda: [{"image_id": "ami-1"}],
+        ) as preflight:
+            self.assertEqual([{"image_id": "ami-1"}], preflight.ami_images())
+            release.set()
+            self.assertTrue(preflight.result().shared_network_exists)
+
+    def test_single_failure_is_reraised_unchanged(self) -> None:
+        """Failure: one failed lookup surfaces its original actionable error."""
+        def missing_ami() -> str:
+            raise RuntimeError("Requested AMI 'gastown_missing' was not found.")
+
+        with DeployPreflight(resolve_loaded_ami=missing_ami, check_shared_network=lambda: True) as preflight:
+            with self.assertRaisesRegex(RuntimeError, r"^Requested AMI 'gastown_missing' was not found\.$"):
+                preflight.result()
+
+    def test_multiple_failures_are_reported_in_deploy_order(self) -> None:
+        """Failure: several failed lookups are listed in the serial deploy order."""
+        def fail(message: str):
+            def lookup():
+                raise RuntimeError(message)
+
+            return lookup
+
+        with DeployPreflight(
+            find_elastic_ip=fail("eip denied"),
+            check_shared_network=fail("stacks denied"),
+            check_ami_permissions=fail("ami denied"),
+        ) as preflight:
+            with self.assertRaises(RuntimeError) as raised:
+                preflight.result()
+
+        self.assertEqual(
+            "Deploy preflight failed:\n"
+            "  1. AMI permission preflight: ami denied\n"
+            "  2. shared network lookup: stacks denied\n"
+            "  3. Elastic IP lookup: eip denied",
+            str(raised.exception),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,275 @@
+"""Unit tests for the post-deploy readiness waiter."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+import io
+import unittest
+from unittest.mock import Mock
+
+from botocore.exceptions import ClientError
+
+from workstation_core.readiness import (
+    WorkstationReadiness,
+    compute_backoff_delay,
+    print_connection_guidance,
+    wait_for_workstation_ready,
+)
+
+
+class _FakeClock:
+    """Monotonic clock advanced by the injected sleeper."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def _instance(state: str, public_ip: str | None = None) -> dict:
+    """Return one ``describe_instances`` response for instance ``i-123``."""
+    instance = {
+        "InstanceId": "i-123",
+        "State": {"Name": state},
+        "LaunchTime": datetime(2026, 1, 1, tzinfo=timezone.utc),
+    }
+    if public_ip:
+        instance["PublicIpAddress"] = public_ip
+    return {"Reservations": [{"Instances": [instance]}]}
+
+
+def _clients() -> tuple[Mock, Mock]:
+    """Return CloudFormation and EC2 mocks with a resolvable fleet request."""
+    cloudformation_client = Mock()
+    cloudformation_client.describe_stack_resource.return_value = {
+        "StackResourceDetail": {"PhysicalResourceId": "sfr-123"}
+    }
+    ec2_client = Mock()
+    ec2_client.describe_spot_fleet_instances.return_value = {"ActiveInstances": [{"InstanceId": "i-123"}]}
+    ec2_client.describe_spot_fleet_requests.return_value = {"SpotFleetRequestConfigs": []}
+    return cloudformation_client, ec2_client
+
+
+class ReadinessTests(unittest.TestCase):
+    """Validate backoff polling, EIP association, and readiness criteria."""
+
+    def test_compute_backoff_delay_grows_and_caps_with_jitter(self) -> None:
+        """Expected: delays double per attempt, stay within jitter bounds, and cap."""
+        self.assertEqual(0.5, compute_backoff_delay(0, rng=lambda: 0.0))
+        self.assertEqual(4.0, compute_backoff_delay(2, rng=lambda: 1.0))
+        self.assertEqual(7.5, compute_backoff_delay(10, max_delay_seconds=15.0, rng=lambda: 0.0))
+
+    def test_wait_associates_eip_once_running_and_returns_eip_address(self) -> None:
+        """Expected: EIP is associated as soon as the instance runs, without a fixed delay."""
+        cloudformation_client, ec2_client = _clients()
+        ec2_client.describe_instances.side_effect = [
+            _instance("pending"),
+            _instance("running", public_ip="203.0.113.10"),
+        ]
+        clock = _FakeClock()
+
+        readiness = wait_for_workstation_ready(
+            cloudformation_client,
+            ec2_client,
+            stack_name="GastownWorkstationStack",
+            spot_fleet_logical_id="GastownSpotFleet",
+            access_mode="ssh",
+            eip_allocation_id="eipalloc-abc123",
+            eip_public_ip="1.2.3.4",
+            monotonic=clock.monotonic,
+            sleeper=clock.sleep,
+            rng=lambda: 0.0,
+            out=io.StringIO(),
+        )
+
+        self.assertEqual("i-123", readiness.instance_id)
+        self.assertEqual("1.2.3.4", readiness.public_ip)
+        self.assertTrue(readiness.elastic_ip_associated)
+        ec2_client.associate_address.assert_called_once_with(
+            AllocationId="eipalloc-abc123",
+            InstanceId="i-123",
+            AllowReassociation=True,
+        )
+        self.assertEqual([0.5], clock.sleeps)
+
+    def test_wait_treats_lookup_errors_as_not_ready_yet(self) -> None:
+        """Edge: early CloudFormation errors and empty fleets keep polling instead of failing."""
+        cloudformation_client, ec2_client = _clients()
+        cloudformation_client.describe_stack_resource.side_effect = [
+            ClientError(
+                {"Error": {"Code": "ValidationError", "Message": "Resource GastownSpotFleet does not exist for stack"}},
+                "DescribeStackResource",
+            ),
+            {"StackResourceDetail": {"PhysicalResourceId": "sfr-123"}},
+        ]
+        ec2_client.describe_spot_fleet_instances.side_effect = [
+            {"ActiveInstances": []},
+            {"ActiveInstances": [{"InstanceId": "i-123"}]},
+        ]
+        ec2_client.describe_instances.return_value = _instance("running", public_ip="203.0.113.10")
+        clock = _FakeClock()
+
+        readiness = wait_for_workstation_ready(
+            cloudformation_client,
+            ec2_client,
+            stack_name="GastownWorkstationStack",
+            spot_fleet_logical_id="GastownSpotFleet",
+            access_mode="both",
+            monotonic=clock.monotonic,
+            sleeper=clock.sleep,
+            rng=lambda: 0.0,
+            out=io.StringIO(),
+        )
+
+        self.assertEqual("203.0.113.10", readiness.public_ip)
+        self.assertFalse(readiness.elastic_ip_associated)
+        self.assertEqual([0.5, 1.0], clock.sleeps)
+        ec2_client.associate_address.assert_not_called()
+
+    def test_wait_raises_permanent_errors_without_waiting(self) -> None:
+        """Failure: denied or invalid requests and code errors surface on the first poll."""
+        errors = (
+            ClientError({"Error": {"Code": "AccessDenied", "Message": "x"}}, "DescribeStackResource"),
+            ClientError({"Error": {"Code": "ExpiredToken", "Message": "x"}}, "DescribeStackResource"),
+            ClientError({"Error": {"Code": "ValidationError", "Message": "Invalid stack"}}, "DescribeStackResource"),
+            AttributeError("'NoneType' object has no attribute 'get'"),
+        )
+        for error in errors:
+            with self.subTest(error=type(error).__name__):
+                cloudformation_client, ec2_client = _clients()
+                cloudformation_client.describe_stack_resource.side_effect = error
+                clock = _FakeClock()
+
+                with self.assertRaises(type(error)):
+                    wait_for_workstation_ready(
+                        cloudformation_client,
+                        ec2_client,
+                        stack_name="GastownWorkstationStack",
+                        spot_fleet_logical_id="GastownSpotFleet",
+                        access_mode="ssh",
+                        monotonic=clock.monotonic,
+                        sleeper=clock.sleep,
+                        rng=lambda: 0.0,
+                        out=io.StringIO(),
+                    )
+
+                self.assertEqual([], clock.sleeps)
+
+    def test_wait_for_ssm_mode_requires_online_agent(self) -> None:
+        """Expected: SSM-only readiness waits for the agent to report Online."""
+        cloudformation_client, ec2_client = _clients()
+        ec2_client.describe_instances.return_value = _instance("running")
+        ssm_client = Mock()
+        ssm_client.describe_instance_information.side_effect = [
+            {"InstanceInformationList": []},
+            {"InstanceInformationList": [{"InstanceId": "i-123", "PingStatus": "Online"}]},
+        ]
+        clock = _FakeClock()
+
+        readiness = wait_for_workstation_ready(
+            cloudformation_client,
+            ec2_client,
+            stack_name="GastownWorkstationStack",
+            spot_fleet_logical_id="GastownSpotFleet",
+            access_mode="ssm",
+            ssm_client=ssm_client,
+            monotonic=clock.monotonic,
+            sleeper=clock.sleep,
+            rng=lambda: 0.0,
+            out=io.StringIO(),
+        )
+
+        self.assertTrue(readiness.ssm_online)
+        self.assertIsNone(readiness.public_ip)
+        self.assertEqual(2, ssm_client.describe_instance_information.call_count)
+
+    def test_wait_raises_after_deadline(self) -> None:
+        """Failure: a workstation that never becomes reachable fails at the deadline only."""
+        cloudformation_client, ec2_client = _clients()
+        ec2_client.describe_instances.return_value = _instance("pending")
+        clock = _FakeClock()
+
+        with self.assertRaisesRegex(RuntimeError, "was not ready after 30 seconds"):
+            wait_for_workstation_ready(
+                cloudformation_client,
+                ec2_client,
+                stack_name="GastownWorkstationStack",
+                spot_fleet_logical_id="GastownSpotFleet",
+                access_mode="ssh",
+                timeout_seconds=30,
+                monotonic=clock.monotonic,
+                sleeper=clock.sleep,
+                rng=lambda: 0.0,
+                out=io.StringIO(),
+            )
+
+        self.assertEqual(30.0, clock.now)
+
+    def test_wait_aborts_on_price_too_low_instead_of_waiting_for_deadline(self) -> None:
+        """Failure: an unfulfillable fleet fails on the first price error with remediation."""
+        cloudformation_client, ec2_client = _clients()
+        created = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        ec2_client.describe_spot_fleet_instances.return_value = {"ActiveInstances": []}
+        ec2_client.describe_spot_fleet_requests.return_value = {
+            "SpotFleetRequestConfigs": [
+                {"ActivityStatus": "error", "SpotFleetRequestState": "active", "CreateTime": created}
+            ]
+        }
+        ec2_client.describe_spot_fleet_request_history.return_value = {
+            "HistoryRecords": [
+                {
+                    "EventType": "error",
+                    "Timestamp": created.replace(second=20),
+                    "EventInformation": {"EventSubType": "price-too-low", "EventDescription": "bid 0.1 < 0.12"},
+                }
+            ]
+        }
+        clock = _FakeClock()
+
+        with self.assertRaisesRegex(RuntimeError, "price-too-low: bid 0.1 < 0.12. .*Raise spot_price"):
+            wait_for_workstation_ready(
+                cloudformation_client,
+                ec2_client,
+                stack_name="GastownWorkstationStack",
+                spot_fleet_logical_id="GastownSpotFleet",
+                access_mode="ssh",
+                monotonic=clock.monotonic,
+                sleeper=clock.sleep,
+                rng=lambda: 0.0,
+                out=io.StringIO(),
+            )
+
+        self.assertEqual(0.0, clock.now)
+
+    def test_print_connection_guidance_for_both_mode(self) -> None:
+        """Expected: dual-access guidance includes SSM command and SSH snippet."""
+        out = io.StringIO()
+
+        print_connection_guidance(
+            WorkstationReadiness(
+                instance_id="i-123",
+                public_ip="1.2.3.4",
+                elastic_ip_associated=True,
+                ssm_online=False,
+                elapsed_seconds=42.0,
+            ),
+            access_mode="both",
+            region="us-west-2",
+            profile="sandbox",
+            ssh_alias="gastown-workstation",
+            out=out,
+        )
+
+        text = out.getvalue()
+        self.assertIn("aws ssm start-session --region us-west-2 --profile sandbox --target i-123", text)
+        self.assertIn("Host gastown-workstation\n  HostName 1.2.3.4\n", text)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,11 +5,14 @@ from __future__ import annotations
 from pathlib import Path
 import tempfile
 import unittest
+from unittest.mock import Mock
 
 from workstation_core.runtime_resolution import (
     get_account,
+    get_caller_account,
     get_region,
     parse_optional_bool_context,
+    parse_optional_index_list_context,
     parse_optional_text_context,
 )
 
@@ -55,12 +58,30 @@ class RuntimeResolutionTests(unittest.TestCase):
         account = get_account(env={"CDK_DEFAULT_ACCOUNT": "111122223333"})
         self.assertEqual("111122223333", account)
 
+    def test_get_caller_account_reads_sts_identity(self) -> None:
+        """Expected: the STS caller account keys local caches; lookup failures are reported."""
+        sts_client = Mock()
+        sts_client.get_caller_identity.return_value = {"Account": "111111111111"}
+        self.assertEqual("111111111111", get_caller_account(sts_client))
+
+        sts_client.get_caller_identity.side_effect = RuntimeError("ExpiredToken")
+        with self.assertRaisesRegex(RuntimeError, "Unable to resolve the AWS account"):
+            get_caller_account(sts_client)
+
     def test_parse_optional_text_context_trims_and_handles_none(self) -> None:
         """Edge: optional text context values are normalized consistently."""
         self.assertIsNone(parse_optional_text_context(None))
         self.assertIsNone(parse_optional_text_context("   "))
         self.assertEqual("ami-1234", parse_optional_text_context(" ami-1234 "))
 
+    def test_parse_optional_index_list_context_accepts_digits_only(self) -> None:
+        """Edge: index list context is optional but must hold non-negative integers."""
+        self.assertIsNone(parse_optional_index_list_context(None, context_key="availability_zone_indexes"))
+        self.assertEqual((2,), parse_optional_index_list_context(" 2 ", context_key="availability_zone_indexes"))
+        self.assertEqual((1, 0), parse_optional_index_list_context("1, 0", context_key="availability_zone_indexes"))
+        with self.assertRaisesRegex(RuntimeError, "Invalid index context value for 'availability_zone_indexes'"):
+            parse_optional_index_list_context("1,-1", context_key="availability_zone_indexes")
+
     def test_parse_optional_bool_context_rejects_invalid_value(self) -> None:
         """Failure: unsupported boolean text raises actionable RuntimeError."""
         with self.assertRaisesRegex(
@@ -74,6 +74,7 @@ class SharedNetworkDestroyTests(unittest.TestCase):
                 "workstation_core.orchestration._resolve_stack_dir",
                 return_value="/tmp/env-stack",
             ),
+            patch("workstation_core.orchestration.find_assembly_with_stack", return_value=None),
             patch("workstation_core.orchestration.run_command") as run_command,
         ):
             result = destroy_shared_network_stack(profile="dev", region="us-west-2", out=out)
@@ -0,0 +1,97 @@
+"""Unit tests for Spot Fleet fulfilment failure detection."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+import unittest
+from unittest.mock import Mock
+
+from workstation_core.spot_fulfilment import SpotFleetFulfilmentMonitor, classify_spot_fleet_error
+
+_CREATED = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _error(code: str, seconds: int, description: str = "") -> dict:
+    """Return one ``describe_spot_fleet_request_history`` error record."""
+    return {
+        "EventType": "error",
+        "Timestamp": _CREATED + timedelta(seconds=seconds),
+        "EventInformation": {"EventSubType": code, "EventDescription": description},
+    }
+
+
+def _client(activity_status: str, *history_pages: list[dict]) -> Mock:
+    """Return an EC2 mock replaying one history page per poll."""
+    ec2_client = Mock()
+    ec2_client.describe_spot_fleet_requests.return_value = {
+        "SpotFleetRequestConfigs": [
+            {"ActivityStatus": activity_status, "SpotFleetRequestState": "active", "CreateTime": _CREATED}
+        ]
+    }
+    ec2_client.describe_spot_fleet_request_history.side_effect = [
+        {"HistoryRecords": page} for page in history_pages
+    ]
+    return ec2_client
+
+
+class _FakeClock:
+    """Settable monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+class SpotFulfilmentTests(unittest.TestCase):
+    """Validate error classification and abort timing."""
+
+    def test_classify_uses_specific_cause_from_launch_spec_description(self) -> None:
+        """Edge: launchSpecUnusable caused by price is reported as price-too-low."""
+        failure = classify_spot_fleet_error("launchSpecUnusable", "price-too-low: your price is below market")
+
+        self.assertEqual("price-too-low", failure.error_code)
+        self.assertTrue(failure.fatal)
+        self.assertIn("spot_price", failure.remediation)
+
+    def test_fatal_error_aborts_on_first_event(self) -> None:
+        """Failure: price-too-low never clears, so the first event aborts."""
+        monitor = SpotFleetFulfilmentMonitor(_client("error", [_error("price-too-low", 5)]), "sfr-1")
+
+        failure = monitor.poll()
+
+        self.assertIsNotNone(failure)
+        self.assertEqual("price-too-low", failure.error_code)
+
+    def test_capacity_error_aborts_only_after_grace_period(self) -> None:
+        """Expected: capacity errors get a short grace period before aborting."""
+        clock = _FakeClock()
+        ec2_client = _client("error", [_error("capacityNotAvailable", 5)], [], [])
+        monitor = SpotFleetFulfilmentMonitor(
+            ec2_client,
+            "sfr-1",
+            capacity_grace_seconds=60.0,
+            monotonic=clock.monotonic,
+        )
+
+        self.assertIsNone(monitor.poll())
+        self.assertEqual("capacityNotAvailable", monitor.latest_failure.error_code)
+        clock.now = 30.0
+        self.assertIsNone(monitor.poll())
+        clock.now = 61.0
+        self.assertEqual("capacityNotAvailable", monitor.poll().error_code)
+        later_start = ec2_client.describe_spot_fleet_request_history.call_args.kwargs["StartTime"]
+        self.assertEqual(_CREATED + timedelta(seconds=5), later_start)
+
+    def test_fulfilled_fleet_clears_previous_failures(self) -> None:
+        """Edge: once the fleet is fulfilled, earlier errors no longer matter."""
+        ec2_client = _client("fulfilled")
+        monitor = SpotFleetFulfilmentMonitor(ec2_client, "sfr-1")
+
+        self.assertIsNone(monitor.poll())
+        ec2_client.describe_spot_fleet_request_history.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,157 @@
+"""Unit tests for lifecycle latency tracing."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import boto3
+from botocore.stub import Stubber
+
+from workstation_core import tracing
+from workstation_core.tracing import (
+    TRACE_FILE_ENV_VAR,
+    TRACEPARENT_ENV_VAR,
+    Tracer,
+    ensure_tracing,
+    format_traceparent,
+    init_tracing,
+    instrument_client,
+    parse_traceparent,
+)
+
+
+def _read_spans(trace_file: Path) -> list[dict]:
+    """Return all spans exported to a JSON Lines trace file."""
+    spans: list[dict] = []
+    for line in trace_file.read_text(encoding="utf-8").splitlines():
+        request = json.loads(line)
+        for resource_spans in request["resourceSpans"]:
+            for scope_spans in resource_spans["scopeSpans"]:
+                spans.extend(scope_spans["spans"])
+    return spans
+
+
+class TracingTests(unittest.TestCase):
+    """Validate span recording, export, and cross-process propagation."""
+
+    def tearDown(self) -> None:
+        """Reset the process-wide tracer after each test."""
+        init_tracing("test", env={})
+
+    def test_parse_traceparent_round_trips_formatted_value(self) -> None:
+        """Expected: formatted traceparent values parse back into ids."""
+        value = format_traceparent("a" * 32, "b" * 16)
+
+        self.assertEqual(("a" * 32, "b" * 16), parse_traceparent(value))
+
+    def test_parse_traceparent_rejects_malformed_value(self) -> None:
+        """Edge: malformed traceparent values are ignored instead of raising."""
+        self.assertIsNone(parse_traceparent("00-not-hex-01"))
+        self.assertIsNone(parse_traceparent("00-" + "z" * 32 + "-" + "b" * 16 + "-01"))
+        self.assertIsNone(parse_traceparent(None))
+
+    def test_init_tracing_is_disabled_without_trace_env(self) -> None:
+        """Expected: tracing stays off and child env is empty by default."""
+        tracer = init_tracing("deploy_workstation", env={})
+
+        with tracer.span("deploy") as span:
+            span.set_attribute("ignored", True)
+
+        self.assertFalse(tracer.enabled)
+        self.assertEqual({}, tracer.child_environment())
+        self.assertEqual((), tracer.finished_spans)
+
+    def test_ensure_tracing_reuses_active_tracer_for_in_process_entrypoints(self) -> None:
+        """Expected: an already-active tracer is kept so nested entrypoints share its trace."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tracer = init_tracing(
+                "interactive_workstation",
+                env={TRACE_FILE_ENV_VAR: str(Path(tmpdir) / "trace.jsonl")},
+            )
+
+            self.assertIs(tracer, ensure_tracing("deploy_workstation"))
+
+    def test_nested_spans_export_parent_links_as_otlp_json(self) -> None:
+        """Expected: nested spans share a trace id and link to their parent."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            trace_file = Path(tmpdir) / "trace.jsonl"
+            tracer = Tracer(service_name="deploy_workstation", trace_file=trace_file)
+
+            with tracer.span("deploy"):
+                with tracer.span("deploy.cdk_deploy", stack_name="GastownWorkstationStack"):
+                    pass
+            tracer.flush()
+
+            request = json.loads(trace_file.read_text(encoding="utf-8").splitlines()[0])
+            spans = _read_spans(trace_file)
+
+        resource_attributes = request["resourceSpans"][0]["resource"]["attributes"]
+        self.assertIn(
+            {"key": "service.name", "value": {"stringValue": "deploy_workstation"}},
+            resource_attributes,
+        )
+        by_name = {span["name"]: span for span in spans}
+        self.assertEqual(by_name["deploy"]["spanId"], by_name["deploy.cdk_deploy"]["parentSpanId"])
+        self.assertNotIn("parentSpanId", by_name["deploy"])
+        self.assertEqual({tracer.trace_id}, {span["traceId"] for span in spans})
+
+    def test_child_process_joins_parent_trace_from_environment(self) -> None:
+        """Expected: a child tracer nests its spans under the parent's active span."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            trace_file = Path(tmpdir) / "trace.jsonl"
+            parent = Tracer(service_name="deploy_workstation", trace_file=trace_file)
+            with parent.span("deploy.post_deploy_check") as parent_span:
+                child_env = parent.child_environment()
+
+            child = init_tracing("check_instance", env=child_env)
+            with child.span("check_instance"):
+                pass
+            child.flush()
+            spans = _read_spans(trace_file)
+
+        self.assertEqual(str(trace_file), child_env[TRACE_FILE_ENV_VAR])
+        self.assertIn(TRACEPARENT_ENV_VAR, child_env)
+        self.assertEqual(parent.trace_id, spans[0]["traceId"])
+        self.assertEqual(parent_span.span_id, spans[0]["parentSpanId"])
+
+    def test_span_records_error_status_and_reraises(self) -> None:
+        """Failure: exceptions mark the span as failed and still propagate."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tracer = Tracer(service_name="stop_workstation", trace_file=Path(tmpdir) / "t.jsonl")
+
+            with self.assertRaisesRegex(RuntimeError, "boom"):
+                with tracer.span("stop.destroy_stack"):
+                    raise RuntimeError("boom")
+
+        span = tracer.finished_spans[0]
+        self.assertEqual(2, span.status_code)
+        self.assertIn("boom", span.status_message)
+
+    def test_instrument_client_records_one_span_per_aws_call(self) -> None:
+        """Expected: instrumented boto3 clients emit client spans per API call."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tracer = Tracer(service_name="deploy_workstation", trace_file=Path(tmpdir) / "t.jsonl")
+            client = boto3.client(
+                "ec2",
+                region_name="us-west-2",
+                aws_access_key_id="testing",
+                aws_secret_access_key="testing",
+            )
+            instrument_client(client)
+            with patch.object(tracing, "_ACTIVE_TRACER", tracer):
+                with Stubber(client) as stubber:
+                    stubber.add_response("describe_addresses", {"Addresses": []})
+                    with tracer.span("deploy.elastic_ip") as parent_span:
+                        client.describe_addresses()
+
+        aws_span = next(span for span in tracer.finished_spans if span.name.startswith("aws."))
+        self.assertEqual("aws.ec2.DescribeAddresses", aws_span.name)
+        self.assertEqual(parent_span.span_id, aws_span.parent_span_id)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,179 @@
+"""Unit tests for root volume warming of restored workstations."""
+
+from __future__ import annotations
+
+import io
+import unittest
+from unittest.mock import Mock
+
+from workstation_core.volume_warming import (
+    FastSnapshotRestoreLease,
+    disable_fast_snapshot_restores,
+    enable_fast_snapshot_restores,
+    parse_volume_preread,
+    read_volume_warm_mode,
+    report_root_volume_fast_restore,
+    wait_for_volume_preread,
+)
+
+
+def _ec2_client(*state_pages: list[dict[str, str]]) -> Mock:
+    """Return an EC2 client whose restore states advance one page per lookup."""
+    ec2_client = Mock()
+    ec2_client.describe_images.return_value = {
+        "Images": [
+            {
+                "BlockDeviceMappings": [
+                    {"DeviceName": "/dev/sda1", "Ebs": {"SnapshotId": "snap-root"}},
+                    {"DeviceName": "/dev/sdb", "VirtualName": "ephemeral0"},
+                ]
+            }
+        ]
+    }
+    ec2_client.get_paginator.return_value.paginate.side_effect = [
+        [{"FastSnapshotRestores": page}] for page in state_pages
+    ]
+    ec2_client.enable_fast_snapshot_restores.return_value = {
+        "Successful": [{"SnapshotId": "snap-root", "AvailabilityZone": "us-west-2a"}],
+        "Unsuccessful": [],
+    }
+    return ec2_client
+
+
+class VolumeWarmingTests(unittest.TestCase):
+    """Validate fast snapshot restore leases and pre-read progress."""
+
+    def test_read_mode_accepts_known_modes_and_rejects_others(self) -> None:
+        """Expected: fsr and preread are accepted case-insensitively; anything else fails."""
+        self.assertIsNone(read_volume_warm_mode({}))
+        self.assertEqual("fsr", read_volume_warm_mode({"AMI_WARM": " FSR "}))
+        with self.assertRaisesRegex(RuntimeError, "Use one of: fsr, preread"):
+            read_volume_warm_mode({"AMI_WARM": "dd"})
+
+    def test_enable_waits_until_restores_are_active(self) -> None:
+        """Expected: missing pairs are enabled, polled until ``enabled`` and returned as the lease."""
+        ec2_client = _ec2_client(
+            [],
+            [{"SnapshotId": "snap-root", "AvailabilityZone": "us-west-2a", "State": "optimizing"}],
+            [{"SnapshotId": "snap-root", "AvailabilityZone": "us-west-2a", "State": "enabled"}],
+        )
+        sleeper = Mock()
+        out = io.StringIO()
+
+        lease = enable_fast_snapshot_restores(
+            ec2_client,
+            image_id="ami-1",
+            zone_names=("us-west-2a",),
+            monotonic=lambda: 0.0,
+            sleeper=sleeper,
+            out=out,
+        )
+
+        ec2_client.enable_fast_snapshot_restores.assert_called_once_with(
+            AvailabilityZones=["us-west-2a"],
+            SourceSnapshotIds=["snap-root"],
+        )
+        self.assertEqual(FastSnapshotRestoreLease("ami-1", (("snap-root", "us-west-2a"),), True), lease)
+        self.assertIn("snap-root/us-west-2a optimizing", out.getvalue())
+        sleeper.assert_called_once()
+
+    def test_enable_leaves_existing_restores_out_of_the_lease(self) -> None:
+        """Edge: restores someone else enabled are used but never disabled by the deploy."""
+        enabled = [{"SnapshotId": "snap-root", "AvailabilityZone": "us-west-2a", "State": "enabled"}]
+        ec2_client = _ec2_client(enabled, enabled)
+
+        lease = enable_fast_snapshot_restores(
+            ec2_client,
+            image_id="ami-1",
+            zone_names=("us-west-2a",),
+            out=io.StringIO(),
+        )
+
+        ec2_client.enable_fast_snapshot_restores.assert_not_called()
+        self.assertEqual((), lease.enabled)
+        self.assertTrue(lease.ready)
+
+    def test_enable_deploys_anyway_after_the_deadline(self) -> None:
+        """Failure: restores still optimizing at the deadline are kept and the deploy continues."""
+        optimizing = [{"SnapshotId": "snap-root", "AvailabilityZone": "us-west-2a", "State": "optimizing"}]
+        ec2_client = _ec2_client([], optimizing)
+        clock = iter([0.0, 61.0])
+        out = io.StringIO()
+
+        lease = enable_fast_snapshot_restores(
+            ec2_client,
+            image_id="ami-1",
+            zone_names=("us-west-2a",),
+            timeout_seconds=60,
+            monotonic=lambda: next(clock),
+            sleeper=lambda _seconds: None,
+            out=out,
+        )
+
+        self.assertFalse(lease.ready)
+        self.assertEqual((("snap-root", "us-west-2a"),), lease.enabled)
+        self.assertIn("deploying anyway", out.getvalue())
+
+    def test_disable_prints_manual_command_when_it_fails(self) -> None:
+        """Failure: a restore left enabled is billed, so the command to turn it off is printed."""
+        ec2_client = Mock()
+        ec2_client.disable_fast_snapshot_restores.side_effect = RuntimeError("Throttling")
+        lease = FastSnapshotRestoreLease("ami-1", (("snap-root", "us-west-2a"),), True)
+        out = io.StringIO()
+
+        with self.assertLogs("workstation_core.volume_warming", level="WARNING"):
+            disable_fast_snapshot_restores(ec2_client, lease, out=out)
+
+        self.assertIn(
+            "aws ec2 disable-fast-snapshot-restores --availability-zones us-west-2a --source-snapshot-ids snap-root",
+            out.getvalue(),
+        )
+
+    def test_report_reads_fast_restored_flag_of_root_volume(self) -> None:
+        """Expected: the root volume's ``FastRestored`` flag is reported."""
+        ec2_client = Mock()
+        ec2_client.describe_instances.return_value = {
+            "Reservations": [
+                {
+                    "Instances": [
+                        {
+                            "RootDeviceName": "/dev/sda1",
+                            "BlockDeviceMappings": [{"DeviceName": "/dev/sda1", "Ebs": {"VolumeId": "vol-1"}}],
+                        }
+                    ]
+                }
+            ]
+        }
+        ec2_client.describe_volumes.return_value = {"Volumes": [{"FastRestored": True}]}
+        out = io.StringIO()
+
+        self.assertTrue(report_root_volume_fast_restore(ec2_client, "i-1", out=out))
+        self.assertIn("vol-1 was created from a fast snapshot restore", out.getvalue())
+
+    def test_parse_preread_tracks_start_and_end_markers(self) -> None:
+        """Expected: the latest marker wins and the end marker carries the duration and exit code."""
+        started = "[ 5.0] env4ai-volume-preread: device=/dev/nvme0n1 start=100"
+        finished = "env4ai-volume-preread: device=/dev/nvme0n1 end=460 exit=0"
+
+        running = parse_volume_preread(f"boot noise\n{started}\n")
+        done = parse_volume_preread(f"{started}\n{finished}\n")
+
+        self.assertIsNone(parse_volume_preread("cloud-init finished\n"))
+        self.assertIsNone(running.exit_code)
+        self.assertEqual(360, done.seconds)
+        self.assertEqual(0, done.exit_code)
+
+    def test_wait_fails_when_the_preread_exits_non_zero(self) -> None:
+        """Failure: a failed read is reported with its device and status."""
+        ec2_client = Mock()
+        ec2_client.get_console_output.return_value = {
+            "Output": "env4ai-volume-preread: device=/dev/nvme0n1 start=100\n"
+            "env4ai-volume-preread: device=/dev/nvme0n1 end=101 exit=1\n"
+        }
+
+        with self.assertRaisesRegex(RuntimeError, "/dev/nvme0n1 exited with status 1 on i-1"):
+            wait_for_volume_preread(ec2_client, "i-1", sleeper=Mock(), out=io.StringIO())
+
+
+if __name__ == "__main__":
+    unittest.main()
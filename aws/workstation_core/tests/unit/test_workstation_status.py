@@ -5,6 +5,7 @@ from __future__ import annotations
 import unittest
 from unittest.mock import Mock, patch
 
+from workstation_core.pause import FleetInstance
 from workstation_core.workstation_status import WorkstationStatus, get_workstation_status
 
 
@@ -62,9 +63,12 @@ class WorkstationStatusTests(unittest.TestCase):
             "Stacks": [{"StackStatus": "CREATE_COMPLETE"}]
         }
 
-        with patch(
-            "workstation_core.workstation_status.resolve_running_instance_id",
-            side_effect=RuntimeError("No running instances found for stack Spot Fleet."),
+        with (
+            patch(
+                "workstation_core.workstation_status.resolve_running_instance_id",
+                side_effect=RuntimeError("No running instances found for stack Spot Fleet."),
+            ),
+            patch("workstation_core.workstation_status.find_fleet_instance", return_value=None),
         ):
             result = get_workstation_status(
                 cloudformation_client,
@@ -78,6 +82,36 @@ class WorkstationStatusTests(unittest.TestCase):
         self.assertEqual("CREATE_COMPLETE", result.stack_status)
         self.assertIsNone(result.instance_id)
 
+    def test_get_workstation_status_reports_stopped_instance_as_paused(self) -> None:
+        """Expected: a stopped fleet instance marks the workstation as paused."""
+        cloudformation_client = Mock()
+        cloudformation_client.describe_stacks.return_value = {
+            "Stacks": [{"StackStatus": "UPDATE_COMPLETE"}]
+        }
+
+        with (
+            patch(
+                "workstation_core.workstation_status.resolve_running_instance_id",
+                side_effect=RuntimeError("No running instances found for stack Spot Fleet."),
+            ),
+            patch(
+                "workstation_core.workstation_status.find_fleet_instance",
+                return_value=FleetInstance(instance_id="i-123", state="stopped"),
+            ),
+        ):
+            result = get_workstation_status(
+                cloudformation_client,
+                Mock(),
+                stack_name="GastownWorkstationStack",
+                spot_fleet_logical_id="GastownSpotFleet",
+                ssh_alias="gastown-workstation",
+            )
+
+        self.assertEqual(
+            WorkstationStatus(stack_state="paused", stack_status="UPDATE_COMPLETE", instance_id="i-123"),
+            result,
+        )
+
     def test_get_workstation_status_raises_for_aws_lookup_errors(self) -> None:
         """Failure: unexpected AWS lookup errors surface actionable runtime errors."""
         cloudformation_client = Mock()
@@ -0,0 +1,497 @@
+"""Span-based latency tracing for workstation lifecycle commands.
+
+Tracing is disabled unless ``ENV4AI_TRACE=1`` or ``ENV4AI_TRACE_FILE`` is set.
+Each process appends one OTLP/JSON ``ExportTraceServiceRequest`` line to the
+shared trace file when it exits, so one deploy or stop run (including the
+child processes it spawns) produces one JSON Lines trace file.  Child
+processes join the parent trace through ``ENV4AI_TRACEPARENT``, which uses the
+W3C ``traceparent`` format.
+"""
+
+from __future__ import annotations
+
+import atexit
+from contextlib import contextmanager
+import contextvars
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+import json
+import logging
+import os
+from pathlib import Path
+import secrets
+import threading
+import time
+from typing import Any, Callable, Iterator, Mapping
+
+LOGGER = logging.getLogger(__name__)
+TRACE_ENABLED_ENV_VAR = "ENV4AI_TRACE"
+TRACE_FILE_ENV_VAR = "ENV4AI_TRACE_FILE"
+TRACEPARENT_ENV_VAR = "ENV4AI_TRACEPARENT"
+DEFAULT_TRACE_DIR = Path.home() / ".config" / "env4ai" / "traces"
+INSTRUMENTATION_SCOPE = "env4ai.workstation_core"
+
+_SPAN_KIND_INTERNAL = 1
+_SPAN_KIND_CLIENT = 3
+_STATUS_CODE_UNSET = 0
+_STATUS_CODE_ERROR = 2
+_BOTO_SPAN_CONTEXT_KEY = "env4ai_trace_span"
+
+
+@dataclass(slots=True)
+class Span:
+    """One timed unit of work inside a trace.
+
+    Args:
+        trace_id: 32-character hex trace id shared by every span in a run.
+        span_id: 16-character hex id of this span.
+        parent_span_id: Parent span id, or ``None`` for the root span.
+        name: Span name (for example ``deploy.cdk_deploy``).
+        start_time_ns: Wall-clock start time in Unix nanoseconds.
+        kind: OTLP span kind.
+        attributes: Span attributes rendered into OTLP key/value pairs.
+        end_time_ns: Wall-clock end time in Unix nanoseconds once finished.
+        status_code: OTLP status code.
+        status_message: Error description when the span failed.
+    """
+
+    trace_id: str
+    span_id: str
+    parent_span_id: str | None
+    name: str
+    start_time_ns: int
+    kind: int = _SPAN_KIND_INTERNAL
+    attributes: dict[str, Any] = field(default_factory=dict)
+    end_time_ns: int | None = None
+    status_code: int = _STATUS_CODE_UNSET
+    status_message: str = ""
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Attach or overwrite one span attribute."""
+        self.attributes[key] = value
+
+    def record_error(self, error: BaseException) -> None:
+        """Mark the span as failed with the error text."""
+        self.status_code = _STATUS_CODE_ERROR
+        self.status_message = f"{type(error).__name__}: {error}"
+
+    @property
+    def duration_seconds(self) -> float | None:
+        """Return span duration in seconds once the span has ended."""
+        if self.end_time_ns is None:
+            return None
+        return (self.end_time_ns - self.start_time_ns) / 1_000_000_000
+
+
+def _new_trace_id() -> str:
+    """Return a random non-zero 128-bit trace id as hex."""
+    return secrets.token_hex(16)
+
+
+def _new_span_id() -> str:
+    """Return a random non-zero 64-bit span id as hex."""
+    return secrets.token_hex(8)
+
+
+def format_traceparent(trace_id: str, span_id: str) -> str:
+    """Format a W3C ``traceparent`` header value."""
+    return f"00-{trace_id}-{span_id}-01"
+
+
+def parse_traceparent(value: str | None) -> tuple[str, str] | None:
+    """Parse a W3C ``traceparent`` value into ``(trace_id, parent_span_id)``.
+
+    Args:
+        value: Raw ``traceparent`` text.
+
+    Returns:
+        Parsed ids, or ``None`` when the value is missing or malformed.
+    """
+    if value is None:
+        return None
+    parts = value.strip().split("-")
+    if len(parts) != 4:
+        return None
+    _, trace_id, span_id, _ = parts
+    if len(trace_id) != 32 or len(span_id) != 16:
+        return None
+    try:
+        int(trace_id, 16)
+        int(span_id, 16)
+    except ValueError:
+        return None
+    return trace_id.lower(), span_id.lower()
+
+
+def _otlp_value(value: Any) -> dict[str, Any]:
+    """Render one attribute value into an OTLP ``AnyValue`` mapping."""
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    if isinstance(value, (list, tuple)):
+        return {"arrayValue": {"values": [_otlp_value(item) for item in value]}}
+    return {"stringValue": str(value)}
+
+
+def _otlp_attributes(attributes: Mapping[str, Any]) -> list[dict[str, Any]]:
+    """Render span attributes as sorted OTLP key/value pairs."""
+    return [
+        {"key": key, "value": _otlp_value(value)}
+        for key, value in sorted(attributes.items())
+        if value is not None
+    ]
+
+
+def span_to_otlp(span: Span) -> dict[str, Any]:
+    """Render a finished span as an OTLP/JSON span object."""
+    payload: dict[str, Any] = {
+        "traceId": span.trace_id,
+        "spanId": span.span_id,
+        "name": span.name,
+        "kind": span.kind,
+        "startTimeUnixNano": str(span.start_time_ns),
+        "endTimeUnixNano": str(span.end_time_ns or span.start_time_ns),
+        "attributes": _otlp_attributes(span.attributes),
+        "status": {"code": span.status_code},
+    }
+    if span.parent_span_id:
+        payload["parentSpanId"] = span.parent_span_id
+    if span.status_message:
+        payload["status"]["message"] = span.status_message
+    return payload
+
+
+class Tracer:
+    """Collect spans for one process and export them as OTLP/JSON lines.
+
+    A tracer without ``trace_file`` is disabled: spans are still yielded so
+    callers can set attributes unconditionally, but nothing is recorded.
+    """
+
+    def __init__(
+        self,
+        *,
+        service_name: str,
+        trace_file: Path | None,
+        trace_id: str | None = None,
+        parent_span_id: str | None = None,
+        clock_ns: Callable[[], int] = time.time_ns,
+    ) -> None:
+        """Create a tracer.
+
+        Args:
+            service_name: OTLP ``service.name`` resource attribute for this process.
+            trace_file: JSON Lines output path, or ``None`` to disable tracing.
+            trace_id: Existing trace id to join, or ``None`` to start a new trace.
+            parent_span_id: Remote parent span id inherited from the parent process.
+            clock_ns: Wall-clock source in Unix nanoseconds.
+        """
+        self.service_name = service_name
+        self.trace_file = trace_file
+        self.trace_id = trace_id or _new_trace_id()
+        self.remote_parent_span_id = parent_span_id
+        self._clock_ns = clock_ns
+        self._finished: list[Span] = []
+        self._lock = threading.Lock()
+        self._current: contextvars.ContextVar[Span | None] = contextvars.ContextVar(
+            f"env4ai_current_span_{id(self)}",
+            default=None,
+        )
+
+    @property
+    def enabled(self) -> bool:
+        """Return whether spans are recorded and exported."""
+        return self.trace_file is not None
+
+    @property
+    def finished_spans(self) -> tuple[Span, ...]:
+        """Return spans finished so far and not yet flushed."""
+        with self._lock:
+            return tuple(self._finished)
+
+    def current_span(self) -> Span | None:
+        """Return the innermost active span in the calling context."""
+        return self._current.get()
+
+    def start_span(
+        self,
+        name: str,
+        *,
+        kind: int = _SPAN_KIND_INTERNAL,
+        parent: Span | None = None,
+        attributes: Mapping[str, Any] | None = None,
+    ) -> Span:
+        """Start a span without activating it in the calling context.
+
+        Args:
+            name: Span name.
+            kind: OTLP span kind.
+            parent: Explicit parent span; defaults to the active span.
+            attributes: Initial span attributes.
+
+        Returns:
+            Started span that must be passed to ``end_span``.
+        """
+        parent_span = parent or self._current.get()
+        parent_span_id = (
+            parent_span.span_id if parent_span is not None else self.remote_parent_span_id
+        )
+        return Span(
+            trace_id=self.trace_id,
+            span_id=_new_span_id(),
+            parent_span_id=parent_span_id,
+            name=name,
+            start_time_ns=self._clock_ns(),
+            kind=kind,
+            attributes=dict(attributes or {}),
+        )
+
+    def end_span(self, span: Span) -> None:
+        """Finish a span and queue it for export."""
+        span.end_time_ns = self._clock_ns()
+        if not self.enabled:
+            return
+        with self._lock:
+            self._finished.append(span)
+
+    @contextmanager
+    def span(self, name: str, **attributes: Any) -> Iterator[Span]:
+        """Record a nested span around a block of work.
+
+        Args:
+            name: Span name.
+            **attributes: Initial span attributes.
+
+        Yields:
+            The active span.
+        """
+        active = self.start_span(name, attributes=attributes)
+        token = self._current.set(active)
+        try:
+            yield active
+        except BaseException as err:
+            active.record_error(err)
+            raise
+        finally:
+            self._current.reset(token)
+            self.end_span(active)
+
+    def child_environment(self) -> dict[str, str]:
+        """Return environment variables that let a child process join this trace."""
+        if not self.enabled:
+            return {}
+        active = self._current.get()
+        parent_span_id = active.span_id if active is not None else self.remote_parent_span_id
+        variables = {TRACE_FILE_ENV_VAR: str(self.trace_file)}
+        if parent_span_id:
+            variables[TRACEPARENT_ENV_VAR] = format_traceparent(self.trace_id, parent_span_id)
+        return variables
+
+    def build_export_request(self, spans: tuple[Span, ...]) -> dict[str, Any]:
+        """Build one OTLP/JSON ``ExportTraceServiceRequest`` for finished spans."""
+        return {
+            "resourceSpans": [
+                {
+                    "resource": {
+                        "attributes": _otlp_attributes(
+                            {
+                                "service.name": self.service_name,
+                                "process.pid": os.getpid(),
+                            }
+                        )
+                    },
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": INSTRUMENTATION_SCOPE},
+                            "spans": [span_to_otlp(span) for span in spans],
+                        }
+                    ],
+                }
+            ]
+        }
+
+    def flush(self) -> None:
+        """Append finished spans to the trace file as one JSON line."""
+        if self.trace_file is None:
+            return
+        with self._lock:
+            spans = tuple(self._finished)
+            self._finished.clear()
+        if not spans:
+            return
+        line = json.dumps(self.build_export_request(spans), separators=(",", ":"))
+        try:
+            self.trace_file.parent.mkdir(parents=True, exist_ok=True)
+            # Reason: one append per process keeps lines intact when parent and
+            # child processes share the same trace file.
+            with self.trace_file.open("a", encoding="utf-8") as handle:
+                handle.write(line + "\n")
+        except OSError:
+            LOGGER.warning("Unable to write trace file trace_file=%s", self.trace_file, exc_info=True)
+
+
+_DISABLED_TRACER = Tracer(service_name="env4ai", trace_file=None)
+_ACTIVE_TRACER: Tracer = _DISABLED_TRACER
+
+
+def _default_trace_file(trace_id: str) -> Path:
+    """Return a fresh trace file path under the default trace directory."""
+    timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    return DEFAULT_TRACE_DIR / f"{timestamp}-{trace_id[:8]}.jsonl"
+
+
+def init_tracing(service_name: str, env: Mapping[str, str] | None = None) -> Tracer:
+    """Configure the process-wide tracer from environment variables.
+
+    ``ENV4AI_TRACE_FILE`` selects the output file; ``ENV4AI_TRACE=1`` without a
+    file starts a new trace under ``~/.config/env4ai/traces``.  A valid
+    ``ENV4AI_TRACEPARENT`` makes this process join the parent trace.
+
+    Args:
+        service_name: OTLP ``service.name`` for spans recorded by this process.
+        env: Optional environment mapping for testability.
+
+    Returns:
+        The active tracer (disabled when tracing is not requested).
+    """
+    global _ACTIVE_TRACER
+    source = env if env is not None else os.environ
+    parent = parse_traceparent(source.get(TRACEPARENT_ENV_VAR))
+    trace_id = parent[0] if parent is not None else _new_trace_id()
+    parent_span_id = parent[1] if parent is not None else None
+
+    trace_file_value = source.get(TRACE_FILE_ENV_VAR, "").strip()
+    trace_file: Path | None = None
+    if trace_file_value:
+        trace_file = Path(trace_file_value).expanduser()
+    elif source.get(TRACE_ENABLED_ENV_VAR, "").strip().lower() in {"1", "true", "yes", "on"}:
+        trace_file = _default_trace_file(trace_id)
+
+    if trace_file is None:
+        _ACTIVE_TRACER = _DISABLED_TRACER
+        return _ACTIVE_TRACER
+
+    tracer = Tracer(
+        service_name=service_name,
+        trace_file=trace_file,
+        trace_id=trace_id,
+        parent_span_id=parent_span_id,
+    )
+    _ACTIVE_TRACER = tracer
+    atexit.register(tracer.flush)
+    return tracer
+
+
+def ensure_tracing(service_name: str) -> Tracer:
+    """Return the active tracer, configuring one from the environment if needed.
+
+    Entrypoints called in-process (for example from the interactive menu) keep
+    recording into the caller's trace instead of starting a new one.
+
+    Args:
+        service_name: OTLP ``service.name`` used when no tracer is active yet.
+
+    Returns:
+        The active tracer.
+    """
+    if _ACTIVE_TRACER.enabled:
+        return _ACTIVE_TRACER
+    return init_tracing(service_name)
+
+
+def get_tracer() -> Tracer:
+    """Return the process-wide tracer configured by ``init_tracing``."""
+    return _ACTIVE_TRACER
+
+
+def trace_span(name: str, **attributes: Any):
+    """Open a span on the process-wide tracer (no-op when tracing is disabled)."""
+    return get_tracer().span(name, **attributes)
+
+
+def child_process_environment(base: Mapping[str, str] | None = None) -> dict[str, str] | None:
+    """Return a child-process environment carrying trace context.
+
+    Args:
+        base: Environment to extend; defaults to ``os.environ``.
+
+    Returns:
+        Environment mapping for ``subprocess``, or ``None`` to inherit unchanged
+        when tracing is disabled.
+    """
+    trace_variables = get_tracer().child_environment()
+    if not trace_variables:
+        return None if base is None else dict(base)
+    environment = dict(base if base is not None else os.environ)
+    environment.update(trace_variables)
+    return environment
+
+
+def _before_aws_call(model: Any = None, context: Any = None, **_: Any) -> None:
+    """Start an AWS API call span from a botocore ``before-call`` event."""
+    tracer = get_tracer()
+    if not tracer.enabled or not isinstance(context, dict) or model is None:
+        return
+    service_model = getattr(model, "service_model", None)
+    service_name = str(getattr(service_model, "service_name", "aws"))
+    operation_name = str(getattr(model, "name", "unknown"))
+    context[_BOTO_SPAN_CONTEXT_KEY] = tracer.start_span(
+        f"aws.{service_name}.{operation_name}",
+        kind=_SPAN_KIND_CLIENT,
+        attributes={
+            "rpc.system": "aws-api",
+            "rpc.service": service_name,
+            "rpc.method": operation_name,
+        },
+    )
+
+
+def _after_aws_call(
+    http_response: Any = None,
+    parsed: Any = None,
+    context: Any = None,
+    exception: BaseException | None = None,
+    **_: Any,
+) -> None:
+    """Finish an AWS API call span from a botocore ``after-call`` event."""
+    if not isinstance(context, dict):
+        return
+    active = context.pop(_BOTO_SPAN_CONTEXT_KEY, None)
+    if active is None:
+        return
+    status_code = getattr(http_response, "status_code", None)
+    if status_code is not None:
+        active.set_attribute("http.status_code", int(status_code))
+    if isinstance(parsed, dict):
+        error = parsed.get("Error", {})
+        if isinstance(error, dict) and error.get("Code"):
+            active.status_code = _STATUS_CODE_ERROR
+            active.status_message = str(error.get("Code"))
+    if exception is not None:
+        active.record_error(exception)
+    get_tracer().end_span(active)
+
+
+def instrument_client(client: Any) -> Any:
+    """Record one span per AWS API call made through a boto3 client.
+
+    Args:
+        client: Boto3 client to instrument.
+
+    Returns:
+        The same client, for call chaining.
+    """
+    events = getattr(getattr(client, "meta", None), "events", None)
+    if events is None:
+        return client
+    events.register("before-call.*.*", _before_aws_call, unique_id="env4ai-trace-before-call")
+    events.register("after-call.*.*", _after_aws_call, unique_id="env4ai-trace-after-call")
+    events.register(
+        "after-call-error.*.*",
+        _after_aws_call,
+        unique_id="env4ai-trace-after-call-error",
+    )
+    return client
@@ -0,0 +1,339 @@
+"""Warm root volumes of workstations restored from saved or golden AMIs."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import logging
+import sys
+import time
+from typing import Any, Callable, Mapping, TextIO
+
+from workstation_core.cdk_helpers import VOLUME_PREREAD_MARKER
+
+LOGGER = logging.getLogger(__name__)
+VOLUME_WARM_MODES: tuple[str, ...] = ("fsr", "preread")
+FAST_SNAPSHOT_RESTORE_TIMEOUT_SECONDS = 30 * 60
+VOLUME_PREREAD_TIMEOUT_SECONDS = 60 * 60
+VOLUME_WARM_POLL_SECONDS = 15.0
+# Reason: pairs in these states were enabled outside this deploy and are left as they are.
+_ACTIVE_FAST_RESTORE_STATES = frozenset({"enabling", "optimizing", "enabled"})
+
+
+@dataclass(frozen=True, slots=True)
+class FastSnapshotRestoreLease:
+    """Fast snapshot restores enabled for one deploy.
+
+    Args:
+        image_id: AMI whose snapshots were enabled.
+        enabled: ``(snapshot_id, availability_zone)`` pairs this deploy enabled
+            and must disable again.
+        ready: Whether every pair reached the ``enabled`` state before launch.
+    """
+
+    image_id: str
+    enabled: tuple[tuple[str, str], ...]
+    ready: bool
+
+
+@dataclass(frozen=True, slots=True)
+class VolumePrereadStatus:
+    """Root volume pre-read progress read from the instance console.
+
+    Args:
+        device: Block device being read.
+        started_at: Epoch seconds the read started.
+        finished_at: Epoch seconds the read finished, when it has.
+        exit_code: Exit status of the read, when it has finished.
+    """
+
+    device: str
+    started_at: int | None = None
+    finished_at: int | None = None
+    exit_code: int | None = None
+
+    @property
+    def seconds(self) -> int | None:
+        """Return how long the read took, once finished."""
+        if self.started_at is None or self.finished_at is None:
+            return None
+        return max(0, self.finished_at - self.started_at)
+
+
+def read_volume_warm_mode(env: Mapping[str, str]) -> str | None:
+    """Return the ``AMI_WARM`` mode, or ``None`` when unset.
+
+    Raises:
+        RuntimeError: If the value is not one of ``VOLUME_WARM_MODES``.
+    """
+    raw = str(env.get("AMI_WARM", "")).strip().lower()
+    if not raw:
+        return None
+    if raw not in VOLUME_WARM_MODES:
+        raise RuntimeError(f"Invalid AMI_WARM value {raw!r}. Use one of: {', '.join(VOLUME_WARM_MODES)}.")
+    return raw
+
+
+def image_snapshot_ids(ec2_client: Any, image_id: str) -> tuple[str, ...]:
+    """Return the EBS snapshot ids backing an AMI.
+
+    Raises:
+        RuntimeError: If the AMI cannot be found.
+    """
+    images = ec2_client.describe_images(ImageIds=[image_id]).get("Images", [])
+    if not images:
+        raise RuntimeError(f"AMI {image_id} was not found.")
+    snapshot_ids = []
+    for mapping in images[0].get("BlockDeviceMappings", []):
+        snapshot_id = str(mapping.get("Ebs", {}).get("SnapshotId", "")).strip()
+        if snapshot_id and snapshot_id not in snapshot_ids:
+            snapshot_ids.append(snapshot_id)
+    return tuple(snapshot_ids)
+
+
+def _fast_restore_states(
+    ec2_client: Any,
+    snapshot_ids: tuple[str, ...],
+    zone_names: tuple[str, ...],
+) -> dict[tuple[str, str], str]:
+    """Return the fast snapshot restore state of each snapshot and zone pair."""
+    states: dict[tuple[str, str], str] = {}
+    paginator = ec2_client.get_paginator("describe_fast_snapshot_restores")
+    for page in paginator.paginate(
+        Filters=[
+            {"Name": "snapshot-id", "Values": list(snapshot_ids)},
+            {"Name": "availability-zone", "Values": list(zone_names)},
+        ]
+    ):
+        for entry in page.get("FastSnapshotRestores", []):
+            states[(str(entry["SnapshotId"]), str(entry["AvailabilityZone"]))] = str(entry.get("State", ""))
+    return states
+
+
+def enable_fast_snapshot_restores(
+    ec2_client: Any,
+    *,
+    image_id: str,
+    zone_names: tuple[str, ...],
+    timeout_seconds: float = FAST_SNAPSHOT_RESTORE_TIMEOUT_SECONDS,
+    poll_interval_seconds: float = VOLUME_WARM_POLL_SECONDS,
+    monotonic: Callable[[], float] = time.monotonic,
+    sleeper: Callable[[float], None] = time.sleep,
+    out: TextIO = sys.stdout,
+) -> FastSnapshotRestoreLease:
+    """Enable fast snapshot restore on an AMI's snapshots and wait until it is active.
+
+    Pairs that already have fast snapshot restore are left alone and are not
+    part of the returned lease. Optimizing takes about an hour per TiB of
+    snapshot data, so when the deadline passes the deploy carries on: volumes
+    created in the meantime are simply initialized lazily.
+
+    Args:
+        ec2_client: Boto3 EC2 client.
+        image_id: AMI the workstation launches from.
+        zone_names: Availability Zones the workstation may launch in.
+        timeout_seconds: How long to wait for the ``enabled`` state.
+        poll_interval_seconds: Delay between state checks.
+        monotonic: Monotonic clock for deadlines.
+        sleeper: Sleep function.
+        out: Output stream for progress lines.
+
+    Returns:
+        The pairs enabled by this call and whether they became active.
+    """
+    snapshot_ids = image_snapshot_ids(ec2_client, image_id)
+    pairs = [(snapshot_id, zone) for snapshot_id in snapshot_ids for zone in zone_names]
+    states = _fast_restore_states(ec2_client, snapshot_ids, zone_names)
+    missing = [pair for pair in pairs if states.get(pair) not in _ACTIVE_FAST_RESTORE_STATES]
+    enabled: list[tuple[str, str]] = []
+    for zone in zone_names:
+        zone_snapshots = [snapshot_id for snapshot_id, pair_zone in missing if pair_zone == zone]
+        if not zone_snapshots:
+            continue
+        response = ec2_client.enable_fast_snapshot_restores(
+            AvailabilityZones=[zone],
+            SourceSnapshotIds=zone_snapshots,
+        )
+        enabled.extend(
+            (str(item["SnapshotId"]), str(item["AvailabilityZone"])) for item in response.get("Successful", [])
+        )
+        for item in response.get("Unsuccessful", []):
+            errors = "; ".join(
+                str(error.get("Error", {}).get("Message", ""))
+                for error in item.get("FastSnapshotRestoreStateErrors", [])
+            )
+            out.write(f"Fast snapshot restore unavailable for {item.get('SnapshotId')} in {zone}: {errors}\n")
+    out.write(
+        f"Fast snapshot restore for {image_id}: enabled {len(enabled)} of {len(pairs)} snapshot/zone pair(s) "
+        f"in {', '.join(zone_names)}.\n"
+    )
+
+    watched = [pair for pair in pairs if pair in enabled or states.get(pair) in _ACTIVE_FAST_RESTORE_STATES]
+    started_at = monotonic()
+    deadline = started_at + timeout_seconds
+    last_status = ""
+    while watched:
+        states = _fast_restore_states(ec2_client, snapshot_ids, zone_names)
+        pending = [pair for pair in watched if states.get(pair) != "enabled"]
+        if not pending:
+            out.write(f"Fast snapshot restore is active after {monotonic() - started_at:.0f}s.\n")
+            return FastSnapshotRestoreLease(image_id=image_id, enabled=tuple(enabled), ready=True)
+        now = monotonic()
+        status = ", ".join(
+            f"{snapshot_id}/{zone} {states.get((snapshot_id, zone), 'unknown')}" for snapshot_id, zone in pending
+        )
+        if status != last_status:
+            out.write(f"Waiting for fast snapshot restore: {status} ({now - started_at:.0f}s elapsed)\n")
+            last_status = status
+        if now >= deadline:
+            out.write(
+                f"Fast snapshot restore was not active within {timeout_seconds:.0f} seconds; "
+                "deploying anyway, the root volume initializes lazily.\n"
+            )
+            break
+        sleeper(min(poll_interval_seconds, max(deadline - now, 0.0)))
+    return FastSnapshotRestoreLease(image_id=image_id, enabled=tuple(enabled), ready=False)
+
+
+def disable_fast_snapshot_restores(
+    ec2_client: Any,
+    lease: FastSnapshotRestoreLease,
+    *,
+    out: TextIO = sys.stdout,
+) -> None:
+    """Disable the fast snapshot restores a deploy enabled.
+
+    Failures are reported rather than raised, because fast snapshot restore is
+    billed per snapshot and zone hour and the user has to turn it off by hand.
+    """
+    for zone in dict.fromkeys(zone for _snapshot_id, zone in lease.enabled):
+        snapshot_ids = [snapshot_id for snapshot_id, pair_zone in lease.enabled if pair_zone == zone]
+        try:
+            ec2_client.disable_fast_snapshot_restores(AvailabilityZones=[zone], SourceSnapshotIds=snapshot_ids)
+        except Exception as err:
+            LOGGER.warning("Disabling fast snapshot restore failed zone=%s", zone, exc_info=True)
+            out.write(
+                f"Could not disable fast snapshot restore for {', '.join(snapshot_ids)} in {zone} ({err}). "
+                f"Run: aws ec2 disable-fast-snapshot-restores --availability-zones {zone} "
+                f"--source-snapshot-ids {' '.join(snapshot_ids)}\n"
+            )
+            continue
+        out.write(f"Disabled fast snapshot restore for {len(snapshot_ids)} snapshot(s) in {zone}.\n")
+
+
+def report_root_volume_fast_restore(
+    ec2_client: Any,
+    instance_id: str,
+    *,
+    out: TextIO = sys.stdout,
+) -> bool | None:
+    """Report whether an instance's root volume was created fully initialized.
+
+    Returns:
+        The volume's ``FastRestored`` flag, or ``None`` when it cannot be read.
+    """
+    try:
+        reservations = ec2_client.describe_instances(InstanceIds=[instance_id]).get("Reservations", [])
+        instance = reservations[0]["Instances"][0]
+        root_device = instance.get("RootDeviceName")
+        volume_id = next(
+            mapping["Ebs"]["VolumeId"]
+            for mapping in instance.get("BlockDeviceMappings", [])
+            if mapping.get("DeviceName") == root_device
+        )
+        volume = ec2_client.describe_volumes(VolumeIds=[volume_id])["Volumes"][0]
+    except Exception:
+        LOGGER.warning("Root volume lookup failed instance_id=%s", instance_id, exc_info=True)
+        return None
+    fast_restored = bool(volume.get("FastRestored"))
+    if fast_restored:
+        out.write(f"Root volume {volume_id} was created from a fast snapshot restore and is fully initialized.\n")
+    else:
+        out.write(
+            f"Root volume {volume_id} was not fast restored (restore not active yet or out of restore credits); "
+            "it initializes lazily on first read.\n"
+        )
+    return fast_restored
+
+
+def _parse_int(value: str) -> int | None:
+    """Return ``value`` as an int, or ``None`` when it is not one."""
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
+
+def parse_volume_preread(console_output: str) -> VolumePrereadStatus | None:
+    """Return the latest pre-read progress from the console, or ``None`` without markers."""
+    status: VolumePrereadStatus | None = None
+    for line in console_output.splitlines():
+        if VOLUME_PREREAD_MARKER not in line:
+            continue
+        values = dict(field.partition("=")[::2] for field in line.split(VOLUME_PREREAD_MARKER, 1)[1].split())
+        device = values.get("device", "")
+        if "start" in values:
+            status = VolumePrereadStatus(device=device, started_at=_parse_int(values["start"]))
+        elif "end" in values:
+            status = VolumePrereadStatus(
+                device=device,
+                started_at=status.started_at if status is not None else None,
+                finished_at=_parse_int(values["end"]),
+                exit_code=_parse_int(values.get("exit", "")),
+            )
+    return status
+
+
+def fetch_volume_preread(ec2_client: Any, instance_id: str) -> VolumePrereadStatus | None:
+    """Read the instance console and parse its pre-read markers."""
+    try:
+        response = ec2_client.get_console_output(InstanceId=instance_id, Latest=True)
+    except Exception:
+        # Reason: Latest=True is only supported on Nitro instances.
+        response = ec2_client.get_console_output(InstanceId=instance_id)
+    return parse_volume_preread(str(response.get("Output") or ""))
+
+
+def wait_for_volume_preread(
+    ec2_client: Any,
+    instance_id: str,
+    *,
+    timeout_seconds: float = VOLUME_PREREAD_TIMEOUT_SECONDS,
+    poll_interval_seconds: float = VOLUME_WARM_POLL_SECONDS,
+    monotonic: Callable[[], float] = time.monotonic,
+    sleeper: Callable[[float], None] = time.sleep,
+    out: TextIO = sys.stdout,
+) -> VolumePrereadStatus:
+    """Poll the instance console until the root volume pre-read has finished.
+
+    Raises:
+        RuntimeError: If the read fails or does not finish before the deadline.
+    """
+    started_at = monotonic()
+    deadline = started_at + timeout_seconds
+    last_status = ""
+    while True:
+        try:
+            status = fetch_volume_preread(ec2_client, instance_id)
+        except Exception as err:
+            LOGGER.debug("Console read failed instance_id=%s error=%s", instance_id, err)
+            status = None
+        if status is not None and status.exit_code is not None:
+            if status.exit_code != 0:
+                raise RuntimeError(
+                    f"Root volume pre-read of {status.device} exited with status {status.exit_code} on {instance_id}."
+                )
+            out.write(
+                f"Root volume {status.device} on {instance_id} is fully initialized ({status.seconds}s pre-read).\n"
+            )
+            return status
+        now = monotonic()
+        description = f"reading {status.device}" if status is not None else "no pre-read output on the console yet"
+        if description != last_status:
+            out.write(f"Waiting for root volume pre-read: {description} ({now - started_at:.0f}s elapsed)\n")
+            last_status = description
+        if now >= deadline:
+            raise RuntimeError(
+                f"Root volume pre-read on {instance_id} did not finish within {timeout_seconds:.0f} seconds "
+                f"(last status: {description})."
+            )
+        sleeper(min(poll_interval_seconds, max(deadline - now, 0.0)))
@@ -6,6 +6,7 @@ from dataclasses import dataclass
 from typing import Any
 
 from workstation_core.ami_lifecycle import resolve_running_instance_id
+from workstation_core.pause import find_fleet_instance
 
 
 @dataclass(frozen=True, slots=True)
@@ -13,7 +14,7 @@ class WorkstationStatus:
     """Summarized workstation status for interactive UX.
 
     Args:
-        stack_state: High-level stack state (`not found`, `in progress`, `running`).
+        stack_state: High-level stack state (`not found`, `in progress`, `running`, `paused`).
         stack_status: Raw CloudFormation stack status when available.
         instance_id: Running instance id when resolvable.
         public_ip: Running instance public IP when resolvable.
@@ -56,6 +57,30 @@ def _resolve_public_ip(ec2_client: Any, instance_id: str) -> str | None:
     return None
 
 
+def _resolve_idle_status(
+    cloudformation_client: Any,
+    ec2_client: Any,
+    *,
+    stack_name: str,
+    spot_fleet_logical_id: str,
+    stack_status: str | None,
+) -> WorkstationStatus:
+    """Report a stack without a running instance as paused or still in progress."""
+    try:
+        stopped = find_fleet_instance(
+            cloudformation_client,
+            ec2_client,
+            stack_name=stack_name,
+            spot_fleet_logical_id=spot_fleet_logical_id,
+            states=("stopping", "stopped"),
+        )
+    except RuntimeError:
+        stopped = None
+    if stopped is None:
+        return WorkstationStatus(stack_state="in progress", stack_status=stack_status)
+    return WorkstationStatus(stack_state="paused", stack_status=stack_status, instance_id=stopped.instance_id)
+
+
 def get_workstation_status(
     cloudformation_client: Any,
     ec2_client: Any,
@@ -102,7 +127,13 @@ def get_workstation_status(
         )
     except RuntimeError as err:
         if _is_runtime_instance_absence(err):
-            return WorkstationStatus(stack_state="in progress", stack_status=normalized_stack_status)
+            return _resolve_idle_status(
+                cloudformation_client,
+                ec2_client,
+                stack_name=stack_name,
+                spot_fleet_logical_id=spot_fleet_logical_id,
+                stack_status=normalized_stack_status,
+            )
         raise RuntimeError(f"Failed to resolve running instance for '{stack_name}'.") from err
 
     try: